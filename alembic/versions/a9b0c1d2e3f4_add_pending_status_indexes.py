@@ -0,0 +1,51 @@
+"""include pending audio_files in the active status index, index pending uploads
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2025-08-20 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "a9b0c1d2e3f4"
+down_revision: Union[str, Sequence[str], None] = "f8a9b0c1d2e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Должно совпадать с core.queue_depth.ACTIVE_STATUSES
+ACTIVE_STATUSES_SQL = "status IN ('uploaded', 'pending', 'queued', 'processing')"
+PREVIOUS_ACTIVE_STATUSES_SQL = "status IN ('uploaded', 'queued', 'processing')"
+PENDING_SQL = "status = 'pending'"
+
+
+def _create_active_index(where: str) -> None:
+    op.create_index(
+        "ix_audio_files_active_status",
+        "audio_files",
+        ["status", "whisper_model"],
+        unique=False,
+        postgresql_where=sa.text(where),
+        sqlite_where=sa.text(where),
+    )
+
+
+def upgrade() -> None:
+    op.drop_index("ix_audio_files_active_status", table_name="audio_files")
+    _create_active_index(ACTIVE_STATUSES_SQL)
+    op.create_index(
+        "ix_audio_files_pending_upload_time",
+        "audio_files",
+        ["upload_time", "id"],
+        unique=False,
+        postgresql_where=sa.text(PENDING_SQL),
+        sqlite_where=sa.text(PENDING_SQL),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audio_files_pending_upload_time", table_name="audio_files")
+    op.drop_index("ix_audio_files_active_status", table_name="audio_files")
+    _create_active_index(PREVIOUS_ACTIVE_STATUSES_SQL)
@@ -0,0 +1,34 @@
+"""add scheduling columns (expected cost, priority, enqueued_at) to audio_files
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2025-08-15 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, Sequence[str], None] = "a3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("audio_files") as batch_op:
+        batch_op.add_column(
+            sa.Column("expected_cost_seconds", sa.Float(), nullable=True)
+        )
+        batch_op.add_column(sa.Column("priority", sa.Integer(), nullable=True))
+        batch_op.add_column(
+            sa.Column("enqueued_at", sa.DateTime(timezone=True), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("audio_files") as batch_op:
+        batch_op.drop_column("enqueued_at")
+        batch_op.drop_column("priority")
+        batch_op.drop_column("expected_cost_seconds")
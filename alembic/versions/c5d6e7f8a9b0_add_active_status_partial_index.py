@@ -0,0 +1,34 @@
+"""add partial index on active audio_files statuses for queue depth counts
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2025-08-16 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "c5d6e7f8a9b0"
+down_revision: Union[str, Sequence[str], None] = "b4c5d6e7f8a9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Должно совпадать с core.queue_depth.ACTIVE_STATUSES
+ACTIVE_STATUSES_SQL = "status IN ('uploaded', 'queued', 'processing')"
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audio_files_active_status",
+        "audio_files",
+        ["status", "whisper_model"],
+        unique=False,
+        postgresql_where=sa.text(ACTIVE_STATUSES_SQL),
+        sqlite_where=sa.text(ACTIVE_STATUSES_SQL),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audio_files_active_status", table_name="audio_files")
@@ -0,0 +1,109 @@
+"""add list/filter indexes and job_events status-transition table
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2025-08-17 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "d6e7f8a9b0c1"
+down_revision: Union[str, Sequence[str], None] = "c5d6e7f8a9b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (имя, таблица, колонки) — фильтры и order_by роутеров списков
+INDEXES = (
+    ("ix_audio_files_user_id_upload_time", "audio_files", ["user_id", "upload_time"]),
+    ("ix_audio_files_status_upload_time", "audio_files", ["status", "upload_time"]),
+    ("ix_audio_files_upload_time", "audio_files", ["upload_time"]),
+    ("ix_transcripts_status_created_at", "transcripts", ["status", "created_at"]),
+    ("ix_transcripts_created_at", "transcripts", ["created_at"]),
+    (
+        "ix_translations_transcript_id_target_language",
+        "translations",
+        ["transcript_id", "target_language"],
+    ),
+    ("ix_translations_status_created_at", "translations", ["status", "created_at"]),
+    ("ix_translations_created_at", "translations", ["created_at"]),
+    (
+        "ix_summaries_source_translation_id_target_language",
+        "summaries",
+        ["source_translation_id", "target_language"],
+    ),
+    ("ix_summaries_status_created_at", "summaries", ["status", "created_at"]),
+    ("ix_summaries_created_at", "summaries", ["created_at"]),
+)
+
+# (имя, таблица, колонки, условие) — частичные индексы задач и планировщика
+PARTIAL_INDEXES = (
+    (
+        "ix_audio_files_queued_enqueued_at",
+        "audio_files",
+        ["enqueued_at"],
+        "status = 'queued'",
+    ),
+    (
+        "ix_transcripts_done_model_name_rtf",
+        "transcripts",
+        ["model_name", "real_time_factor"],
+        "status = 'done'",
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for name, table, columns, where in PARTIAL_INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            postgresql_where=sa.text(where),
+            sqlite_where=sa.text(where),
+        )
+
+    op.create_table(
+        "job_events",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            primary_key=True,
+        ),
+        sa.Column("entity_type", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("audio_file_id", sa.Integer(), nullable=True),
+        sa.Column("from_status", sa.String(length=32), nullable=True),
+        sa.Column("to_status", sa.String(length=32), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_job_events_entity",
+        "job_events",
+        ["entity_type", "entity_id", "created_at"],
+    )
+    op.create_index(
+        "ix_job_events_to_status_created_at",
+        "job_events",
+        ["to_status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_events_to_status_created_at", table_name="job_events")
+    op.drop_index("ix_job_events_entity", table_name="job_events")
+    op.drop_table("job_events")
+    for name, table, _columns, _where in reversed(PARTIAL_INDEXES):
+        op.drop_index(name, table_name=table)
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,30 @@
+"""add content_hash to audio_files for upload deduplication
+
+Revision ID: e1f2a3b4c5d6
+Revises: d2e3f4a5b6c7
+Create Date: 2025-08-12 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d2e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("audio_files") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(64), nullable=True))
+    op.create_index(
+        "ix_audio_files_content_hash", "audio_files", ["content_hash"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audio_files_content_hash", table_name="audio_files")
+    with op.batch_alter_table("audio_files") as batch_op:
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,26 @@
+"""add tokens_per_second to translations (translation throughput)
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2025-08-18 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e7f8a9b0c1d2"
+down_revision: Union[str, Sequence[str], None] = "d6e7f8a9b0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("translations") as batch_op:
+        batch_op.add_column(sa.Column("tokens_per_second", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("translations") as batch_op:
+        batch_op.drop_column("tokens_per_second")
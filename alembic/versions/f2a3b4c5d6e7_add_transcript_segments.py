@@ -0,0 +1,49 @@
+"""add transcript_segments table and transcript progress
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2025-08-13 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcript_segments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "transcript_id",
+            sa.Integer(),
+            sa.ForeignKey("transcripts.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("start", sa.Float(), nullable=False),
+        sa.Column("end", sa.Float(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("avg_logprob", sa.Float(), nullable=True),
+    )
+    op.create_index(
+        "ix_transcript_segments_transcript_id_start",
+        "transcript_segments",
+        ["transcript_id", "start"],
+    )
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.add_column(sa.Column("progress_percent", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transcripts") as batch_op:
+        batch_op.drop_column("progress_percent")
+    op.drop_index(
+        "ix_transcript_segments_transcript_id_start", table_name="transcript_segments"
+    )
+    op.drop_table("transcript_segments")
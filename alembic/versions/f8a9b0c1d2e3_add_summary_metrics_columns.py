@@ -0,0 +1,30 @@
+"""add processing_seconds, input_chars, text_chars to summaries
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2025-08-19 10:00:00
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f8a9b0c1d2e3"
+down_revision: Union[str, Sequence[str], None] = "e7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("summaries") as batch_op:
+        batch_op.add_column(sa.Column("processing_seconds", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("input_chars", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("text_chars", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("summaries") as batch_op:
+        batch_op.drop_column("text_chars")
+        batch_op.drop_column("input_chars")
+        batch_op.drop_column("processing_seconds")
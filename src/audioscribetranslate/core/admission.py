@@ -0,0 +1,285 @@
+"""
+Контроль допуска загрузок и обратное давление очереди.
+
+Нагрузка измеряется в секундах работы (expected_cost_seconds: длительность ×
+RTF, как у планировщика), а не в числе файлов: трёхчасовая запись и
+голосовое сообщение стоят по-разному. Незавершённая работа — файлы в
+статусах pending, queued и processing — считается одним агрегирующим
+запросом по частичному индексу ix_audio_files_active_status.
+
+Решения (decide_admission — чистая функция):
+
+- до копирования загрузки в хранилище (тело уже принято разбором
+  multipart-формы, экономятся копирование, хеш и ffprobe): 429, если у пользователя уже больше
+  max_user_work_seconds незавершённой работы, и 503, если общий бэклог
+  больше max_backlog_work_seconds; оба с Retry-After по скорости разбора
+  очереди (drain_rate секунд работы в секунду — число воркеров);
+- после сохранения файла (стоимость уже известна): в очередь брокера, если
+  там меньше max_queue_work_seconds работы и хватает памяти, иначе файл
+  остаётся в БД в статусе pending. Новые файлы встают за уже ждущими (FIFO).
+
+Статус pending долговечен: фоновый цикл менеджера цепочек
+(drain_pending_uploads в tasks) ставит такие файлы в очередь по мере
+освобождения бюджета, поэтому ни перегрузка, ни сбой брокера не оставляют
+файлы без обработки.
+
+Example:
+    backlog = await load_backlog(db, user_id, config)
+    decision = decide_admission(backlog, cost_seconds=0.0, config=config)
+    if not decision.admitted: raise HTTPException(decision.status_code, ...)
+"""
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from audioscribetranslate.core.config import Settings
+from audioscribetranslate.core.pagination import AnySelect
+from audioscribetranslate.models.audio_file import AudioFile
+
+PENDING_STATUS = "pending"
+# Незавершённая работа (все статусы покрыты ix_audio_files_active_status)
+OUTSTANDING_STATUSES: Tuple[str, ...] = (PENDING_STATUS, "queued", "processing")
+
+ADMIT = "admit"
+DEFER = "defer"
+REJECT_USER = "reject_user"
+REJECT_BACKLOG = "reject_backlog"
+
+# RTF для файлов без оценки стоимости (как _FALLBACK_RTF планировщика)
+_FALLBACK_RTF = 0.5
+
+
+@dataclass(frozen=True)
+class AdmissionConfig:
+    """
+    Пороги допуска загрузок.
+
+    Attributes:
+        enabled (bool): Контроль включён (False — всё сразу в очередь).
+        max_user_work_seconds (float): Незавершённая работа одного пользователя (429).
+        max_backlog_work_seconds (float): Общая незавершённая работа (503).
+        max_queue_work_seconds (float): Работа в очереди брокера; сверх неё — pending.
+        drain_rate (float): Секунд работы, выполняемых за секунду (≈ max_workers).
+        default_cost_seconds (float): Стоимость файла без оценки.
+        min_retry_after_seconds (int): Нижняя граница Retry-After.
+        max_retry_after_seconds (int): Верхняя граница Retry-After.
+    """
+
+    enabled: bool = True
+    max_user_work_seconds: float = 4 * 3600.0
+    max_backlog_work_seconds: float = 24 * 3600.0
+    max_queue_work_seconds: float = 2 * 3600.0
+    drain_rate: float = 1.0
+    default_cost_seconds: float = 300.0
+    min_retry_after_seconds: int = 5
+    max_retry_after_seconds: int = 3600
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AdmissionConfig":
+        """Собирает конфигурацию из настроек приложения."""
+        return cls(
+            enabled=settings.admission_enabled,
+            max_user_work_seconds=settings.admission_max_user_work_seconds,
+            max_backlog_work_seconds=settings.admission_max_backlog_work_seconds,
+            max_queue_work_seconds=settings.admission_max_queue_work_seconds,
+            drain_rate=float(max(settings.max_workers, 1)),
+            default_cost_seconds=settings.scheduler_default_duration_seconds
+            * _FALLBACK_RTF,
+        )
+
+
+@dataclass(frozen=True)
+class Backlog:
+    """
+    Незавершённая работа в секундах.
+
+    Attributes:
+        user_seconds (float): Работа пользователя (все незавершённые статусы).
+        dispatched_seconds (float): Работа в очереди брокера и в обработке.
+        pending_seconds (float): Работа, отложенная в pending.
+        pending_count (int): Файлов в pending.
+    """
+
+    user_seconds: float = 0.0
+    dispatched_seconds: float = 0.0
+    pending_seconds: float = 0.0
+    pending_count: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        """Вся незавершённая работа."""
+        return self.dispatched_seconds + self.pending_seconds
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    """
+    Решение о загрузке.
+
+    Attributes:
+        action (str): ADMIT, DEFER, REJECT_USER или REJECT_BACKLOG.
+        status_code (int): HTTP-код отказа (429/503), 200 для принятых.
+        retry_after (int): Рекомендуемая пауза клиента (сек), 0 — не нужна.
+        reason (str): Пояснение для ответа и логов.
+    """
+
+    action: str
+    status_code: int = 200
+    retry_after: int = 0
+    reason: str = ""
+
+    @property
+    def admitted(self) -> bool:
+        """Загрузка принята (сразу в очередь или в pending)."""
+        return self.action in (ADMIT, DEFER)
+
+
+def retry_after_seconds(excess_seconds: float, config: AdmissionConfig) -> int:
+    """
+    Оценивает, через сколько секунд избыток работы будет разобран.
+
+    Args:
+        excess_seconds (float): Работа сверх порога (сек).
+        config (AdmissionConfig): Скорость разбора и границы ответа.
+
+    Returns:
+        int: Retry-After в секундах.
+
+    Example:
+        >>> retry_after_seconds(600.0, AdmissionConfig(drain_rate=4.0))
+        150
+    """
+    seconds = math.ceil(max(excess_seconds, 0.0) / max(config.drain_rate, 1e-9))
+    return min(
+        max(seconds, config.min_retry_after_seconds), config.max_retry_after_seconds
+    )
+
+
+def decide_admission(
+    backlog: Backlog,
+    cost_seconds: float,
+    config: AdmissionConfig,
+    memory_ok: bool = True,
+) -> AdmissionDecision:
+    """
+    Решает судьбу загрузки по бэклогу и её стоимости.
+
+    Отказ (429/503) возможен только по уже накопленной работе: файл, который
+    один превышает порог, принимается, если у пользователя ничего не ждёт.
+
+    Args:
+        backlog (Backlog): Незавершённая работа.
+        cost_seconds (float): Стоимость файла (0 — до сохранения файла, проверка отказа).
+        config (AdmissionConfig): Пороги.
+        memory_ok (bool): Хватает ли памяти для обработки (иначе — pending).
+
+    Returns:
+        AdmissionDecision: Решение.
+    """
+    if not config.enabled:
+        return AdmissionDecision(ADMIT)
+    if backlog.user_seconds >= config.max_user_work_seconds:
+        excess = backlog.user_seconds - config.max_user_work_seconds + cost_seconds
+        return AdmissionDecision(
+            REJECT_USER,
+            status_code=429,
+            retry_after=retry_after_seconds(excess, config),
+            reason="Слишком много необработанной работы пользователя",
+        )
+    if backlog.total_seconds >= config.max_backlog_work_seconds:
+        excess = backlog.total_seconds - config.max_backlog_work_seconds + cost_seconds
+        return AdmissionDecision(
+            REJECT_BACKLOG,
+            status_code=503,
+            retry_after=retry_after_seconds(excess, config),
+            reason="Очередь обработки переполнена",
+        )
+    if not memory_ok:
+        return AdmissionDecision(DEFER, reason="Недостаточно памяти")
+    if backlog.pending_count > 0:
+        # Не обгоняем уже отложенные файлы
+        return AdmissionDecision(DEFER, reason="Есть отложенные файлы")
+    over = backlog.dispatched_seconds + cost_seconds - config.max_queue_work_seconds
+    if over > 0 and backlog.dispatched_seconds > 0:
+        return AdmissionDecision(
+            DEFER,
+            retry_after=retry_after_seconds(over, config),
+            reason="Очередь брокера заполнена",
+        )
+    return AdmissionDecision(ADMIT)
+
+
+def backlog_query(user_id: Optional[int], default_cost_seconds: float) -> AnySelect:
+    """
+    Запрос незавершённой работы: общей, отложенной и пользователя.
+
+    Args:
+        user_id (Optional[int]): Пользователь (None — только общая работа).
+        default_cost_seconds (float): Стоимость файлов без оценки.
+
+    Returns:
+        Select: Одна строка: user, dispatched, pending (сек), pending_count.
+    """
+    cost: ColumnElement[float] = func.coalesce(
+        AudioFile.expected_cost_seconds, literal(default_cost_seconds)
+    )
+    is_pending: ColumnElement[bool] = AudioFile.status == PENDING_STATUS
+    user_cost = (
+        func.sum(case((AudioFile.user_id == user_id, cost), else_=0.0))
+        if user_id is not None
+        else literal(0.0)
+    )
+    return select(
+        func.coalesce(user_cost, 0.0).label("user"),
+        func.coalesce(func.sum(case((is_pending, 0.0), else_=cost)), 0.0).label(
+            "dispatched"
+        ),
+        func.coalesce(func.sum(case((is_pending, cost), else_=0.0)), 0.0).label(
+            "pending"
+        ),
+        func.count(case((is_pending, 1))).label("pending_count"),
+    ).where(AudioFile.status.in_(OUTSTANDING_STATUSES))
+
+
+def _backlog_from_row(row: Any) -> Backlog:
+    return Backlog(
+        user_seconds=float(row.user or 0.0),
+        dispatched_seconds=float(row.dispatched or 0.0),
+        pending_seconds=float(row.pending or 0.0),
+        pending_count=int(row.pending_count or 0),
+    )
+
+
+async def load_backlog(
+    session: AsyncSession, user_id: Optional[int], config: AdmissionConfig
+) -> Backlog:
+    """Считает бэклог асинхронной сессией (эндпоинты)."""
+    row = (
+        await session.execute(backlog_query(user_id, config.default_cost_seconds))
+    ).one()
+    return _backlog_from_row(row)
+
+
+def load_backlog_sync(
+    session: Session, user_id: Optional[int], config: AdmissionConfig
+) -> Backlog:
+    """Считает бэклог синхронной сессией (задачи, менеджер цепочек)."""
+    row = session.execute(backlog_query(user_id, config.default_cost_seconds)).one()
+    return _backlog_from_row(row)
+
+
+def backlog_as_dict(backlog: Backlog, config: AdmissionConfig) -> Dict[str, Any]:
+    """Представление для мониторинга."""
+    return {
+        "dispatched_seconds": round(backlog.dispatched_seconds, 1),
+        "pending_seconds": round(backlog.pending_seconds, 1),
+        "pending_count": backlog.pending_count,
+        "total_seconds": round(backlog.total_seconds, 1),
+        "config": asdict(config),
+    }
@@ -0,0 +1,284 @@
+"""
+Автомасштабирование воркеров цепочек по очереди, прогнозу работы и памяти.
+
+Решение принимается по снимку состояния (AutoscalerInputs) чистой функцией
+Autoscaler.decide(), поэтому его легко проверять и объяснять:
+
+- спрос: воркеры, занятые сейчас (processing), плюс столько, чтобы
+  прогнозируемая работа очереди (Σ длительность × RTF) выполнилась за
+  target_drain_seconds, но не больше числа ждущих файлов;
+- потолок по памяти: каждый новый воркер стоит накладные расходы процесса
+  плюс самую тяжелую модель из очереди (estimate_model_bytes), и после
+  запуска должно оставаться min_free_memory_gb;
+- рост пачкой до max_scale_up_step воркеров за такт, не чаще
+  scale_up_cooldown_seconds;
+- уменьшение по одному воркеру, только если даже более строгий спрос
+  (целевое время опустошения / (1 + hysteresis)) держится ниже текущего
+  числа воркеров не меньше scale_down_cooldown_seconds. Между двумя
+  порогами лежит полоса, в которой число воркеров не меняется.
+
+Последние решения и счётчики доступны через get_metrics() и
+GET /monitoring/autoscaler.
+
+Example:
+    scaler = Autoscaler(AutoscalerConfig.from_settings(settings))
+    decision = scaler.decide(inputs)
+    if decision.delta > 0: ...start decision.delta workers...
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+from audioscribetranslate.core.config import Settings
+from audioscribetranslate.core.scheduler import DEFAULT_RTF
+from audioscribetranslate.services.transcription import (
+    ComputeType,
+    estimate_model_bytes,
+)
+
+_FALLBACK_RTF = 0.5
+_GB = 1024**3
+_MB = 1024**2
+
+
+@dataclass(frozen=True)
+class AutoscalerConfig:
+    """
+    Параметры автомасштабирования.
+
+    Attributes:
+        min_workers (int): Минимум воркеров (0 — гасить всех в простое).
+        max_workers (int): Максимум воркеров.
+        target_drain_seconds (float): За сколько должна выполняться работа очереди.
+        max_scale_up_step (int): Максимум воркеров, запускаемых за один такт.
+        scale_up_cooldown_seconds (float): Пауза между запусками.
+        scale_down_cooldown_seconds (float): Сколько спрос должен держаться ниже
+            числа воркеров, прежде чем остановить один.
+        hysteresis (float): Ширина полосы без изменений: для уменьшения спрос
+            считается по target_drain_seconds / (1 + hysteresis).
+        worker_overhead_bytes (int): Память процесса воркера без модели.
+        min_free_bytes (int): Сколько памяти оставлять свободной.
+        default_cost_seconds (float): Длительность файла без оценки стоимости.
+    """
+
+    min_workers: int = 0
+    max_workers: int = 6
+    target_drain_seconds: float = 300.0
+    max_scale_up_step: int = 2
+    scale_up_cooldown_seconds: float = 10.0
+    scale_down_cooldown_seconds: float = 180.0
+    hysteresis: float = 0.25
+    worker_overhead_bytes: int = 512 * _MB
+    min_free_bytes: int = 4 * _GB
+    default_cost_seconds: float = 600.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AutoscalerConfig":
+        """Собирает конфигурацию из настроек приложения."""
+        return cls(
+            min_workers=settings.autoscaler_min_workers,
+            max_workers=settings.max_workers,
+            target_drain_seconds=settings.autoscaler_target_drain_seconds,
+            max_scale_up_step=settings.autoscaler_max_scale_up_step,
+            scale_up_cooldown_seconds=settings.autoscaler_scale_up_cooldown_seconds,
+            scale_down_cooldown_seconds=settings.autoscaler_scale_down_cooldown_seconds,
+            hysteresis=settings.autoscaler_hysteresis,
+            worker_overhead_bytes=settings.autoscaler_worker_overhead_mb * _MB,
+            min_free_bytes=int(settings.min_free_memory_gb * _GB),
+            default_cost_seconds=settings.scheduler_default_duration_seconds,
+        )
+
+
+@dataclass(frozen=True)
+class AutoscalerInputs:
+    """
+    Снимок состояния для решения.
+
+    Attributes:
+        workers (int): Запущенные воркеры.
+        processing (int): Файлы в обработке (заняты воркерами).
+        queued_by_model (Dict[str, int]): Ждущие файлы по моделям.
+        cost_by_model (Dict[str, float]): Σ expected_cost_seconds ждущих по моделям.
+        unpriced_by_model (Dict[str, int]): Ждущие без оценки стоимости.
+        available_bytes (int): Доступная память.
+        now (float): time.monotonic() момента снимка.
+    """
+
+    workers: int
+    processing: int
+    queued_by_model: Dict[str, int] = field(default_factory=dict)
+    cost_by_model: Dict[str, float] = field(default_factory=dict)
+    unpriced_by_model: Dict[str, int] = field(default_factory=dict)
+    available_bytes: int = 0
+    now: float = 0.0
+
+
+@dataclass(frozen=True)
+class ScalingDecision:
+    """
+    Решение автомасштабирования.
+
+    Attributes:
+        current (int): Воркеров до решения.
+        target (int): Воркеров после решения.
+        desired (int): Спрос без учёта шага и пауз.
+        memory_cap (int): Сколько воркеров помещается в память.
+        work_seconds (float): Прогноз работы очереди (сек).
+        reason (str): Причина (scale_up, scale_down, hold_*).
+        at (float): time.time() решения.
+    """
+
+    current: int
+    target: int
+    desired: int
+    memory_cap: int
+    work_seconds: float
+    reason: str
+    at: float
+
+    @property
+    def delta(self) -> int:
+        """Сколько воркеров запустить (> 0) или остановить (< 0)."""
+        return self.target - self.current
+
+
+def predicted_work_seconds(
+    inputs: AutoscalerInputs, default_cost_seconds: float
+) -> float:
+    """
+    Прогноз работы очереди: оценки планировщика плюс оценка для файлов без неё.
+
+    Args:
+        inputs (AutoscalerInputs): Снимок очереди.
+        default_cost_seconds (float): Длительность файла без оценки.
+
+    Returns:
+        float: Секунды обработки на одном воркере.
+    """
+    total = sum(inputs.cost_by_model.values())
+    for model, count in inputs.unpriced_by_model.items():
+        total += count * default_cost_seconds * DEFAULT_RTF.get(model, _FALLBACK_RTF)
+    return total
+
+
+def worker_memory_bytes(models: Any, overhead_bytes: int) -> int:
+    """
+    Память нового воркера: процесс плюс самая тяжелая модель из очереди (CPU int8).
+
+    Args:
+        models (Iterable[str]): Модели ждущих файлов.
+        overhead_bytes (int): Память процесса без модели.
+
+    Returns:
+        int: Байт на воркер.
+    """
+    heaviest = max(
+        (estimate_model_bytes(m, ComputeType.INT8) for m in models), default=0
+    )
+    return overhead_bytes + heaviest
+
+
+class Autoscaler:
+    """
+    Решения о числе воркеров с паузами и гистерезисом.
+
+    Attributes:
+        config (AutoscalerConfig): Параметры.
+    """
+
+    def __init__(self, config: AutoscalerConfig, history_size: int = 50) -> None:
+        self.config = config
+        self._lock = threading.Lock()
+        self._last_scale_up = -math.inf
+        self._last_scale_down = -math.inf
+        self._below_since: Optional[float] = None
+        self._history: Deque[ScalingDecision] = deque(maxlen=history_size)
+        self._counters: Dict[str, int] = {}
+
+    def _demand(self, inputs: AutoscalerInputs, work: float, drain: float) -> int:
+        queued = sum(inputs.queued_by_model.values())
+        if queued == 0:
+            return inputs.processing
+        needed = max(math.ceil(work / max(drain, 1.0)), 1)
+        return inputs.processing + min(needed, queued)
+
+    def decide(self, inputs: AutoscalerInputs) -> ScalingDecision:
+        """
+        Вычисляет целевое число воркеров и запоминает решение.
+
+        Args:
+            inputs (AutoscalerInputs): Снимок состояния.
+
+        Returns:
+            ScalingDecision: Решение (delta > 0 — запуск, < 0 — остановка).
+        """
+        cfg = self.config
+        now = inputs.now
+        current = inputs.workers
+        work = predicted_work_seconds(inputs, cfg.default_cost_seconds)
+        desired_up = self._demand(inputs, work, cfg.target_drain_seconds)
+        desired_down = self._demand(
+            inputs, work, cfg.target_drain_seconds / (1.0 + cfg.hysteresis)
+        )
+        desired_up = min(max(desired_up, cfg.min_workers), cfg.max_workers)
+        desired_down = min(max(desired_down, cfg.min_workers), cfg.max_workers)
+
+        per_worker = worker_memory_bytes(
+            inputs.queued_by_model, cfg.worker_overhead_bytes
+        )
+        spare = max(inputs.available_bytes - cfg.min_free_bytes, 0)
+        memory_cap = current + spare // max(per_worker, 1)
+
+        with self._lock:
+            target, reason = current, "hold"
+            if desired_up > current:
+                self._below_since = None
+                allowed = min(desired_up, memory_cap, current + cfg.max_scale_up_step)
+                if allowed <= current:
+                    reason = "hold_memory"
+                elif now - self._last_scale_up < cfg.scale_up_cooldown_seconds:
+                    reason = "hold_up_cooldown"
+                else:
+                    target, reason = allowed, "scale_up"
+                    self._last_scale_up = now
+            elif desired_down < current:
+                if self._below_since is None:
+                    self._below_since = now
+                quiet = now - self._below_since >= cfg.scale_down_cooldown_seconds
+                spaced = now - self._last_scale_down >= cfg.scale_down_cooldown_seconds
+                if quiet and spaced:
+                    target, reason = current - 1, "scale_down"
+                    self._last_scale_down = now
+                else:
+                    reason = "hold_down_cooldown"
+            else:
+                # Спрос в полосе гистерезиса: ничего не меняем
+                self._below_since = None
+
+            decision = ScalingDecision(
+                current=current,
+                target=target,
+                desired=desired_up,
+                memory_cap=int(memory_cap),
+                work_seconds=round(work, 1),
+                reason=reason,
+                at=time.time(),
+            )
+            self._history.append(decision)
+            self._counters[reason] = self._counters.get(reason, 0) + 1
+        return decision
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Последнее решение, счётчики причин и история для мониторинга."""
+        with self._lock:
+            history = [asdict(d) for d in self._history]
+            return {
+                "last_decision": history[-1] if history else None,
+                "decisions_total": dict(self._counters),
+                "history": history,
+                "config": asdict(self.config),
+            }
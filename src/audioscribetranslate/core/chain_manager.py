@@ -4,7 +4,12 @@
 Отвечает за:
 - Автоматический запуск воркеров при наличии файлов в очереди
 - Контроль использования памяти
-- Масштабирование количества воркеров
+- Масштабирование количества воркеров (core/autoscaler.py): рост по
+  прогнозу работы очереди, остановка простаивающих с паузой и гистерезисом
+- Мгновенную реакцию на новые файлы (core/queue_notify.py): постановка в
+  очередь будит цикл, опрос БД остаётся страховкой
+- Постановку в очередь загрузок, отложенных контролем допуска (core/admission.py)
+- Возврат в очередь файлов, брошенных упавшими воркерами (core/leases.py)
 """
 
 import logging
@@ -12,13 +17,24 @@ import os
 import subprocess
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import psutil
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
 
+from audioscribetranslate.core.autoscaler import (
+    Autoscaler,
+    AutoscalerConfig,
+    AutoscalerInputs,
+    ScalingDecision,
+)
 from audioscribetranslate.core.config import get_settings
+from audioscribetranslate.core.leases import held_lease_pids
+from audioscribetranslate.core.queue_depth import (
+    get_queue_depth,
+    invalidate_queue_depth,
+)
+from audioscribetranslate.core.queue_notify import get_queue_notifier
+from audioscribetranslate.db.sync_session import get_sync_engine, get_sync_sessionmaker
 from audioscribetranslate.models.audio_file import AudioFile
 
 logger = logging.getLogger(__name__)
@@ -27,7 +43,7 @@ logger = logging.getLogger(__name__)
 class ChainWorkerProcess:
     """Представляет процесс воркера цепочек обработки."""
     
-    def __init__(self, worker_id: str, process: subprocess.Popen[bytes]) -> None:
+    def __init__(self, worker_id: str, process: "subprocess.Popen[Any]") -> None:
         self.worker_id = worker_id
         self.process = process
         self.start_time = time.time()
@@ -45,6 +61,18 @@ class ChainWorkerProcess:
         """Проверяет, запущен ли процесс."""
         return self.process.poll() is None
     
+    def request_stop(self) -> None:
+        """
+        Посылает SIGTERM без ожидания: тёплая остановка Celery дорабатывает
+        текущую задачу, процесс собирает cleanup_inactive_workers.
+        """
+        try:
+            self.process.terminate()
+            self.is_active = False
+            logger.info(f"Воркер цепочек {self.worker_id} останавливается")
+        except Exception as e:
+            logger.error(f"Ошибка остановки воркера {self.worker_id}: {e}")
+
     def terminate(self) -> None:
         """Завершает процесс воркера."""
         try:
@@ -66,10 +94,16 @@ class ProcessingChainManager:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.workers: Dict[str, ChainWorkerProcess] = {}
+        # Получили SIGTERM и дорабатывают задачу; в число воркеров не входят
+        self.stopping: Dict[str, ChainWorkerProcess] = {}
+        self.autoscaler = Autoscaler(AutoscalerConfig.from_settings(self.settings))
+        self._worker_seq = 0
+        self.notifier = get_queue_notifier()
+        self._last_status_log = 0.0
         self.is_running = False
         self.monitor_thread: Optional[threading.Thread] = None
-        self.engine = create_engine(self.settings.sync_database_url, future=True)
-        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False, future=True)
+        self.engine = get_sync_engine()
+        self.SessionLocal = get_sync_sessionmaker()
     
     def get_available_memory_gb(self) -> float:
         """Возвращает доступную память в ГБ."""
@@ -77,45 +111,85 @@ class ProcessingChainManager:
         return float(memory.available / (1024**3))
     
     def get_queued_files_count(self) -> int:
-        """Возвращает количество файлов в очереди."""
+        """Возвращает количество файлов в очереди (count(*) с коротким кэшем)."""
+        return get_queue_depth().queued
+    
+    def get_active_workers(self) -> List[ChainWorkerProcess]:
+        """Запущенные воркеры в порядке запуска."""
+        return [w for w in self.workers.values() if w.is_running()]
+
+    def collect_autoscaler_inputs(self) -> AutoscalerInputs:
+        """Снимок очереди, памяти и воркеров для автомасштабирования."""
+        depth = get_queue_depth()
+        return AutoscalerInputs(
+            workers=len(self.get_active_workers()),
+            processing=depth.by_status.get("processing", 0),
+            queued_by_model=dict(depth.by_model),
+            cost_by_model=dict(depth.cost_by_model),
+            unpriced_by_model=dict(depth.unpriced_by_model),
+            available_bytes=int(psutil.virtual_memory().available),
+            now=time.monotonic(),
+        )
+
+    def autoscale(self) -> ScalingDecision:
+        """
+        Один такт автомасштабирования: решение и его применение.
+
+        Returns:
+            ScalingDecision: Принятое решение.
+        """
+        decision = self.autoscaler.decide(self.collect_autoscaler_inputs())
+        if decision.delta > 0:
+            logger.info(
+                f"Автомасштабирование: +{decision.delta} воркер(ов) "
+                f"({decision.current} -> {decision.target}, работа очереди "
+                f"{decision.work_seconds:.0f} с, потолок памяти {decision.memory_cap})"
+            )
+            for _ in range(decision.delta):
+                if self.start_chain_worker() is None:
+                    break
+        elif decision.delta < 0:
+            logger.info(
+                f"Автомасштабирование: остановка воркера "
+                f"({decision.current} -> {decision.target}, спрос {decision.desired})"
+            )
+            self.stop_newest_worker()
+        return decision
+
+    def get_busy_pids(self) -> Set[int]:
+        """PID воркеров, держащих аренду файла (core/leases.py)."""
         try:
             with self.SessionLocal() as session:
-                result = session.execute(
-                    select(AudioFile).where(AudioFile.status == "queued")
-                )
-                return len(result.scalars().all())
+                return held_lease_pids(session, AudioFile)
         except Exception as e:
-            logger.error(f"Ошибка получения количества файлов в очереди: {e}")
-            return 0
-    
-    def should_start_new_worker(self) -> bool:
+            logger.error(f"Ошибка чтения аренд воркеров: {e}")
+            return {w.process.pid for w in self.workers.values()}
+
+    def stop_newest_worker(self) -> Optional[str]:
         """
-        Определяет, нужно ли запускать новый воркер.
-        
+        Останавливает самый новый простаивающий воркер (у старых модели прогреты).
+
         Returns:
-            bool: True если нужно запускать новый воркер
+            Optional[str]: ID остановленного воркера или None, если все заняты.
+
+        Pitfalls:
+            - Занятым считается воркер, чей PID держит аренду файла; без
+              простаивающих остановка откладывается до следующего такта.
+            - SIGTERM без ожидания и без SIGKILL: цикл мониторинга не
+              блокируется, а задача, взятая между проверкой и сигналом,
+              дорабатывается тёплой остановкой Celery.
         """
-        # Проверяем память
-        available_memory = self.get_available_memory_gb()
-        if available_memory < self.settings.min_free_memory_gb:
-            logger.debug(f"Недостаточно памяти: {available_memory:.1f}GB < {self.settings.min_free_memory_gb}GB")
-            return False
-        
-        # Проверяем очередь
-        queued_files = self.get_queued_files_count()
-        if queued_files == 0:
-            logger.debug("Нет файлов в очереди")
-            return False
-        
-        # Проверяем максимальное количество воркеров
-        active_workers = len([w for w in self.workers.values() if w.is_running()])
-        if active_workers >= self.settings.max_workers:
-            logger.debug(f"Достигнут максимум воркеров: {active_workers}/{self.settings.max_workers}")
-            return False
-        
-        logger.info(f"Можно запустить новый воркер: память={available_memory:.1f}GB, очередь={queued_files}, воркеров={active_workers}")
-        return True
-    
+        busy = self.get_busy_pids()
+        idle = [w for w in self.get_active_workers() if w.process.pid not in busy]
+        if not idle:
+            logger.info("Автомасштабирование: все воркеры заняты, остановка отложена")
+            return None
+        worker = max(idle, key=lambda w: w.start_time)
+        worker.request_stop()
+        self.workers.pop(worker.worker_id, None)
+        self.stopping[worker.worker_id] = worker
+        return worker.worker_id
+
     def start_chain_worker(self) -> Optional[str]:
         """
         Запускает новый воркер для обработки цепочек.
@@ -124,7 +198,9 @@ class ProcessingChainManager:
             Optional[str]: ID воркера если запуск успешен, иначе None
         """
         try:
-            worker_id = f"chain_worker_{len(self.workers) + 1}"
+            # Монотонный номер: после остановок имена не повторяются
+            self._worker_seq += 1
+            worker_id = f"chain_worker_{self._worker_seq}"
             
             # Команда для запуска воркера цепочек
             cmd = [
@@ -133,18 +209,22 @@ class ProcessingChainManager:
                 "worker",
                 "--loglevel=info",
                 "--pool=solo",
-                "--queues=processing_chains",
+                "--queues=processing_chains,processing_chains.long",
                 f"--hostname={worker_id}@%h",
                 "--concurrency=1",
             ]
             
             logger.info(f"Запуск воркера цепочек: {worker_id}")
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
-            )
+            # Своя группа процессов: Ctrl+C менеджера не убивает воркеры посреди
+            # задачи. CREATE_NEW_PROCESS_GROUP есть только в Windows. Вывод
+            # наследуется: непрочитанный PIPE заполнился бы и остановил воркер.
+            if os.name == "nt":
+                popen_kwargs: Dict[str, Any] = {
+                    "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP  # type: ignore[attr-defined]
+                }
+            else:
+                popen_kwargs = {"start_new_session": True}
+            process = subprocess.Popen(cmd, **popen_kwargs)
             
             worker = ChainWorkerProcess(worker_id, process)
             self.workers[worker_id] = worker
@@ -166,6 +246,11 @@ class ProcessingChainManager:
         for worker_id in inactive_workers:
             logger.info(f"Удаляем неактивный воркер: {worker_id}")
             del self.workers[worker_id]
+
+        # poll() в is_running забирает код возврата остановленных воркеров
+        for worker_id in [w_id for w_id, w in self.stopping.items() if not w.is_running()]:
+            logger.info(f"Воркер цепочек {worker_id} остановлен")
+            del self.stopping[worker_id]
     
     def get_workers_status(self) -> Dict[str, Dict[str, Any]]:
         """Возвращает статус всех воркеров."""
@@ -189,20 +274,88 @@ class ProcessingChainManager:
                 # Очистка неактивных воркеров
                 self.cleanup_inactive_workers()
                 
-                # Проверка необходимости запуска новых воркеров
-                if self.should_start_new_worker():
-                    self.start_chain_worker()
+                # Запуск/остановка воркеров по очереди, прогнозу работы и памяти
+                decision = self.autoscale()
+
+                # Брошенные упавшими воркерами файлы (аренда истекла) — снова в очередь
+                self.reap_abandoned()
+
+                # Старение: повышаем приоритет давно ждущих длинных задач
+                self.reprioritize_queue()
+
+                # Отложенные контролем допуска загрузки — в очередь, если есть место
+                self.drain_pending()
                 
                 # Логирование статуса каждые 60 секунд
-                if int(time.time()) % 60 == 0:
+                if time.monotonic() - self._last_status_log >= 60:
+                    self._last_status_log = time.monotonic()
                     self.log_status()
                 
-                time.sleep(self.settings.chain_queue_check_interval)
+                self.wait_for_queue_change(decision)
                 
             except Exception as e:
                 logger.error(f"Ошибка в цикле мониторинга цепочек: {e}")
                 time.sleep(30)  # Больше времени при ошибках
     
+    def wait_for_queue_change(self, decision: ScalingDecision) -> bool:
+        """
+        Ждёт постановки файла в очередь или страховочного таймаута.
+
+        В простое (нет воркеров и спроса) опрос БД редкий —
+        chain_queue_check_interval; пока есть работа, такты чаще
+        (chain_queue_active_check_interval): паузы автомасштабирования
+        и освобождение памяти событий не порождают.
+
+        Args:
+            decision (ScalingDecision): Решение последнего такта.
+
+        Returns:
+            bool: True — разбужен событием очереди.
+        """
+        idle = decision.current == 0 and decision.desired == 0
+        timeout = (
+            self.settings.chain_queue_check_interval
+            if idle
+            else self.settings.chain_queue_active_check_interval
+        )
+        woke = self.notifier.wait(
+            timeout, settle=self.settings.chain_queue_wakeup_debounce_seconds
+        )
+        if woke:
+            # Кэш глубины мог быть посчитан до commit нового файла
+            invalidate_queue_depth()
+        return woke
+
+    def reprioritize_queue(self) -> int:
+        """Переопубликовывает ждущие задачи, которым старение дало приоритет выше."""
+        from audioscribetranslate.core.tasks import reprioritize_queued_jobs
+
+        try:
+            return reprioritize_queued_jobs()
+        except Exception as e:
+            logger.error(f"Ошибка повышения приоритетов очереди: {e}")
+            return 0
+
+    def reap_abandoned(self) -> int:
+        """Возвращает в очередь файлы с истёкшей арендой (core/leases.py)."""
+        from audioscribetranslate.core.tasks import reap_expired_leases
+
+        try:
+            return reap_expired_leases()
+        except Exception as e:
+            logger.error(f"Ошибка сбора брошенных задач: {e}")
+            return 0
+
+    def drain_pending(self) -> int:
+        """Ставит в очередь отложенные (pending) загрузки по мере освобождения места."""
+        from audioscribetranslate.core.tasks import drain_pending_uploads
+
+        try:
+            return drain_pending_uploads()
+        except Exception as e:
+            logger.error(f"Ошибка постановки отложенных загрузок: {e}")
+            return 0
+
     def log_status(self) -> None:
         """Логирует текущий статус системы."""
         active_workers = len([w for w in self.workers.values() if w.is_running()])
@@ -225,6 +378,8 @@ class ProcessingChainManager:
             return
         
         self.is_running = True
+        if not self.notifier.start_listener():
+            logger.info("Redis для пробуждений не настроен: очередь проверяется опросом")
         self.monitor_thread = threading.Thread(target=self.monitor_and_scale, daemon=True)
         self.monitor_thread.start()
         logger.info("Менеджер цепочек обработки запущен")
@@ -233,9 +388,11 @@ class ProcessingChainManager:
         """Останавливает менеджер и все воркеры."""
         logger.info("Остановка менеджера цепочек обработки...")
         self.is_running = False
+        self.notifier.stop_listener()
+        self.notifier.interrupt()
         
-        # Останавливаем все воркеры
-        for worker in self.workers.values():
+        # Останавливаем все воркеры, включая уже получившие SIGTERM
+        for worker in [*self.workers.values(), *self.stopping.values()]:
             worker.terminate()
         
         # Ждем завершения потока мониторинга
@@ -243,6 +400,7 @@ class ProcessingChainManager:
             self.monitor_thread.join(timeout=30)
         
         self.workers.clear()
+        self.stopping.clear()
         logger.info("Менеджер цепочек обработки остановлен")
 
 
@@ -279,17 +437,11 @@ print(f"[DIAG] MIN_FREE_MEMORY_GB from config: {getattr(settings, 'min_free_memo
 free_mem_gb = psutil.virtual_memory().available / (1024**3)
 
 # Перед запуском очереди:
-from audioscribetranslate.models.audio_file import AudioFile
-
-manager = ProcessingChainManager()
-with manager.SessionLocal() as session:
-    uploaded_files = session.execute(
-        select(AudioFile).where(AudioFile.status == 'uploaded')
-    ).scalars().all()
-    print(f"[DIAG] Файлов со статусом 'uploaded': {len(uploaded_files)}")
-    if not uploaded_files:
-        print("[DIAG] Нет файлов для обработки!")
-    elif free_mem_gb < getattr(settings, 'min_free_memory_gb', 1):
-        print(f"[DIAG] Недостаточно памяти для запуска цепочки! Требуется: {getattr(settings, 'min_free_memory_gb', 1)} GB, доступно: {free_mem_gb:.2f} GB")
-    else:
-        print("[DIAG] Условия для запуска цепочки выполнены, задачи будут поставлены в очередь.")
+uploaded_count = get_queue_depth().by_status.get('uploaded', 0)
+print(f"[DIAG] Файлов со статусом 'uploaded': {uploaded_count}")
+if not uploaded_count:
+    print("[DIAG] Нет файлов для обработки!")
+elif free_mem_gb < getattr(settings, 'min_free_memory_gb', 1):
+    print(f"[DIAG] Недостаточно памяти для запуска цепочки! Требуется: {getattr(settings, 'min_free_memory_gb', 1)} GB, доступно: {free_mem_gb:.2f} GB")
+else:
+    print("[DIAG] Условия для запуска цепочки выполнены, задачи будут поставлены в очередь.")
@@ -1,6 +1,7 @@
 import os
-from functools import lru_cache
-from typing import Any, List, Optional
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
 
 from pydantic import PostgresDsn, RedisDsn
 from pydantic_settings import BaseSettings
@@ -92,7 +93,81 @@ class Settings(BaseSettings):
         max_workers (int): Максимальное количество воркеров цепочек.
         min_free_memory_gb (int): Минимум свободной памяти для запуска воркера.
         enable_processing_chains (bool): Включить обработку цепочками.
-        chain_queue_check_interval (int): Интервал проверки очереди цепочек (сек).
+        chain_queue_check_interval (int): Страховочный опрос очереди в простое (сек);
+            новые файлы будят менеджер сразу (core/queue_notify.py).
+        chain_queue_active_check_interval (int): Опрос, пока есть воркеры или работа (сек).
+        chain_queue_wakeup_debounce_seconds (float): Минимум между тактами при
+            частых пробуждениях (пачка загрузок — один пересчёт).
+        chain_queue_notify_redis (bool): Пробуждать менеджер через Redis pub/sub (redis_url).
+        db_pool_size (int): Размер пула синхронных соединений на процесс воркера.
+        db_max_overflow (int): Дополнительные соединения сверх db_pool_size.
+        db_pool_recycle (int): Пересоздание соединения старше N секунд.
+        db_pool_pre_ping (bool): Проверять соединение перед выдачей из пула.
+        db_pool_timeout (int): Таймаут ожидания свободного соединения (сек).
+        max_upload_size_mb (int): Максимальный размер загружаемого аудиофайла (МБ).
+        upload_chunk_size_kb (int): Размер блока потокового копирования загрузки (КБ).
+        transcription_streaming (bool): Сохранять сегменты транскрипции по мере готовности.
+        transcript_segment_batch_size (int): Сегментов в одной пакетной вставке.
+        long_audio_threshold_seconds (int): С какой длительности включать
+            параллельную транскрипцию по фрагментам (0 — отключено).
+        parallel_transcription_workers (int): Процессов для длинных файлов (0 — авто).
+        whisper_cache_max_mb (int): Бюджет памяти кэша моделей Whisper в процессе
+            (МБ, 0 — без ограничения, вытеснение только по количеству моделей).
+        worker_preload_models (str): Модели для предзагрузки в процессе воркера:
+            список через запятую, "auto" (по недавней статистике загрузок) или "" (выкл.).
+        worker_preload_max_models (int): Максимум моделей для режима "auto".
+        worker_preload_window (int): Сколько последних загрузок учитывать в режиме "auto".
+        transcription_model_queues (bool): Отправлять транскрипцию в очереди
+            transcription.<model>, чтобы воркер держал «горячей» одну модель.
+        worker_share_models (bool): Загружать модели один раз в главном процессе
+            воркера и делить веса между параллельными задачами (pool=threads).
+        scheduler_enabled (bool): Назначать приоритеты по ожидаемой стоимости задачи.
+        scheduler_priority_base_seconds (float): Стоимость, получающая приоритет 0;
+            каждое удвоение стоимости понижает приоритет на уровень.
+        scheduler_aging_seconds (float): За сколько ожидания эффективная стоимость
+            уменьшается вдвое (0 — без старения).
+        scheduler_long_job_seconds (float): С какой стоимости задача уходит в очередь
+            <queue>.long (0 — одна очередь).
+        scheduler_default_duration_seconds (float): Длительность для файлов,
+            длительность которых не удалось определить.
+        scheduler_rtf_cache_seconds (int): Время жизни кэша исторического RTF.
+        queue_depth_cache_seconds (float): Время жизни кэша глубины очереди.
+        transcript_text_chunk_bytes (int): Размер куска при потоковой отдаче
+            текста транскрипта (GET /transcripts/{id}/text).
+        translation_backend (str): Реализация перевода: ctranslate2 (без модели
+            перевод помечается failed) или stub (только для разработки и тестов).
+        translation_models_dir (str): Каталог моделей CTranslate2 для перевода.
+        translation_model_template (str): Имя модели для пары языков ({src}, {tgt}).
+        translation_max_batch_tokens (int): Бюджет мини-батча перевода с паддингом.
+        translation_beam_size (int): Размер луча при переводе (1 — greedy).
+        translation_target_prefix_template (str): Токен целевого языка многоязычной
+            модели (например, "__{tgt}__" для M2M100; "" — модели на пару языков).
+        translation_memory_size (int): Предложений в памяти переводов процесса (0 — выкл.).
+        translation_memory_redis (bool): Общая память переводов в Redis (redis_url).
+        translation_memory_ttl_seconds (int): Время жизни записей памяти переводов.
+        summary_ratio (float): Доля предложений перевода в саммари.
+        summary_max_sentences (int): Максимум предложений в саммари.
+        summary_chunk_sentences (int): Предложений во фрагменте map-reduce суммаризации.
+        autoscaler_min_workers (int): Минимум воркеров цепочек (0 — гасить в простое).
+        autoscaler_target_drain_seconds (float): За сколько секунд должна
+            выполняться прогнозируемая работа очереди (длительность × RTF).
+        autoscaler_max_scale_up_step (int): Воркеров, запускаемых за один такт.
+        autoscaler_scale_up_cooldown_seconds (float): Пауза между запусками.
+        autoscaler_scale_down_cooldown_seconds (float): Сколько спрос держится ниже
+            числа воркеров до остановки одного.
+        autoscaler_hysteresis (float): Ширина полосы без изменений числа воркеров:
+            для уменьшения спрос считается по target_drain / (1 + hysteresis).
+        autoscaler_worker_overhead_mb (int): Память процесса воркера без модели (МБ).
+        admission_enabled (bool): Контроль допуска загрузок (core/admission.py).
+        admission_max_user_work_seconds (float): Незавершённая работа пользователя до 429.
+        admission_max_backlog_work_seconds (float): Общая незавершённая работа до 503.
+        admission_max_queue_work_seconds (float): Работа в брокере, сверх которой
+            новые файлы ждут в статусе pending.
+        admission_drain_batch_size (int): Сколько pending-файлов проверять за такт.
+        lease_ttl_seconds (float): Срок аренды файла в обработке (core/leases.py).
+        lease_heartbeat_seconds (float): Период продления аренды воркером.
+        lease_max_attempts (int): Захватов до пометки failed брошенного файла.
+        lease_reaper_batch_size (int): Брошенных файлов за проход сборщика.
 
     Example:
         settings = Settings()
@@ -116,7 +191,87 @@ class Settings(BaseSettings):
     # Настройки цепочек обработки
     min_free_memory_gb: int = 4  # Минимум свободной памяти для запуска нового воркера
     enable_processing_chains: bool = True  # Включить обработку цепочками
-    chain_queue_check_interval: int = 10  # Интервал проверки очереди цепочек (сек)
+    chain_queue_check_interval: int = 60  # Страховочный опрос очереди в простое (сек)
+    chain_queue_active_check_interval: int = 10
+    chain_queue_wakeup_debounce_seconds: float = 0.25
+    chain_queue_notify_redis: bool = True
+
+    # Пул синхронных соединений (Celery-задачи, менеджер цепочек)
+    db_pool_size: int = 5
+    db_max_overflow: int = 5
+    db_pool_recycle: int = 1800  # Пересоздавать соединения старше 30 минут
+    db_pool_pre_ping: bool = True  # Отбрасывать «мёртвые» соединения до выдачи
+    db_pool_timeout: int = 30
+
+    # Загрузка файлов
+    max_upload_size_mb: int = 2048
+    upload_chunk_size_kb: int = 1024
+
+    # Потоковая транскрипция
+    transcription_streaming: bool = True
+    transcript_segment_batch_size: int = 20
+    long_audio_threshold_seconds: int = 1200  # 20 минут
+    parallel_transcription_workers: int = 0  # 0 = по числу ядер
+    whisper_cache_max_mb: int = 0  # 0 = без бюджета памяти
+
+    # Предзагрузка моделей в воркерах и маршрутизация по моделям
+    worker_preload_models: str = "auto"
+    worker_preload_max_models: int = 1
+    worker_preload_window: int = 200
+    transcription_model_queues: bool = False
+    worker_share_models: bool = False
+
+    # Планирование: короткие задачи первыми, со старением длинных
+    scheduler_enabled: bool = True
+    scheduler_priority_base_seconds: float = 30.0
+    scheduler_aging_seconds: float = 600.0
+    scheduler_long_job_seconds: float = 0.0
+    scheduler_default_duration_seconds: float = 600.0
+    scheduler_rtf_cache_seconds: int = 300
+
+    # Глубина очереди (count(*) по частичному индексу), общий кэш на процесс
+    queue_depth_cache_seconds: float = 2.0
+
+    # Потоковая отдача текста транскрипта кусками (байт UTF-8)
+    transcript_text_chunk_bytes: int = 256 * 1024
+
+    # Перевод (services/translation.py)
+    translation_backend: str = "ctranslate2"
+    translation_models_dir: str = "models/translation"
+    translation_model_template: str = "opus-mt-{src}-{tgt}"
+    translation_max_batch_tokens: int = 4096
+    translation_beam_size: int = 2
+    translation_target_prefix_template: str = ""
+    translation_memory_size: int = 100_000
+    translation_memory_redis: bool = True
+    translation_memory_ttl_seconds: int = 30 * 24 * 3600
+
+    # Суммаризация (services/summarization.py)
+    summary_ratio: float = 0.1
+    summary_max_sentences: int = 15
+    summary_chunk_sentences: int = 300
+
+    # Автомасштабирование воркеров цепочек (core/autoscaler.py)
+    autoscaler_min_workers: int = 0
+    autoscaler_target_drain_seconds: float = 300.0
+    autoscaler_max_scale_up_step: int = 2
+    autoscaler_scale_up_cooldown_seconds: float = 10.0
+    autoscaler_scale_down_cooldown_seconds: float = 180.0
+    autoscaler_hysteresis: float = 0.25
+    autoscaler_worker_overhead_mb: int = 512
+
+    # Контроль допуска загрузок и отложенные файлы (core/admission.py)
+    admission_enabled: bool = True
+    admission_max_user_work_seconds: float = 4 * 3600.0
+    admission_max_backlog_work_seconds: float = 24 * 3600.0
+    admission_max_queue_work_seconds: float = 2 * 3600.0
+    admission_drain_batch_size: int = 50
+
+    # Аренда файлов в обработке и сборщик брошенных задач (core/leases.py)
+    lease_ttl_seconds: float = 120.0
+    lease_heartbeat_seconds: float = 30.0
+    lease_max_attempts: int = 3
+    lease_reaper_batch_size: int = 100
 
     @property
     def whisper_models_list(self) -> list[str]:
@@ -206,9 +361,34 @@ def create_settings(**kwargs: Any) -> Settings:
     return DynamicSettings(**kwargs)
 
 
+# Кэш настроек: ключ — (ENV, env-файл, mtime env-файла)
+_settings_cache: Optional[Settings] = None
+_settings_cache_key: Optional[Tuple[str, str, Optional[int]]] = None
+_settings_override: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def _settings_key() -> Tuple[str, str, Optional[int]]:
+    """
+    Возвращает ключ кэша настроек: ENV, имя env-файла и время его изменения.
+
+    Returns:
+        Tuple[str, str, Optional[int]]: Ключ (mtime None, если файла нет).
+    """
+    env_file = get_env_file()
+    try:
+        mtime: Optional[int] = os.stat(env_file).st_mtime_ns
+    except OSError:
+        mtime = None
+    return os.getenv("ENV", "local"), env_file, mtime
+
+
 def get_settings() -> Settings:
     """
-    Всегда возвращает экземпляр Settings с актуальным env-файлом (без кэширования по ENV).
+    Возвращает закэшированный экземпляр Settings.
+
+    Настройки пересоздаются только при смене ENV или изменении env-файла
+    (по mtime); в остальных случаях вызов стоит одного os.stat.
 
     Returns:
         Settings: Глобальный экземпляр конфигурации.
@@ -216,5 +396,74 @@ def get_settings() -> Settings:
     Example:
         >>> settings = get_settings()
         >>> print(settings.redis_url)
+
+    Pitfalls:
+        - Изменения переменных окружения (кроме ENV) не отслеживаются:
+          после них вызовите reload_settings().
+        - Возвращается общий объект — не изменяйте его поля, используйте
+          override_settings() в тестах.
+    """
+    global _settings_cache, _settings_cache_key
+    override = _settings_override
+    if override is not None:
+        return override
+    key = _settings_key()
+    cached = _settings_cache
+    if cached is not None and _settings_cache_key == key:
+        return cached
+    with _settings_lock:
+        if _settings_cache is None or _settings_cache_key != key:
+            _settings_cache = create_settings()
+            _settings_cache_key = key
+        return _settings_cache
+
+
+def reload_settings() -> Settings:
+    """
+    Принудительно перечитывает настройки из окружения и env-файла.
+
+    Returns:
+        Settings: Новый экземпляр конфигурации.
     """
-    return create_settings()
+    invalidate_settings()
+    return get_settings()
+
+
+def invalidate_settings() -> None:
+    """
+    Сбрасывает кэш настроек; следующий get_settings() создаст их заново.
+    """
+    global _settings_cache, _settings_cache_key
+    with _settings_lock:
+        _settings_cache = None
+        _settings_cache_key = None
+
+
+# Совместимость с прежним API на lru_cache: get_settings.cache_clear()
+get_settings.cache_clear = invalidate_settings  # type: ignore[attr-defined]
+
+
+@contextmanager
+def override_settings(settings: Optional[Settings] = None, **fields: Any) -> Iterator[Settings]:
+    """
+    Временно подменяет результат get_settings() (для тестов).
+
+    Args:
+        settings (Optional[Settings]): Готовый экземпляр; по умолчанию
+            создаётся create_settings(**fields).
+        **fields: Поля Settings для переопределения.
+
+    Yields:
+        Settings: Действующие на время блока настройки.
+
+    Example:
+        >>> with override_settings(max_workers=1) as s:
+        ...     assert get_settings().max_workers == 1
+    """
+    global _settings_override
+    previous = _settings_override
+    _settings_override = settings if settings is not None else create_settings(**fields)
+    try:
+        yield _settings_override
+    finally:
+        _settings_override = previous
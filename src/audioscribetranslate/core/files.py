@@ -17,8 +17,11 @@ def get_uploaded_files_dir() -> str:
     )
 
 
+import hashlib
 import os  # Модуль для работы с файловой системой и путями
-from typing import Sequence
+import tempfile
+from dataclasses import dataclass
+from typing import BinaryIO, Optional, Sequence
 
 
 def create_uploaded_files_structure(
@@ -55,3 +58,119 @@ def create_uploaded_files_structure(
     print(
         f"[INIT] uploaded_files structure created for models: {models} and users: {user_names}"
     )
+
+
+class UploadTooLargeError(ValueError):
+    """Загружаемый файл превышает допустимый размер (max_upload_size_mb)."""
+
+
+@dataclass(frozen=True)
+class StoredUpload:
+    """
+    Результат потокового сохранения загруженного файла.
+
+    Attributes:
+        path (str): Абсолютный путь к сохранённому файлу.
+        size (int): Размер файла в байтах.
+        sha256 (str): SHA-256 содержимого (hex).
+        deduplicated (bool): Файл с таким содержимым уже был на диске.
+    """
+
+    path: str
+    size: int
+    sha256: str
+    deduplicated: bool = False
+
+
+def content_addressed_filename(sha256: str, original_name: Optional[str]) -> str:
+    """
+    Формирует имя файла по хэшу содержимого с расширением исходного файла.
+
+    Args:
+        sha256 (str): SHA-256 содержимого (hex).
+        original_name (Optional[str]): Исходное имя файла (для расширения).
+
+    Returns:
+        str: Имя вида '<sha256><ext>'.
+
+    Example:
+        >>> content_addressed_filename("ab12", "talk.MP3")
+        'ab12.mp3'
+    """
+    ext = os.path.splitext(original_name or "")[1].lower()
+    return f"{sha256}{ext}"
+
+
+def save_upload_stream(
+    src: BinaryIO,
+    target_dir: str,
+    filename: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = 1024 * 1024,
+    original_name: Optional[str] = None,
+) -> StoredUpload:
+    """
+    Копирует поток загрузки на диск фиксированными блоками с подсчётом SHA-256 и размера.
+
+    Файл сначала пишется во временный файл в target_dir, затем атомарно
+    переименовывается (os.replace) в target_dir/filename. Память на загрузку
+    ограничена размером одного блока независимо от размера файла.
+
+    Если filename не задан, файл хранится адресно по содержимому
+    (content_addressed_filename); при наличии такого файла временная копия
+    удаляется, а существующий файл переиспользуется.
+
+    Args:
+        src (BinaryIO): Источник данных (например, UploadFile.file).
+        target_dir (str): Каталог назначения (создаётся при необходимости).
+        filename (Optional[str]): Итоговое имя файла; None — имя по SHA-256.
+        max_bytes (Optional[int]): Максимальный размер файла; None — без ограничения.
+        chunk_size (int): Размер блока чтения в байтах.
+        original_name (Optional[str]): Исходное имя (расширение для имени по хэшу).
+
+    Returns:
+        StoredUpload: Путь, размер и SHA-256 сохранённого файла.
+
+    Raises:
+        UploadTooLargeError: Если размер превысил max_bytes (временный файл удаляется).
+
+    Example:
+        >>> stored = save_upload_stream(upload.file, "/data/base/alice", "a.mp3")
+
+    Warning:
+        Функция блокирующая — из async-кода вызывайте через run_in_threadpool.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix=".upload-", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"Размер файла превышает лимит {max_bytes} байт"
+                    )
+                digest.update(chunk)
+                out.write(chunk)
+        sha256 = digest.hexdigest()
+        deduplicated = False
+        if filename is None:
+            filename = content_addressed_filename(sha256, original_name)
+            deduplicated = os.path.exists(os.path.join(target_dir, filename))
+        final_path = os.path.join(target_dir, filename)
+        if deduplicated:
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, final_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return StoredUpload(
+        path=final_path, size=size, sha256=sha256, deduplicated=deduplicated
+    )
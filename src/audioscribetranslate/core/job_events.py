@@ -0,0 +1,181 @@
+"""
+Журнал переходов статусов и перцентили задержек по стадиям.
+
+Каждая смена статуса аудиофайла, транскрипта, перевода или саммари
+добавляет строку в job_events в той же транзакции, что и сама смена.
+Из пар событий одной сущности считаются:
+    queue_wait — от queued до первого processing (ожидание в очереди);
+    processing — от первого processing до done (время обработки).
+Перцентили считаются в БД (percentile_cont, PostgreSQL) по индексу
+ix_job_events_to_status_created_at, без выгрузки событий в Python.
+
+Example:
+    record_job_event(session, TRANSCRIPT, transcript.id, "done", "processing")
+    session.commit()
+    stats = await stage_latency_percentiles(db, since)
+    stats["processing"]["transcript"]["p90"]  # 41.7
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import Select, and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from audioscribetranslate.models.job_event import JobEvent
+
+# Типы сущностей в job_events.entity_type
+AUDIO_FILE = "audio_file"
+TRANSCRIPT = "transcript"
+TRANSLATION = "translation"
+SUMMARY = "summary"
+
+# Стадия -> (статус начала, статус конца)
+STAGES: Dict[str, Tuple[str, str]] = {
+    "queue_wait": ("queued", "processing"),
+    "processing": ("processing", "done"),
+}
+
+DEFAULT_PERCENTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+
+
+def record_job_event(
+    session: Union[Session, AsyncSession],
+    entity_type: str,
+    entity_id: int,
+    to_status: str,
+    from_status: Optional[str] = None,
+    audio_file_id: Optional[int] = None,
+) -> JobEvent:
+    """
+    Добавляет событие перехода статуса в сессию (без commit).
+
+    Args:
+        session (Union[Session, AsyncSession]): Сессия, в которой меняется статус.
+        entity_type (str): Тип сущности (AUDIO_FILE, TRANSCRIPT, ...).
+        entity_id (int): ID сущности.
+        to_status (str): Новый статус.
+        from_status (Optional[str]): Предыдущий статус, если известен.
+        audio_file_id (Optional[int]): ID исходного аудиофайла.
+
+    Returns:
+        JobEvent: Добавленное событие.
+
+    Pitfalls:
+        Событие фиксируется вместе со сменой статуса, поэтому его нужно
+        добавлять до commit той же транзакции.
+    """
+    event = JobEvent(
+        entity_type=entity_type,
+        entity_id=int(entity_id),
+        audio_file_id=int(audio_file_id) if audio_file_id is not None else None,
+        from_status=from_status,
+        to_status=to_status,
+    )
+    session.add(event)
+    return event
+
+
+def build_stage_latency_query(
+    start_status: str,
+    end_status: str,
+    since: datetime,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> Select[Any]:
+    """
+    Строит запрос перцентилей длительности стадии по типам сущностей.
+
+    Для каждой сущности берётся первое событие start_status и первое событие
+    end_status (повторы после ретраев не удлиняют стадию).
+
+    Args:
+        start_status (str): Статус начала стадии.
+        end_status (str): Статус конца стадии.
+        since (datetime): Учитывать события начиная с этого времени.
+        percentiles (Sequence[float]): Перцентили в долях (0.5, 0.9, ...).
+
+    Returns:
+        Select: Колонки entity_type, count, p<N>... (секунды).
+    """
+    created_at: ColumnElement[datetime] = JobEvent.created_at
+    spans = (
+        select(
+            JobEvent.entity_type,
+            JobEvent.entity_id,
+            func.min(
+                case((JobEvent.to_status == start_status, JobEvent.created_at))
+            ).label("started_at"),
+            func.min(
+                case((JobEvent.to_status == end_status, JobEvent.created_at))
+            ).label("finished_at"),
+        )
+        .where(
+            JobEvent.to_status.in_((start_status, end_status)),
+            created_at >= since,
+        )
+        .group_by(JobEvent.entity_type, JobEvent.entity_id)
+        .subquery()
+    )
+    seconds = func.extract("epoch", spans.c.finished_at - spans.c.started_at)
+    columns = [
+        func.percentile_cont(p).within_group(seconds).label(percentile_label(p))
+        for p in percentiles
+    ]
+    return (
+        select(spans.c.entity_type, func.count().label("count"), *columns)
+        .where(
+            and_(
+                spans.c.started_at.is_not(None),
+                spans.c.finished_at >= spans.c.started_at,
+            )
+        )
+        .group_by(spans.c.entity_type)
+    )
+
+
+def percentile_label(p: float) -> str:
+    """
+    Возвращает имя колонки перцентиля.
+
+    Example:
+        >>> percentile_label(0.5), percentile_label(0.999)
+        ('p50', 'p99.9')
+    """
+    return "p" + f"{p * 100:g}"
+
+
+async def stage_latency_percentiles(
+    session: AsyncSession,
+    since: datetime,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Считает перцентили ожидания и обработки по стадиям.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия БД (PostgreSQL).
+        since (datetime): Начало окна наблюдения.
+        percentiles (Sequence[float]): Перцентили в долях.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, float]]]: Стадия -> тип сущности ->
+            {"count": N, "p50": сек, ...}.
+    """
+    result: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for stage, (start_status, end_status) in STAGES.items():
+        rows = (
+            await session.execute(
+                build_stage_latency_query(start_status, end_status, since, percentiles)
+            )
+        ).mappings()
+        stage_stats: Dict[str, Dict[str, float]] = {}
+        for row in rows:
+            stats: Dict[str, float] = {"count": int(row["count"])}
+            for p in percentiles:
+                value = row[percentile_label(p)]
+                stats[percentile_label(p)] = round(float(value), 3)
+            stage_stats[str(row["entity_type"])] = stats
+        result[stage] = stage_stats
+    return result
@@ -0,0 +1,308 @@
+"""
+Аренда (lease) задач в обработке: владелец, срок, пульс, попытки.
+
+Воркер, берущий файл в обработку, атомарно захватывает строку условным
+UPDATE: статус processing, lease_owner, lease_expires_at = now + ttl,
+attempts + 1 — только если строку никто не держит (аренды нет или она
+истекла). Пока задача идёт, фоновый поток LeaseHeartbeat продлевает аренду
+каждые heartbeat_seconds отдельной короткой сессией, поэтому продление не
+зависит от того, чем занят основной поток (Whisper, пул процессов).
+
+Если воркер упал, аренда перестаёт продлеваться и истекает. Сборщик
+(reap_expired_leases в tasks, цикл менеджера цепочек) находит такие строки
+запросом expired_leases_query и возвращает их в очередь, а после
+max_attempts попыток помечает failed. Повторная доставка того же сообщения
+брокером (acks_late) не запускает вторую обработку: захват не удастся,
+пока жива аренда первого воркера.
+
+Модель должна иметь колонки status, lease_owner, lease_expires_at,
+heartbeat_at и attempts (AudioFile).
+
+Example:
+    owner = new_lease_owner()
+    if claim_lease(session, AudioFile, audio_id, owner, ttl_seconds=120):
+        session.commit()
+        with LeaseHeartbeat(SyncSessionLocal, AudioFile, audio_id, owner, 120, 30):
+            ...долгая работа...
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Set, Type, cast
+
+from sqlalchemy import CursorResult, or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from audioscribetranslate.core.pagination import AnySelect
+
+logger = logging.getLogger(__name__)
+
+PROCESSING_STATUS = "processing"
+
+
+class LeaseLostError(RuntimeError):
+    """Аренду забрал другой воркер или сборщик: результат записывать нельзя."""
+
+
+def new_lease_owner() -> str:
+    """
+    Уникальный владелец аренды: хост, PID и случайный суффикс.
+
+    Example:
+        >>> new_lease_owner()  # doctest: +SKIP
+        'worker-1:4242:9f2c1a7b'
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def released_lease_values() -> Dict[str, Any]:
+    """Значения колонок для снятия аренды (в том же UPDATE, что и финальный статус)."""
+    return {"lease_owner": None, "lease_expires_at": None}
+
+
+def claim_lease(
+    session: Session,
+    model: Type[Any],
+    row_id: int,
+    owner: str,
+    ttl_seconds: float,
+    now: Optional[datetime] = None,
+) -> bool:
+    """
+    Захватывает строку в обработку (без commit).
+
+    Захват удаётся, если строка не done и её аренда отсутствует, истекла или
+    уже принадлежит owner. Статус становится processing, attempts растёт на 1.
+
+    Args:
+        session (Session): Синхронная сессия БД.
+        model (Type): ORM-модель с колонками аренды.
+        row_id (int): ID строки.
+        owner (str): Владелец (new_lease_owner()).
+        ttl_seconds (float): Срок аренды.
+        now (Optional[datetime]): Текущее время (UTC), для тестов.
+
+    Returns:
+        bool: True — строка захвачена этим владельцем.
+    """
+    now = now or _now()
+    result = session.execute(
+        update(model)
+        .where(
+            model.id == row_id,
+            model.status != "done",
+            or_(
+                model.lease_expires_at.is_(None),
+                model.lease_expires_at < now,
+                model.lease_owner == owner,
+            ),
+        )
+        .values(
+            status=PROCESSING_STATUS,
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=ttl_seconds),
+            heartbeat_at=now,
+            attempts=model.attempts + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return bool(cast(CursorResult[Any], result).rowcount)
+
+
+def renew_lease(
+    session: Session,
+    model: Type[Any],
+    row_id: int,
+    owner: str,
+    ttl_seconds: float,
+    now: Optional[datetime] = None,
+) -> bool:
+    """
+    Продлевает аренду, если она всё ещё принадлежит owner (без commit).
+
+    Returns:
+        bool: False — аренду забрал сборщик или строка уже не в обработке.
+    """
+    now = now or _now()
+    result = session.execute(
+        update(model)
+        .where(
+            model.id == row_id,
+            model.lease_owner == owner,
+            model.status == PROCESSING_STATUS,
+        )
+        .values(lease_expires_at=now + timedelta(seconds=ttl_seconds), heartbeat_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return bool(cast(CursorResult[Any], result).rowcount)
+
+
+def abandoned_clause(model: Type[Any], now: datetime) -> ColumnElement[bool]:
+    """
+    Условие «брошена»: в обработке, а аренда истекла или её нет.
+
+    Строки processing без аренды остались от воркеров до появления аренды.
+    """
+    clause: ColumnElement[bool] = (model.status == PROCESSING_STATUS) & or_(
+        model.lease_expires_at.is_(None), model.lease_expires_at < now
+    )
+    return clause
+
+
+def expired_leases_query(
+    model: Type[Any], now: datetime, limit: int = 100, *columns: Any
+) -> AnySelect:
+    """
+    Запрос брошенных строк для сборщика.
+
+    Args:
+        model (Type): ORM-модель с колонками аренды.
+        now (datetime): Текущее время (UTC).
+        limit (int): Максимум строк за проход.
+        *columns: Дополнительные колонки (например, модель Whisper).
+
+    Returns:
+        AnySelect: Колонки id, attempts, lease_owner и columns.
+    """
+    return (
+        select(model.id, model.attempts, model.lease_owner, *columns)
+        .where(abandoned_clause(model, now))
+        .order_by(model.id)
+        .limit(limit)
+    )
+
+
+def held_lease_pids(
+    session: Session,
+    model: Type[Any],
+    hostname: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> Set[int]:
+    """
+    PID процессов хоста, держащих живую аренду (занятые воркеры).
+
+    Владелец аренды — "хост:pid:суффикс" (new_lease_owner); у воркера
+    с --pool=solo задача идёт в главном процессе, так что PID совпадает
+    с PID запущенного менеджером процесса.
+
+    Args:
+        session (Session): Синхронная сессия.
+        model (Type[Any]): ORM-модель с колонками аренды.
+        hostname (Optional[str]): Хост (по умолчанию текущий).
+        now (Optional[datetime]): Текущее время (UTC).
+
+    Returns:
+        Set[int]: PID владельцев неистёкших аренд.
+    """
+    host = hostname or socket.gethostname()
+    owners = session.execute(
+        select(model.lease_owner).where(
+            model.status == PROCESSING_STATUS,
+            model.lease_owner.like(f"{host}:%"),
+            model.lease_expires_at >= (now or _now()),
+        )
+    ).scalars()
+    pids: Set[int] = set()
+    for owner in owners:
+        parts = str(owner).rsplit(":", 2)
+        if len(parts) == 3 and parts[1].isdigit():
+            pids.add(int(parts[1]))
+    return pids
+
+
+class LeaseHeartbeat:
+    """
+    Фоновое продление аренды на время работы задачи.
+
+    Attributes:
+        lost (bool): Аренду забрали (продление не удалось) — работу, скорее
+            всего, уже выполняет другой воркер.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        model: Type[Any],
+        row_id: int,
+        owner: str,
+        ttl_seconds: float,
+        interval_seconds: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._model = model
+        self._row_id = row_id
+        self._owner = owner
+        self._ttl_seconds = ttl_seconds
+        self._interval = max(interval_seconds, 0.01)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.lost = False
+
+    def beat(self) -> bool:
+        """Одно продление аренды; ошибки БД не прерывают задачу."""
+        try:
+            with self._session_factory() as session:
+                renewed = renew_lease(
+                    session, self._model, self._row_id, self._owner, self._ttl_seconds
+                )
+                session.commit()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("[LEASE] Heartbeat failed for %s: %s", self._row_id, e)
+            return False
+        if not renewed and not self.lost:
+            self.lost = True
+            logger.warning(
+                "[LEASE] Lease for %s %s lost by %s",
+                self._model.__tablename__,
+                self._row_id,
+                self._owner,
+            )
+        return renewed
+
+    def raise_if_lost(self) -> None:
+        """
+        Прерывает задачу, если аренда потеряна (перед записью результата).
+
+        Raises:
+            LeaseLostError: Продление не удалось, строку держит другой владелец.
+        """
+        if self.lost:
+            raise LeaseLostError(
+                f"Lease for {self._model.__tablename__} {self._row_id} "
+                f"lost by {self._owner}"
+            )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            if not self.beat() and self.lost:
+                return
+
+    def start(self) -> "LeaseHeartbeat":
+        """Запускает поток продления."""
+        self._thread = threading.Thread(
+            target=self._run, name=f"lease-heartbeat-{self._row_id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Останавливает поток продления (аренду снимает финальный UPDATE задачи)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval + 5.0)
+            self._thread = None
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
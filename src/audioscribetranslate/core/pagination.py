@@ -0,0 +1,328 @@
+"""
+Keyset (курсорная) пагинация списков.
+
+OFFSET заставляет БД прочитать и отбросить все строки предыдущих страниц,
+поэтому глубокие страницы дорожают линейно. Курсор запоминает значение
+колонки сортировки и id последней строки страницы, и следующая страница
+начинается условием (order_col, id) > (value, id) по индексу — страница
+10 000 стоит столько же, сколько первая. count(*) считается только при
+include_total=true.
+
+Курсор непрозрачен для клиента: base64url от JSON
+{"o": order_by, "d": order_dir, "v": значение, "i": id}. Курсор привязан к
+сортировке: с другим order_by/order_dir он отклоняется (InvalidCursorError).
+
+Порядок NULL такой же, как у индексов PostgreSQL по умолчанию: ASC NULLS
+LAST, DESC NULLS FIRST (обратный проход того же индекса).
+
+Example:
+    rows, page = await paginate(
+        db, select(AudioFile), select(func.count(AudioFile.id)),
+        order_by="upload_time", order_col=AudioFile.upload_time, id_col=AudioFile.id,
+        order_dir="desc", limit=20, cursor=request_cursor,
+    )
+    return {"items": [...], **page}   # total, limit, offset, next_cursor
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, and_, asc, desc, literal, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+from typing_extensions import Unpack
+
+MAX_LIMIT = 100
+
+# Запрос с произвольным набором колонок (Select типизирован по каждой колонке)
+AnySelect = Select[Unpack[Tuple[Any, ...]]]
+
+
+class InvalidCursorError(ValueError):
+    """Курсор повреждён или не соответствует сортировке запроса."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if set(value) != {"dt"}:
+            raise InvalidCursorError("Unsupported cursor value")
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(order_by: str, order_dir: str, value: Any, row_id: int) -> str:
+    """
+    Кодирует позицию последней строки страницы в непрозрачный курсор.
+
+    Args:
+        order_by (str): Имя поля сортировки.
+        order_dir (str): Направление сортировки (asc|desc).
+        value (Any): Значение поля сортировки в последней строке.
+        row_id (int): id последней строки.
+
+    Returns:
+        str: base64url-строка без паддинга.
+    """
+    payload = {
+        "o": order_by,
+        "d": order_dir,
+        "v": _encode_value(value),
+        "i": int(row_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, order_by: str, order_dir: str) -> Tuple[Any, int]:
+    """
+    Декодирует курсор и проверяет, что он выдан для той же сортировки.
+
+    Args:
+        cursor (str): Курсор из next_cursor предыдущего ответа.
+        order_by (str): Текущее поле сортировки.
+        order_dir (str): Текущее направление сортировки.
+
+    Returns:
+        Tuple[Any, int]: (значение поля сортировки, id).
+
+    Raises:
+        InvalidCursorError: Курсор повреждён или выдан для другой сортировки.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        value = _decode_value(payload["v"])
+        row_id = int(payload["i"])
+        cursor_order = (payload["o"], payload["d"])
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+    if cursor_order != (order_by, order_dir):
+        raise InvalidCursorError("Cursor does not match order_by/order_dir")
+    return value, row_id
+
+
+def _selects_entity(stmt: AnySelect) -> bool:
+    """True для select(Model) (ORM-объекты), False для выборки колонок (Row)."""
+    descriptions = stmt.column_descriptions
+    return (
+        len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]
+    )
+
+
+def order_clauses(
+    order_col: ColumnElement[Any], id_col: ColumnElement[Any], descending: bool
+) -> List[ColumnElement[Any]]:
+    """
+    Возвращает ORDER BY с id как tie-breaker (детерминированный порядок).
+
+    Args:
+        order_col (ColumnElement[Any]): Колонка сортировки.
+        id_col (ColumnElement[Any]): Первичный ключ.
+        descending (bool): Сортировка по убыванию.
+
+    Returns:
+        List[ColumnElement[Any]]: Выражения для order_by().
+    """
+    if descending:
+        if order_col is id_col:
+            return [desc(id_col)]
+        return [desc(order_col).nulls_first(), desc(id_col)]
+    if order_col is id_col:
+        return [asc(id_col)]
+    return [asc(order_col).nulls_last(), asc(id_col)]
+
+
+def _is_nullable(column: ColumnElement[Any]) -> bool:
+    expression = getattr(column, "expression", column)
+    return bool(getattr(expression, "nullable", True))
+
+
+def keyset_condition(
+    order_col: ColumnElement[Any],
+    id_col: ColumnElement[Any],
+    descending: bool,
+    value: Any,
+    row_id: int,
+) -> ColumnElement[bool]:
+    """
+    Строит условие "строки после (value, row_id)" в порядке order_clauses().
+
+    Args:
+        order_col (ColumnElement[Any]): Колонка сортировки.
+        id_col (ColumnElement[Any]): Первичный ключ.
+        descending (bool): Сортировка по убыванию.
+        value (Any): Значение колонки сортировки последней строки.
+        row_id (int): id последней строки.
+
+    Returns:
+        ColumnElement[bool]: Условие WHERE для следующей страницы.
+
+    Pitfalls:
+        NULL в колонке сортировки идут последними при ASC и первыми при DESC,
+        поэтому для nullable колонок добавляется отдельная ветка IS NULL.
+    """
+    if order_col is id_col:
+        return id_col < row_id if descending else id_col > row_id
+    if value is None:
+        after_id = id_col < row_id if descending else id_col > row_id
+        after_null = and_(order_col.is_(None), after_id)
+        # DESC: после группы NULL идут все непустые значения
+        return or_(after_null, order_col.is_not(None)) if descending else after_null
+    # Типизированные параметры: значение проходит тот же bind processor, что и колонка
+    position = tuple_(literal(value, order_col.type), literal(row_id, id_col.type))
+    if descending:
+        return tuple_(order_col, id_col) < position
+    condition = tuple_(order_col, id_col) > position
+    if _is_nullable(order_col):
+        # ASC: группа NULL идёт после всех непустых значений
+        return or_(condition, order_col.is_(None))
+    return condition
+
+
+def build_page_query(
+    stmt: AnySelect,
+    order_by: str,
+    order_col: ColumnElement[Any],
+    id_col: ColumnElement[Any],
+    order_dir: str,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> AnySelect:
+    """
+    Добавляет к запросу сортировку, курсор (или OFFSET) и LIMIT limit + 1.
+
+    Лишняя строка нужна, чтобы узнать, есть ли следующая страница, без count(*).
+
+    Args:
+        stmt (Select): Запрос с уже применёнными фильтрами.
+        order_by (str): Имя поля сортировки (для курсора).
+        order_col (ColumnElement[Any]): Колонка сортировки.
+        id_col (ColumnElement[Any]): Первичный ключ.
+        order_dir (str): Направление сортировки (asc|desc).
+        limit (int): Размер страницы.
+        offset (int): Смещение (игнорируется при наличии курсора).
+        cursor (Optional[str]): Курсор следующей страницы.
+
+    Returns:
+        Select: Запрос страницы.
+
+    Raises:
+        InvalidCursorError: Некорректный курсор.
+    """
+    descending = order_dir == "desc"
+    if not _selects_entity(stmt):
+        # Выборка колонок: значения для курсора должны быть в строке
+        selected = set(stmt.selected_columns.keys())
+        for column in (order_col, id_col):
+            if column.key not in selected:
+                stmt = stmt.add_columns(column)
+    stmt = stmt.order_by(*order_clauses(order_col, id_col, descending))
+    if cursor:
+        value, row_id = decode_cursor(cursor, order_by, order_dir)
+        stmt = stmt.where(
+            keyset_condition(order_col, id_col, descending, value, row_id)
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt.limit(limit + 1)
+
+
+def make_page(
+    rows: Sequence[Any],
+    order_by: str,
+    order_col: ColumnElement[Any],
+    id_col: ColumnElement[Any],
+    order_dir: str,
+    limit: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Отрезает лишнюю строку и формирует курсор следующей страницы.
+
+    Args:
+        rows (Sequence[Any]): До limit + 1 строк (ORM-объекты или Row).
+        order_by (str): Имя поля сортировки.
+        order_col (ColumnElement[Any]): Колонка сортировки.
+        id_col (ColumnElement[Any]): Первичный ключ.
+        order_dir (str): Направление сортировки.
+        limit (int): Размер страницы.
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: (строки страницы, next_cursor или None).
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    order_key, id_key = order_col.key, id_col.key
+    if order_key is None or id_key is None:
+        raise ValueError("Колонки сортировки и ключа должны иметь имя (key)")
+    last = page[-1]
+    return page, encode_cursor(
+        order_by, order_dir, getattr(last, order_key), getattr(last, id_key)
+    )
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: AnySelect,
+    count_stmt: AnySelect,
+    order_by: str,
+    order_col: ColumnElement[Any],
+    id_col: ColumnElement[Any],
+    order_dir: str = "desc",
+    limit: int = 20,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    Выполняет запрос страницы списка (курсор или OFFSET) и, опционально, count(*).
+
+    Args:
+        db (AsyncSession): Сессия базы данных.
+        stmt (Select): Запрос с фильтрами (без сортировки и лимита).
+        count_stmt (Select): count(*) с теми же фильтрами.
+        order_by (str): Имя поля сортировки (уже проверенное по order_map).
+        order_col (ColumnElement[Any]): Колонка сортировки.
+        id_col (ColumnElement[Any]): Первичный ключ.
+        order_dir (str): Направление сортировки (asc|desc).
+        limit (int): Размер страницы (1..MAX_LIMIT).
+        offset (int): Смещение для совместимости со старыми клиентами.
+        cursor (Optional[str]): Курсор из next_cursor.
+        include_total (bool): Считать ли total (count(*)).
+
+    Returns:
+        Tuple[List[Any], Dict[str, Any]]: Строки страницы и поля ответа
+            {total, limit, offset, next_cursor}. total = None при
+            include_total=false, offset = None в курсорном режиме.
+
+    Raises:
+        InvalidCursorError: Некорректный курсор (роутер отвечает 400).
+    """
+    limit = min(max(limit, 1), MAX_LIMIT)
+    offset = max(offset, 0)
+    order_dir = "desc" if order_dir.lower() == "desc" else "asc"
+    page_stmt = build_page_query(
+        stmt, order_by, order_col, id_col, order_dir, limit, offset, cursor
+    )
+    result = await db.execute(page_stmt)
+    rows = result.scalars().all() if _selects_entity(stmt) else result.all()
+    page, next_cursor = make_page(rows, order_by, order_col, id_col, order_dir, limit)
+    total = (await db.execute(count_stmt)).scalar_one() if include_total else None
+    return page, {
+        "total": total,
+        "limit": limit,
+        "offset": None if cursor else offset,
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,204 @@
+"""
+Модуль предзагрузки моделей Whisper в процессах Celery-воркеров.
+
+Дочерние процессы prefork-воркера пересоздаются каждые
+worker_max_tasks_per_child задач, и первая задача в новом процессе платит
+полную загрузку модели. Предзагрузка в сигнале worker_process_init переносит
+эту стоимость на старт процесса, а закрепление (pin) не даёт LRU-кэшу вытеснить
+модель разовыми запросами других моделей.
+
+Какие модели грузить:
+    0. Воркер не слушает ни transcription*, ни processing_chains* (перевод,
+       саммари) — ничего: Whisper ему не нужен;
+    1. Воркер слушает очереди transcription.<model> — модели этих очередей;
+    2. worker_preload_models = "auto" — самые частые модели среди последних
+       worker_preload_window загрузок (AudioFile.whisper_model);
+    3. иначе — явный список через запятую ("" — предзагрузка выключена).
+
+Совместное использование весов (worker_share_models):
+    Модель CTranslate2 держит собственные рабочие потоки, которые не переживают
+    fork, поэтому загруженную в родителе модель нельзя использовать в дочерних
+    prefork-процессах. Вместо этого воркер запускается с pool=threads: модели
+    грузятся один раз в главном процессе, а параллельные задачи делят одну
+    копию весов (WhisperModel(num_workers=concurrency)).
+
+Example:
+    models = resolve_preload_models(get_settings(), consumed_queues=["transcription.base"])
+    warm_up_models(models)  # ['base']
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import psutil
+from sqlalchemy import select
+
+from audioscribetranslate.core.config import Settings
+from audioscribetranslate.db.sync_session import SyncSessionLocal
+from audioscribetranslate.models.audio_file import AudioFile
+
+logger = logging.getLogger(__name__)
+
+# Базовое имя очереди транскрипции; модельные очереди: transcription.<model>
+TRANSCRIPTION_QUEUE = "transcription"
+
+# Очереди задач с Whisper (вместе с производными .<model> и .long)
+WHISPER_QUEUE_PREFIXES = (TRANSCRIPTION_QUEUE, "processing_chains")
+
+# Значение worker_preload_models для выбора моделей по статистике загрузок
+AUTO_PRELOAD = "auto"
+
+
+def model_queue_name(model_name: str) -> str:
+    """
+    Возвращает имя очереди транскрипции для конкретной модели.
+
+    Args:
+        model_name (str): Название модели Whisper.
+
+    Returns:
+        str: Имя очереди, например 'transcription.base'.
+    """
+    return f"{TRANSCRIPTION_QUEUE}.{model_name}"
+
+
+def models_from_queues(queue_names: Iterable[str]) -> List[str]:
+    """
+    Извлекает модели из имён очередей вида transcription.<model>.
+
+    Args:
+        queue_names (Iterable[str]): Очереди, которые слушает воркер.
+
+    Returns:
+        List[str]: Модели в порядке появления очередей, без повторов.
+
+    Example:
+        >>> models_from_queues(["transcription.large", "translation"])
+        ['large']
+    """
+    prefix = TRANSCRIPTION_QUEUE + "."
+    models: List[str] = []
+    for name in queue_names:
+        if name.startswith(prefix):
+            model = name[len(prefix) :]
+            if model and model not in models:
+                models.append(model)
+    return models
+
+
+def consumes_whisper_queues(queue_names: Iterable[str]) -> bool:
+    """
+    Проверяет, слушает ли воркер очереди, задачам которых нужен Whisper.
+
+    Example:
+        >>> consumes_whisper_queues(["translation", "summarization"])
+        False
+    """
+    return any(name.startswith(WHISPER_QUEUE_PREFIXES) for name in queue_names)
+
+
+def recent_model_mix(window: int) -> List[str]:
+    """
+    Возвращает модели из последних загрузок, отсортированные по частоте.
+
+    Args:
+        window (int): Сколько последних AudioFile учитывать.
+
+    Returns:
+        List[str]: Модели от самой частой к самой редкой.
+    """
+    with SyncSessionLocal() as session:
+        rows: List[str] = list(
+            session.execute(
+                select(AudioFile.whisper_model)
+                .order_by(AudioFile.id.desc())
+                .limit(window)
+            ).scalars()
+        )
+        counts = Counter(model for model in rows if model)
+    return [model for model, _ in counts.most_common()]
+
+
+def resolve_preload_models(
+    settings: Settings, consumed_queues: Optional[Iterable[str]] = None
+) -> List[str]:
+    """
+    Определяет, какие модели предзагрузить в процессе воркера.
+
+    Args:
+        settings (Settings): Настройки приложения.
+        consumed_queues (Optional[Iterable[str]]): Очереди, которые слушает воркер
+            (None — неизвестны, выбор только по настройкам).
+
+    Returns:
+        List[str]: Модели для предзагрузки (только из whisper_models_list);
+            пусто, если воркер не слушает очереди транскрипции и цепочек.
+
+    Pitfalls:
+        Ошибка чтения статистики в режиме "auto" не прерывает старт воркера:
+        в этом случае грузится первая модель из whisper_models_list.
+    """
+    queues = list(consumed_queues) if consumed_queues is not None else None
+    if queues is not None and not consumes_whisper_queues(queues):
+        return []
+    allowed = settings.whisper_models_list
+    queue_models = [m for m in models_from_queues(queues or []) if m in allowed]
+    if queue_models:
+        return queue_models
+
+    configured = settings.worker_preload_models.strip()
+    if not configured:
+        return []
+    if configured.lower() != AUTO_PRELOAD:
+        return [m.strip() for m in configured.split(",") if m.strip() in allowed]
+
+    limit = max(settings.worker_preload_max_models, 0)
+    try:
+        mix = [
+            m for m in recent_model_mix(settings.worker_preload_window) if m in allowed
+        ]
+    except Exception as e:  # noqa: BLE001
+        logger.warning("[PRELOAD] Failed to read recent model mix: %s", e)
+        mix = []
+    return (mix or allowed[:1])[:limit]
+
+
+def process_memory_snapshot() -> Dict[str, float]:
+    """
+    Снимает показатели памяти текущего процесса в мегабайтах.
+
+    Returns:
+        Dict[str, float]: rss — резидентная память (включая общие страницы),
+            uss — уникальная для процесса, pss — пропорциональная доля общих
+            страниц (только Linux). USS/PSS отсутствуют, если недоступны.
+
+    Example:
+        >>> process_memory_snapshot()["rss"] > 0
+        True
+    """
+    mb = 1024 * 1024
+    process = psutil.Process()
+    try:
+        info = process.memory_full_info()
+    except (psutil.AccessDenied, psutil.Error, OSError):
+        info = process.memory_info()
+    snapshot = {"rss": info.rss / mb}
+    for field in ("uss", "pss"):
+        value = getattr(info, field, None)
+        if value is not None:
+            snapshot[field] = value / mb
+    return snapshot
+
+
+def format_memory_snapshot(snapshot: Dict[str, float]) -> str:
+    """
+    Форматирует снимок памяти для логов.
+
+    Args:
+        snapshot (Dict[str, float]): Результат process_memory_snapshot().
+
+    Returns:
+        str: Строка вида 'rss=512.0MB uss=128.0MB pss=300.5MB'.
+    """
+    return " ".join(f"{key}={value:.1f}MB" for key, value in snapshot.items())
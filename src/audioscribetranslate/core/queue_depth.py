@@ -0,0 +1,156 @@
+"""
+Сервис глубины очереди аудиофайлов.
+
+Считает ждущие и обрабатываемые файлы одним агрегирующим запросом
+SELECT status, whisper_model, count(*) ... GROUP BY по частичному индексу
+ix_audio_files_active_status (только активные статусы), без загрузки строк
+ORM и их связей. Результат кэшируется на queue_depth_cache_seconds и
+общий для менеджера цепочек, задач и эндпоинтов мониторинга процесса.
+
+Example:
+    depth = get_queue_depth()
+    depth.queued                  # 42
+    depth.by_model["large"]       # 3
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from audioscribetranslate.core.config import get_settings
+from audioscribetranslate.db.sync_session import SyncSessionLocal
+from audioscribetranslate.models.audio_file import AudioFile
+
+logger = logging.getLogger(__name__)
+
+# Статусы, покрытые частичным индексом (должны совпадать с миграцией)
+ACTIVE_STATUSES: Tuple[str, ...] = ("uploaded", "pending", "queued", "processing")
+
+
+@dataclass(frozen=True)
+class QueueDepth:
+    """
+    Снимок глубины очереди.
+
+    Attributes:
+        by_status (Dict[str, int]): Количество файлов по активным статусам.
+        by_model (Dict[str, int]): Количество ждущих (queued) файлов по моделям.
+        cost_by_model (Dict[str, float]): Сумма expected_cost_seconds ждущих
+            файлов по моделям (оценка планировщика: длительность × RTF).
+        unpriced_by_model (Dict[str, int]): Ждущие файлы без оценки стоимости.
+        computed_at (float): Время расчёта (time.monotonic()).
+    """
+
+    by_status: Dict[str, int] = field(default_factory=dict)
+    by_model: Dict[str, int] = field(default_factory=dict)
+    cost_by_model: Dict[str, float] = field(default_factory=dict)
+    unpriced_by_model: Dict[str, int] = field(default_factory=dict)
+    computed_at: float = 0.0
+
+    @property
+    def queued(self) -> int:
+        """Количество файлов со статусом queued."""
+        return self.by_status.get("queued", 0)
+
+    def as_dict(self) -> Dict[str, object]:
+        """Представление для JSON-ответов мониторинга."""
+        return {
+            "queued": self.queued,
+            "by_status": dict(self.by_status),
+            "by_model": dict(self.by_model),
+            "cost_seconds_by_model": {
+                k: round(v, 1) for k, v in self.cost_by_model.items()
+            },
+            "age_seconds": round(max(time.monotonic() - self.computed_at, 0.0), 3),
+        }
+
+
+def count_queue_depth(session: Session) -> QueueDepth:
+    """
+    Считает глубину очереди одним GROUP BY запросом.
+
+    Args:
+        session (Session): Синхронная сессия БД.
+
+    Returns:
+        QueueDepth: Разбивка по статусам и моделям.
+    """
+    rows: Sequence[Any] = session.execute(
+        select(
+            AudioFile.status,
+            AudioFile.whisper_model,
+            func.count(),
+            func.sum(AudioFile.expected_cost_seconds),
+            func.count(AudioFile.expected_cost_seconds),
+        )
+        .where(AudioFile.status.in_(ACTIVE_STATUSES))
+        .group_by(AudioFile.status, AudioFile.whisper_model)
+    ).all()
+    by_status: Dict[str, int] = {status: 0 for status in ACTIVE_STATUSES}
+    by_model: Dict[str, int] = {}
+    cost_by_model: Dict[str, float] = {}
+    unpriced_by_model: Dict[str, int] = {}
+    for status, model, count, cost, priced in rows:
+        by_status[status] = by_status.get(status, 0) + int(count)
+        if status == "queued":
+            key = str(model)
+            by_model[key] = by_model.get(key, 0) + int(count)
+            cost_by_model[key] = cost_by_model.get(key, 0.0) + float(cost or 0.0)
+            missing = int(count) - int(priced)
+            if missing:
+                unpriced_by_model[key] = unpriced_by_model.get(key, 0) + missing
+    return QueueDepth(
+        by_status=by_status,
+        by_model=by_model,
+        cost_by_model=cost_by_model,
+        unpriced_by_model=unpriced_by_model,
+        computed_at=time.monotonic(),
+    )
+
+
+_cached: Optional[QueueDepth] = None
+_lock = threading.Lock()
+
+
+def get_queue_depth(max_age: Optional[float] = None) -> QueueDepth:
+    """
+    Возвращает глубину очереди из кэша или пересчитывает её.
+
+    Args:
+        max_age (Optional[float]): Допустимый возраст кэша в секундах
+            (по умолчанию queue_depth_cache_seconds из настроек).
+
+    Returns:
+        QueueDepth: Снимок глубины очереди. При ошибке БД — последний
+            известный снимок или пустой.
+    """
+    global _cached
+    if max_age is None:
+        max_age = get_settings().queue_depth_cache_seconds
+    cached = _cached
+    if cached is not None and time.monotonic() - cached.computed_at <= max_age:
+        return cached
+    with _lock:
+        # Пока ждали блокировку, другой поток мог уже пересчитать
+        cached = _cached
+        if cached is not None and time.monotonic() - cached.computed_at <= max_age:
+            return cached
+        try:
+            with SyncSessionLocal() as session:
+                _cached = count_queue_depth(session)
+        except Exception as e:  # noqa: BLE001
+            logger.error("[QUEUE] Failed to count queue depth: %s", e)
+            return cached or QueueDepth()
+        return _cached
+
+
+def invalidate_queue_depth() -> None:
+    """Сбрасывает кэш (например, сразу после постановки файла в очередь)."""
+    global _cached
+    with _lock:
+        _cached = None
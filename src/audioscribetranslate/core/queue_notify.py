@@ -0,0 +1,227 @@
+"""
+Мгновенное пробуждение менеджера цепочек при постановке файлов в очередь.
+
+Пути постановки (загрузка файла, enqueue_audio_chain) вызывают
+notify_queue_changed(): локальное threading.Event будит ожидающих в том же
+процессе сразу, а публикация в канал Redis — менеджер цепочек в другом
+процессе (manage.py). Менеджер ждёт wait(timeout) вместо time.sleep, поэтому
+файл, загруженный в простаивающую систему, видит за доли секунды, а опрос БД
+остаётся только страховкой (chain_queue_check_interval) на случай потерянного
+сообщения: pub/sub Redis не хранит сообщения для отключённых подписчиков.
+
+Ошибки Redis не мешают постановке: публикация отключается на
+REMOTE_RETRY_SECONDS, слушатель переподключается с той же паузой и после
+переподключения один раз будит менеджер (сообщения могли потеряться).
+
+Example:
+    notifier = get_queue_notifier()
+    notifier.start_listener()          # в процессе менеджера
+    if notifier.wait(60.0): ...        # разбужен событием, а не таймаутом
+    notify_queue_changed("upload")     # в API/задачах после commit
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from audioscribetranslate.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+redis: Optional[Any] = None
+
+try:
+    import redis
+except ImportError:
+    logger.debug("redis не установлен - пробуждение очереди только в процессе")
+
+QUEUE_CHANNEL = "audioscribetranslate:queue"
+REMOTE_RETRY_SECONDS = 30.0
+_LISTEN_POLL_SECONDS = 1.0
+
+
+class QueueNotifier:
+    """
+    Событие «очередь изменилась»: локально и между процессами через Redis.
+
+    Attributes:
+        channel (str): Канал Redis pub/sub.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        channel: str = QUEUE_CHANNEL,
+        client: Optional[Any] = None,
+    ) -> None:
+        self.channel = channel
+        self._client = client
+        if self._client is None and redis_url and redis is not None:
+            # from_url не подключается: соединение откроется при первой публикации
+            self._client = redis.Redis.from_url(
+                redis_url, socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        self._event = threading.Event()
+        self._stop = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._remote_disabled_until = 0.0
+        self._counters: Dict[str, int] = {
+            "published": 0,
+            "publish_errors": 0,
+            "received": 0,
+            "wakeups": 0,
+            "timeouts": 0,
+        }
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _remote(self) -> Optional[Any]:
+        if self._client is None or time.monotonic() < self._remote_disabled_until:
+            return None
+        return self._client
+
+    def notify(self, reason: str = "enqueue") -> bool:
+        """
+        Будит ожидающих: в процессе сразу, в других процессах через Redis.
+
+        Вызывать после commit: проснувшийся менеджер должен увидеть строку в БД.
+
+        Args:
+            reason (str): Причина (пишется в сообщение, для отладки).
+
+        Returns:
+            bool: True — сообщение опубликовано в Redis.
+        """
+        self._event.set()
+        client = self._remote()
+        if client is None:
+            return False
+        try:
+            client.publish(self.channel, reason)
+        except Exception as e:  # noqa: BLE001
+            self._remote_disabled_until = time.monotonic() + REMOTE_RETRY_SECONDS
+            self._count("publish_errors")
+            logger.warning(
+                "Публикация пробуждения очереди в Redis не удалась (%s), повтор через %.0f с",
+                e,
+                REMOTE_RETRY_SECONDS,
+            )
+            return False
+        self._count("published")
+        return True
+
+    def interrupt(self) -> None:
+        """Будит ожидающих только в этом процессе (например, при остановке)."""
+        self._event.set()
+
+    def wait(self, timeout: float, settle: float = 0.0) -> bool:
+        """
+        Ждёт события не дольше timeout и сбрасывает его.
+
+        Событие сбрасывается до того, как вызывающий прочитает очередь, поэтому
+        уведомление, пришедшее во время обработки, разбудит следующий wait().
+
+        Args:
+            timeout (float): Максимальное ожидание (сек) — страховочный опрос.
+            settle (float): Пауза после пробуждения: уведомления пачки загрузок,
+                пришедшие за это время, схлопываются в одно.
+
+        Returns:
+            bool: True — разбужен событием, False — истёк timeout.
+        """
+        woke = self._event.wait(max(timeout, 0.0))
+        if woke and settle > 0:
+            time.sleep(settle)
+        self._event.clear()
+        self._count("wakeups" if woke else "timeouts")
+        return woke
+
+    def start_listener(self) -> bool:
+        """
+        Запускает поток-подписчик канала Redis (в процессе менеджера).
+
+        Returns:
+            bool: True — слушатель запущен (или уже работает), False — Redis не настроен.
+        """
+        if self._client is None:
+            return False
+        if self._listener is not None and self._listener.is_alive():
+            return True
+        self._stop.clear()
+        self._listener = threading.Thread(
+            target=self._listen, name="queue-notify-listener", daemon=True
+        )
+        self._listener.start()
+        return True
+
+    def stop_listener(self, timeout: float = 5.0) -> None:
+        """Останавливает поток-подписчик."""
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.join(timeout=timeout)
+            self._listener = None
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)  # type: ignore[union-attr]
+                pubsub.subscribe(self.channel)
+                # Пока не были подписаны, сообщения могли пропасть — один опрос БД
+                self._event.set()
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=_LISTEN_POLL_SECONDS)
+                    if message is not None and message.get("type") == "message":
+                        self._count("received")
+                        self._event.set()
+            except Exception as e:  # noqa: BLE001
+                logger.warning(
+                    "Подписка на пробуждения очереди прервана (%s), повтор через %.0f с",
+                    e,
+                    REMOTE_RETRY_SECONDS,
+                )
+                self._stop.wait(REMOTE_RETRY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:  # noqa: BLE001
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Счётчики публикаций, полученных сообщений, пробуждений и таймаутов."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+        stats["remote_enabled"] = self._client is not None
+        stats["listening"] = self._listener is not None and self._listener.is_alive()
+        return stats
+
+
+_notifier: Optional[QueueNotifier] = None
+_notifier_lock = threading.Lock()
+
+
+def get_queue_notifier() -> QueueNotifier:
+    """Возвращает общий на процесс QueueNotifier (Redis по настройкам)."""
+    global _notifier
+    if _notifier is None:
+        with _notifier_lock:
+            if _notifier is None:
+                settings = get_settings()
+                _notifier = QueueNotifier(
+                    settings.redis_url if settings.chain_queue_notify_redis else None
+                )
+    return _notifier
+
+
+def notify_queue_changed(reason: str = "enqueue") -> bool:
+    """Будит менеджер цепочек (см. QueueNotifier.notify); ошибки не пробрасываются."""
+    try:
+        return get_queue_notifier().notify(reason)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Не удалось отправить пробуждение очереди: %s", e)
+        return False
@@ -0,0 +1,327 @@
+"""
+Планировщик транскрипции с учётом длительности аудио (SJF со старением).
+
+Стоимость задачи оценивается как длительность аудио × исторический RTF
+(Transcript.real_time_factor) выбранной модели Whisper. По стоимости задаче
+назначается приоритет Celery 0..9 (0 — наивысший в Redis-транспорте) и,
+опционально, отдельная очередь для длинных задач. Короткие голосовые
+сообщения больше не ждут за трёхчасовыми записями.
+
+Старение: эффективная стоимость уменьшается со временем ожидания
+(cost / (1 + wait / scheduler_aging_seconds)), поэтому длинная задача
+постепенно поднимается в приоритете и не голодает. Брокер не умеет менять
+приоритет уже поставленного сообщения, поэтому повышение выполняется
+повторной публикацией (reprioritize_queued_jobs в tasks): новое сообщение
+несёт новый приоритет, а старое при получении распознаётся как устаревшее
+(is_stale_dispatch) и пропускается.
+
+Example:
+    decision = plan_job(duration_seconds=30.0, model_name="base", base_queue="transcription")
+    decision.priority  # 0
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from audioscribetranslate.core.config import Settings, get_settings
+from audioscribetranslate.models.audio_file import AudioFile
+from audioscribetranslate.models.transcript import Transcript
+
+logger = logging.getLogger(__name__)
+
+# Число уровней приоритета Celery (Redis priority_steps 0..9)
+PRIORITY_LEVELS = 10
+
+# Суффикс очереди для длинных задач: processing_chains -> processing_chains.long
+LONG_QUEUE_SUFFIX = ".long"
+
+# RTF по умолчанию (CPU int8), пока нет истории для модели
+DEFAULT_RTF: Dict[str, float] = {
+    "tiny": 0.05,
+    "base": 0.1,
+    "small": 0.25,
+    "medium": 0.6,
+    "large": 1.2,
+}
+_FALLBACK_RTF = 0.5
+
+_rtf_cache: Dict[str, float] = {}
+_rtf_cache_at = 0.0
+_rtf_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ScheduleDecision:
+    """
+    Решение планировщика для одной задачи.
+
+    Attributes:
+        priority (int): Приоритет Celery (0 — наивысший).
+        queue (str): Очередь, в которую отправляется задача.
+        expected_seconds (float): Ожидаемое время обработки (сек).
+    """
+
+    priority: int
+    queue: str
+    expected_seconds: float
+
+
+def load_historical_rtf(session: Session) -> Dict[str, float]:
+    """
+    Считает средний RTF успешных транскрипций по моделям.
+
+    Args:
+        session (Session): Синхронная сессия БД.
+
+    Returns:
+        Dict[str, float]: Модель -> средний real_time_factor.
+    """
+    rtf: ColumnElement[Any] = Transcript.real_time_factor
+    rows = session.execute(
+        select(Transcript.model_name, func.avg(rtf))
+        .where(Transcript.status == "done", rtf.is_not(None), rtf > 0)
+        .group_by(Transcript.model_name)
+    ).all()
+    return {str(model): float(rtf) for model, rtf in rows if model and rtf}
+
+
+def get_model_rtf(session: Session, model_name: str, ttl_seconds: float) -> float:
+    """
+    Возвращает ожидаемый RTF модели (история из БД с кэшем на ttl_seconds).
+
+    Args:
+        session (Session): Синхронная сессия БД.
+        model_name (str): Модель Whisper.
+        ttl_seconds (float): Время жизни кэша статистики.
+
+    Returns:
+        float: RTF (секунд обработки на секунду аудио).
+    """
+    global _rtf_cache, _rtf_cache_at
+    now = time.monotonic()
+    with _rtf_lock:
+        stale = now - _rtf_cache_at > ttl_seconds
+    if stale:
+        try:
+            table = load_historical_rtf(session)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("[SCHED] Failed to load historical RTF: %s", e)
+            table = None
+        with _rtf_lock:
+            if table is not None:
+                _rtf_cache = table
+            _rtf_cache_at = now
+    with _rtf_lock:
+        rtf = _rtf_cache.get(model_name)
+    return rtf or DEFAULT_RTF.get(model_name, _FALLBACK_RTF)
+
+
+def reset_rtf_cache() -> None:
+    """Сбрасывает кэш исторического RTF (для тестов и после миграций)."""
+    global _rtf_cache, _rtf_cache_at
+    with _rtf_lock:
+        _rtf_cache = {}
+        _rtf_cache_at = 0.0
+
+
+def priority_for_cost(
+    expected_seconds: float,
+    base_seconds: float,
+    waited_seconds: float = 0.0,
+    aging_seconds: float = 0.0,
+) -> int:
+    """
+    Переводит ожидаемую стоимость в приоритет Celery (логарифмическая шкала).
+
+    Каждое удвоение стоимости сверх base_seconds опускает задачу на один
+    уровень. Ожидание уменьшает эффективную стоимость (старение).
+
+    Args:
+        expected_seconds (float): Ожидаемое время обработки.
+        base_seconds (float): Стоимость, которая ещё получает приоритет 0.
+        waited_seconds (float): Сколько задача уже ждёт в очереди.
+        aging_seconds (float): За сколько ожидания эффективная стоимость
+            уменьшается вдвое (0 — без старения).
+
+    Returns:
+        int: Приоритет 0..9.
+
+    Example:
+        >>> priority_for_cost(30, base_seconds=30)
+        0
+        >>> priority_for_cost(240, base_seconds=30)
+        3
+    """
+    effective = max(expected_seconds, 0.0)
+    if aging_seconds > 0 and waited_seconds > 0:
+        effective /= 1.0 + waited_seconds / aging_seconds
+    if effective <= base_seconds or base_seconds <= 0:
+        return 0
+    level = math.ceil(math.log2(effective / base_seconds) - 1e-9)
+    return min(max(level, 0), PRIORITY_LEVELS - 1)
+
+
+def plan_job(
+    duration_seconds: Optional[float],
+    model_name: str,
+    base_queue: str,
+    rtf: Optional[float] = None,
+    settings: Optional[Settings] = None,
+    waited_seconds: float = 0.0,
+) -> ScheduleDecision:
+    """
+    Рассчитывает приоритет и очередь для задачи по длительности и модели.
+
+    Args:
+        duration_seconds (Optional[float]): Длительность аудио (None — неизвестна).
+        model_name (str): Модель Whisper.
+        base_queue (str): Основная очередь задачи.
+        rtf (Optional[float]): RTF модели (по умолчанию из DEFAULT_RTF).
+        settings (Optional[Settings]): Настройки (по умолчанию get_settings()).
+        waited_seconds (float): Время ожидания задачи в очереди.
+
+    Returns:
+        ScheduleDecision: Приоритет, очередь и ожидаемое время обработки.
+    """
+    settings = settings or get_settings()
+    if rtf is None:
+        rtf = DEFAULT_RTF.get(model_name, _FALLBACK_RTF)
+    duration = (
+        duration_seconds
+        if duration_seconds and duration_seconds > 0
+        else settings.scheduler_default_duration_seconds
+    )
+    expected = duration * rtf
+    priority = priority_for_cost(
+        expected,
+        settings.scheduler_priority_base_seconds,
+        waited_seconds,
+        settings.scheduler_aging_seconds,
+    )
+    queue = queue_for_cost(expected, base_queue, settings)
+    return ScheduleDecision(priority=priority, queue=queue, expected_seconds=expected)
+
+
+def queue_for_cost(expected_seconds: float, base_queue: str, settings: Settings) -> str:
+    """
+    Выбирает очередь: длинные задачи уходят в <base_queue>.long.
+
+    Args:
+        expected_seconds (float): Ожидаемое время обработки.
+        base_queue (str): Основная очередь.
+        settings (Settings): Настройки (scheduler_long_job_seconds, 0 — без разделения).
+
+    Returns:
+        str: Имя очереди.
+    """
+    long_threshold = settings.scheduler_long_job_seconds
+    if long_threshold > 0 and expected_seconds >= long_threshold:
+        return base_queue + LONG_QUEUE_SUFFIX
+    return base_queue
+
+
+def schedule_audio(
+    session: Session, audio_id: int, base_queue: str
+) -> ScheduleDecision:
+    """
+    Планирует аудиофайл и сохраняет решение в AudioFile (без commit).
+
+    Args:
+        session (Session): Синхронная сессия БД.
+        audio_id (int): ID аудиофайла.
+        base_queue (str): Основная очередь задачи.
+
+    Returns:
+        ScheduleDecision: Решение планировщика (для неизвестного файла — по умолчанию).
+    """
+    settings = get_settings()
+    audio = session.get(AudioFile, audio_id)
+    if audio is None:
+        return plan_job(None, "", base_queue, settings=settings)
+    model_name = str(audio.whisper_model)
+    duration = cast(Optional[float], audio.duration_seconds)
+    rtf = get_model_rtf(session, model_name, settings.scheduler_rtf_cache_seconds)
+    decision = plan_job(duration, model_name, base_queue, rtf, settings)
+    session.execute(
+        update(AudioFile)
+        .where(AudioFile.id == audio_id)
+        .values(
+            expected_cost_seconds=decision.expected_seconds,
+            priority=decision.priority,
+            enqueued_at=datetime.now(timezone.utc),
+        )
+    )
+    return decision
+
+
+def find_promotions(
+    session: Session, now: Optional[datetime] = None, limit: int = 100
+) -> List[Tuple[AudioFile, int]]:
+    """
+    Находит ждущие задачи, которым старение дало более высокий приоритет.
+
+    Args:
+        session (Session): Синхронная сессия БД.
+        now (Optional[datetime]): Текущее время (для тестов).
+        limit (int): Максимум задач за один проход.
+
+    Returns:
+        List[Tuple[AudioFile, int]]: Пары (аудиофайл, новый приоритет).
+    """
+    settings = get_settings()
+    if settings.scheduler_aging_seconds <= 0:
+        return []
+    now = now or datetime.now(timezone.utc)
+    priority: ColumnElement[int] = AudioFile.priority
+    rows = session.execute(
+        select(AudioFile)
+        .where(
+            AudioFile.status == "queued",
+            priority > 0,
+            AudioFile.enqueued_at.is_not(None),
+        )
+        .order_by(AudioFile.enqueued_at)
+        .limit(limit)
+    ).scalars()
+    promotions: List[Tuple[AudioFile, int]] = []
+    for audio in rows:
+        enqueued_at = audio.enqueued_at
+        if enqueued_at.tzinfo is None:
+            enqueued_at = enqueued_at.replace(tzinfo=timezone.utc)
+        waited = (now - enqueued_at).total_seconds()
+        new_priority = priority_for_cost(
+            audio.expected_cost_seconds or 0.0,
+            settings.scheduler_priority_base_seconds,
+            waited,
+            settings.scheduler_aging_seconds,
+        )
+        if new_priority < audio.priority:
+            promotions.append((audio, new_priority))
+    return promotions
+
+
+def is_stale_dispatch(audio: AudioFile, priority: Optional[int]) -> bool:
+    """
+    Проверяет, что сообщение устарело после повышения приоритета.
+
+    Args:
+        audio (AudioFile): Аудиофайл задачи.
+        priority (Optional[int]): Приоритет, с которым опубликовано сообщение.
+
+    Returns:
+        bool: True, если задача была переопубликована с другим приоритетом.
+    """
+    return (
+        priority is not None
+        and audio.priority is not None
+        and int(audio.priority) != int(priority)
+    )
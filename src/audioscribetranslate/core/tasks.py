@@ -1,8 +1,10 @@
 import logging
 import os
+import threading
 import time
 import traceback
-from typing import Any, Optional, Tuple, Union
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence, Tuple, Union, cast
 
 """
 Модуль задач Celery для аудиотранскрибации, перевода и суммаризации.
@@ -10,7 +12,10 @@ from typing import Any, Optional, Tuple, Union
 Содержит задачи:
     - transcribe_audio: транскрибация аудиофайла
     - translate_transcript: перевод транскрипта
+    - translate_transcript_multi: перевод транскрипта на несколько языков
     - summarize_translation: суммаризация перевода
+    - pipeline_transcribe / pipeline_translate / pipeline_summarize: стадии
+      конвейера цепочки (celery.chain, каждая стадия в своей очереди)
 
 Также содержит функции безопасной постановки задач в очередь.
 
@@ -20,25 +25,108 @@ Example:
     >>> enqueue_summary(translation_id=3, target_language='ru')
 """
 
-from celery import Celery
-from celery.signals import worker_ready, worker_shutdown
-from sqlalchemy import create_engine, select, update
-from sqlalchemy.orm import sessionmaker
+from celery import Celery, chain
+from celery.signals import (
+    celeryd_after_setup,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
+from sqlalchemy import CursorResult, delete, func, insert, literal, select, update
+from sqlalchemy.orm import Session
 
+from audioscribetranslate.core.admission import (
+    PENDING_STATUS,
+    AdmissionConfig,
+    load_backlog_sync,
+)
 from audioscribetranslate.core.config import get_settings
+from audioscribetranslate.core.job_events import (
+    AUDIO_FILE,
+    SUMMARY,
+    TRANSCRIPT,
+    TRANSLATION,
+    record_job_event,
+)
+from audioscribetranslate.core.leases import (
+    LeaseHeartbeat,
+    LeaseLostError,
+    abandoned_clause,
+    claim_lease,
+    expired_leases_query,
+    new_lease_owner,
+    released_lease_values,
+)
+from audioscribetranslate.core.preload import (
+    format_memory_snapshot,
+    model_queue_name,
+    process_memory_snapshot,
+    resolve_preload_models,
+)
+from audioscribetranslate.core.queue_depth import get_queue_depth
+from audioscribetranslate.core.queue_notify import notify_queue_changed
+from audioscribetranslate.core.scheduler import (
+    ScheduleDecision,
+    find_promotions,
+    is_stale_dispatch,
+    queue_for_cost,
+    schedule_audio,
+)
+from audioscribetranslate.db.sync_session import (
+    SyncSessionLocal,
+    dispose_sync_engine,
+    reset_sync_engine,
+)
 from audioscribetranslate.models.audio_file import AudioFile
 from audioscribetranslate.models.summary import Summary
 from audioscribetranslate.models.transcript import Transcript
+from audioscribetranslate.models.transcript_segment import TranscriptSegment
 from audioscribetranslate.models.translation import Translation
+from audioscribetranslate.services.summarization import (
+    configure_summarization_service,
+    get_summarization_service,
+)
 from audioscribetranslate.services.transcription import (
+    DeviceType,
+    TranscriptSegmentResult,
+    configure_transcription_service,
     get_audio_duration_seconds,
     safe_transcribe,
+    select_default_device,
+    transcribe_stream,
+    transcribe_stream_parallel,
+    warm_up_models,
+)
+from audioscribetranslate.services.translation import (
+    configure_translation_service,
+    get_translation_service,
 )
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+configure_translation_service(
+    backend=settings.translation_backend,
+    models_dir=settings.translation_models_dir,
+    model_template=settings.translation_model_template,
+    max_batch_tokens=settings.translation_max_batch_tokens,
+    beam_size=settings.translation_beam_size,
+    target_prefix_template=settings.translation_target_prefix_template,
+    memory_size=settings.translation_memory_size,
+    memory_redis_url=settings.redis_url if settings.translation_memory_redis else None,
+    memory_ttl_seconds=settings.translation_memory_ttl_seconds,
+)
+configure_transcription_service(
+    cache_max_bytes=settings.whisper_cache_max_mb * 1024 * 1024,
+)
+configure_summarization_service(
+    ratio=settings.summary_ratio,
+    max_sentences=settings.summary_max_sentences,
+    chunk_sentences=settings.summary_chunk_sentences,
+)
+
 celery_app = Celery(
     "audioscribetranslate",
     broker=settings.celery_broker_url,
@@ -53,10 +141,17 @@ celery_app.conf.update(
     broker_connection_timeout=2,  # короткий таймаут подключения
     broker_connection_retry_on_startup=False,  # не зависать при старте
     result_backend_transport_options={"retry_policy": {"timeout": 2}},
+    # Приоритеты Redis: 0 — наивысший, воркер выбирает сообщения по приоритету
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    },
     # Настройки для управления памятью и производительности
     worker_prefetch_multiplier=1,  # Один таск на раз для контроля памяти
     task_acks_late=True,  # Подтверждаем выполнение только после завершения
     worker_max_tasks_per_child=15,  # Перезапуск воркера после 15 задач (для очистки памяти)
+    worker_proc_alive_timeout=60,  # Запас на старт процесса с предзагрузкой моделей
     # Таймауты для длительных задач (обработка аудио)
     task_time_limit=3600,  # 1 час на задачу максимум
     task_soft_time_limit=3300,  # 55 минут мягкий лимит
@@ -72,6 +167,9 @@ celery_app.conf.update(
         "audioscribetranslate.core.tasks.translate_transcript": {
             "queue": "translation"
         },
+        "audioscribetranslate.core.tasks.translate_transcript_multi": {
+            "queue": "translation"
+        },
         "audioscribetranslate.core.tasks.summarize_translation": {
             "queue": "summarization"
         },
@@ -94,6 +192,109 @@ def worker_ready_handler(sender: Optional[object] = None, **kwargs: Any) -> None
 def worker_shutdown_handler(sender: Optional[object] = None, **kwargs: Any) -> None:
     """Сигнал завершения воркера"""
     logger.info(f"Celery воркер завершается: {sender}")
+    dispose_sync_engine()
+
+
+# Очереди, которые слушает воркер (заполняется в главном процессе до fork)
+_consumed_queues: List[str] = []
+
+
+@celeryd_after_setup.connect  # type: ignore[misc]
+def celeryd_after_setup_handler(
+    sender: Optional[object] = None, instance: Any = None, **kwargs: Any
+) -> None:
+    """
+    Запоминает очереди воркера, чтобы дочерние процессы знали, какие модели греть.
+    При worker_share_models загружает модели в главном процессе (до старта пула).
+    """
+    try:
+        _consumed_queues[:] = list(instance.app.amqp.queues.consume_from)
+    except AttributeError:
+        _consumed_queues[:] = []
+    if get_settings().worker_share_models:
+        share_worker_models(instance)
+
+
+def share_worker_models(instance: Any) -> List[str]:
+    """
+    Загружает модели один раз на процесс воркера для всех параллельных задач.
+
+    Args:
+        instance (Any): WorkController текущего воркера.
+
+    Returns:
+        List[str]: Загруженные модели (пусто, если режим неприменим).
+
+    Pitfalls:
+        - Работает только с pool=threads/solo: модели CTranslate2 держат рабочие
+          потоки, которые не переживают fork в prefork-процессы.
+        - На GPU режим не включается: контексты CUDA не делятся так же, как RAM.
+    """
+    pool_name = getattr(instance.pool_cls, "__module__", "")
+    if pool_name.endswith("prefork"):
+        logger.warning(
+            "[CELERY] worker_share_models requires --pool threads; "
+            "prefork children load their own model copies"
+        )
+        return []
+    device, _ = select_default_device()
+    if device == DeviceType.CUDA:
+        logger.warning("[CELERY] worker_share_models is CPU-only, skipping on CUDA")
+        return []
+    concurrency = max(int(getattr(instance, "concurrency", 1) or 1), 1)
+    # Одна копия весов обслуживает до concurrency транскрипций одновременно
+    configure_transcription_service(num_workers=concurrency)
+    loaded = preload_worker_models()
+    dispose_sync_engine()
+    return loaded
+
+
+def preload_worker_models() -> List[str]:
+    """
+    Предзагружает и закрепляет модели Whisper в текущем процессе воркера.
+
+    Память процесса (RSS/USS/PSS) логируется до и после загрузки.
+
+    Returns:
+        List[str]: Успешно загруженные модели.
+    """
+    models = resolve_preload_models(get_settings(), _consumed_queues)
+    if not models:
+        return []
+    before = process_memory_snapshot()
+    loaded = warm_up_models(models, pin=True)
+    after = process_memory_snapshot()
+    logger.info(
+        "[CELERY] Preloaded Whisper models %s (pid=%s): before %s, after %s",
+        loaded,
+        os.getpid(),
+        format_memory_snapshot(before),
+        format_memory_snapshot(after),
+    )
+    return loaded
+
+
+@worker_process_init.connect  # type: ignore[misc]
+def worker_process_init_handler(**kwargs: Any) -> None:
+    """
+    Сигнал старта дочернего процесса: сбрасываем унаследованный после fork пул БД
+    и в фоне предзагружаем модели.
+
+    Note:
+        Загрузка идёт в отдельном потоке, чтобы не превышать таймаут старта
+        процесса. Задача, пришедшая раньше окончания загрузки, дождётся её
+        (single-flight в WhisperModelCache), а не начнёт вторую загрузку.
+    """
+    reset_sync_engine()
+    threading.Thread(
+        target=preload_worker_models, name="whisper-preload", daemon=True
+    ).start()
+
+
+@worker_process_shutdown.connect  # type: ignore[misc]
+def worker_process_shutdown_handler(**kwargs: Any) -> None:
+    """Сигнал завершения дочернего процесса: закрываем его соединения с БД"""
+    dispose_sync_engine()
 
 
 try:
@@ -103,13 +304,225 @@ except Exception as e:  # noqa: BLE001
     logger.warning("[CELERY] Broker initial connection failed: %s", e)
 
 
+# Префикс текста-заглушки, который пишется при неудачной транскрипции
+TRANSCRIPT_FALLBACK_PREFIX = "Transcript fallback"
+
+
+def find_reusable_transcript(
+    session: Session, audio: AudioFile, model_name: str
+) -> Optional[Transcript]:
+    """
+    Ищет готовый транскрипт того же содержимого (content_hash) той же модели.
+
+    Args:
+        session (Session): Синхронная сессия БД.
+        audio (AudioFile): Аудиофайл, для которого ищется транскрипт.
+        model_name (str): Модель Whisper.
+
+    Returns:
+        Optional[Transcript]: Готовый транскрипт другого файла или None.
+
+    Pitfalls:
+        Транскрипты-заглушки (fallback) не переиспользуются.
+    """
+    if not audio.content_hash:
+        return None
+    return session.execute(
+        select(Transcript)
+        .join(AudioFile, AudioFile.id == Transcript.audio_file_id)
+        .where(
+            AudioFile.content_hash == audio.content_hash,
+            AudioFile.id != audio.id,
+            Transcript.model_name == model_name,
+            Transcript.status == "done",
+            Transcript.text.isnot(None),
+            Transcript.text.notlike(f"{TRANSCRIPT_FALLBACK_PREFIX}%"),
+        )
+        .order_by(Transcript.id.desc())
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+def copy_transcript_segments(session: Session, source_id: int, target_id: int) -> int:
+    """
+    Копирует сегменты транскрипта-источника одним INSERT ... SELECT (без commit).
+
+    Сегменты, оставшиеся от прерванной попытки, предварительно удаляются, чтобы
+    окно текста (/transcripts/{id}/text?start=&end=) не содержало дублей.
+
+    Args:
+        session (Session): Синхронная сессия БД.
+        source_id (int): ID готового транскрипта-источника.
+        target_id (int): ID транскрипта, получающего копию.
+
+    Returns:
+        int: Количество скопированных сегментов.
+    """
+    session.execute(
+        delete(TranscriptSegment).where(TranscriptSegment.transcript_id == target_id)
+    )
+    columns = ("start", "end", "text", "avg_logprob")
+    source = select(
+        literal(target_id).label("transcript_id"),
+        *(getattr(TranscriptSegment, name) for name in columns),
+    ).where(TranscriptSegment.transcript_id == source_id)
+    result = session.execute(
+        insert(TranscriptSegment).from_select(("transcript_id", *columns), source)
+    )
+    return int(cast(CursorResult[Any], result).rowcount or 0)
+
+
+def _persist_segment_batch(
+    session: Session,
+    transcript_id: int,
+    batch: List[TranscriptSegmentResult],
+    duration: Optional[float],
+) -> None:
+    """Пакетно сохраняет сегменты и обновляет прогресс транскрипта одним коммитом."""
+    session.execute(
+        insert(TranscriptSegment),
+        [
+            {
+                "transcript_id": transcript_id,
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "avg_logprob": seg.avg_logprob,
+            }
+            for seg in batch
+        ],
+    )
+    if duration and duration > 0:
+        progress = min(100.0, batch[-1].end / duration * 100.0)
+        session.execute(
+            update(Transcript)
+            .where(Transcript.id == transcript_id)
+            .values(progress_percent=round(progress, 1))
+        )
+    session.commit()
+
+
+def run_streaming_transcription(
+    session: Session,
+    transcript_id: int,
+    path: str,
+    model_name: str,
+    known_language: Optional[str] = None,
+    duration_hint: Optional[float] = None,
+    lease: Optional[LeaseHeartbeat] = None,
+) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[float], bool]:
+    """
+    Потоковая транскрипция с пакетной записью сегментов в transcript_segments.
+
+    Продолжает с конца последнего сохранённого сегмента (если они есть),
+    поэтому повторный запуск после падения воркера не теряет работу.
+    Файлы длиннее long_audio_threshold_seconds транскрибируются параллельно
+    по фрагментам в пуле процессов.
+
+    Args:
+        session (Session): Синхронная сессия БД.
+        transcript_id (int): ID транскрипта, в который пишутся сегменты.
+        path (str): Абсолютный путь к аудиофайлу.
+        model_name (str): Модель Whisper.
+        known_language (Optional[str]): Язык, определённый при предыдущей попытке.
+        duration_hint (Optional[float]): Длительность, определённая при загрузке
+            (AudioFile.duration_seconds); если None — определяется по файлу.
+        lease (Optional[LeaseHeartbeat]): Пульс аренды файла; потеря аренды
+            проверяется перед записью каждого пакета сегментов.
+
+    Returns:
+        Tuple: (текст, язык, ошибка, длительность аудио, rtf_valid). При ошибке
+            текст и язык None. rtf_valid — файл пройден целиком одним процессом:
+            при возобновлении время покрывает только хвост, а параллельный
+            режим делит работу между процессами, и RTF вышел бы заниженным.
+
+    Raises:
+        LeaseLostError: Аренду забрали — файл обрабатывает другой воркер.
+    """
+    resume_from = (
+        session.execute(
+            select(func.max(TranscriptSegment.end)).where(
+                TranscriptSegment.transcript_id == transcript_id
+            )
+        ).scalar()
+        or 0.0
+    )
+    parallel = False
+    try:
+        language = known_language if resume_from > 0 else None
+        # Длинные файлы транскрибируем параллельно по фрагментам
+        threshold = settings.long_audio_threshold_seconds
+        if duration_hint is None and threshold > 0:
+            duration_hint = get_audio_duration_seconds(path)
+        if threshold > 0 and duration_hint and duration_hint - resume_from >= threshold:
+            parallel = True
+            stream = transcribe_stream_parallel(
+                path,
+                model_name,
+                start_offset=resume_from,
+                language=language,
+                workers=settings.parallel_transcription_workers or None,
+            )
+        else:
+            stream = transcribe_stream(
+                path, model_name, start_offset=resume_from, language=language
+            )
+        # Язык известен сразу: сохраняем для возможного возобновления
+        session.execute(
+            update(Transcript)
+            .where(Transcript.id == transcript_id)
+            .values(language=stream.language)
+        )
+        batch: List[TranscriptSegmentResult] = []
+        for seg in stream.segments:
+            batch.append(seg)
+            if len(batch) >= settings.transcript_segment_batch_size:
+                if lease is not None:
+                    lease.raise_if_lost()
+                _persist_segment_batch(session, transcript_id, batch, stream.duration)
+                batch = []
+        if lease is not None:
+            lease.raise_if_lost()
+        if batch:
+            _persist_segment_batch(session, transcript_id, batch, stream.duration)
+        session.commit()
+    except LeaseLostError:
+        session.rollback()
+        raise
+    except Exception as e:  # noqa: BLE001
+        session.rollback()
+        logger.error(
+            "[CELERY] Streaming transcription failed for transcript %s: %s",
+            transcript_id,
+            e,
+        )
+        return None, None, str(e), None, False
+
+    texts: List[str] = list(
+        session.execute(
+            select(TranscriptSegment.text)
+            .where(TranscriptSegment.transcript_id == transcript_id)
+            .order_by(TranscriptSegment.start)
+        ).scalars()
+    )
+    text = " ".join(texts)
+    rtf_valid = resume_from == 0 and not parallel
+    return text or None, stream.language, None, stream.duration, rtf_valid
+
+
 @celery_app.task  # type: ignore
-def transcribe_audio(audio_id: int) -> None:
+def transcribe_audio(
+    audio_id: int, dispatch_priority: Optional[int] = None, auto_translate: bool = True
+) -> None:
     """
     Транскрибация аудиофайла через faster-whisper.
 
     Args:
         audio_id (int): ID аудиофайла для транскрибации.
+        dispatch_priority (Optional[int]): Приоритет, с которым опубликована задача;
+            сообщение с устаревшим приоритетом (после старения) пропускается.
+        auto_translate (bool): Ставить перевод на английский после транскрибации
+            (конвейер цепочки ставит перевод сам и передаёт False).
 
     Returns:
         None
@@ -121,67 +534,177 @@ def transcribe_audio(audio_id: int) -> None:
         >>> transcribe_audio.delay(123)
 
     Idempotency:
-        Если уже есть transcript для аудиофайла, задача пропускается.
+        Если уже есть готовый transcript для аудиофайла, задача пропускается.
+        Файл захватывается арендой (core/leases.py): если его держит живой
+        воркер (повторная доставка сообщения), задача пропускается. Брошенный
+        transcript (аренда истекла) в потоковом режиме продолжается с конца
+        последнего сохранённого сегмента, иначе пересчитывается заново.
+        Потерявший аренду воркер (пульс не продлил её) прекращает запись
+        сегментов, а финальные UPDATE с условием lease_owner не перезаписывают
+        результат нового владельца.
+
+    Deduplication:
+        Если файл с тем же content_hash уже транскрибирован той же моделью,
+        текст копируется из готового транскрипта без запуска Whisper.
 
     Pitfalls:
         Ошибки транскрибации не пробрасываются, а логируются и помечают статус 'failed'.
     """
-    engine = create_engine(settings.sync_database_url, future=True)
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
-    with SessionLocal() as session:
+    heartbeat: Optional[LeaseHeartbeat] = None
+    lease_owner = new_lease_owner()
+    transcript_id: Optional[int] = None
+    with SyncSessionLocal() as session:
         try:
             audio = session.get(AudioFile, audio_id)
             if not audio:
                 logger.warning("[CELERY] Audio %s not found", audio_id)
                 return
-            # Idempotency: если уже есть хотя бы один transcript -> ничего не делаем
-            existing = session.execute(
-                select(Transcript.id).where(Transcript.audio_file_id == audio_id)
-            ).first()
-            if existing:
+            if is_stale_dispatch(audio, dispatch_priority):
+                logger.info(
+                    "[CELERY] Stale dispatch for audio %s (priority %s), skip",
+                    audio_id,
+                    dispatch_priority,
+                )
+                return
+            # Idempotency: готовый transcript -> ничего не делаем;
+            # брошенный (аренда истекла) -> продолжаем с последнего сегмента
+            existing = (
+                session.execute(
+                    select(Transcript)
+                    .where(Transcript.audio_file_id == audio_id)
+                    .order_by(Transcript.id)
+                )
+                .scalars()
+                .first()
+            )
+            if existing is not None and existing.status == "done":
                 logger.info(
                     "[CELERY] Transcript already exists for audio %s, skip", audio_id
                 )
                 return
 
-            # processing
-            session.execute(
-                update(AudioFile)
-                .where(AudioFile.id == audio_id)
-                .values(status="processing")
+            # processing: захват аренды; живой владелец -> дубликат сообщения
+            previous_status = cast(Optional[str], audio.status)
+            if not claim_lease(
+                session, AudioFile, audio_id, lease_owner, settings.lease_ttl_seconds
+            ):
+                session.rollback()
+                logger.info(
+                    "[CELERY] Audio %s is leased by another worker, skip", audio_id
+                )
+                return
+            record_job_event(
+                session, AUDIO_FILE, audio_id, "processing", previous_status, audio_id
             )
             session.commit()
+            heartbeat = LeaseHeartbeat(
+                SyncSessionLocal,
+                AudioFile,
+                audio_id,
+                lease_owner,
+                settings.lease_ttl_seconds,
+                settings.lease_heartbeat_seconds,
+            ).start()
 
             model_name = audio.whisper_model
             if hasattr(model_name, "name"):
                 model_name_value = model_name.name
             else:
                 model_name_value = str(model_name)
-            transcript_row = Transcript(
-                audio_file_id=audio_id,
-                model_name=model_name_value,
-                status="processing",
-            )
-            session.add(transcript_row)
-            session.commit()
+            if existing is not None:
+                transcript_row = existing
+                logger.info(
+                    "[CELERY] Resuming transcript %s for audio %s",
+                    transcript_row.id,
+                    audio_id,
+                )
+                if existing.status != "processing":
+                    # failed после прошлой попытки (потеря аренды, ошибка)
+                    session.execute(
+                        update(Transcript)
+                        .where(Transcript.id == existing.id)
+                        .values(status="processing")
+                    )
+                    session.commit()
+            else:
+                transcript_row = Transcript(
+                    audio_file_id=audio_id,
+                    model_name=model_name_value,
+                    status="processing",
+                )
+                session.add(transcript_row)
+                session.flush()
+                record_job_event(
+                    session,
+                    TRANSCRIPT,
+                    int(transcript_row.id),
+                    "processing",
+                    audio_file_id=audio_id,
+                )
+                session.commit()
+            transcript_id = int(transcript_row.id)
 
-            start_t = time.time()
-            text, lang, err = safe_transcribe(
-                audio.storage_path or "", model_name_value
-            )
-            end_t = time.time()
-            proc_sec = end_t - start_t
-            text_chars = len(text) if text else None
-            # audio_duration_seconds: можно добавить извлечение длительности позже (ffprobe)
-            # Попытка определить длительность файла
             full_path = None
             if audio.storage_path:
                 from audioscribetranslate.core.files import get_uploaded_files_dir
 
                 base_dir = get_uploaded_files_dir()
                 full_path = os.path.join(base_dir, audio.storage_path)
-            audio_dur = get_audio_duration_seconds(full_path) if full_path else None
-            rtf = (proc_sec / audio_dur) if audio_dur and audio_dur > 0 else None
+
+            upload_duration = cast(Optional[float], audio.duration_seconds)
+            start_t = time.time()
+            # Дедупликация: тот же контент уже транскрибирован той же моделью
+            reused = find_reusable_transcript(session, audio, model_name_value)
+            if reused is not None:
+                text = cast(Optional[str], reused.text)
+                lang = cast(Optional[str], reused.language)
+                err = None
+                proc_sec = time.time() - start_t
+                text_chars = reused.text_chars or (len(text) if text else None)
+                audio_dur = cast(Optional[float], reused.audio_duration_seconds)
+                # RTF не записываем: повторное использование не отражает скорость модели
+                rtf = None
+                copy_transcript_segments(
+                    session, int(reused.id), int(transcript_row.id)
+                )
+                logger.info(
+                    "[CELERY] Reusing transcript %s for audio %s (content_hash=%s)",
+                    reused.id,
+                    audio_id,
+                    audio.content_hash,
+                )
+            elif settings.transcription_streaming:
+                text, lang, err, audio_dur, rtf_valid = run_streaming_transcription(
+                    session,
+                    int(transcript_row.id),
+                    full_path or "",
+                    model_name_value,
+                    known_language=cast(Optional[str], transcript_row.language),
+                    duration_hint=upload_duration,
+                    lease=heartbeat,
+                )
+                proc_sec = time.time() - start_t
+                text_chars = len(text) if text else None
+                if audio_dur is None:
+                    audio_dur = upload_duration
+                if audio_dur is None and full_path:
+                    audio_dur = get_audio_duration_seconds(full_path)
+                # Возобновление и параллельные фрагменты не отражают скорость модели
+                rtf = (
+                    (proc_sec / audio_dur)
+                    if rtf_valid and audio_dur and audio_dur > 0
+                    else None
+                )
+            else:
+                text, lang, err = safe_transcribe(full_path or "", model_name_value)
+                end_t = time.time()
+                proc_sec = end_t - start_t
+                text_chars = len(text) if text else None
+                # Длительность из загрузки; по файлу — только для старых записей
+                audio_dur = upload_duration
+                if audio_dur is None and full_path:
+                    audio_dur = get_audio_duration_seconds(full_path)
+                rtf = (proc_sec / audio_dur) if audio_dur and audio_dur > 0 else None
             if err or not text:
                 # Fallback: генерируем заглушку вместо провала всей задачи
                 logger.warning(
@@ -189,10 +712,28 @@ def transcribe_audio(audio_id: int) -> None:
                     audio_id,
                     err,
                 )
-                text = f"Transcript fallback for audio {audio_id}"
+                text = f"{TRANSCRIPT_FALLBACK_PREFIX} for audio {audio_id}"
                 lang = lang or "unknown"
                 text_chars = len(text)
 
+            # Результат пишет только владелец аренды: после перехвата файл
+            # обрабатывает другой воркер, и его запись не перезаписывается
+            if heartbeat is not None:
+                heartbeat.raise_if_lost()
+            released = cast(
+                CursorResult[Any],
+                session.execute(
+                    update(AudioFile)
+                    .where(
+                        AudioFile.id == audio_id, AudioFile.lease_owner == lease_owner
+                    )
+                    .values(status="done", **released_lease_values())
+                ),
+            )
+            if released.rowcount != 1:
+                raise LeaseLostError(
+                    f"Lease for audio {audio_id} lost by {lease_owner}"
+                )
             session.execute(
                 update(Transcript)
                 .where(Transcript.id == transcript_row.id)
@@ -204,10 +745,19 @@ def transcribe_audio(audio_id: int) -> None:
                     text_chars=text_chars,
                     audio_duration_seconds=audio_dur,
                     real_time_factor=rtf,
+                    progress_percent=100.0,
                 )
             )
-            session.execute(
-                update(AudioFile).where(AudioFile.id == audio_id).values(status="done")
+            record_job_event(
+                session,
+                TRANSCRIPT,
+                int(transcript_row.id),
+                "done",
+                "processing",
+                audio_id,
+            )
+            record_job_event(
+                session, AUDIO_FILE, audio_id, "done", "processing", audio_id
             )
             session.commit()
             logger.info(
@@ -218,7 +768,7 @@ def transcribe_audio(audio_id: int) -> None:
             )
 
             # Авто постановка перевода (target=en) если языка не en
-            if lang and lang.lower() != "en":
+            if auto_translate and lang and lang.lower() != "en":
                 try:
                     # Создать запись queued translation и отправить задачу
                     tr_obj = Translation(
@@ -229,6 +779,14 @@ def transcribe_audio(audio_id: int) -> None:
                         status="queued",
                     )
                     session.add(tr_obj)
+                    session.flush()
+                    record_job_event(
+                        session,
+                        TRANSLATION,
+                        int(tr_obj.id),
+                        "queued",
+                        audio_file_id=audio_id,
+                    )
                     session.commit()
                     translate_transcript.delay(tr_obj.id)
                     logger.info(
@@ -239,6 +797,10 @@ def transcribe_audio(audio_id: int) -> None:
                 except Exception as te:  # noqa: BLE001
                     session.rollback()
                     logger.error("[CELERY] Auto translation enqueue failed: %s", te)
+        except LeaseLostError as e:
+            # Файл уже у другого воркера: ни результата, ни статуса failed
+            session.rollback()
+            logger.warning("[CELERY] Abort audio %s: %s", audio_id, e)
         except Exception as e:  # noqa: BLE001
             session.rollback()
             logger.error(
@@ -248,22 +810,80 @@ def transcribe_audio(audio_id: int) -> None:
                 traceback.format_exc(),
             )
             try:
-                session.execute(
-                    update(AudioFile)
-                    .where(AudioFile.id == audio_id)
-                    .values(status="failed")
+                failed = cast(
+                    CursorResult[Any],
+                    session.execute(
+                        update(AudioFile)
+                        .where(
+                            AudioFile.id == audio_id,
+                            AudioFile.lease_owner == lease_owner,
+                        )
+                        .values(status="failed", **released_lease_values())
+                    ),
+                )
+                if failed.rowcount != 1:
+                    # Аренду забрали: статус файла принадлежит новому владельцу
+                    session.rollback()
+                    return
+                record_job_event(
+                    session, AUDIO_FILE, audio_id, "failed", audio_file_id=audio_id
                 )
+                if transcript_id is not None:
+                    session.execute(
+                        update(Transcript)
+                        .where(
+                            Transcript.id == transcript_id,
+                            Transcript.status != "done",
+                        )
+                        .values(status="failed")
+                    )
+                    record_job_event(
+                        session,
+                        TRANSCRIPT,
+                        transcript_id,
+                        "failed",
+                        audio_file_id=audio_id,
+                    )
                 session.commit()
             except Exception:  # noqa: BLE001
                 session.rollback()
+        finally:
+            if heartbeat is not None:
+                heartbeat.stop()
+
 
+def schedule_dispatch(audio_id: int, base_queue: str) -> Optional[ScheduleDecision]:
+    """
+    Рассчитывает приоритет и очередь задачи и сохраняет их в AudioFile.
 
-def enqueue_transcription(audio_id: int) -> bool:
+    Args:
+        audio_id (int): ID аудиофайла.
+        base_queue (str): Основная очередь задачи.
+
+    Returns:
+        Optional[ScheduleDecision]: Решение планировщика или None, если
+            планирование выключено или не удалось (задача уходит без приоритета).
+    """
+    if not get_settings().scheduler_enabled:
+        return None
+    try:
+        with SyncSessionLocal() as session:
+            decision = schedule_audio(session, audio_id, base_queue)
+            session.commit()
+            return decision
+    except Exception as e:  # noqa: BLE001
+        logger.warning("[SCHED] Scheduling failed for audio %s: %s", audio_id, e)
+        return None
+
+
+def enqueue_transcription(audio_id: int, whisper_model: Optional[str] = None) -> bool:
     """
     Безопасно ставит задачу транскрибации в очередь.
 
     Args:
         audio_id (int): ID аудиофайла.
+        whisper_model (Optional[str]): Модель файла. При включённом
+            transcription_model_queues задача уходит в очередь transcription.<model>.
 
     Returns:
         bool: True при успехе, False при ошибке.
@@ -273,9 +893,26 @@ def enqueue_transcription(audio_id: int) -> bool:
 
     Warning:
         Ошибки не пробрасываются, чтобы не блокировать HTTP-ответ.
+
+    Pitfalls:
+        Модельные очереди должен кто-то слушать:
+        celery -A ... worker -Q transcription.base,transcription.
+        При scheduler_long_job_seconds > 0 — и очереди <queue>.long.
     """
     try:
-        transcribe_audio.delay(audio_id)
+        queue = "transcription"
+        if whisper_model and get_settings().transcription_model_queues:
+            queue = model_queue_name(whisper_model)
+        decision = schedule_dispatch(audio_id, queue)
+        if decision is None:
+            transcribe_audio.apply_async(args=[audio_id], queue=queue)
+        else:
+            transcribe_audio.apply_async(
+                args=[audio_id],
+                kwargs={"dispatch_priority": decision.priority},
+                queue=decision.queue,
+                priority=decision.priority,
+            )
         return True
     except Exception as e:  # noqa: BLE001
         logger.error(
@@ -290,7 +927,10 @@ def enqueue_transcription(audio_id: int) -> bool:
 @celery_app.task  # type: ignore
 def translate_transcript(translation_id: int) -> None:
     """
-    Перевод транскрипта в целевой язык.
+    Перевод транскрипта в целевой язык (services/translation.py).
+
+    Текст делится на предложения и переводится мини-батчами; в Translation
+    записываются фактическая модель и tokens_per_second.
 
     Args:
         translation_id (int): ID объекта Translation.
@@ -302,16 +942,24 @@ def translate_transcript(translation_id: int) -> None:
         >>> translate_transcript.delay(456)
 
     Pitfalls:
-        Ошибки перевода не пробрасываются, а логируются и помечают статус 'failed'.
+        - Ошибки перевода не пробрасываются, а логируются и помечают статус 'failed'.
+        - Без модели CTranslate2 перевод помечается 'failed'; заглушка работает
+          только при явном translation_backend=stub, фактический backend
+          записывается в Translation.backend.
     """
-    engine = create_engine(settings.sync_database_url, future=True)
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
-    with SessionLocal() as session:
+    with SyncSessionLocal() as session:
         try:
             translation_row = session.get(Translation, translation_id)
             if translation_row is None:
                 return
             # В processing
+            record_job_event(
+                session,
+                TRANSLATION,
+                translation_id,
+                "processing",
+                str(translation_row.status),
+            )
             session.execute(
                 update(Translation)
                 .where(Translation.id == translation_id)
@@ -323,27 +971,44 @@ def translate_transcript(translation_id: int) -> None:
                 translation_id,
                 translation_row.transcript_id,
             )
-            start_t = time.time()
-            # Пока нет реальной модели перевода — используем placeholder как "перевод"
-            time.sleep(0.2)
-            placeholder = (
-                f"Translation placeholder (target={translation_row.target_language})"
-            )
-            end_t = time.time()
-            proc_sec = end_t - start_t
-            text_chars = len(placeholder)
+            source_text = session.execute(
+                select(Transcript.text).where(
+                    Transcript.id == translation_row.transcript_id
+                )
+            ).scalar_one_or_none()
+            source_language = cast(Optional[str], translation_row.source_language)
+            target_language = cast(str, translation_row.target_language)
+            model_name = cast(Optional[str], translation_row.model_name)
+            result = get_translation_service().translate_text(
+                source_text or "",
+                source_language or "",
+                target_language,
+                model_name,
+            )
             session.execute(
                 update(Translation)
                 .where(Translation.id == translation_id)
                 .values(
-                    text=placeholder,
+                    text=result.text,
                     status="done",
-                    processing_seconds=proc_sec,
-                    text_chars=text_chars,
+                    model_name=result.model_name,
+                    backend=result.backend,
+                    processing_seconds=result.processing_seconds,
+                    text_chars=len(result.text),
+                    tokens_per_second=result.tokens_per_second,
                 )
             )
+            record_job_event(session, TRANSLATION, translation_id, "done", "processing")
             session.commit()
-            logger.info("[CELERY] Translation %s done", translation_id)
+            logger.info(
+                "[CELERY] Translation %s done "
+                "(%s, %d sentences in %d batches, %.1f tok/s)",
+                translation_id,
+                result.backend,
+                result.sentences,
+                result.batches,
+                result.tokens_per_second or 0.0,
+            )
         except Exception as e:  # noqa: BLE001
             session.rollback()
             logger.error(
@@ -360,11 +1025,61 @@ def translate_transcript(translation_id: int) -> None:
                         .where(Translation.id == translation_id)
                         .values(status="failed")
                     )
+                    record_job_event(session, TRANSLATION, translation_id, "failed")
                     session.commit()
             except Exception:
                 session.rollback()
 
 
+def add_queued_translation(
+    session: Session,
+    transcript: Transcript,
+    target_language: str,
+    model_name: Optional[str] = None,
+) -> Translation:
+    """
+    Добавляет в сессию Translation со статусом queued и событие queued.
+
+    Args:
+        session (Session): Синхронная сессия (коммит — на вызывающем).
+        transcript (Transcript): Готовый транскрипт.
+        target_language (str): Целевой язык перевода.
+        model_name (Optional[str]): Название модели перевода.
+
+    Returns:
+        Translation: Запись с уже назначенным id (после flush).
+    """
+    row = Translation(
+        transcript_id=transcript.id,
+        source_language=transcript.language,
+        target_language=target_language,
+        model_name=model_name or "mt_model",
+        status="queued",
+    )
+    session.add(row)
+    session.flush()
+    record_job_event(session, TRANSLATION, int(row.id), "queued")
+    return row
+
+
+def fail_queued_translations(session: Session, translation_ids: List[int]) -> None:
+    """
+    Помечает 'failed' переводы, задачу для которых не удалось поставить в очередь.
+
+    Args:
+        session (Session): Синхронная сессия; изменения фиксируются здесь же.
+        translation_ids (List[int]): ID записей Translation в статусе queued.
+    """
+    session.execute(
+        update(Translation)
+        .where(Translation.id.in_(translation_ids))
+        .values(status="failed")
+    )
+    for tid in translation_ids:
+        record_job_event(session, TRANSLATION, tid, "failed", "queued")
+    session.commit()
+
+
 def enqueue_translation(
     transcript_id: int, target_language: str, model_name: Optional[str] = None
 ) -> Tuple[bool, Optional[int]]:
@@ -385,21 +1100,12 @@ def enqueue_translation(
     Pitfalls:
         Если транскрипт не готов, задача не ставится.
     """
-    engine = create_engine(settings.sync_database_url, future=True)
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
-    with SessionLocal() as session:
+    with SyncSessionLocal() as session:
         # Проверяем существование и готовность транскрипта
         transcript = session.get(Transcript, transcript_id)
         if not transcript or transcript.status != "done":
             return False, None
-        row = Translation(
-            transcript_id=transcript_id,
-            source_language=transcript.language,
-            target_language=target_language,
-            model_name=model_name or "mt_model",
-            status="queued",
-        )
-        session.add(row)
+        row = add_queued_translation(session, transcript, target_language, model_name)
         session.commit()
         try:
             translate_transcript.delay(row.id)
@@ -410,13 +1116,170 @@ def enqueue_translation(
                 transcript_id,
                 e,
             )
+            fail_queued_translations(session, [int(row.id)])
+            return False, int(getattr(row, "id"))
+
+
+@celery_app.task  # type: ignore
+def translate_transcript_multi(translation_ids: List[int]) -> None:
+    """
+    Перевод одного транскрипта сразу на несколько языков.
+
+    Транскрипт читается и делится на предложения один раз, модели и токены
+    переиспользуются между языками, все Translation записываются одной
+    транзакцией.
+
+    Args:
+        translation_ids (List[int]): ID объектов Translation одного транскрипта.
+
+    Returns:
+        None
+
+    Example:
+        >>> translate_transcript_multi.delay([456, 457, 458])
+
+    Pitfalls:
+        - Ошибка перевода на любой язык помечает 'failed' все незавершённые
+          переводы пакета: частичный результат не сохраняется, пакет можно
+          поставить повторно.
+        - Строки не своего транскрипта (если такие переданы) пропускаются.
+    """
+    # До фильтрации по транскрипту при ошибке помечаются все переданные id
+    ids: List[int] = list(translation_ids)
+    with SyncSessionLocal() as session:
+        try:
+            rows = (
+                session.execute(
+                    select(Translation).where(Translation.id.in_(translation_ids))
+                )
+                .scalars()
+                .all()
+            )
+            if not rows:
+                return
+            transcript_id = rows[0].transcript_id
+            rows = [r for r in rows if r.transcript_id == transcript_id]
+            ids = [int(r.id) for r in rows]
+            for r in rows:
+                record_job_event(session, TRANSLATION, r.id, "processing", r.status)
             session.execute(
                 update(Translation)
-                .where(Translation.id == row.id)
-                .values(status="failed")
+                .where(Translation.id.in_(ids))
+                .values(status="processing")
             )
             session.commit()
-            return False, int(getattr(row, "id"))
+            logger.info(
+                "[CELERY] Translations %s set to processing (transcript %s)",
+                ids,
+                transcript_id,
+            )
+            source_text = session.execute(
+                select(Transcript.text).where(Transcript.id == transcript_id)
+            ).scalar_one_or_none()
+            source_language = rows[0].source_language or ""
+            model_name = rows[0].model_name
+            results = get_translation_service().translate_many(
+                source_text or "",
+                source_language,
+                [r.target_language for r in rows],
+                model_name,
+            )
+            for r in rows:
+                result = results[r.target_language]
+                session.execute(
+                    update(Translation)
+                    .where(Translation.id == r.id)
+                    .values(
+                        text=result.text,
+                        status="done",
+                        model_name=result.model_name,
+                        backend=result.backend,
+                        processing_seconds=result.processing_seconds,
+                        text_chars=len(result.text),
+                        tokens_per_second=result.tokens_per_second,
+                    )
+                )
+                record_job_event(session, TRANSLATION, r.id, "done", "processing")
+            session.commit()
+            logger.info(
+                "[CELERY] Translations %s done (%s)",
+                ids,
+                ", ".join(
+                    f"{lang}: {res.tokens_per_second or 0.0:.1f} tok/s"
+                    for lang, res in results.items()
+                ),
+            )
+        except Exception as e:  # noqa: BLE001
+            session.rollback()
+            logger.error(
+                "[CELERY] Failed translating translation_ids=%s: %s\n%s",
+                translation_ids,
+                e,
+                traceback.format_exc(),
+            )
+            try:
+                # Готовые переводы (например, при повторной доставке) не трогаем
+                unfinished: Sequence[Any] = session.execute(
+                    select(Translation.id, Translation.status).where(
+                        Translation.id.in_(ids), Translation.status != "done"
+                    )
+                ).all()
+                if unfinished:
+                    session.execute(
+                        update(Translation)
+                        .where(Translation.id.in_([r.id for r in unfinished]))
+                        .values(status="failed")
+                    )
+                    for r in unfinished:
+                        record_job_event(
+                            session, TRANSLATION, r.id, "failed", r.status
+                        )
+                    session.commit()
+            except Exception:
+                session.rollback()
+
+
+def enqueue_translations(
+    transcript_id: int, target_languages: List[str], model_name: Optional[str] = None
+) -> Tuple[bool, List[int]]:
+    """
+    Создаёт Translation на каждый целевой язык и ставит одну задачу перевода.
+
+    Args:
+        transcript_id (int): ID транскрипта.
+        target_languages (List[str]): Целевые языки (повторы игнорируются).
+        model_name (Optional[str]): Название модели перевода.
+
+    Returns:
+        Tuple[bool, List[int]]: (успех, id созданных Translation в порядке языков)
+
+    Example:
+        >>> enqueue_translations(2, ['en', 'de', 'fr', 'es'])
+
+    Pitfalls:
+        Если транскрипт не готов, записи не создаются и задача не ставится.
+    """
+    languages = list(dict.fromkeys(target_languages))
+    with SyncSessionLocal() as session:
+        transcript = session.get(Transcript, transcript_id)
+        if not transcript or transcript.status != "done" or not languages:
+            return False, []
+        ids = [
+            int(add_queued_translation(session, transcript, language, model_name).id)
+            for language in languages
+        ]
+        session.commit()
+        try:
+            translate_transcript_multi.delay(ids)
+            return True, ids
+        except Exception as e:  # noqa: BLE001
+            logger.error(
+                "[CELERY] Failed to enqueue translations for transcript_id=%s: %s",
+                transcript_id,
+                e,
+            )
+            fail_queued_translations(session, ids)
+            return False, ids
 
 
 # ---------------- Summary -----------------
@@ -425,7 +1288,10 @@ def enqueue_translation(
 @celery_app.task  # type: ignore
 def summarize_translation(summary_id: int) -> None:
     """
-    Суммаризация перевода (Summary).
+    Суммаризация перевода (Summary) через services/summarization.py.
+
+    Длинные переводы суммаризируются иерархическим map-reduce; если язык
+    саммари отличается от языка перевода, переводится только саммари.
 
     Args:
         summary_id (int): ID объекта Summary.
@@ -434,18 +1300,19 @@ def summarize_translation(summary_id: int) -> None:
         None
 
     Example:
-                        os.path.join(get_uploaded_files_dir(), audio.storage_path) or "", model_name_value
+        >>> summarize_translation.delay(789)
 
     Pitfalls:
         Ошибки суммаризации не пробрасываются, а логируются и помечают статус 'failed'.
     """
-    engine = create_engine(settings.sync_database_url, future=True)
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
-    with SessionLocal() as session:
+    with SyncSessionLocal() as session:
         try:
             summary_row = session.get(Summary, summary_id)
             if summary_row is None:
                 return
+            record_job_event(
+                session, SUMMARY, summary_id, "processing", str(summary_row.status)
+            )
             session.execute(
                 update(Summary)
                 .where(Summary.id == summary_id)
@@ -457,15 +1324,47 @@ def summarize_translation(summary_id: int) -> None:
                 summary_id,
                 summary_row.source_translation_id,
             )
-            time.sleep(1)
-            placeholder = f"Summary placeholder (target={summary_row.target_language})"
+            source_text = session.execute(
+                select(Translation.text).where(
+                    Translation.id == summary_row.source_translation_id
+                )
+            ).scalar_one_or_none()
+            model_name = cast(Optional[str], summary_row.model_name)
+            result = get_summarization_service().summarize_text(
+                source_text or "", model_name
+            )
+            text = result.text
+            proc_sec = result.processing_seconds
+            base_language = cast(Optional[str], summary_row.base_language)
+            target_language = cast(str, summary_row.target_language)
+            if base_language and base_language != target_language:
+                translated = get_translation_service().translate_text(
+                    text, base_language, target_language
+                )
+                text = translated.text
+                proc_sec += translated.processing_seconds
             session.execute(
                 update(Summary)
                 .where(Summary.id == summary_id)
-                .values(text=placeholder, status="done")
+                .values(
+                    text=text,
+                    status="done",
+                    model_name=result.model_name,
+                    processing_seconds=proc_sec,
+                    input_chars=result.input_chars,
+                    text_chars=len(text),
+                )
             )
+            record_job_event(session, SUMMARY, summary_id, "done", "processing")
             session.commit()
-            logger.info("[CELERY] Summary %s done", summary_id)
+            logger.info(
+                "[CELERY] Summary %s done (%d -> %d sentences, %d levels, %.2fs)",
+                summary_id,
+                result.input_sentences,
+                result.output_sentences,
+                result.levels,
+                proc_sec,
+            )
         except Exception as e:  # noqa: BLE001
             session.rollback()
             logger.error(
@@ -482,11 +1381,43 @@ def summarize_translation(summary_id: int) -> None:
                         .where(Summary.id == summary_id)
                         .values(status="failed")
                     )
+                    record_job_event(session, SUMMARY, summary_id, "failed")
                     session.commit()
             except Exception:
                 session.rollback()
 
 
+def add_queued_summary(
+    session: Session,
+    translation: Translation,
+    target_language: str,
+    model_name: Optional[str] = None,
+) -> Summary:
+    """
+    Добавляет в сессию Summary со статусом queued и событие queued.
+
+    Args:
+        session (Session): Синхронная сессия (коммит — на вызывающем).
+        translation (Translation): Готовый перевод.
+        target_language (str): Целевой язык саммари.
+        model_name (Optional[str]): Название модели суммаризации.
+
+    Returns:
+        Summary: Запись с уже назначенным id (после flush).
+    """
+    row = Summary(
+        source_translation_id=translation.id,
+        base_language=translation.target_language,
+        target_language=target_language,
+        model_name=model_name or "summ_model",
+        status="queued",
+    )
+    session.add(row)
+    session.flush()
+    record_job_event(session, SUMMARY, int(row.id), "queued")
+    return row
+
+
 def enqueue_summary(
     translation_id: int, target_language: str, model_name: Optional[str] = None
 ) -> Tuple[bool, Optional[int]]:
@@ -507,20 +1438,11 @@ def enqueue_summary(
     Pitfalls:
         Если перевод не готов, задача не ставится.
     """
-    engine = create_engine(settings.sync_database_url, future=True)
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
-    with SessionLocal() as session:
+    with SyncSessionLocal() as session:
         translation = session.get(Translation, translation_id)
         if not translation or translation.status != "done":
             return False, None
-        row = Summary(
-            source_translation_id=translation_id,
-            base_language=translation.target_language,
-            target_language=target_language,
-            model_name=model_name or "summ_model",
-            status="queued",
-        )
-        session.add(row)
+        row = add_queued_summary(session, translation, target_language, model_name)
         session.commit()
         try:
             summarize_translation.delay(row.id)
@@ -534,6 +1456,7 @@ def enqueue_summary(
             session.execute(
                 update(Summary).where(Summary.id == row.id).values(status="failed")
             )
+            record_job_event(session, SUMMARY, int(row.id), "failed", "queued")
             session.commit()
             return False, int(getattr(row, "id"))
 
@@ -568,117 +1491,294 @@ def get_queued_audio_files_count() -> int:
     Returns:
         int: Количество файлов в очереди
     """
-    engine = create_engine(settings.sync_database_url, future=True)
-    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
-    
-    with SessionLocal() as session:
-        result = session.execute(
-            select(AudioFile).where(AudioFile.status == "queued")
+    count = get_queue_depth().queued
+    logger.info(f"Файлов в очереди: {count}")
+    return count
+
+
+# Очереди конвейера: транскрибация — воркеры Whisper (менеджер цепочек),
+# перевод и саммари — лёгкие воркеры без модели Whisper
+CHAIN_QUEUE = "processing_chains"
+TRANSLATION_QUEUE = "translation"
+SUMMARIZATION_QUEUE = "summarization"
+
+# Явные имена: задачи находятся одинаково при запуске воркера как
+# src.audioscribetranslate.* и как audioscribetranslate.*
+PIPELINE_TRANSCRIBE_TASK = "audioscribetranslate.pipeline.transcribe"
+PIPELINE_TRANSLATE_TASK = "audioscribetranslate.pipeline.translate"
+PIPELINE_SUMMARIZE_TASK = "audioscribetranslate.pipeline.summarize"
+
+
+@celery_app.task(name=PIPELINE_TRANSCRIBE_TASK)  # type: ignore
+def pipeline_transcribe(
+    audio_id: int, dispatch_priority: Optional[int] = None
+) -> Optional[int]:
+    """
+    Стадия конвейера: транскрибация. Возвращает ID транскрипта следующей стадии.
+
+    Args:
+        audio_id (int): ID аудиофайла.
+        dispatch_priority (Optional[int]): Приоритет публикации; устаревшее после
+            старения сообщение пропускается.
+
+    Returns:
+        Optional[int]: ID готового транскрипта или None (пропуск, ошибка) —
+            тогда следующие стадии ничего не делают.
+    """
+    with SyncSessionLocal() as session:
+        audio = session.get(AudioFile, audio_id)
+        if audio is None:
+            return None
+        if is_stale_dispatch(audio, dispatch_priority):
+            logger.info("[PIPELINE] Stale dispatch for audio %s, skip", audio_id)
+            return None
+    transcribe_audio(audio_id, dispatch_priority, auto_translate=False)
+    # Новая сессия: результат читается после коммита стадии, без устаревшего кэша
+    with SyncSessionLocal() as session:
+        row: Optional[Any] = session.execute(
+            select(Transcript.id, Transcript.status)
+            .where(Transcript.audio_file_id == audio_id)
+            .order_by(Transcript.id)
+            .limit(1)
+        ).first()
+    if row is None or row.status != "done":
+        logger.warning("[PIPELINE] Transcription failed for audio %s", audio_id)
+        return None
+    return int(row.id)
+
+
+@celery_app.task(name=PIPELINE_TRANSLATE_TASK)  # type: ignore
+def pipeline_translate(
+    transcript_id: Optional[int], target_language: str = "ru"
+) -> Optional[int]:
+    """
+    Стадия конвейера: перевод. Возвращает ID перевода следующей стадии.
+
+    Args:
+        transcript_id (Optional[int]): Результат стадии транскрибации.
+        target_language (str): Целевой язык.
+
+    Returns:
+        Optional[int]: ID готового перевода или None (нет транскрипта, язык
+            совпадает с целевым, ошибка перевода).
+
+    Idempotency:
+        Готовый перевод транскрипта на тот же язык переиспользуется
+        (повторная доставка сообщения не создаёт дубликатов).
+    """
+    if transcript_id is None:
+        return None
+    with SyncSessionLocal() as session:
+        transcript = session.get(Transcript, transcript_id)
+        if transcript is None or transcript.status != "done":
+            return None
+        if target_language == transcript.language:
+            logger.info(
+                "[PIPELINE] Transcript %s already in %s, no translation",
+                transcript_id,
+                target_language,
+            )
+            return None
+        done_id = session.execute(
+            select(Translation.id)
+            .where(
+                Translation.transcript_id == transcript_id,
+                Translation.target_language == target_language,
+                Translation.status == "done",
+            )
+            .limit(1)
+        ).scalar_one_or_none()
+        if done_id is not None:
+            return int(done_id)
+        translation_id = int(
+            add_queued_translation(session, transcript, target_language).id
         )
-        count = len(result.scalars().all())
-        logger.info(f"Файлов в очереди: {count}")
-        return count
+        session.commit()
+    translate_transcript(translation_id)
+    with SyncSessionLocal() as session:
+        status = session.execute(
+            select(Translation.status).where(Translation.id == translation_id)
+        ).scalar_one_or_none()
+    return translation_id if status == "done" else None
+
+
+@celery_app.task(name=PIPELINE_SUMMARIZE_TASK)  # type: ignore
+def pipeline_summarize(
+    translation_id: Optional[int], target_language: str = "ru"
+) -> Optional[int]:
+    """
+    Стадия конвейера: саммари перевода.
+
+    Args:
+        translation_id (Optional[int]): Результат стадии перевода.
+        target_language (str): Язык саммари.
+
+    Returns:
+        Optional[int]: ID готового саммари или None.
+
+    Idempotency:
+        Готовое саммари перевода на тот же язык переиспользуется.
+    """
+    if translation_id is None:
+        return None
+    with SyncSessionLocal() as session:
+        translation = session.get(Translation, translation_id)
+        if translation is None or translation.status != "done":
+            return None
+        done_id = session.execute(
+            select(Summary.id)
+            .where(
+                Summary.source_translation_id == translation_id,
+                Summary.target_language == target_language,
+                Summary.status == "done",
+            )
+            .limit(1)
+        ).scalar_one_or_none()
+        if done_id is not None:
+            return int(done_id)
+        summary_id = int(add_queued_summary(session, translation, target_language).id)
+        session.commit()
+    summarize_translation(summary_id)
+    with SyncSessionLocal() as session:
+        status = session.execute(
+            select(Summary.status).where(Summary.id == summary_id)
+        ).scalar_one_or_none()
+    return summary_id if status == "done" else None
+
+
+def build_audio_pipeline(
+    audio_id: int, target_language: str, priority: Optional[int], queue: str
+) -> Any:
+    """
+    Собирает цепочку Celery: транскрибация -> перевод -> саммари.
+
+    Каждая стадия выполняется в своей очереди и передаёт следующей только ID,
+    поэтому воркер Whisper сразу берёт следующий файл, а перевод и саммари
+    идут на более дешёвых воркерах.
+
+    Args:
+        audio_id (int): ID аудиофайла.
+        target_language (str): Целевой язык перевода и саммари.
+        priority (Optional[int]): Приоритет транскрибации (None — без приоритета).
+        queue (str): Очередь транскрибации (processing_chains или .long).
+
+    Returns:
+        celery.canvas._chain: Цепочка для apply_async().
+    """
+    transcribe_options: Dict[str, Any] = {"queue": queue}
+    transcribe_kwargs: Dict[str, Any] = {}
+    if priority is not None:
+        transcribe_options["priority"] = priority
+        transcribe_kwargs["dispatch_priority"] = priority
+    return chain(
+        pipeline_transcribe.si(audio_id, **transcribe_kwargs).set(**transcribe_options),
+        pipeline_translate.s(target_language).set(queue=TRANSLATION_QUEUE),
+        pipeline_summarize.s(target_language).set(queue=SUMMARIZATION_QUEUE),
+    )
 
 
 @celery_app.task  # type: ignore
-def process_audio_file_chain(audio_id: int, target_language: str = "ru") -> Dict[str, Any]:
+def process_audio_file_chain(
+    audio_id: int, target_language: str = "ru", dispatch_priority: Optional[int] = None
+) -> Optional[int]:
     """
-    Полная цепочка обработки аудиофайла: транскрибирование -> перевод -> саммари.
-    Выполняется последовательно в одном воркере.
-    
+    Совместимость: сообщения цепочки, опубликованные до перехода на конвейер.
+
+    Транскрибирует файл в текущем воркере, а перевод и саммари отправляет
+    дальше по конвейеру (очереди translation и summarization).
+
     Args:
         audio_id (int): ID аудиофайла
         target_language (str): Целевой язык для перевода и саммари
-    
+        dispatch_priority (Optional[int]): Приоритет публикации
+
     Returns:
-        Dict[str, Any]: Результат обработки с ID всех созданных объектов
+        Optional[int]: ID транскрипта или None
     """
-    logger.info(f"[CHAIN] Начинаем обработку цепочки для аудио ID={audio_id}")
-    
-    result: Dict[str, Any] = {
-        "audio_id": audio_id,
-        "transcript_id": None,
-        "translation_id": None,
-        "summary_id": None,
-        "status": "processing",
-        "errors": []
-    }
-    
-    try:
-        # 1. Транскрибирование
-        logger.info(f"[CHAIN] Шаг 1/3: Транскрибирование аудио ID={audio_id}")
-        transcribe_audio(audio_id)
-        
-        # Получаем созданный транскрипт
-        engine = create_engine(settings.sync_database_url, future=True)
-        SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
-        
-        with SessionLocal() as session:
-            transcript = session.execute(
-                select(Transcript).where(Transcript.audio_file_id == audio_id)
-            ).scalar_one_or_none()
-            
-            if not transcript or transcript.status != "done":
-                raise Exception(f"Транскрибирование не удалось для аудио ID={audio_id}")
-            
-            result["transcript_id"] = int(transcript.id)
-            logger.info(f"[CHAIN] Транскрипт создан: ID={transcript.id}")
-            
-            # 2. Перевод
-            if target_language != transcript.language:
-                logger.info(f"[CHAIN] Шаг 2/3: Перевод с {transcript.language} на {target_language}")
-                success, translation_id = enqueue_translation(
-                    transcript_id=int(transcript.id),
-                    target_language=target_language
-                )
-                
-                if success and translation_id:
-                    # Ждем завершения перевода и запускаем его
-                    translate_transcript(translation_id)
-                    
-                    # Проверяем результат
-                    translation = session.get(Translation, translation_id)
-                    if not translation or translation.status != "done":
-                        raise Exception(f"Перевод не удался для транскрипта ID={transcript.id}")
-                    
-                    result["translation_id"] = translation_id
-                    logger.info(f"[CHAIN] Перевод создан: ID={translation_id}")
-                    
-                    # 3. Саммари
-                    logger.info(f"[CHAIN] Шаг 3/3: Создание саммари")
-                    success, summary_id = enqueue_summary(
-                        translation_id=translation_id,
-                        target_language=target_language
-                    )
-                    
-                    if success and summary_id:
-                        # Ждем завершения саммари и запускаем его
-                        summarize_translation(summary_id)
-                        
-                        # Проверяем результат
-                        summary = session.get(Summary, summary_id)
-                        if not summary or summary.status != "done":
-                            raise Exception(f"Саммари не удалось для перевода ID={translation_id}")
-                        
-                        result["summary_id"] = summary_id
-                        logger.info(f"[CHAIN] Саммари создано: ID={summary_id}")
-                    else:
-                        result["errors"].append("Не удалось создать задачу саммари")
+    transcript_id: Optional[int] = pipeline_transcribe(audio_id, dispatch_priority)
+    if transcript_id is not None:
+        chain(
+            pipeline_translate.s(transcript_id, target_language).set(
+                queue=TRANSLATION_QUEUE
+            ),
+            pipeline_summarize.s(target_language).set(queue=SUMMARIZATION_QUEUE),
+        ).apply_async()
+    return transcript_id
+
+
+def send_chain_task(
+    audio_id: int, target_language: str, priority: Optional[int], queue: str
+) -> None:
+    """
+    Публикует конвейер обработки аудиофайла с приоритетом планировщика.
+
+    Args:
+        audio_id (int): ID аудиофайла
+        target_language (str): Целевой язык
+        priority (Optional[int]): Приоритет Celery (None — без приоритета)
+        queue (str): Очередь стадии транскрибации
+    """
+    build_audio_pipeline(audio_id, target_language, priority, queue).apply_async()
+
+
+def reprioritize_queued_jobs(target_language: str = "ru") -> int:
+    """
+    Повышает приоритет давно ждущих задач (старение) повторной публикацией.
+
+    Старое сообщение остаётся в брокере, но при получении пропускается
+    (is_stale_dispatch), так как приоритет в AudioFile уже другой.
+
+    Args:
+        target_language (str): Целевой язык цепочки.
+
+    Returns:
+        int: Количество переопубликованных задач.
+    """
+    settings = get_settings()
+    if not settings.scheduler_enabled:
+        return 0
+    promoted = 0
+    with SyncSessionLocal() as session:
+        for audio, new_priority in find_promotions(session):
+            old_priority = audio.priority
+            # Сначала фиксируем новый приоритет: новое сообщение не должно
+            # оказаться «устаревшим», если его заберут сразу после публикации
+            session.execute(
+                update(AudioFile)
+                .where(AudioFile.id == audio.id)
+                .values(priority=new_priority)
+            )
+            session.commit()
+            cost = float(audio.expected_cost_seconds or 0.0)
+            try:
+                if settings.enable_processing_chains:
+                    queue = queue_for_cost(cost, CHAIN_QUEUE, settings)
+                    send_chain_task(int(audio.id), target_language, new_priority, queue)
                 else:
-                    result["errors"].append("Не удалось создать задачу перевода")
-            else:
-                logger.info(f"[CHAIN] Перевод не требуется (язык уже {target_language})")
-                
-        result["status"] = "completed"
-        logger.info(f"[CHAIN] Цепочка завершена для аудио ID={audio_id}")
-        
-    except Exception as e:
-        result["status"] = "failed"
-        result["errors"].append(str(e))
-        logger.error(f"[CHAIN] Ошибка в цепочке для аудио ID={audio_id}: {e}")
-        logger.error(traceback.format_exc())
-    
-    return result
+                    base = (
+                        model_queue_name(str(audio.whisper_model))
+                        if settings.transcription_model_queues
+                        else "transcription"
+                    )
+                    transcribe_audio.apply_async(
+                        args=[int(audio.id)],
+                        kwargs={"dispatch_priority": new_priority},
+                        queue=queue_for_cost(cost, base, settings),
+                        priority=new_priority,
+                    )
+                promoted += 1
+            except Exception as e:  # noqa: BLE001
+                # Публикация не удалась — возвращаем приоритет старого сообщения
+                session.execute(
+                    update(AudioFile)
+                    .where(AudioFile.id == audio.id)
+                    .values(priority=old_priority)
+                )
+                session.commit()
+                logger.warning("[SCHED] Failed to republish audio %s: %s", audio.id, e)
+    if promoted:
+        logger.info("[SCHED] Promoted %s aged jobs", promoted)
+    return promoted
 
 
 def enqueue_audio_chain(audio_id: int, target_language: str = "ru") -> bool:
@@ -693,17 +1793,18 @@ def enqueue_audio_chain(audio_id: int, target_language: str = "ru") -> bool:
         bool: True если задача поставлена в очередь
     """
     try:
-        # Проверяем доступность памяти
-        if not check_memory_available():
-            logger.warning(f"[CHAIN] Недостаточно памяти для запуска цепочки аудио ID={audio_id}")
-            return False
-            
-        # Ставим задачу в специальную очередь цепочек
-        celery_app.send_task(
-            "src.audioscribetranslate.core.tasks.process_audio_file_chain",
-            args=[audio_id, target_language],
-            queue="processing_chains"
+        # Память проверяют контроль допуска (pending) и автомасштабирование:
+        # публикация сообщения памяти не требует
+        # Ставим задачу в очередь цепочек: короткие файлы — с более высоким приоритетом
+        decision = schedule_dispatch(audio_id, CHAIN_QUEUE)
+        send_chain_task(
+            audio_id,
+            target_language,
+            decision.priority if decision else None,
+            decision.queue if decision else CHAIN_QUEUE,
         )
+        # Менеджер цепочек запускает воркер сразу, не дожидаясь опроса очереди
+        notify_queue_changed("audio_chain")
         
         logger.info(f"[CHAIN] Цепочка для аудио ID={audio_id} поставлена в очередь")
         return True
@@ -713,7 +1814,190 @@ def enqueue_audio_chain(audio_id: int, target_language: str = "ru") -> bool:
         return False
 
 
+def enqueue_audio(
+    audio_id: int, whisper_model: str, target_language: str = "ru"
+) -> bool:
+    """
+    Ставит аудиофайл в очередь цепочек или отдельной транскрибации.
+
+    Args:
+        audio_id (int): ID аудиофайла
+        whisper_model (str): Модель файла (для модельных очередей)
+        target_language (str): Целевой язык цепочки
+
+    Returns:
+        bool: True если задача поставлена в очередь
+    """
+    if get_settings().enable_processing_chains:
+        return enqueue_audio_chain(audio_id, target_language)
+    return enqueue_transcription(audio_id, whisper_model)
+
+
+def drain_pending_uploads(target_language: str = "ru") -> int:
+    """
+    Ставит отложенные (pending) загрузки в очередь по мере освобождения места.
+
+    Файлы берутся в порядке загрузки, пока работа в брокере не достигнет
+    admission_max_queue_work_seconds; в пустую очередь проходит хотя бы один
+    файл, даже если он один больше бюджета. Перевод pending -> queued делается
+    условным UPDATE до публикации, поэтому файл не уйдёт в очередь дважды.
+    Если брокер недоступен, файл возвращается в pending до следующего такта.
+
+    Args:
+        target_language (str): Целевой язык цепочки.
+
+    Returns:
+        int: Количество поставленных в очередь файлов.
+    """
+    settings = get_settings()
+    config = AdmissionConfig.from_settings(settings)
+    if not check_memory_available():
+        return 0
+    released = 0
+    with SyncSessionLocal() as session:
+        backlog = load_backlog_sync(session, None, config)
+        if backlog.pending_count == 0:
+            return 0
+        dispatched = backlog.dispatched_seconds
+        rows: Sequence[Any] = session.execute(
+            select(
+                AudioFile.id, AudioFile.whisper_model, AudioFile.expected_cost_seconds
+            )
+            .where(AudioFile.status == PENDING_STATUS)
+            .order_by(AudioFile.upload_time, AudioFile.id)
+            .limit(settings.admission_drain_batch_size)
+        ).all()
+        for audio_id, whisper_model, expected_cost in rows:
+            cost = float(expected_cost or config.default_cost_seconds)
+            if (
+                config.enabled
+                and dispatched > 0
+                and dispatched + cost > config.max_queue_work_seconds
+            ):
+                break
+            claimed = cast(
+                CursorResult[Any],
+                session.execute(
+                    update(AudioFile)
+                    .where(AudioFile.id == audio_id, AudioFile.status == PENDING_STATUS)
+                    .values(status="queued")
+                ),
+            ).rowcount
+            if not claimed:
+                session.rollback()
+                continue
+            record_job_event(
+                session, AUDIO_FILE, audio_id, "queued", PENDING_STATUS, audio_id
+            )
+            session.commit()
+            if not enqueue_audio(int(audio_id), str(whisper_model), target_language):
+                session.execute(
+                    update(AudioFile)
+                    .where(AudioFile.id == audio_id, AudioFile.status == "queued")
+                    .values(status=PENDING_STATUS)
+                )
+                record_job_event(
+                    session, AUDIO_FILE, audio_id, PENDING_STATUS, "queued", audio_id
+                )
+                session.commit()
+                logger.warning(
+                    "[ADMISSION] Re-enqueue failed for audio %s, kept pending", audio_id
+                )
+                break
+            released += 1
+            dispatched += cost
+    if released:
+        logger.info("[ADMISSION] Released %s pending uploads", released)
+    return released
+
+
+def reap_expired_leases(target_language: str = "ru") -> int:
+    """
+    Возвращает в очередь файлы, брошенные упавшими воркерами (аренда истекла).
+
+    Файл с исчерпанными попытками (attempts >= lease_max_attempts) помечается
+    failed вместе с незавершённым транскриптом, остальные — queued и
+    публикуются заново (при сбое брокера — pending для drain_pending_uploads).
+    Сегменты брошенного транскрипта сохраняются: новая попытка продолжит с них.
+
+    Args:
+        target_language (str): Целевой язык цепочки.
+
+    Returns:
+        int: Количество обработанных брошенных файлов.
+    """
+    settings = get_settings()
+    now = datetime.now(timezone.utc)
+    requeue: List[Tuple[int, str]] = []
+    reaped = 0
+    with SyncSessionLocal() as session:
+        rows = session.execute(
+            expired_leases_query(
+                AudioFile,
+                now,
+                settings.lease_reaper_batch_size,
+                AudioFile.whisper_model,
+            )
+        ).all()
+        for audio_id, attempts, owner, whisper_model in rows:
+            exhausted = int(attempts or 0) >= settings.lease_max_attempts
+            new_status = "failed" if exhausted else "queued"
+            # Условие повторяет выборку: воркер мог успеть продлить аренду
+            claimed = cast(
+                CursorResult[Any],
+                session.execute(
+                    update(AudioFile)
+                    .where(AudioFile.id == audio_id, abandoned_clause(AudioFile, now))
+                    .values(status=new_status, **released_lease_values())
+                ),
+            ).rowcount
+            if not claimed:
+                session.rollback()
+                continue
+            record_job_event(
+                session, AUDIO_FILE, audio_id, new_status, "processing", audio_id
+            )
+            if exhausted:
+                session.execute(
+                    update(Transcript)
+                    .where(
+                        Transcript.audio_file_id == audio_id,
+                        Transcript.status != "done",
+                    )
+                    .values(status="failed")
+                )
+            session.commit()
+            reaped += 1
+            logger.warning(
+                "[LEASE] Abandoned audio %s (owner=%s, attempt %s) -> %s",
+                audio_id,
+                owner,
+                attempts,
+                new_status,
+            )
+            if not exhausted:
+                requeue.append((int(audio_id), str(whisper_model)))
+        for audio_id, whisper_model in requeue:
+            if enqueue_audio(audio_id, whisper_model, target_language):
+                continue
+            session.execute(
+                update(AudioFile)
+                .where(AudioFile.id == audio_id, AudioFile.status == "queued")
+                .values(status=PENDING_STATUS)
+            )
+            record_job_event(
+                session, AUDIO_FILE, audio_id, PENDING_STATUS, "queued", audio_id
+            )
+            session.commit()
+    return reaped
+
+
 # Обновляем настройки маршрутизации для новых очередей
 celery_app.conf.task_routes.update({
-    "src.audioscribetranslate.core.tasks.process_audio_file_chain": {"queue": "processing_chains"},
+    "src.audioscribetranslate.core.tasks.process_audio_file_chain": {
+        "queue": CHAIN_QUEUE
+    },
+    PIPELINE_TRANSCRIBE_TASK: {"queue": CHAIN_QUEUE},
+    PIPELINE_TRANSLATE_TASK: {"queue": TRANSLATION_QUEUE},
+    PIPELINE_SUMMARIZE_TASK: {"queue": SUMMARIZATION_QUEUE},
 })
@@ -0,0 +1,253 @@
+"""
+Отдача больших текстов (транскриптов) частями: ETag, Range, окна по сегментам.
+
+Текст не загружается в память целиком: размер (octet_length) и ETag
+считаются в БД, а тело читается кусками substring(convert_to(text, 'UTF8'))
+по chunk_bytes байт. Range задаётся в байтах UTF-8 (RFC 9110), поэтому
+границы кусков могут проходить внутри многобайтового символа — клиент
+склеивает байты, а не строки.
+
+ETag строится по (id, updated_at, длина): любое изменение текста обновляет
+updated_at (onupdate), поэтому тело не хешируется. ETag окна по времени
+дополнительно учитывает число сегментов окна и их максимальный end —
+сегменты дописываются без изменения строки транскрипта. Если текст изменился во
+время отдачи (потоковая транскрипция ещё пишет), чтение прекращается —
+ответ короче Content-Length, и клиент повторяет запрос.
+
+Example:
+    start, end = parse_byte_range("bytes=0-1023", length)   # (0, 1023)
+    chunks = iter_text_bytes(AsyncSessionLocal, Transcript, 5, updated_at, start, end)
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple, Type
+
+from sqlalchemy import LargeBinary, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+from audioscribetranslate.core.pagination import AnySelect
+from audioscribetranslate.models.transcript_segment import TranscriptSegment
+
+DEFAULT_CHUNK_BYTES = 256 * 1024
+
+# Сегменты Whisper не длиннее окна декодирования (30 с): нижняя граница поиска
+# по индексу (transcript_id, start) для окна [start, end)
+SEGMENT_MAX_SECONDS = 30.0
+
+
+class RangeNotSatisfiableError(ValueError):
+    """Запрошенный диапазон байт лежит за пределами текста (HTTP 416)."""
+
+
+def make_etag(
+    entity_id: int, updated_at: Optional[datetime], length: int, suffix: str = ""
+) -> str:
+    """
+    Строит сильный ETag текста без чтения тела.
+
+    Args:
+        entity_id (int): ID записи.
+        updated_at (Optional[datetime]): Время последнего изменения записи.
+        length (int): Размер текста в байтах.
+        suffix (str): Уточнение представления (например, окно по времени).
+
+    Returns:
+        str: ETag в кавычках, например '"5-18c2a1f0e3b-1048576"'.
+    """
+    stamp = format(int(updated_at.timestamp() * 1_000_000), "x") if updated_at else "0"
+    tag = f"{entity_id}-{stamp}-{length}"
+    if suffix:
+        tag = f"{tag}-{suffix}"
+    return f'"{tag}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Проверяет заголовок If-None-Match (слабое сравнение, список, "*").
+
+    Args:
+        if_none_match (Optional[str]): Значение заголовка.
+        etag (str): Текущий ETag.
+
+    Returns:
+        bool: True — у клиента актуальная версия (ответ 304).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def parse_byte_range(header: Optional[str], length: int) -> Optional[Tuple[int, int]]:
+    """
+    Разбирает заголовок Range с одним диапазоном байт.
+
+    Args:
+        header (Optional[str]): Значение Range ("bytes=0-99", "bytes=100-", "bytes=-50").
+        length (int): Полный размер тела в байтах.
+
+    Returns:
+        Optional[Tuple[int, int]]: (первый, последний) байт включительно или
+            None — заголовка нет, он некорректен или диапазонов несколько
+            (отдаётся всё тело, как разрешает RFC 9110).
+
+    Raises:
+        RangeNotSatisfiableError: Диапазон начинается за концом тела.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header[len("bytes=") :].strip()
+    if "," in spec or "-" not in spec:
+        return None
+    first_s, last_s = (part.strip() for part in spec.split("-", 1))
+    if not (first_s or last_s).isdigit() or (
+        first_s and last_s and not last_s.isdigit()
+    ):
+        return None
+    if not first_s:
+        # Суффикс: последние N байт
+        suffix = int(last_s)
+        if suffix == 0:
+            raise RangeNotSatisfiableError(header)
+        return max(length - suffix, 0), length - 1
+    first = int(first_s)
+    last = int(last_s) if last_s else length - 1
+    if first >= length:
+        raise RangeNotSatisfiableError(header)
+    if last < first:
+        return None
+    return first, min(last, length - 1)
+
+
+def text_meta_query(model: Type[Any], entity_id: int) -> AnySelect:
+    """
+    Запрос метаданных текста без самого текста.
+
+    Args:
+        model (Type): ORM-модель с колонками id, status, updated_at, text.
+        entity_id (int): ID записи.
+
+    Returns:
+        Select: Колонки status, updated_at, length (байт UTF-8, None если текста нет).
+    """
+    return select(
+        model.status,
+        model.updated_at,
+        func.octet_length(model.text).label("length"),
+    ).where(model.id == entity_id)
+
+
+async def iter_text_bytes(
+    session_factory: Callable[[], AsyncSession],
+    model: Type[Any],
+    entity_id: int,
+    updated_at: Optional[datetime],
+    first: int,
+    last: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> AsyncIterator[bytes]:
+    """
+    Отдаёт байты text[first..last] кусками по chunk_bytes.
+
+    Args:
+        session_factory (Callable[[], AsyncSession]): Фабрика сессий (сессия
+            запроса к моменту отдачи тела может быть уже закрыта).
+        model (Type): ORM-модель с колонками id, updated_at, text.
+        entity_id (int): ID записи.
+        updated_at (Optional[datetime]): Версия, для которой посчитан ETag.
+        first (int): Первый байт (включительно).
+        last (int): Последний байт (включительно).
+        chunk_bytes (int): Размер куска.
+
+    Yields:
+        bytes: Очередной кусок тела.
+    """
+    chunk_bytes = max(chunk_bytes, 1)
+    async with session_factory() as session:
+        offset = first
+        while offset <= last:
+            size = min(chunk_bytes, last - offset + 1)
+            body = func.convert_to(model.text, "UTF8")
+            stmt: AnySelect = select(
+                func.substring(body, offset + 1, size, type_=LargeBinary)
+            ).where(model.id == entity_id)
+            if updated_at is not None:
+                # Текст изменился после расчёта ETag — прерываем отдачу
+                stmt = stmt.where(model.updated_at == updated_at)
+            chunk = (await session.execute(stmt)).scalar_one_or_none()
+            if not chunk:
+                return
+            yield bytes(chunk)
+            offset += len(chunk)
+
+
+def _segment_window_filters(
+    transcript_id: int, start: float, end: Optional[float]
+) -> List[ColumnElement[bool]]:
+    """Условия отбора сегментов, пересекающих окно [start, end) по времени."""
+    seg_start: ColumnElement[float] = TranscriptSegment.start
+    seg_end: ColumnElement[float] = TranscriptSegment.end
+    filters = [
+        TranscriptSegment.transcript_id == transcript_id,
+        seg_start >= start - SEGMENT_MAX_SECONDS,
+        seg_end > start,
+    ]
+    if end is not None:
+        filters.append(seg_start < end)
+    return filters
+
+
+def segment_window_query(
+    transcript_id: int, start: float, end: Optional[float]
+) -> AnySelect:
+    """
+    Запрос сегментов, пересекающих окно [start, end) по времени.
+
+    Args:
+        transcript_id (int): ID транскрипта.
+        start (float): Начало окна (сек).
+        end (Optional[float]): Конец окна (сек), None — до конца записи.
+
+    Returns:
+        Select: Колонки start, end, text в порядке start.
+    """
+    seg_start: ColumnElement[float] = TranscriptSegment.start
+    seg_end: ColumnElement[float] = TranscriptSegment.end
+    stmt: AnySelect = (
+        select(seg_start, seg_end, TranscriptSegment.text)
+        .where(*_segment_window_filters(transcript_id, start, end))
+        .order_by(seg_start)
+    )
+    return stmt
+
+
+def segment_window_version_query(
+    transcript_id: int, start: float, end: Optional[float]
+) -> AnySelect:
+    """
+    Запрос версии окна: число сегментов и максимальный end.
+
+    Потоковая транскрипция дописывает сегменты, не всегда обновляя
+    Transcript.updated_at, поэтому ETag окна строится по этой паре.
+
+    Args:
+        transcript_id (int): ID транскрипта.
+        start (float): Начало окна (сек).
+        end (Optional[float]): Конец окна (сек), None — до конца записи.
+
+    Returns:
+        Select: Колонки segments, max_end (одна строка).
+    """
+    seg_end: ColumnElement[float] = TranscriptSegment.end
+    stmt: AnySelect = select(
+        func.count().label("segments"), func.max(seg_end).label("max_end")
+    ).where(*_segment_window_filters(transcript_id, start, end))
+    return stmt
+
+
+def join_segment_texts(texts: List[str]) -> str:
+    """Склеивает тексты сегментов так же, как итоговый Transcript.text."""
+    return " ".join(texts)
@@ -0,0 +1,136 @@
+"""
+Модуль синхронного движка SQLAlchemy для Celery-задач и фоновых сервисов.
+
+Один пул соединений на процесс: движок создаётся лениво при первом обращении
+и пересоздаётся после fork (prefork-воркеры Celery), чтобы дочерние процессы
+не делили сокеты родителя.
+
+Example:
+    with SyncSessionLocal() as session:
+        audio = session.get(AudioFile, 1)
+
+Pitfalls:
+    - После fork необходимо вызвать reset_sync_engine() (делается в сигнале
+      worker_process_init), иначе соединения родителя будут использованы повторно.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from audioscribetranslate.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_engine: Optional[Engine] = None
+_engine_pid: Optional[int] = None
+_session_factory: Optional["sessionmaker[Session]"] = None
+_lock = threading.Lock()
+
+
+def get_sync_engine() -> Engine:
+    """
+    Возвращает синхронный движок текущего процесса, создавая его при необходимости.
+
+    Returns:
+        Engine: Движок с пулом соединений, настроенным из Settings
+            (db_pool_size, db_max_overflow, db_pool_recycle, db_pool_pre_ping).
+
+    Example:
+        >>> engine = get_sync_engine()
+        >>> engine is get_sync_engine()
+        True
+
+    Note:
+        Если PID процесса изменился (fork), старый движок отбрасывается без
+        закрытия соединений родителя и создаётся новый.
+    """
+    global _engine, _engine_pid, _session_factory
+    pid = os.getpid()
+    if _engine is not None and _engine_pid == pid:
+        return _engine
+    with _lock:
+        if _engine is not None and _engine_pid != pid:
+            # Унаследованный после fork пул: не закрываем сокеты родителя
+            _engine.dispose(close=False)
+            _engine = None
+            _session_factory = None
+        if _engine is None:
+            settings = get_settings()
+            _engine = create_engine(
+                settings.sync_database_url,
+                future=True,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_recycle=settings.db_pool_recycle,
+                pool_pre_ping=settings.db_pool_pre_ping,
+                pool_timeout=settings.db_pool_timeout,
+            )
+            _engine_pid = pid
+            logger.debug("[DB] Sync engine created for pid=%s", pid)
+        return _engine
+
+
+def get_sync_sessionmaker() -> "sessionmaker[Session]":
+    """
+    Возвращает фабрику синхронных сессий, привязанную к движку процесса.
+
+    Returns:
+        sessionmaker[Session]: Фабрика сессий с expire_on_commit=False.
+    """
+    global _session_factory
+    engine = get_sync_engine()
+    if _session_factory is None:
+        _session_factory = sessionmaker(
+            bind=engine, expire_on_commit=False, future=True
+        )
+    return _session_factory
+
+
+def SyncSessionLocal() -> Session:
+    """
+    Создаёт новую синхронную сессию на общем пуле соединений процесса.
+
+    Returns:
+        Session: Сессия SQLAlchemy (использовать как контекстный менеджер).
+
+    Example:
+        with SyncSessionLocal() as session:
+            session.execute(...)
+    """
+    return get_sync_sessionmaker()()
+
+
+def reset_sync_engine() -> None:
+    """
+    Сбрасывает движок, унаследованный от родительского процесса после fork.
+
+    Соединения родителя не закрываются (dispose(close=False)), новый пул будет
+    создан лениво при следующем обращении.
+    """
+    global _engine, _engine_pid, _session_factory
+    with _lock:
+        if _engine is not None:
+            _engine.dispose(close=False)
+        _engine = None
+        _engine_pid = None
+        _session_factory = None
+
+
+def dispose_sync_engine() -> None:
+    """
+    Закрывает все соединения пула текущего процесса (при завершении воркера).
+    """
+    global _engine, _engine_pid, _session_factory
+    with _lock:
+        if _engine is not None and _engine_pid == os.getpid():
+            _engine.dispose()
+            logger.debug("[DB] Sync engine disposed for pid=%s", _engine_pid)
+        _engine = None
+        _engine_pid = None
+        _session_factory = None
@@ -6,12 +6,21 @@
 #     from audioscribetranslate.models import user, audio_file
 
 from .audio_file import AudioFile
+from .job_event import JobEvent
 from .summary import Summary
 from .transcript import Transcript
+from .transcript_segment import TranscriptSegment
 from .translation import Translation
 
 # Импортируем все модели для правильной работы relationships
 from .user import User
 
-__all__ = ["User", "AudioFile", "Transcript", "Translation", "Summary"]
-__all__ = ["User", "AudioFile", "Transcript", "Translation", "Summary"]
+__all__ = [
+    "User",
+    "AudioFile",
+    "Transcript",
+    "TranscriptSegment",
+    "Translation",
+    "Summary",
+    "JobEvent",
+]
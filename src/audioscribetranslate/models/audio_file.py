@@ -1,6 +1,16 @@
 from typing import Any
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -21,8 +31,18 @@ class AudioFile(Base):
         size (int): Размер файла в байтах.
         upload_time (datetime): Время загрузки файла.
         whisper_model (str): Название модели Whisper, выбранной для транскрибации.
-        status (str): Статус обработки: uploaded, processing, done, failed.
+        status (str): Статус обработки: uploaded, pending (отложен контролем
+            допуска), queued, processing, done, failed.
         storage_path (str): Относительный путь (model/user/filename).
+        content_hash (str): SHA-256 содержимого файла (hex), для дедупликации.
+        duration_seconds (float): Длительность аудио, определённая при загрузке.
+        expected_cost_seconds (float): Ожидаемое время обработки (оценка планировщика).
+        priority (int): Приоритет Celery последней публикации (0 — наивысший).
+        enqueued_at (datetime): Время постановки в очередь (для старения).
+        lease_owner (str): Воркер, держащий файл в обработке (core.leases).
+        lease_expires_at (datetime): Срок аренды; истёкшую забирает сборщик.
+        heartbeat_at (datetime): Последнее продление аренды воркером.
+        attempts (int): Число захватов в обработку (повторы после сбоев).
         transcripts (List[Transcript]): Список транскриптов, связанных с этим файлом.
 
     Example:
@@ -31,9 +51,38 @@ class AudioFile(Base):
     Pitfalls:
         - Необходимо корректно заполнять storage_path для поиска файла.
         - Статус должен обновляться при обработке.
+        - transcripts не загружаются неявно: нужен selectinload(AudioFile.transcripts).
     """
 
     __tablename__ = "audio_files"
+    __table_args__ = (
+        # Частичный индекс для count(*) глубины очереди (core.queue_depth)
+        Index(
+            "ix_audio_files_active_status",
+            "status",
+            "whisper_model",
+            postgresql_where=text(
+                "status IN ('uploaded', 'pending', 'queued', 'processing')"
+            ),
+        ),
+        # Список файлов: фильтр user_id/status + сортировка по upload_time
+        Index("ix_audio_files_user_id_upload_time", "user_id", "upload_time"),
+        Index("ix_audio_files_status_upload_time", "status", "upload_time"),
+        Index("ix_audio_files_upload_time", "upload_time"),
+        # Старение приоритетов: ждущие задачи по времени постановки (core.scheduler)
+        Index(
+            "ix_audio_files_queued_enqueued_at",
+            "enqueued_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        # Отложенные загрузки в порядке поступления (core.admission)
+        Index(
+            "ix_audio_files_pending_upload_time",
+            "upload_time",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id = Column(
         Integer, primary_key=True, index=True
@@ -68,11 +117,39 @@ class AudioFile(Base):
     storage_path = Column(
         String, nullable=True
     )  # Относительный путь (model/user/filename)
+    content_hash = Column(
+        String(64), nullable=True, index=True
+    )  # SHA-256 содержимого (hex), ключ дедупликации
+    duration_seconds = Column(
+        Float, nullable=True
+    )  # Длительность аудио (сек), None если не удалось определить
+    expected_cost_seconds = Column(
+        Float, nullable=True
+    )  # Ожидаемое время обработки: длительность × RTF модели
+    priority = Column(
+        Integer, nullable=True
+    )  # Приоритет Celery последней публикации (0 — наивысший)
+    enqueued_at = Column(
+        DateTime(timezone=True), nullable=True
+    )  # Время постановки в очередь (для старения)
+    lease_owner = Column(
+        String(128), nullable=True
+    )  # Воркер, держащий файл в обработке (host:pid:suffix)
+    lease_expires_at = Column(
+        DateTime(timezone=True), nullable=True
+    )  # Срок аренды; истёкшую забирает сборщик брошенных задач
+    heartbeat_at = Column(
+        DateTime(timezone=True), nullable=True
+    )  # Последнее продление аренды воркером
+    attempts = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )  # Число захватов в обработку
 
     # ORM relationships
     transcripts = relationship(
         "Transcript",
         back_populates="audio_file",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,  # дочерние строки удаляет ON DELETE CASCADE
+        lazy="raise_on_sql",
     )
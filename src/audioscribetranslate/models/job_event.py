@@ -0,0 +1,48 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class JobEvent(Base):
+    """
+    Журнал переходов статусов задач (только добавление).
+
+    Каждая смена статуса AudioFile, Transcript, Translation или Summary
+    записывается отдельной строкой с временем перехода. Из пар событий
+    (queued -> processing, processing -> done) считаются ожидание в очереди
+    и время обработки по стадиям, включая перцентили (core.job_events).
+
+    Attributes:
+        id (int): Уникальный идентификатор события.
+        entity_type (str): Тип сущности: audio_file, transcript, translation, summary.
+        entity_id (int): ID сущности.
+        audio_file_id (int): ID исходного аудиофайла (для сквозной трассировки).
+        from_status (str): Предыдущий статус (None, если неизвестен).
+        to_status (str): Новый статус.
+        created_at (datetime): Время перехода.
+
+    Example:
+        event = JobEvent(entity_type='transcript', entity_id=1, to_status='done')
+
+    Pitfalls:
+        - Строки не обновляются и не удаляются вместе с сущностью: внешних
+          ключей нет, чтобы журнал переживал удаление файлов.
+        - Событие добавляется в ту же транзакцию, что и смена статуса.
+    """
+
+    __tablename__ = "job_events"
+    __table_args__ = (
+        Index("ix_job_events_entity", "entity_type", "entity_id", "created_at"),
+        Index("ix_job_events_to_status_created_at", "to_status", "created_at"),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    entity_type = Column(String(32), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    audio_file_id = Column(Integer, nullable=True)
+    from_status = Column(String(32), nullable=True)
+    to_status = Column(String(32), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -19,6 +19,9 @@ class Summary(Base):
         model_name (str): Название модели суммаризации.
         status (str): Статус обработки: processing, done, failed.
         text (str): Текст саммари.
+        processing_seconds (float): Время обработки (сек).
+        input_chars (int): Количество символов суммаризированного текста.
+        text_chars (int): Количество символов в саммари.
         created_at (datetime): Время создания.
         updated_at (datetime): Время обновления.
         translation (Translation): Связанный объект перевода.
@@ -29,8 +32,20 @@ class Summary(Base):
     Pitfalls:
         - Статус должен обновляться при обработке.
         - Связь с Translation должна быть корректно настроена.
+        - translation загружается только явно: selectinload(Summary.translation).
     """
     __tablename__ = "summaries"
+    __table_args__ = (
+        # Саммари перевода на конкретный язык (фильтры translation_id + target_language)
+        Index(
+            "ix_summaries_source_translation_id_target_language",
+            "source_translation_id",
+            "target_language",
+        ),
+        # Список: фильтр status + сортировка по created_at
+        Index("ix_summaries_status_created_at", "status", "created_at"),
+        Index("ix_summaries_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     source_translation_id = Column(
@@ -51,11 +66,15 @@ class Summary(Base):
             kwargs["status"] = "processing"
         super().__init__(**kwargs)
     text = Column(Text, nullable=True)
+    # Метрики
+    processing_seconds = Column(Float, nullable=True)
+    input_chars = Column(Integer, nullable=True)
+    text_chars = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     translation = relationship(
-        "Translation", back_populates="summaries", lazy="selectin"
+        "Translation", back_populates="summaries", lazy="raise_on_sql"
     )
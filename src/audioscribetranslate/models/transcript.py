@@ -1,6 +1,16 @@
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -22,6 +32,7 @@ class Transcript(Base):
         processing_seconds (float): Время обработки (сек).
         text_chars (int): Количество символов в тексте.
         real_time_factor (float): processing_seconds / audio_duration_seconds.
+        progress_percent (float): Прогресс потоковой транскрипции (0-100).
         created_at (datetime): Время создания.
         updated_at (datetime): Время обновления.
         audio_file (AudioFile): Связанный аудиофайл.
@@ -33,8 +44,22 @@ class Transcript(Base):
     Pitfalls:
         - Статус должен обновляться при обработке.
         - Связь с AudioFile и Translation должна быть корректно настроена.
+        - Связи загружаются только явно (selectinload/joinedload в запросе),
+          иначе обращение к ним поднимает ошибку вместо скрытого запроса.
     """
     __tablename__ = "transcripts"
+    __table_args__ = (
+        # Список транскриптов: фильтр status + сортировка по created_at
+        Index("ix_transcripts_status_created_at", "status", "created_at"),
+        Index("ix_transcripts_created_at", "created_at"),
+        # Исторический RTF по моделям (core.scheduler.load_historical_rtf)
+        Index(
+            "ix_transcripts_done_model_name_rtf",
+            "model_name",
+            "real_time_factor",
+            postgresql_where=text("status = 'done'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     audio_file_id = Column(
@@ -59,17 +84,21 @@ class Transcript(Base):
     real_time_factor = Column(
         Float, nullable=True
     )  # processing_seconds / audio_duration_seconds
+    progress_percent = Column(
+        Float, nullable=True
+    )  # конец последнего сегмента / длительность аудио * 100
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     audio_file = relationship(
-        "AudioFile", back_populates="transcripts", lazy="selectin"
+        "AudioFile", back_populates="transcripts", lazy="raise_on_sql"
     )
     translations = relationship(
         "Translation",
         back_populates="transcript",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,  # дочерние строки удаляет ON DELETE CASCADE
+        lazy="raise_on_sql",
     )
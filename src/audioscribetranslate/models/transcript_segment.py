@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, Text
+
+from .base import Base
+
+
+class TranscriptSegment(Base):
+    """
+    Модель сегмента транскрипта (потоковая транскрипция).
+
+    Сегменты записываются партиями по мере декодирования, поэтому после сбоя
+    задачи уже распознанная часть сохраняется, а транскрипция продолжается
+    с конца последнего сегмента.
+
+    Attributes:
+        id (int): Уникальный идентификатор сегмента.
+        transcript_id (int): ID транскрипта.
+        start (float): Начало сегмента (сек от начала файла).
+        end (float): Конец сегмента (сек от начала файла).
+        text (str): Текст сегмента.
+        avg_logprob (float): Средняя лог-вероятность токенов сегмента.
+
+    Example:
+        segment = TranscriptSegment(transcript_id=1, start=0.0, end=2.5, text='...')
+
+    Pitfalls:
+        - Итоговый Transcript.text собирается из сегментов в порядке start.
+    """
+
+    __tablename__ = "transcript_segments"
+    __table_args__ = (
+        Index("ix_transcript_segments_transcript_id_start", "transcript_id", "start"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    transcript_id = Column(
+        Integer,
+        ForeignKey("transcripts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    start = Column(Float, nullable=False)
+    end = Column(Float, nullable=False)
+    text = Column(Text, nullable=False)
+    avg_logprob = Column(Float, nullable=True)
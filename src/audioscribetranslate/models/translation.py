@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -17,10 +17,12 @@ class Translation(Base):
         source_language (str): Язык исходного текста.
         target_language (str): Язык перевода.
         model_name (str): Название модели перевода.
+        backend (str): Реализация, выполнившая перевод (ctranslate2 / stub).
         status (str): Статус обработки: processing, done, failed.
         text (str): Текст перевода.
         processing_seconds (float): Время обработки (сек).
         text_chars (int): Количество символов в тексте.
+        tokens_per_second (float): Скорость перевода (сгенерированных токенов в секунду).
         created_at (datetime): Время создания.
         updated_at (datetime): Время обновления.
         transcript (Transcript): Связанный транскрипт.
@@ -32,8 +34,20 @@ class Translation(Base):
     Pitfalls:
         - Статус должен обновляться при обработке.
         - Связь с Transcript и Summary должна быть корректно настроена.
+        - transcript и summaries загружаются только опциями запроса (selectinload).
     """
     __tablename__ = "translations"
+    __table_args__ = (
+        # Переводы транскрипта на конкретный язык (фильтры transcript_id + target_language)
+        Index(
+            "ix_translations_transcript_id_target_language",
+            "transcript_id",
+            "target_language",
+        ),
+        # Список: фильтр status + сортировка по created_at
+        Index("ix_translations_status_created_at", "status", "created_at"),
+        Index("ix_translations_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     transcript_id = Column(
@@ -45,6 +59,7 @@ class Translation(Base):
     source_language = Column(String, nullable=True)
     target_language = Column(String, nullable=False)
     model_name = Column(String, nullable=True)
+    backend = Column(String(32), nullable=True)
     status = Column(String, default="processing", server_default="processing", nullable=False)  # processing|done|failed
 
     def __init__(self, **kwargs: Any) -> None:
@@ -55,17 +70,19 @@ class Translation(Base):
     # Метрики
     processing_seconds = Column(Float, nullable=True)
     text_chars = Column(Integer, nullable=True)
+    tokens_per_second = Column(Float, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     transcript = relationship(
-        "Transcript", back_populates="translations", lazy="selectin"
+        "Transcript", back_populates="translations", lazy="raise_on_sql"
     )
     summaries = relationship(
         "Summary",
         back_populates="translation",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,  # дочерние строки удаляет ON DELETE CASCADE
+        lazy="raise_on_sql",
     )
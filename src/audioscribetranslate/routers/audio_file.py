@@ -2,17 +2,50 @@ import os
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from sqlalchemy import asc, desc, func
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql import ColumnElement
 
+from audioscribetranslate.core.admission import (
+    ADMIT,
+    PENDING_STATUS,
+    AdmissionConfig,
+    decide_admission,
+    load_backlog,
+)
 from audioscribetranslate.core.config import get_settings
-from audioscribetranslate.core.files import get_uploaded_files_dir
-from audioscribetranslate.core.tasks import enqueue_audio_chain, enqueue_transcription
+from audioscribetranslate.core.files import (
+    UploadTooLargeError,
+    get_uploaded_files_dir,
+    save_upload_stream,
+)
+from audioscribetranslate.core.job_events import AUDIO_FILE, record_job_event
+from audioscribetranslate.core.pagination import (
+    AnySelect,
+    InvalidCursorError,
+    paginate,
+)
+from audioscribetranslate.core.scheduler import plan_job
+from audioscribetranslate.core.tasks import (
+    check_memory_available,
+    enqueue_audio_chain,
+    enqueue_transcription,
+)
 from audioscribetranslate.db.session import get_db
 from audioscribetranslate.models.audio_file import AudioFile
+from audioscribetranslate.services.transcription import probe_audio_duration
 
 router = APIRouter(prefix="/audio_files", tags=["audio_files"])
 
@@ -31,6 +64,7 @@ class WhisperModelEnum(str, Enum):
 
 @router.post("/", response_model=dict)
 async def upload_audio_file(
+    response: Response,
     file: UploadFile = File(...),
     whisper_model: WhisperModelEnum = Form(
         ..., description="Название модели Whisper для транскрибации"
@@ -41,7 +75,14 @@ async def upload_audio_file(
     """
     Загружает аудиофайл, валидирует выбранную модель Whisper и сохраняет запись в БД.
 
+    Контроль допуска (core/admission.py): при перегрузке запрос отклоняется
+    до копирования файла в хранилище и подсчёта хеша (429 — работа
+    пользователя, 503 — общий бэклог, оба с Retry-After). Принятый файл ставится в очередь или, если очередь брокера
+    заполнена, не хватает памяти или брокер недоступен, остаётся в статусе
+    pending: его поставит в очередь менеджер цепочек (drain_pending_uploads).
+
     Args:
+        response (Response): Ответ (Retry-After для отложенного файла).
         file (UploadFile): Загружаемый аудиофайл.
         whisper_model (WhisperModelEnum): Модель Whisper для транскрибации.
         user_id (int): ID пользователя.
@@ -53,9 +94,17 @@ async def upload_audio_file(
     Example:
         POST /audio_files с multipart/form-data
 
+    Raises:
+        HTTPException: 400 — недопустимая модель, 404 — пользователь не найден,
+            413 — файл больше max_upload_size_mb, 429/503 — перегрузка.
+
     Pitfalls:
         - Проверяйте доступность модели Whisper.
         - Файл сохраняется на диск, убедитесь в наличии прав.
+        - Тело к этому моменту уже принято: FastAPI разбирает multipart (и
+          сбрасывает файл во временный) до вызова обработчика, а user_id
+          приходит в той же форме. Отказ экономит копирование, хеш и ffprobe,
+          но не трафик загрузки.
     """
     settings = get_settings()
     allowed_models = settings.whisper_models_list
@@ -65,14 +114,6 @@ async def upload_audio_file(
             detail=f"Недопустимая модель Whisper: {whisper_model}. Доступные: {allowed_models}",
         )
 
-    # Пример: сохраняем файл на диск (можно заменить на S3 или другое хранилище)
-    import os
-    import uuid
-
-    # Проверяем пользователя
-    user_row = await db.execute(
-        select(AudioFile.user_id).where(AudioFile.user_id == user_id)
-    )
     # Получаем имя пользователя (нужно для структуры директорий)
     from audioscribetranslate.models.user import User
 
@@ -81,54 +122,111 @@ async def upload_audio_file(
     if not user_obj:
         raise HTTPException(status_code=404, detail="User not found")
 
-        # Путь: <base_dir>/<model>/<user_name>/
+    # Отказ до копирования в хранилище и хеша (тело уже принято разбором формы)
+    admission = AdmissionConfig.from_settings(settings)
+    precheck = decide_admission(await load_backlog(db, user_id, admission), 0.0, admission)
+    if not precheck.admitted:
+        raise HTTPException(
+            status_code=precheck.status_code,
+            detail=precheck.reason,
+            headers={"Retry-After": str(precheck.retry_after)},
+        )
+
+    # Путь: <base_dir>/<model>/<user_name>/<sha256><ext> (адресация по содержимому)
     base_dir = get_uploaded_files_dir()
     target_dir = os.path.join(base_dir, whisper_model.value, user_obj.name)
-    os.makedirs(target_dir, exist_ok=True)
-    unique_filename = f"{uuid.uuid4().hex}_{file.filename}"
-    relative_storage_path = f"{whisper_model.value}/{user_obj.name}/{unique_filename}"
-    file_path = os.path.join(get_uploaded_files_dir(), relative_storage_path)
-    with open(file_path, "wb") as f:
-        f.write(await file.read())
+    # Потоковое копирование блоками вне event loop: память не зависит от размера файла
+    try:
+        stored = await run_in_threadpool(
+            save_upload_stream,
+            file.file,
+            target_dir,
+            max_bytes=settings.max_upload_size_mb * 1024 * 1024,
+            chunk_size=settings.upload_chunk_size_kb * 1024,
+            original_name=file.filename,
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    finally:
+        await file.close()
+    stored_filename = os.path.basename(stored.path)
+    relative_storage_path = f"{whisper_model.value}/{user_obj.name}/{stored_filename}"
+    # Длительность по заголовкам (без ffprobe для MP3/FLAC/OGG/M4A/WAV) — нужна планировщику
+    duration_seconds = await probe_audio_duration(stored.path)
+    # Оценка стоимости по RTF модели по умолчанию; планировщик уточнит её историей
+    cost_seconds = plan_job(
+        duration_seconds, whisper_model.value, "", settings=settings
+    ).expected_seconds
+    # Файл уже на диске: вместо отказа он только откладывается в pending
+    admission_decision = decide_admission(
+        await load_backlog(db, user_id, admission),
+        cost_seconds,
+        admission,
+        memory_ok=await run_in_threadpool(check_memory_available),
+    )
+    deferred = admission_decision.action != ADMIT
 
     audio = AudioFile(
         user_id=user_id,
-        filename=unique_filename,
+        filename=stored_filename,
         original_name=file.filename,
         content_type=file.content_type,
-        size=os.path.getsize(file_path),
+        size=stored.size,
         whisper_model=whisper_model,
         status="uploaded",
         storage_path=relative_storage_path,
+        content_hash=stored.sha256,
+        duration_seconds=duration_seconds,
+        expected_cost_seconds=cost_seconds,
     )
     db.add(audio)
-    await db.commit()
-    await db.refresh(audio)
-    # Помещаем задачу в очередь на обработку (не блокируя ответ)
-    from fastapi.concurrency import run_in_threadpool
-
-    settings = get_settings()
-    
-    # Выбираем тип обработки: цепочки или отдельные задачи
-    if settings.enable_processing_chains:
-        # Используем новую систему цепочек обработки
-        enqueue_ok = await run_in_threadpool(enqueue_audio_chain, int(audio.id), "ru")
-        processing_type = "chain"
+    await db.flush()
+    audio_id = int(audio.id)
+    record_job_event(db, AUDIO_FILE, audio_id, "uploaded", audio_file_id=audio_id)
+    enqueue_ok = False
+    processing_type: Optional[str] = None
+    if deferred:
+        setattr(audio, "status", PENDING_STATUS)
+        record_job_event(db, AUDIO_FILE, audio_id, PENDING_STATUS, "uploaded", audio_id)
+        await db.commit()
+        await db.refresh(audio)
     else:
-        # Используем старую систему отдельных задач
-        enqueue_ok = await run_in_threadpool(enqueue_transcription, int(audio.id))
-        processing_type = "transcription_only"
-        
-    if enqueue_ok:
+        # queued фиксируется до публикации: иначе воркер может успеть перевести
+        # файл в processing, а запоздалый queued перезапишет статус
         setattr(audio, "status", "queued")
+        record_job_event(db, AUDIO_FILE, audio_id, "queued", "uploaded", audio_id)
         await db.commit()
         await db.refresh(audio)
+        # Помещаем задачу в очередь на обработку (не блокируя ответ)
+        # Выбираем тип обработки: цепочки или отдельные задачи
+        if settings.enable_processing_chains:
+            # Используем новую систему цепочек обработки
+            enqueue_ok = await run_in_threadpool(enqueue_audio_chain, audio_id, "ru")
+            processing_type = "chain"
+        else:
+            # Используем старую систему отдельных задач
+            enqueue_ok = await run_in_threadpool(
+                enqueue_transcription, audio_id, str(audio.whisper_model)
+            )
+            processing_type = "transcription_only"
+        if not enqueue_ok:
+            # Брокер недоступен: файл не теряется, его переотправит менеджер цепочек
+            setattr(audio, "status", PENDING_STATUS)
+            record_job_event(db, AUDIO_FILE, audio_id, PENDING_STATUS, "queued", audio_id)
+            await db.commit()
+            await db.refresh(audio)
+    if not enqueue_ok and admission_decision.retry_after:
+        # Подсказка клиенту, когда проверять статус отложенного файла
+        response.headers["Retry-After"] = str(admission_decision.retry_after)
     return {
         "id": audio.id,
         "filename": audio.filename,
         "relative_path": relative_storage_path,
+        "content_hash": audio.content_hash,
+        "deduplicated": stored.deduplicated,
+        "duration_seconds": audio.duration_seconds,
         "whisper_model": audio.whisper_model,
-        "status": audio.status if enqueue_ok else "queue_failed",
+        "status": audio.status,
         "processing_type": processing_type if enqueue_ok else None,
     }
 
@@ -144,6 +242,8 @@ async def list_audio_files(
     order_dir: str = "desc",
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
 ) -> dict[str, Any]:
     """
     Получает список аудиофайлов с фильтрами и пагинацией.
@@ -157,10 +257,12 @@ async def list_audio_files(
         order_by (str): Поле сортировки.
         order_dir (str): Направление сортировки.
         limit (int): Лимит.
-        offset (int): Смещение.
+        offset (int): Смещение (совместимость; для глубоких страниц — cursor).
+        cursor (Optional[str]): Курсор next_cursor предыдущей страницы.
+        include_total (bool): Считать ли total (false — без count(*)).
 
     Returns:
-        dict: {items, total, limit, offset}
+        dict: {items, total, limit, offset, next_cursor}
 
     Example:
         GET /audio_files?user_id=1&limit=10
@@ -168,14 +270,22 @@ async def list_audio_files(
     Pitfalls:
         - Лимит не может превышать 100.
         - Сортировка только по разрешённым полям.
+        - Курсор действителен только для тех же order_by/order_dir (иначе 400).
     """
-    limit = min(max(limit, 1), 100)
-    offset = max(offset, 0)
-
-    stmt = select(AudioFile)
+    # Только возвращаемые колонки, без связей
+    stmt: AnySelect = select(
+        AudioFile.id,
+        AudioFile.filename,
+        AudioFile.status,
+        AudioFile.whisper_model,
+        AudioFile.user_id,
+        AudioFile.size,
+        AudioFile.duration_seconds,
+        AudioFile.upload_time,
+    )
     count_stmt = select(func.count(AudioFile.id))
 
-    conditions = []
+    conditions: List[ColumnElement[bool]] = []
     if user_id is not None:
         conditions.append(AudioFile.user_id == user_id)
     if status is not None:
@@ -198,15 +308,23 @@ async def list_audio_files(
         "status": AudioFile.status,
     }
     if order_by not in order_map:
-        order_col: ColumnElement[Any] = AudioFile.upload_time  # fallback to a valid column
-    else:
-        order_col = order_map[order_by]
-    direction = desc if order_dir.lower() == "desc" else asc
-    stmt = stmt.order_by(direction(order_col))
-
-    total = (await db.execute(count_stmt)).scalar_one()
-    stmt = stmt.offset(offset).limit(limit)
-    rows = (await db.execute(stmt)).scalars().all()
+        order_by = "upload_time"  # fallback to a valid column
+    try:
+        rows, page = await paginate(
+            db,
+            stmt,
+            count_stmt,
+            order_by,
+            order_map[order_by],
+            AudioFile.id,
+            order_dir,
+            limit,
+            offset,
+            cursor,
+            include_total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     items = [
         {
             "id": f.id,
@@ -215,11 +333,12 @@ async def list_audio_files(
             "whisper_model": f.whisper_model,
             "user_id": f.user_id,
             "size": f.size,
+            "duration_seconds": f.duration_seconds,
             "upload_time": f.upload_time,
         }
         for f in rows
     ]
-    return {"items": items, "total": total, "limit": limit, "offset": offset}
+    return {"items": items, **page}
 
 
 @router.get("/{audio_file_id}", response_model=dict)
@@ -269,6 +388,7 @@ async def delete_audio_file(
 
     Pitfalls:
         - Файл на диске может отсутствовать, тогда удаляется только запись.
+        - Файл не удаляется, пока на него ссылаются другие записи (дубликаты).
     """
     audio = await db.get(AudioFile, audio_file_id)
     if not audio:
@@ -280,8 +400,18 @@ async def delete_audio_file(
         if audio.storage_path
         else os.path.join(base_dir, audio.filename)
     )
-    # Удаляем файл с диска, если существует
-    if os.path.exists(file_path):
+    # Файлы хранятся по содержимому: удаляем с диска только последнюю ссылку
+    other_refs = 0
+    if audio.storage_path:
+        other_refs = (
+            await db.execute(
+                select(func.count(AudioFile.id)).where(
+                    AudioFile.storage_path == audio.storage_path,
+                    AudioFile.id != audio.id,
+                )
+            )
+        ).scalar_one()
+    if other_refs == 0 and os.path.exists(file_path):
         os.remove(file_path)
     # Удаляем из БД
     await db.delete(audio)
@@ -2,9 +2,12 @@
 Маршруты для мониторинга системы обработки цепочек.
 """
 import logging
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
 try:
     import psutil
@@ -12,7 +15,18 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+from audioscribetranslate.core.admission import (
+    AdmissionConfig,
+    backlog_as_dict,
+    load_backlog,
+)
 from audioscribetranslate.core.chain_manager import ProcessingChainManager
+from audioscribetranslate.core.config import get_settings
+from audioscribetranslate.core.job_events import stage_latency_percentiles
+from audioscribetranslate.core.queue_depth import get_queue_depth
+from audioscribetranslate.core.queue_notify import get_queue_notifier
+from audioscribetranslate.db.session import get_db
+from audioscribetranslate.services.translation import get_translation_service
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +88,7 @@ async def get_worker_info() -> Dict[str, Any]:
             "active_workers": 0,
             "worker_processes": [],
             "queue_info": {
-                "processing_chains": "unknown"
+                "processing_chains": (await run_in_threadpool(get_queue_depth)).queued
             }
         }
 
@@ -105,6 +119,56 @@ async def get_worker_info() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Ошибка получения информации о воркерах: {str(e)}")
 
 
+@router.get("/queue")
+async def get_queue_info() -> Dict[str, Any]:
+    """Возвращает глубину очереди по статусам и моделям (кэш общий с менеджером цепочек)."""
+    depth = await run_in_threadpool(get_queue_depth)
+    return depth.as_dict()
+
+
+@router.get("/latency")
+async def get_stage_latency(
+    hours: float = Query(24.0, gt=0, le=24 * 30),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """Возвращает перцентили ожидания в очереди и обработки по стадиям (job_events)."""
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    try:
+        stages = await stage_latency_percentiles(db, since)
+    except Exception as e:
+        logger.error(f"Ошибка расчёта задержек по стадиям: {e}")
+        raise HTTPException(status_code=500, detail=f"Ошибка расчёта задержек: {str(e)}")
+    return {"since": since.isoformat(), "stages": stages}
+
+
+@router.get("/autoscaler")
+async def get_autoscaler_metrics() -> Dict[str, Any]:
+    """Возвращает решения автомасштабирования: последнее, счётчики причин, историю."""
+    if not chain_manager:
+        raise HTTPException(status_code=503, detail="Chain manager не инициализирован")
+    return chain_manager.autoscaler.get_metrics()
+
+
+@router.get("/admission")
+async def get_admission_backlog(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+    """Возвращает незавершённую работу (сек) и пороги контроля допуска загрузок."""
+    config = AdmissionConfig.from_settings(get_settings())
+    backlog = await load_backlog(db, None, config)
+    return backlog_as_dict(backlog, config)
+
+
+@router.get("/queue-notify")
+async def get_queue_notify_stats() -> Dict[str, Any]:
+    """Возвращает счётчики пробуждений очереди: публикации API, события и таймауты менеджера."""
+    return get_queue_notifier().get_stats()
+
+
+@router.get("/translation-memory")
+async def get_translation_memory_stats() -> Dict[str, Any]:
+    """Возвращает попадания в память переводов: процесса API и общие по воркерам (Redis)."""
+    return await run_in_threadpool(get_translation_service().memory.get_stats)
+
+
 @router.get("/memory")
 async def get_memory_info() -> Dict[str, Any]:
     """Возвращает детальную информацию о памяти системы."""
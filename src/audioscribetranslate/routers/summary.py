@@ -2,9 +2,14 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from audioscribetranslate.core.pagination import (
+    AnySelect,
+    InvalidCursorError,
+    paginate,
+)
 from audioscribetranslate.core.tasks import enqueue_summary
 from audioscribetranslate.db.session import get_db
 from audioscribetranslate.models.summary import Summary
@@ -22,6 +27,8 @@ async def list_summaries(
     order_dir: str = "desc",
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
 ) -> dict[str, Any]:
     """
     Получить список summary с фильтрами и пагинацией.
@@ -34,10 +41,12 @@ async def list_summaries(
         order_by (str): Поле сортировки.
         order_dir (str): Направление сортировки.
         limit (int): Лимит.
-        offset (int): Смещение.
+        offset (int): Смещение (совместимость; для глубоких страниц — cursor).
+        cursor (Optional[str]): Курсор next_cursor предыдущей страницы.
+        include_total (bool): Считать ли total (false — без count(*)).
 
     Returns:
-        dict: {items, total, limit, offset}
+        dict: {items, total, limit, offset, next_cursor}
 
     Example:
         GET /summaries?translation_id=1&limit=10
@@ -45,11 +54,19 @@ async def list_summaries(
     Pitfalls:
         - Лимит не может превышать 100.
         - Сортировка только по разрешённым полям.
+        - Курсор действителен только для тех же order_by/order_dir (иначе 400).
     """
-    limit = min(max(limit, 1), 100)
-    offset = max(offset, 0)
-
-    stmt = select(Summary)
+    # Только возвращаемые колонки: text не читается, has_text считается в SQL
+    stmt: AnySelect = select(
+        Summary.id,
+        Summary.source_translation_id,
+        Summary.status,
+        Summary.base_language,
+        Summary.target_language,
+        Summary.model_name,
+        Summary.text.is_not(None).label("has_text"),
+        Summary.created_at,
+    )
     count_stmt = select(func.count(Summary.id))
 
     if translation_id is not None:
@@ -62,24 +79,31 @@ async def list_summaries(
         stmt = stmt.where(Summary.target_language == target_language)
         count_stmt = count_stmt.where(Summary.target_language == target_language)
 
-    from typing import Any as _Any
-
-    order_col: _Any
-    if order_by == "id":
-        order_col = Summary.id
-    elif order_by == "updated_at":
-        order_col = Summary.updated_at
-    elif order_by == "status":
-        order_col = Summary.status
-    elif order_by == "target_language":
-        order_col = Summary.target_language
-    else:
-        order_col = Summary.created_at
-    direction_fn = desc if order_dir.lower() == "desc" else asc
-    stmt = stmt.order_by(direction_fn(order_col)).offset(offset).limit(limit)
-
-    rows = (await db.execute(stmt)).scalars().all()
-    total = (await db.execute(count_stmt)).scalar_one()
+    order_map = {
+        "id": Summary.id,
+        "created_at": Summary.created_at,
+        "updated_at": Summary.updated_at,
+        "status": Summary.status,
+        "target_language": Summary.target_language,
+    }
+    if order_by not in order_map:
+        order_by = "created_at"
+    try:
+        rows, page = await paginate(
+            db,
+            stmt,
+            count_stmt,
+            order_by,
+            order_map[order_by],
+            Summary.id,
+            order_dir,
+            limit,
+            offset,
+            cursor,
+            include_total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     items = [
         {
@@ -89,12 +113,12 @@ async def list_summaries(
             "base_language": r.base_language,
             "target_language": r.target_language,
             "model_name": r.model_name,
-            "has_text": r.text is not None,
+            "has_text": bool(r.has_text),
             "created_at": r.created_at,
         }
         for r in rows
     ]
-    return {"items": items, "total": total, "limit": limit, "offset": offset}
+    return {"items": items, **page}
 
 
 @router.get("/{summary_id}", response_model=dict)
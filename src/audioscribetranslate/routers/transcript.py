@@ -1,10 +1,28 @@
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import asc, desc, func, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from audioscribetranslate.db.session import get_db
+from audioscribetranslate.core.config import get_settings
+from audioscribetranslate.core.pagination import (
+    AnySelect,
+    InvalidCursorError,
+    paginate,
+)
+from audioscribetranslate.core.text_streaming import (
+    RangeNotSatisfiableError,
+    etag_matches,
+    iter_text_bytes,
+    join_segment_texts,
+    make_etag,
+    parse_byte_range,
+    segment_window_query,
+    segment_window_version_query,
+    text_meta_query,
+)
+from audioscribetranslate.db.session import AsyncSessionLocal, get_db
 from audioscribetranslate.models.transcript import Transcript
 
 router = APIRouter(prefix="/transcripts", tags=["transcripts"])
@@ -19,6 +37,8 @@ async def list_transcripts(
     order_dir: str = "desc",
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
 ) -> dict[str, Any]:
     """
     Получить список транскриптов с фильтрами и пагинацией.
@@ -30,10 +50,12 @@ async def list_transcripts(
         order_by (str): Поле сортировки.
         order_dir (str): Направление сортировки.
         limit (int): Лимит.
-        offset (int): Смещение.
+        offset (int): Смещение (совместимость; для глубоких страниц — cursor).
+        cursor (Optional[str]): Курсор next_cursor предыдущей страницы.
+        include_total (bool): Считать ли total (false — без count(*)).
 
     Returns:
-        dict: {items, total, limit, offset}
+        dict: {items, total, limit, offset, next_cursor}
 
     Example:
         GET /transcripts?audio_file_id=1&limit=10
@@ -41,11 +63,18 @@ async def list_transcripts(
     Pitfalls:
         - Лимит не может превышать 100.
         - Сортировка только по разрешённым полям.
+        - Курсор действителен только для тех же order_by/order_dir (иначе 400).
     """
-    limit = min(max(limit, 1), 100)
-    offset = max(offset, 0)
-
-    stmt = select(Transcript)
+    # Только возвращаемые колонки: text не читается, has_text считается в SQL
+    stmt: AnySelect = select(
+        Transcript.id,
+        Transcript.audio_file_id,
+        Transcript.status,
+        Transcript.language,
+        Transcript.model_name,
+        Transcript.text.is_not(None).label("has_text"),
+        Transcript.created_at,
+    )
     count_stmt = select(func.count(Transcript.id))
 
     if audio_file_id is not None:
@@ -61,13 +90,24 @@ async def list_transcripts(
         "updated_at": Transcript.updated_at,
         "status": Transcript.status,
     }
-    order_col = order_map.get(order_by, Transcript.created_at)
-    direction_fn = desc if order_dir.lower() == "desc" else asc
-    order_col_any: Any = order_col  # help type checker
-    stmt = stmt.order_by(direction_fn(order_col_any)).offset(offset).limit(limit)
-
-    rows = (await db.execute(stmt)).scalars().all()
-    total = (await db.execute(count_stmt)).scalar_one()
+    if order_by not in order_map:
+        order_by = "created_at"
+    try:
+        rows, page = await paginate(
+            db,
+            stmt,
+            count_stmt,
+            order_by,
+            order_map[order_by],
+            Transcript.id,
+            order_dir,
+            limit,
+            offset,
+            cursor,
+            include_total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     items = [
         {
@@ -76,12 +116,12 @@ async def list_transcripts(
             "status": r.status,
             "language": r.language,
             "model_name": r.model_name,
-            "has_text": r.text is not None,
+            "has_text": bool(r.has_text),
             "created_at": r.created_at,
         }
         for r in rows
     ]
-    return {"items": items, "total": total, "limit": limit, "offset": offset}
+    return {"items": items, **page}
 
 
 @router.get("/{transcript_id}", response_model=dict)
@@ -115,3 +155,123 @@ async def get_transcript(
         "created_at": obj.created_at,
         "updated_at": obj.updated_at,
     }
+
+
+TEXT_MEDIA_TYPE = "text/plain; charset=utf-8"
+
+
+@router.get("/{transcript_id}/text")
+async def get_transcript_text(
+    transcript_id: int,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, gt=0),
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_none_match: Optional[str] = Header(None),
+    if_range: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Отдаёт текст транскрипта потоком (text/plain) с ETag и Range.
+
+    Args:
+        transcript_id (int): ID транскрипта.
+        start (Optional[float]): Начало окна по времени (сек) — текст сегментов.
+        end (Optional[float]): Конец окна по времени (сек).
+        range_header (Optional[str]): Заголовок Range (байты UTF-8).
+        if_none_match (Optional[str]): Заголовок If-None-Match.
+        if_range (Optional[str]): Заголовок If-Range (ETag).
+        db (AsyncSession): Сессия базы данных.
+
+    Returns:
+        Response: 200/206 с телом, 304 без тела, 416 для диапазона за концом текста.
+
+    Raises:
+        HTTPException: 404 — нет транскрипта, текста или сегментов окна.
+
+    Example:
+        GET /transcripts/5/text  (Range: bytes=0-65535)
+        GET /transcripts/5/text?start=600&end=660
+
+    Pitfalls:
+        - Range считается в байтах UTF-8, а не в символах.
+        - Окно по времени доступно только для потоковой транскрипции (есть сегменты).
+    """
+    meta = (await db.execute(text_meta_query(Transcript, transcript_id))).one_or_none()
+    if meta is None:
+        raise HTTPException(status_code=404, detail="Transcript not found")
+
+    if start is not None or end is not None:
+        window_start = start or 0.0
+        if end is not None and end <= window_start:
+            raise HTTPException(
+                status_code=400, detail="end must be greater than start"
+            )
+        version = (
+            await db.execute(
+                segment_window_version_query(transcript_id, window_start, end)
+            )
+        ).one()
+        if not version.segments:
+            raise HTTPException(
+                status_code=404, detail="No segments in this time window"
+            )
+        etag = make_etag(
+            transcript_id,
+            meta.updated_at,
+            meta.length or 0,
+            f"w{window_start:g}-{end or ''}-{version.segments}-{version.max_end:g}",
+        )
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        rows = (
+            await db.execute(segment_window_query(transcript_id, window_start, end))
+        ).all()
+        if not rows:
+            raise HTTPException(
+                status_code=404, detail="No segments in this time window"
+            )
+        return Response(
+            content=join_segment_texts([r.text for r in rows]),
+            media_type=TEXT_MEDIA_TYPE,
+            headers={
+                "ETag": etag,
+                "X-Segment-Start": f"{rows[0].start:g}",
+                "X-Segment-End": f"{rows[-1].end:g}",
+            },
+        )
+
+    if meta.length is None:
+        raise HTTPException(status_code=404, detail="Transcript text is not ready")
+    length = int(meta.length)
+    etag = make_etag(transcript_id, meta.updated_at, length)
+    headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = parse_byte_range(range_header, length)
+        except RangeNotSatisfiableError:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{length}"},
+            )
+    first, last = byte_range if byte_range else (0, length - 1)
+    if byte_range:
+        headers["Content-Range"] = f"bytes {first}-{last}/{length}"
+    headers["Content-Length"] = str(max(last - first + 1, 0))
+    return StreamingResponse(
+        iter_text_bytes(
+            AsyncSessionLocal,
+            Transcript,
+            transcript_id,
+            meta.updated_at,
+            first,
+            last,
+            get_settings().transcript_text_chunk_bytes,
+        ),
+        status_code=206 if byte_range else 200,
+        media_type=TEXT_MEDIA_TYPE,
+        headers=headers,
+    )
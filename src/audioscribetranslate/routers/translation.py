@@ -1,11 +1,16 @@
-from typing import Any, Optional, cast
+from typing import Any, List, Optional, cast
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from audioscribetranslate.core.tasks import enqueue_translation
+from audioscribetranslate.core.pagination import (
+    AnySelect,
+    InvalidCursorError,
+    paginate,
+)
+from audioscribetranslate.core.tasks import enqueue_translation, enqueue_translations
 from audioscribetranslate.db.session import get_db
 from audioscribetranslate.models.translation import Translation
 
@@ -22,6 +27,8 @@ async def list_translations(
     order_dir: str = "desc",
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
 ) -> dict[str, Any]:
     """
     Получить список переводов с фильтрами и пагинацией.
@@ -34,10 +41,12 @@ async def list_translations(
         order_by (str): Поле сортировки.
         order_dir (str): Направление сортировки.
         limit (int): Лимит.
-        offset (int): Смещение.
+        offset (int): Смещение (совместимость; для глубоких страниц — cursor).
+        cursor (Optional[str]): Курсор next_cursor предыдущей страницы.
+        include_total (bool): Считать ли total (false — без count(*)).
 
     Returns:
-        dict: {items, total, limit, offset}
+        dict: {items, total, limit, offset, next_cursor}
 
     Example:
         GET /translations?transcript_id=1&limit=10
@@ -45,11 +54,19 @@ async def list_translations(
     Pitfalls:
         - Лимит не может превышать 100.
         - Сортировка только по разрешённым полям.
+        - Курсор действителен только для тех же order_by/order_dir (иначе 400).
     """
-    limit = min(max(limit, 1), 100)
-    offset = max(offset, 0)
-
-    stmt = select(Translation)
+    # Только возвращаемые колонки: text не читается, has_text считается в SQL
+    stmt: AnySelect = select(
+        Translation.id,
+        Translation.transcript_id,
+        Translation.status,
+        Translation.source_language,
+        Translation.target_language,
+        Translation.model_name,
+        Translation.text.is_not(None).label("has_text"),
+        Translation.created_at,
+    )
     count_stmt = select(func.count(Translation.id))
 
     if transcript_id is not None:
@@ -62,24 +79,31 @@ async def list_translations(
         stmt = stmt.where(Translation.target_language == target_language)
         count_stmt = count_stmt.where(Translation.target_language == target_language)
 
-    from sqlalchemy.sql.schema import Column
-
-    order_col: Column[Any]
-    if order_by == "id":
-        order_col = Translation.id
-    elif order_by == "updated_at":
-        order_col = Translation.updated_at
-    elif order_by == "status":
-        order_col = Translation.status
-    elif order_by == "target_language":
-        order_col = Translation.target_language
-    else:
-        order_col = Translation.created_at
-    direction_fn = desc if order_dir.lower() == "desc" else asc
-    stmt = stmt.order_by(direction_fn(order_col)).offset(offset).limit(limit)
-
-    rows = (await db.execute(stmt)).scalars().all()
-    total = (await db.execute(count_stmt)).scalar_one()
+    order_map = {
+        "id": Translation.id,
+        "created_at": Translation.created_at,
+        "updated_at": Translation.updated_at,
+        "status": Translation.status,
+        "target_language": Translation.target_language,
+    }
+    if order_by not in order_map:
+        order_by = "created_at"
+    try:
+        rows, page = await paginate(
+            db,
+            stmt,
+            count_stmt,
+            order_by,
+            order_map[order_by],
+            Translation.id,
+            order_dir,
+            limit,
+            offset,
+            cursor,
+            include_total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     items = [
         {
@@ -89,12 +113,12 @@ async def list_translations(
             "source_language": r.source_language,
             "target_language": r.target_language,
             "model_name": r.model_name,
-            "has_text": r.text is not None,
+            "has_text": bool(r.has_text),
             "created_at": r.created_at,
         }
         for r in rows
     ]
-    return {"items": items, "total": total, "limit": limit, "offset": offset}
+    return {"items": items, **page}
 
 
 @router.get("/{translation_id}", response_model=dict)
@@ -171,3 +195,57 @@ async def create_translation(payload: TranslationCreateRequest) -> dict[str, Any
             detail="Unable to enqueue translation (transcript not ready or internal error)",
         )
     return {"id": translation_id, "status": "queued"}
+
+
+class TranslationBatchRequest(BaseModel):
+    """
+    Модель запроса на перевод транскрипта на несколько языков.
+
+    Attributes:
+        transcript_id (int): ID транскрипта.
+        target_languages (List[str]): Целевые языки (повторы игнорируются).
+        model_name (Optional[str]): Название модели (многоязычной — одна на все языки).
+    """
+    transcript_id: int = Field(..., ge=1)
+    target_languages: List[str] = Field(..., min_length=1, max_length=32)
+    model_name: Optional[str] = Field(None, max_length=100)
+
+
+@router.post("/batch", response_model=dict, status_code=201)
+async def create_translations_batch(payload: TranslationBatchRequest) -> dict[str, Any]:
+    """
+    Поставить одну задачу перевода транскрипта на несколько языков.
+
+    Транскрипт делится на предложения один раз, все переводы записываются
+    одной транзакцией.
+
+    Args:
+        payload (TranslationBatchRequest): Транскрипт и целевые языки.
+
+    Returns:
+        dict: Созданные переводы (id и язык) и статус постановки в очередь.
+
+    Raises:
+        HTTPException: Некорректный язык, транскрипт не готов или внутренняя ошибка.
+
+    Example:
+        POST /translations/batch {"transcript_id": 2, "target_languages": ["en", "de"]}
+    """
+    languages = list(dict.fromkeys(lang.strip() for lang in payload.target_languages))
+    if any(not lang or len(lang) > 16 for lang in languages):
+        raise HTTPException(status_code=422, detail="Invalid target language")
+    ok, translation_ids = enqueue_translations(
+        payload.transcript_id, languages, payload.model_name
+    )
+    if not ok:
+        raise HTTPException(
+            status_code=400,
+            detail="Unable to enqueue translations (transcript not ready or internal error)",
+        )
+    return {
+        "items": [
+            {"id": tid, "target_language": lang}
+            for tid, lang in zip(translation_ids, languages)
+        ],
+        "status": "queued",
+    }
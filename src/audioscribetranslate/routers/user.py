@@ -2,12 +2,17 @@ import os
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import asc, desc, func
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql import ColumnElement
 
 from audioscribetranslate.core.files import get_uploaded_files_dir
+from audioscribetranslate.core.pagination import (
+    AnySelect,
+    InvalidCursorError,
+    paginate,
+)
 from audioscribetranslate.db.session import get_db
 from audioscribetranslate.models.audio_file import AudioFile
 from audioscribetranslate.models.user import User
@@ -72,6 +77,8 @@ async def list_users(
     order_dir: str = "asc",
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
 ) -> dict[str, Any]:
     """
     Получить список пользователей с фильтрами и пагинацией.
@@ -84,10 +91,12 @@ async def list_users(
         order_by (str): Поле сортировки.
         order_dir (str): Направление сортировки.
         limit (int): Лимит.
-        offset (int): Смещение.
+        offset (int): Смещение (совместимость; для глубоких страниц — cursor).
+        cursor (Optional[str]): Курсор next_cursor предыдущей страницы.
+        include_total (bool): Считать ли total (false — без count(*)).
 
     Returns:
-        dict: {items, total, limit, offset}
+        dict: {items, total, limit, offset, next_cursor}
 
     Example:
         GET /users?is_active=1&limit=10
@@ -95,13 +104,11 @@ async def list_users(
     Pitfalls:
         - Лимит не может превышать 100.
         - Сортировка только по разрешённым полям.
+        - Курсор действителен только для тех же order_by/order_dir (иначе 400).
     """
-    limit = min(max(limit, 1), 100)
-    offset = max(offset, 0)
-
-    stmt = select(User)
+    stmt: AnySelect = select(User.id, User.name, User.is_active, User.is_admin)
     count_stmt = select(func.count(User.id))
-    conditions = []
+    conditions: List[ColumnElement[bool]] = []
     if is_active is not None:
         conditions.append(User.is_active == is_active)
     if is_admin is not None:
@@ -115,13 +122,24 @@ async def list_users(
             count_stmt = count_stmt.where(c)
 
     order_map: Dict[str, ColumnElement[Any]] = {"id": User.id, "name": User.name}
-    order_col: ColumnElement[Any] = order_map.get(order_by, User.id)
-    direction = desc if order_dir.lower() == "desc" else asc
-    stmt = stmt.order_by(direction(order_col))
-
-    total = (await db.execute(count_stmt)).scalar_one()
-    stmt = stmt.offset(offset).limit(limit)
-    rows = (await db.execute(stmt)).scalars().all()
+    if order_by not in order_map:
+        order_by = "id"
+    try:
+        rows, page = await paginate(
+            db,
+            stmt,
+            count_stmt,
+            order_by,
+            order_map[order_by],
+            User.id,
+            order_dir,
+            limit,
+            offset,
+            cursor,
+            include_total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     items = [
         {
             "id": u.id,
@@ -131,7 +149,7 @@ async def list_users(
         }
         for u in rows
     ]
-    return {"items": items, "total": total, "limit": limit, "offset": offset}
+    return {"items": items, **page}
 
 
 @router.get("/{user_id}", response_model=dict)
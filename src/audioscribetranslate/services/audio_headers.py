@@ -0,0 +1,418 @@
+"""Определение длительности аудио по заголовкам контейнеров без внешних процессов.
+
+Разбирает служебные структуры распространенных форматов напрямую из файла,
+чтобы длительность большинства загрузок определялась без запуска ffprobe.
+
+Поддерживаемые форматы:
+- MP3: заголовок Xing/Info или VBRI, иначе CBR-оценка или обход кадров
+- FLAC: блок STREAMINFO (общее число сэмплов и частота)
+- OGG (Vorbis/Opus): позиция гранулы последней страницы
+- M4A/MP4: атом mvhd (timescale и duration)
+
+Все парсеры читают только заголовки (десятки килобайт), а не аудиоданные,
+и возвращают None для неподдерживаемых или поврежденных файлов - в этом
+случае AudioDurationService переходит к следующему экстрактору (ffprobe).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# MP3
+# ============================================================================
+
+# Битрейты (кбит/с) по индексу: ключ (версия MPEG 1/2, слой)
+_MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Частоты дискретизации MPEG-1; для MPEG-2 делятся на 2, для MPEG-2.5 - на 4
+_MP3_SAMPLE_RATES = (44100, 48000, 32000)
+
+# Сколько байт искать первый кадр после ID3-тега (мусор, обложки без тега)
+_MP3_SYNC_SEARCH_BYTES = 64 * 1024
+
+# Сколько первых кадров проверять на постоянство битрейта
+_MP3_CBR_PROBE_FRAMES = 32
+
+
+class _Mp3Frame:
+    """Разобранный 4-байтовый заголовок кадра MPEG audio."""
+
+    __slots__ = (
+        "version",
+        "layer",
+        "bitrate",
+        "sample_rate",
+        "length",
+        "samples",
+        "mono",
+    )
+
+    def __init__(
+        self,
+        version: float,
+        layer: int,
+        bitrate: int,
+        sample_rate: int,
+        length: int,
+        samples: int,
+        mono: bool,
+    ) -> None:
+        self.version = version
+        self.layer = layer
+        self.bitrate = bitrate
+        self.sample_rate = sample_rate
+        self.length = length
+        self.samples = samples
+        self.mono = mono
+
+
+def _parse_mp3_frame_header(header: bytes) -> Optional[_Mp3Frame]:
+    """Разбирает заголовок кадра MP3; None если байты не являются валидным кадром."""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    version_bits = (header[1] >> 3) & 0x03
+    layer_bits = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    if (
+        version_bits == 1
+        or layer_bits == 0
+        or bitrate_index in (0, 15)
+        or rate_index == 3
+    ):
+        return None
+
+    version = {0: 2.5, 2: 2.0, 3: 1.0}[version_bits]
+    layer = 4 - layer_bits
+    bitrate = _MP3_BITRATES[(1 if version == 1.0 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[rate_index]
+    if version == 2.0:
+        sample_rate //= 2
+    elif version == 2.5:
+        sample_rate //= 4
+    padding = (header[2] >> 1) & 0x01
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if layer == 2 or version == 1.0 else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    mono = (header[3] >> 6) == 3
+    return _Mp3Frame(version, layer, bitrate, sample_rate, length, samples, mono)
+
+
+def _id3v2_size(head: bytes) -> int:
+    """Возвращает полный размер ID3v2-тега в начале файла (0 если тега нет)."""
+    if len(head) < 10 or head[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in head[6:10]:
+        size = (size << 7) | (byte & 0x7F)  # syncsafe integer
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _find_first_mp3_frame(f: BinaryIO, start: int) -> Optional[Tuple[int, _Mp3Frame]]:
+    """Ищет первый кадр, за которым следует еще один валидный кадр."""
+    f.seek(start)
+    data = f.read(_MP3_SYNC_SEARCH_BYTES)
+    pos = data.find(b"\xff")
+    while 0 <= pos < len(data) - 4:
+        frame = _parse_mp3_frame_header(data[pos : pos + 4])
+        if frame is not None and frame.length > 0:
+            # Проверяем следующий кадр, чтобы не принять данные за синхрослово
+            nxt = pos + frame.length
+            if nxt + 4 > len(data) or _parse_mp3_frame_header(data[nxt : nxt + 4]):
+                return start + pos, frame
+        pos = data.find(b"\xff", pos + 1)
+    return None
+
+
+def _mp3_vbr_header_frames(frame_data: bytes, frame: _Mp3Frame) -> Optional[int]:
+    """Возвращает число кадров из заголовка Xing/Info или VBRI первого кадра."""
+    if frame.version == 1.0:
+        side_info = 17 if frame.mono else 32
+    else:
+        side_info = 9 if frame.mono else 17
+    xing = 4 + side_info
+    tag = frame_data[xing : xing + 4]
+    if tag in (b"Xing", b"Info") and len(frame_data) >= xing + 12:
+        flags = struct.unpack(">I", frame_data[xing + 4 : xing + 8])[0]
+        if flags & 0x01:
+            return int(struct.unpack(">I", frame_data[xing + 8 : xing + 12])[0])
+    # VBRI (Fraunhofer) всегда находится через 32 байта после заголовка кадра
+    vbri = 4 + 32
+    if frame_data[vbri : vbri + 4] == b"VBRI" and len(frame_data) >= vbri + 18:
+        return int(struct.unpack(">I", frame_data[vbri + 14 : vbri + 18])[0])
+    return None
+
+
+def mp3_duration(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Определяет длительность MP3.
+
+    Порядок: заголовок Xing/Info/VBRI (точно для VBR) -> CBR по битрейту
+    первых кадров -> обход заголовков всех кадров (VBR без заголовка).
+
+    Args:
+        f: Открытый в бинарном режиме файл
+        file_size: Размер файла в байтах
+
+    Returns:
+        Длительность в секундах или None
+    """
+    f.seek(0)
+    start = _id3v2_size(f.read(10))
+    found = _find_first_mp3_frame(f, start)
+    if found is None:
+        return None
+    audio_start, first = found
+
+    f.seek(audio_start)
+    frame_data = f.read(max(first.length, 4 + 32 + 18))
+    frames = _mp3_vbr_header_frames(frame_data, first)
+    if frames:
+        return frames * first.samples / first.sample_rate
+
+    audio_end = file_size
+    f.seek(max(file_size - 128, 0))
+    if f.read(3) == b"TAG":  # ID3v1 в конце файла
+        audio_end -= 128
+
+    # Проверяем постоянство битрейта по первым кадрам
+    pos = audio_start
+    bitrates = set()
+    for _ in range(_MP3_CBR_PROBE_FRAMES):
+        f.seek(pos)
+        frame = _parse_mp3_frame_header(f.read(4))
+        if frame is None or frame.length <= 0:
+            break
+        bitrates.add(frame.bitrate)
+        pos += frame.length
+    if len(bitrates) <= 1:
+        return (audio_end - audio_start) * 8 / first.bitrate
+
+    # VBR без заголовка: обходим кадры, читая только их заголовки
+    pos = audio_start
+    total_samples = 0
+    while pos + 4 <= audio_end:
+        f.seek(pos)
+        frame = _parse_mp3_frame_header(f.read(4))
+        if frame is None or frame.length <= 0:
+            break
+        total_samples += frame.samples
+        pos += frame.length
+    return total_samples / first.sample_rate if total_samples else None
+
+
+# ============================================================================
+# FLAC
+# ============================================================================
+
+
+def flac_duration(f: BinaryIO, offset: int = 0) -> Optional[float]:
+    """Определяет длительность FLAC по блоку STREAMINFO.
+
+    Args:
+        f: Открытый в бинарном режиме файл
+        offset: Смещение маркера fLaC (после ID3v2-тега, если он есть)
+
+    Returns:
+        Длительность в секундах или None (в т.ч. если число сэмплов не записано)
+    """
+    f.seek(offset)
+    data = f.read(4 + 4 + 34)
+    if len(data) < 42 or data[:4] != b"fLaC" or (data[4] & 0x7F) != 0:
+        return None
+    # STREAMINFO: 10 байт размеров блоков/кадров, затем 64 бита:
+    # частота (20) | каналы-1 (3) | бит на сэмпл-1 (5) | всего сэмплов (36)
+    packed: int = struct.unpack(">Q", data[18:26])[0]
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if sample_rate <= 0 or total_samples <= 0:
+        return None
+    return total_samples / sample_rate
+
+
+# ============================================================================
+# OGG
+# ============================================================================
+
+# Opus всегда считает гранулы в 48 кГц независимо от исходной частоты
+_OPUS_GRANULE_RATE = 48000
+
+# Размер хвоста файла, в котором ищется последняя страница OGG
+_OGG_TAIL_BYTES = 64 * 1024
+
+
+def ogg_duration(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Определяет длительность OGG Vorbis/Opus по гранулам последней страницы.
+
+    Args:
+        f: Открытый в бинарном режиме файл
+        file_size: Размер файла в байтах
+
+    Returns:
+        Длительность в секундах или None для других кодеков в OGG
+    """
+    f.seek(0)
+    head = f.read(27 + 255 + 64)
+    if len(head) < 28 or head[:4] != b"OggS":
+        return None
+    packet = head[27 + head[26] :]
+    pre_skip = 0
+    rate: int
+    if packet[:7] == b"\x01vorbis" and len(packet) >= 16:
+        rate = struct.unpack("<I", packet[12:16])[0]
+    elif packet[:8] == b"OpusHead" and len(packet) >= 12:
+        pre_skip = struct.unpack("<H", packet[10:12])[0]
+        rate = _OPUS_GRANULE_RATE
+    else:
+        return None
+    if rate <= 0:
+        return None
+
+    tail_start = max(file_size - _OGG_TAIL_BYTES, 0)
+    f.seek(tail_start)
+    tail = f.read(_OGG_TAIL_BYTES)
+    pos = tail.rfind(b"OggS")
+    while pos >= 0:
+        if pos + 14 <= len(tail):
+            granule: int = struct.unpack("<q", tail[pos + 6 : pos + 14])[0]
+            if granule >= 0:  # -1 - на странице нет завершенного пакета
+                return max(granule - pre_skip, 0) / rate
+        pos = tail.rfind(b"OggS", 0, pos)
+    return None
+
+
+# ============================================================================
+# MP4 / M4A
+# ============================================================================
+
+
+def _iter_atoms(f: BinaryIO, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Перебирает атомы MP4 в диапазоне [start, end): (тип, начало данных, конец)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(16)
+        if len(header) < 8:
+            return
+        size, kind = struct.unpack(">I4s", header[:8])
+        data_start = pos + 8
+        if size == 1:  # 64-битный размер
+            if len(header) < 16:
+                return
+            size = struct.unpack(">Q", header[8:16])[0]
+            data_start = pos + 16
+        elif size == 0:  # атом до конца файла
+            size = end - pos
+        if size < 8:
+            return
+        yield kind, data_start, min(pos + size, end)
+        pos += size
+
+
+def mp4_duration(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Определяет длительность MP4/M4A по атому moov/mvhd.
+
+    Атом moov может находиться и после mdat (в конце файла): атомы
+    перебираются по размерам без чтения аудиоданных.
+
+    Args:
+        f: Открытый в бинарном режиме файл
+        file_size: Размер файла в байтах
+
+    Returns:
+        Длительность в секундах или None
+    """
+    for kind, moov_start, moov_end in _iter_atoms(f, 0, file_size):
+        if kind != b"moov":
+            continue
+        for child, data_start, _ in _iter_atoms(f, moov_start, moov_end):
+            if child != b"mvhd":
+                continue
+            f.seek(data_start)
+            data = f.read(32)
+            if not data:
+                return None
+            if data[0] == 1 and len(data) >= 32:
+                timescale, duration = struct.unpack(">IQ", data[20:32])
+            elif len(data) >= 20:
+                timescale, duration = struct.unpack(">II", data[12:20])
+            else:
+                return None
+            return duration / timescale if timescale > 0 else None
+        return None
+    return None
+
+
+# ============================================================================
+# ЭКСТРАКТОР
+# ============================================================================
+
+
+def parse_header_duration(path: Path) -> Optional[float]:
+    """Определяет формат по сигнатуре и вызывает соответствующий парсер.
+
+    Args:
+        path: Путь к аудиофайлу
+
+    Returns:
+        Длительность в секундах или None если формат не поддерживается
+    """
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        head = f.read(12)
+        if head[:4] == b"fLaC":
+            return flac_duration(f)
+        if head[:4] == b"OggS":
+            return ogg_duration(f, file_size)
+        if head[4:8] == b"ftyp":
+            return mp4_duration(f, file_size)
+        id3_size = _id3v2_size(head[:10] if len(head) >= 10 else head)
+        if id3_size:
+            f.seek(id3_size)
+            if f.read(4) == b"fLaC":
+                return flac_duration(f, id3_size)
+        if id3_size or head[:1] == b"\xff" or path.suffix.lower() == ".mp3":
+            return mp3_duration(f, file_size)
+    return None
+
+
+class HeaderDurationExtractor:
+    """Извлекает длительность из заголовков MP3/FLAC/OGG/M4A без ffprobe.
+
+    Формат определяется по сигнатуре файла, а не по расширению, поэтому
+    переименованные файлы обрабатываются корректно.
+    """
+
+    def extract_duration(self, path: Path) -> Optional[float]:
+        """Извлекает длительность разбором заголовков контейнера.
+
+        Args:
+            path: Путь к аудиофайлу
+
+        Returns:
+            Длительность в секундах или None для неподдерживаемых/поврежденных файлов
+        """
+        try:
+            duration = parse_header_duration(path)
+        except (OSError, struct.error, ValueError, ZeroDivisionError) as e:
+            logger.debug("Не удалось разобрать заголовок %s: %s", path, e)
+            return None
+        return duration if duration and duration > 0 else None
@@ -0,0 +1,341 @@
+"""Сервис суммаризации переводов.
+
+Устроен так же, как сервисы транскрипции и перевода: конфигурация,
+подключаемые реализации (backend) за общим интерфейсом и глобальный сервис.
+
+Реализация по умолчанию - экстрактивная TextRank на NumPy (без моделей и
+GPU): предложения превращаются в хешированные TF-IDF векторы, граф сходства
+считается одним матричным умножением, ранги - степенным методом PageRank.
+В саммари попадают лучшие предложения в исходном порядке.
+
+Длинные тексты (многочасовые записи) обрабатываются иерархическим
+map-reduce: текст режется на фрагменты по chunk_sentences предложений,
+фрагменты суммаризируются параллельно, их саммари склеиваются и
+суммаризируются снова, пока не останется один фрагмент. Память на
+фрагмент ограничена chunk_sentences² (матрица сходства) и
+chunk_sentences × hash_features (векторы), время растет линейно от
+длины текста.
+
+Example:
+    service = get_summarization_service()
+    result = service.summarize_text(long_text)
+    result.text, result.levels, result.processing_seconds
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import math
+import os
+import re
+import time
+import zlib
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import numpy as np
+
+from .translation import split_sentences
+
+logger = logging.getLogger(__name__)
+
+# Имя модели по умолчанию в Summary.model_name (enqueue_summary)
+DEFAULT_MODEL_ALIAS = "summ_model"
+
+BACKEND_TEXTRANK = "textrank"
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SummarizationConfig:
+    """Конфигурация сервиса суммаризации.
+
+    Атрибуты:
+        backend: Реализация суммаризации (textrank)
+        ratio: Доля предложений исходного текста в саммари
+        min_sentences: Минимум предложений в саммари
+        max_sentences: Максимум предложений в саммари
+        chunk_sentences: Предложений во фрагменте map-reduce
+        max_workers: Потоков для фрагментов (0 - по числу ядер)
+        hash_features: Размерность хешированных векторов слов
+        min_word_chars: Слова короче не учитываются (предлоги, союзы)
+        damping: Коэффициент затухания PageRank
+        max_iterations: Максимум итераций степенного метода
+        tolerance: Порог сходимости степенного метода (L1)
+    """
+
+    backend: str = BACKEND_TEXTRANK
+    ratio: float = 0.1
+    min_sentences: int = 3
+    max_sentences: int = 15
+    chunk_sentences: int = 300
+    max_workers: int = 0
+    hash_features: int = 1 << 12
+    min_word_chars: int = 3
+    damping: float = 0.85
+    max_iterations: int = 100
+    tolerance: float = 1e-6
+
+
+@dataclass(frozen=True)
+class SummaryResult:
+    """Результат суммаризации с метриками.
+
+    Атрибуты:
+        text: Текст саммари
+        model_name: Использованная модель (реализация)
+        input_chars: Символов на входе
+        input_sentences: Предложений на входе
+        output_sentences: Предложений в саммари
+        chunks: Фрагментов на первом уровне map-reduce
+        levels: Уровней map-reduce (1 - без разбиения)
+        processing_seconds: Время суммаризации
+    """
+
+    text: str
+    model_name: str
+    input_chars: int = 0
+    input_sentences: int = 0
+    output_sentences: int = 0
+    chunks: int = 0
+    levels: int = 0
+    processing_seconds: float = 0.0
+
+    @property
+    def output_chars(self) -> int:
+        """Символов в саммари."""
+        return len(self.text)
+
+
+class SummarizationError(RuntimeError):
+    """Суммаризация невозможна (неизвестная реализация)."""
+
+
+# ============================================================================
+# РЕАЛИЗАЦИИ (BACKENDS)
+# ============================================================================
+
+
+class SummarizationBackend(ABC):
+    """Интерфейс суммаризатора: выбор/генерация не более limit предложений."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def summarize_sentences(self, sentences: List[str], limit: int) -> List[str]:
+        """Возвращает саммари фрагмента (не более limit предложений)."""
+
+
+class TextRankSummarizer(SummarizationBackend):
+    """Экстрактивная суммаризация TextRank, векторизованная на NumPy.
+
+    Pitfalls:
+        - Слова хешируются (crc32) в hash_features корзин: словарь не растет с
+          длиной текста, редкие коллизии почти не влияют на ранжирование.
+        - Предложения без значимых слов получают только "телепортационный"
+          ранг и в саммари попадают последними.
+    """
+
+    name = BACKEND_TEXTRANK
+
+    def __init__(self, config: Optional[SummarizationConfig] = None) -> None:
+        self.config = config or SummarizationConfig()
+
+    def vectorize(self, sentences: List[str]) -> np.ndarray:
+        """Строит L2-нормированные TF-IDF векторы предложений (n × hash_features)."""
+        features = self.config.hash_features
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, sentence in enumerate(sentences):
+            for word in _WORD.findall(sentence.lower()):
+                if len(word) >= self.config.min_word_chars:
+                    rows.append(row)
+                    cols.append(zlib.crc32(word.encode("utf-8")) % features)
+        matrix = np.zeros((len(sentences), features), dtype=np.float32)
+        index = (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))
+        np.add.at(matrix, index, 1.0)
+        document_freq = np.count_nonzero(matrix, axis=0)
+        idf = np.log((1.0 + len(sentences)) / (1.0 + document_freq)) + 1.0
+        matrix = np.log1p(matrix) * idf.astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        normalized: np.ndarray = matrix / np.maximum(norms, 1e-12)
+        return normalized
+
+    def rank(self, sentences: List[str]) -> np.ndarray:
+        """Ранги предложений PageRank по косинусному сходству."""
+        count = len(sentences)
+        if count <= 1:
+            return np.ones(count, dtype=np.float64)
+        vectors = self.vectorize(sentences)
+        similarity = (vectors @ vectors.T).astype(np.float64)
+        np.fill_diagonal(similarity, 0.0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        # Строки без связей распределяют вес равномерно (висячие вершины)
+        transition = np.where(
+            out_weight > 0, similarity / np.maximum(out_weight, 1e-12), 1.0 / count
+        )
+        damping = self.config.damping
+        scores = np.full(count, 1.0 / count)
+        for _ in range(self.config.max_iterations):
+            updated = (1.0 - damping) / count + damping * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < self.config.tolerance:
+                scores = updated
+                break
+            scores = updated
+        return scores
+
+    def summarize_sentences(self, sentences: List[str], limit: int) -> List[str]:
+        if len(sentences) <= limit:
+            return list(sentences)
+        scores = self.rank(sentences)
+        # Устойчивая сортировка: при равных рангах - более раннее предложение
+        best = np.argsort(-scores, kind="stable")[:limit]
+        return [sentences[i] for i in sorted(best.tolist())]
+
+
+# ============================================================================
+# СЕРВИС
+# ============================================================================
+
+
+class SummarizationService:
+    """Сервис суммаризации: размер саммари, map-reduce, метрики.
+
+    Атрибуты:
+        config: Конфигурация сервиса
+        backend: Реализация суммаризации
+    """
+
+    def __init__(
+        self,
+        config: Optional[SummarizationConfig] = None,
+        backend: Optional[SummarizationBackend] = None,
+    ) -> None:
+        self.config = config or SummarizationConfig()
+        self.backend = backend or self._create_backend()
+
+    def _create_backend(self) -> SummarizationBackend:
+        if self.config.backend == BACKEND_TEXTRANK:
+            return TextRankSummarizer(self.config)
+        raise SummarizationError(
+            f"Неизвестная реализация суммаризации: {self.config.backend}"
+        )
+
+    def target_sentences(self, total: int) -> int:
+        """Размер саммари для текста из total предложений."""
+        target = math.ceil(total * self.config.ratio)
+        return max(
+            min(target, self.config.max_sentences),
+            min(self.config.min_sentences, total),
+        )
+
+    def _summarize_chunks(self, chunks: List[List[str]], limit: int) -> List[List[str]]:
+        if len(chunks) == 1:
+            return [self.backend.summarize_sentences(chunks[0], limit)]
+        # Матричные операции NumPy отпускают GIL: потоков достаточно
+        workers = self.config.max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            return list(
+                pool.map(
+                    lambda chunk: self.backend.summarize_sentences(chunk, limit), chunks
+                )
+            )
+
+    def summarize_text(
+        self, text: str, model_name: Optional[str] = None
+    ) -> SummaryResult:
+        """Суммаризирует текст, при необходимости иерархическим map-reduce.
+
+        Args:
+            text: Исходный текст
+            model_name: Модель из Summary.model_name (None или 'summ_model' - по умолчанию)
+
+        Returns:
+            Саммари и метрики
+        """
+        resolved = (
+            model_name
+            if model_name and model_name != DEFAULT_MODEL_ALIAS
+            else self.backend.name
+        )
+        started = time.perf_counter()
+        sentences = split_sentences(text)
+        limit = self.target_sentences(len(sentences))
+        chunk_size = max(self.config.chunk_sentences, 2)
+        # Фрагмент должен сжиматься хотя бы вдвое, иначе уровни не сходятся
+        map_limit = max(min(limit, chunk_size // 2), 1)
+
+        current = sentences
+        levels = 0
+        first_level_chunks = 0
+        while len(current) > chunk_size:
+            chunks = [
+                current[i : i + chunk_size] for i in range(0, len(current), chunk_size)
+            ]
+            first_level_chunks = first_level_chunks or len(chunks)
+            current = [
+                s for part in self._summarize_chunks(chunks, map_limit) for s in part
+            ]
+            levels += 1
+        summary = self.backend.summarize_sentences(current, limit) if current else []
+        levels += 1
+
+        result = SummaryResult(
+            text=" ".join(summary),
+            model_name=resolved,
+            input_chars=len(text),
+            input_sentences=len(sentences),
+            output_sentences=len(summary),
+            chunks=first_level_chunks or 1,
+            levels=levels,
+            processing_seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "Саммари (%s): %d -> %d предложений, %d фрагментов, %d уровней, %.2f с",
+            resolved,
+            result.input_sentences,
+            result.output_sentences,
+            result.chunks,
+            result.levels,
+            result.processing_seconds,
+        )
+        return result
+
+
+# ============================================================================
+# ГЛОБАЛЬНЫЙ СЕРВИС
+# ============================================================================
+
+_summarization_service = SummarizationService()
+
+
+def get_summarization_service() -> SummarizationService:
+    """Возвращает глобальный сервис суммаризации."""
+    return _summarization_service
+
+
+def configure_summarization_service(**overrides: Any) -> SummarizationService:
+    """Пересоздает глобальный сервис с измененной конфигурацией.
+
+    Args:
+        **overrides: Поля SummarizationConfig для замены
+
+    Returns:
+        Новый глобальный сервис
+
+    Example:
+        configure_summarization_service(ratio=0.05, max_sentences=20)
+    """
+    global _summarization_service
+    config = dataclasses.replace(_summarization_service.config, **overrides)
+    _summarization_service = SummarizationService(config)
+    return _summarization_service
+
+
+def summarize_text(text: str, model_name: Optional[str] = None) -> SummaryResult:
+    """Суммаризирует текст глобальным сервисом (см. SummarizationService.summarize_text)."""
+    return _summarization_service.summarize_text(text, model_name)
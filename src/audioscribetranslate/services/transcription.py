@@ -6,7 +6,10 @@
 Возможности:
 - Автоматический выбор GPU/CPU устройства
 - Кэширование моделей для избежания повторной загрузки
-- Извлечение длительности аудио (WAV + резервный ffprobe)
+- Извлечение длительности аудио (WAV, заголовки MP3/FLAC/OGG/M4A, резервный ffprobe)
+  с кэшем по (путь, mtime, размер)
+- Потоковая выдача сегментов с возобновлением с заданной секунды
+- Параллельная транскрипция длинных файлов по фрагментам (VAD) в пуле процессов
 - Комплексная обработка ошибок и логирование
 - Управление конфигурацией
 - Поддержка инъекции зависимостей
@@ -16,7 +19,7 @@
 Архитектурные принципы:
 - Service-oriented архитектура для лучшей тестируемости
 - Protocol-based подход для стратегий извлечения длительности
-- LRU кэширование с детальными метриками
+- Потокобезопасное LRU кэширование с бюджетом памяти и детальными метриками
 - Graceful degradation при отсутствии зависимостей
 - Полная обратная совместимость с legacy API
 """
@@ -24,19 +27,41 @@
 # Импорты с поддержкой Python 3.8+
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import dataclasses
+import itertools
 import logging
+import multiprocessing
 import os
 import subprocess
+import threading
 import time
 import wave
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
 from weakref import WeakValueDictionary
 
+import psutil
+
+from .audio_headers import HeaderDurationExtractor
+
 # Настраиваем логгер для модуля транскрипции
 logger = logging.getLogger(__name__)
 
@@ -72,17 +97,31 @@ class TranscriptionConfig:
         default_model: Модель Whisper по умолчанию ('tiny', 'base', 'small', 'medium', 'large')
         beam_size: Размер луча для beam search (больше = точнее, но медленнее)
         cache_size: Максимальное количество моделей в кэше
+        cache_max_bytes: Бюджет памяти кэша моделей в байтах (0 - без ограничения)
         ffprobe_timeout: Таймаут для ffprobe в секундах
         enable_gpu: Разрешить использование GPU если доступно
         log_performance: Логировать метрики производительности
+        cpu_threads: Потоков CTranslate2 на модель (0 - значение faster-whisper)
+        num_workers: Параллельных транскрипций на одну модель (общие веса в памяти)
+        chunk_seconds: Целевая длина фрагмента в режиме длинных файлов
+        chunk_overlap_seconds: Перекрытие фрагментов (контекст на границах)
+        vad_min_silence_ms: Минимальная пауза, по которой режется аудио
+        parallel_workers: Процессов для длинных файлов (0 - по числу ядер)
     """
 
     default_model: str = "base"  # Баланс между скоростью и качеством
     beam_size: int = 1  # Быстрый режим для real-time приложений
     cache_size: int = 8  # Достаточно для большинства сценариев
+    cache_max_bytes: int = 0  # 0 = вытеснение только по количеству
     ffprobe_timeout: float = 5.0  # Предотвращает зависание на поврежденных файлах
     enable_gpu: bool = True  # Автоматическое использование GPU
     log_performance: bool = True  # Включить мониторинг производительности
+    cpu_threads: int = 0  # 0 = значение по умолчанию faster-whisper
+    num_workers: int = 1  # >1 - потоки процесса делят одну копию весов
+    chunk_seconds: float = 300.0  # ~5 минут на фрагмент длинного файла
+    chunk_overlap_seconds: float = 1.0  # Контекст по краям фрагмента
+    vad_min_silence_ms: int = 500  # Паузы короче не считаются границей
+    parallel_workers: int = 0  # 0 = автоматически по числу ядер
 
 
 class DeviceType(str, Enum):
@@ -129,6 +168,44 @@ class TranscriptionResult:
     device_used: Optional[str] = None  # Для оптимизации распределения нагрузки
 
 
+@dataclass(frozen=True)
+class TranscriptSegmentResult:
+    """Один сегмент транскрипции faster-whisper.
+
+    Атрибуты:
+        start: Начало сегмента в секундах от начала файла
+        end: Конец сегмента в секундах от начала файла
+        text: Текст сегмента (без обрамляющих пробелов)
+        avg_logprob: Средняя лог-вероятность токенов (оценка качества)
+    """
+
+    start: float
+    end: float
+    text: str
+    avg_logprob: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class TranscriptionStream:
+    """Потоковый результат транскрипции: метаданные сразу, сегменты по мере готовности.
+
+    Атрибуты:
+        language: Обнаруженный (или заданный) язык
+        confidence: Уверенность определения языка
+        duration: Длительность всего аудио в секундах (если известна)
+        segments: Ленивый итератор сегментов в порядке времени
+        model_used: Использованная модель Whisper
+        device_used: Устройство для вычислений (cuda/cpu)
+    """
+
+    language: str
+    confidence: Optional[float]
+    duration: Optional[float]
+    segments: Iterator[TranscriptSegmentResult]
+    model_used: Optional[str] = None
+    device_used: Optional[str] = None
+
+
 @dataclass(frozen=True)
 class TranscriptionError:
     """Информация об ошибке транскрипции с контекстом для диагностики.
@@ -161,12 +238,24 @@ class ModelCacheStats:
         cache_hits: Количество успешных обращений к кэшу
         cache_misses: Количество промахов кэша (требующих загрузки)
         loaded_models: Список ключей загруженных моделей
+        evictions: Количество вытесненных моделей
+        load_waits: Сколько раз поток ждал загрузку, начатую другим потоком
+        cache_bytes: Оценка памяти, занятой моделями в кэше
+        max_bytes: Бюджет памяти кэша (0 - без ограничения)
+        load_seconds: Длительность последней загрузки по ключу модели
+        pinned_models: Ключи закрепленных (невытесняемых) моделей
     """
 
     cache_size: int
     cache_hits: int
     cache_misses: int
     loaded_models: List[str]
+    evictions: int = 0
+    load_waits: int = 0
+    cache_bytes: int = 0
+    max_bytes: int = 0
+    load_seconds: Dict[str, float] = field(default_factory=dict)
+    pinned_models: List[str] = field(default_factory=list)
 
     @property
     def hit_ratio(self) -> float:
@@ -312,22 +401,43 @@ class AudioDurationService:
 
     Стратегии применяются в порядке:
     1. WaveDurationExtractor - быстро для WAV файлов
-    2. FFProbeDurationExtractor - универсально для остальных форматов
+    2. HeaderDurationExtractor - заголовки MP3/FLAC/OGG/M4A без подпроцесса
+    3. FFProbeDurationExtractor - универсально для остальных форматов
+
+    Результаты кэшируются (LRU) по ключу (путь, mtime, размер): повторные
+    запросы для неизмененного файла не читают его и не запускают ffprobe.
 
     Атрибуты:
         extractors: Список экстракторов в порядке приоритета
+        cache_size: Максимальное количество закэшированных результатов
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = 1024, ffprobe_timeout: float = 5.0) -> None:
         """Инициализирует сервис с предустановленными экстракторами.
 
         Порядок экстракторов важен - более быстрые и специализированные
         должны идти первыми.
+
+        Args:
+            cache_size: Размер LRU кэша результатов (0 - без кэша)
+            ffprobe_timeout: Таймаут резервного вызова ffprobe в секундах
         """
         self.extractors: list[AudioDurationExtractor] = [
             WaveDurationExtractor(),  # Быстрый метод для WAV
-            FFProbeDurationExtractor(),  # Универсальный метод
+            HeaderDurationExtractor(),  # Заголовки сжатых форматов
+            FFProbeDurationExtractor(timeout=ffprobe_timeout),  # Универсальный метод
         ]
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int, int], Optional[float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Возвращает статистику кэша длительностей (size, hits, misses)."""
+        with self._lock:
+            return {"size": len(self._cache), **self._stats}
 
     def get_duration_seconds(
         self, path: Union[str, os.PathLike[str]]
@@ -346,11 +456,49 @@ class AudioDurationService:
         path_obj = Path(path)
 
         # Проверяем существование файла перед попытками извлечения
-        if not path_obj.exists():
+        try:
+            stat = path_obj.stat()
+        except OSError:
             logger.debug("Аудиофайл не найден: %s", path_obj)
             return None
 
-        # Пробуем каждый экстрактор в порядке приоритета
+        # Измененный файл получает новый ключ, устаревшая запись вытеснится по LRU
+        cache_key = (str(path_obj.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if cache_key in self._cache:
+                self._stats["hits"] += 1
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+            self._stats["misses"] += 1
+
+        duration = self._extract(path_obj)
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[cache_key] = duration
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return duration
+
+    async def get_duration_seconds_async(
+        self, path: Union[str, os.PathLike[str]]
+    ) -> Optional[float]:
+        """Асинхронная версия get_duration_seconds для обработчиков FastAPI.
+
+        Чтение заголовков и возможный вызов ffprobe выполняются в пуле потоков,
+        чтобы не блокировать цикл событий.
+
+        Args:
+            path: Путь к аудиофайлу
+
+        Returns:
+            Длительность в секундах или None если не удалось определить
+        """
+        return await asyncio.to_thread(self.get_duration_seconds, path)
+
+    def _extract(self, path_obj: Path) -> Optional[float]:
+        """Пробует экстракторы по очереди до первого успешного результата."""
         for extractor in self.extractors:
             duration = extractor.extract_duration(path_obj)
             if duration is not None:
@@ -433,61 +581,122 @@ class DeviceSelector:
         return info
 
 
-class WhisperModelCache:
-    """Продвинутый менеджер кэширования моделей Whisper с LRU вытеснением и метриками.
+# Оценка памяти, занимаемой загруженной моделью (МБ, веса float16 + рабочие буферы).
+# Для int8 расход примерно вдвое меньше. Используется для бюджета кэша.
+MODEL_MEMORY_ESTIMATES_MB: Dict[str, int] = {
+    "tiny": 150,
+    "base": 300,
+    "small": 1000,
+    "medium": 3000,
+    "large": 6000,
+    "large-v1": 6000,
+    "large-v2": 6000,
+    "large-v3": 6000,
+    "large-v3-turbo": 3300,
+    "turbo": 3300,
+    "distil-large-v3": 3000,
+}
+
+# Оценка для неизвестных моделей (например, путь к локальной модели)
+_DEFAULT_MODEL_MEMORY_MB = 3000
+
+
+def estimate_model_bytes(model_name: str, compute_type: ComputeType) -> int:
+    """Оценивает объем памяти, который займет модель после загрузки.
+
+    Args:
+        model_name: Название модели Whisper (или путь к модели)
+        compute_type: Тип вычислений (int8 вдвое компактнее float16)
+
+    Returns:
+        Оценка в байтах
+    """
+    base_name = os.path.basename(str(model_name).rstrip("/\\")).lower()
+    size_mb = MODEL_MEMORY_ESTIMATES_MB.get(base_name, _DEFAULT_MODEL_MEMORY_MB)
+    if compute_type == ComputeType.INT8:
+        size_mb //= 2
+    return size_mb * 1024 * 1024
 
-    Реализует intelligent кэширование для минимизации времени загрузки моделей.
-    Использует LRU (Least Recently Used) алгоритм для оптимального использования памяти.
-    Собирает детальную статистику для мониторинга производительности.
+
+@dataclass
+class _CacheEntry:
+    """Запись кэша: модель и оценка занимаемой ею памяти."""
+
+    model: Any
+    size_bytes: int
+
+
+class _PendingLoad:
+    """Загрузка модели в процессе: остальные потоки ждут ее, а не грузят повторно."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.model: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class WhisperModelCache:
+    """Потокобезопасный кэш моделей Whisper с LRU вытеснением по числу и памяти.
 
     Особенности:
-    - LRU вытеснение для оптимального использования памяти
-    - Детальные метрики производительности (hits/misses/evictions)
-    - Thread-safe операции (если не используется из разных потоков одновременно)
-    - Graceful handling ошибок загрузки
+    - LRU на OrderedDict: обновление порядка и вытеснение за O(1)
+    - Потокобезопасность: все операции над кэшем под одной блокировкой
+    - Single-flight загрузка: параллельные запросы одной модели ждут одну
+      загрузку вместо N одновременных загрузок многогигабайтных весов
+    - Бюджет памяти (cache_max_bytes): перед загрузкой вытесняются самые
+      давно использованные модели, чтобы новая поместилась
+    - Закрепление (pin): предзагруженные модели воркера не вытесняются
+    - Метрики: попадания, промахи, вытеснения, ожидания, длительности загрузок
 
     Атрибуты:
         config: Конфигурация кэша
         max_size: Максимальное количество моделей в кэше
-        _cache: Основное хранилище моделей
-        _access_order: Порядок доступа для LRU алгоритма
-        _stats: Статистика производительности кэша
+        max_bytes: Бюджет памяти в байтах (0 - без ограничения)
     """
 
     def __init__(self, config: TranscriptionConfig):
         """Инициализирует кэш с конфигурацией.
 
         Args:
-            config: Конфигурация с размером кэша и другими настройками
+            config: Конфигурация с размером кэша, бюджетом памяти и другими настройками
         """
         self.config = config
         self.max_size = config.cache_size
-        self._cache: Dict[str, Any] = {}  # Хранилище моделей
-        self._access_order: List[str] = []  # LRU порядок доступа
-        self._stats = {"hits": 0, "misses": 0, "evictions": 0}  # Метрики
+        self.max_bytes = config.cache_max_bytes
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._loading: Dict[str, _PendingLoad] = {}
+        self._pinned: set[str] = set()  # Ключи, которые не вытесняются
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "load_waits": 0}
+        self._load_seconds: Dict[str, float] = {}  # Последняя длительность загрузки
 
     def get_model(
-        self, model_name: str, device: DeviceType, compute_type: ComputeType
+        self,
+        model_name: str,
+        device: DeviceType,
+        compute_type: ComputeType,
+        pin: bool = False,
     ) -> Any:
-        """Получает или загружает модель Whisper с продвинутым кэшированием и метриками.
+        """Получает модель из кэша или загружает ее (один раз на ключ).
 
-        Реализует следующую логику:
-        1. Проверка наличия в кэше (cache hit)
-        2. При попадании - обновление LRU порядка
-        3. При промахе - освобождение места и загрузка новой модели
-        4. Обновление статистики на каждом этапе
+        Логика:
+        1. Попадание - модель перемещается в конец LRU и возвращается
+        2. Модель уже грузится другим потоком - ждем завершения этой загрузки
+        3. Промах - освобождаем место под бюджет, грузим вне блокировки,
+           добавляем в кэш и будим ожидающих
 
         Args:
             model_name: Название модели Whisper ('tiny', 'base', 'small', etc.)
             device: Тип устройства (CUDA/CPU)
             compute_type: Тип вычислений (float16/int8)
+            pin: Закрепить модель в кэше (не вытеснять по LRU и бюджету)
 
         Returns:
             Загруженная модель Whisper
 
         Raises:
             RuntimeError: Если faster-whisper не установлен
-            Exception: Любые ошибки загрузки модели (проброшены выше)
+            Exception: Ошибки загрузки модели (получают и все ожидавшие потоки)
         """
         # Проверяем доступность faster-whisper
         if WhisperModel is None:
@@ -497,22 +706,62 @@ class WhisperModelCache:
 
         # Создаем уникальный ключ для кэша на основе всех параметров
         cache_key = f"{model_name}_{device.value}_{compute_type.value}"
+        size_bytes = estimate_model_bytes(model_name, compute_type)
+
+        with self._lock:
+            if pin:
+                self._pinned.add(cache_key)
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                self._stats["hits"] += 1
+                self._cache.move_to_end(cache_key)
+                logger.debug("Попадание в кэш модели: %s", cache_key)
+                return entry.model
+            pending = self._loading.get(cache_key)
+            if pending is None:
+                # Этот поток отвечает за загрузку
+                self._stats["misses"] += 1
+                pending = _PendingLoad()
+                self._loading[cache_key] = pending
+                is_loader = True
+                self._evict_if_needed(size_bytes)
+            else:
+                self._stats["load_waits"] += 1
+                is_loader = False
+
+        if not is_loader:
+            logger.debug("Ожидаем загрузку модели другим потоком: %s", cache_key)
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.model
 
-        # Проверяем попадание в кэш
-        if cache_key in self._cache:
-            self._stats["hits"] += 1
-            self._update_access_order(cache_key)  # Обновляем LRU порядок
-            logger.debug("Попадание в кэш модели: %s", cache_key)
-            return self._cache[cache_key]
-
-        # Промах кэша - нужно загружать модель
-        self._stats["misses"] += 1
         logger.debug("Промах кэша модели: %s", cache_key)
+        try:
+            model = self._load_model(model_name, device, compute_type)
+        except BaseException as e:
+            with self._lock:
+                pending.error = e
+                self._pinned.discard(cache_key)
+                del self._loading[cache_key]
+            pending.done.set()
+            raise
 
-        # Освобождаем место если кэш заполнен
-        self._evict_if_needed()
+        with self._lock:
+            self._cache[cache_key] = _CacheEntry(model=model, size_bytes=size_bytes)
+            pending.model = model
+            del self._loading[cache_key]
+            # Параллельные загрузки других ключей могли превысить бюджет
+            self._evict_if_needed(0, keep=cache_key)
+        pending.done.set()
+        return model
 
-        # Загружаем новую модель с замером времени
+    def _load_model(
+        self, model_name: str, device: DeviceType, compute_type: ComputeType
+    ) -> Any:
+        """Загружает модель faster-whisper с замером времени (вне блокировки кэша)."""
+        if WhisperModel is None:
+            raise RuntimeError("faster-whisper недоступен")
         start_time = time.time()
         logger.info(
             "Загружаем модель Whisper '%s' на %s (%s)",
@@ -523,78 +772,91 @@ class WhisperModelCache:
 
         # Создаем экземпляр модели
         model = WhisperModel(
-            model_name, device=device.value, compute_type=compute_type.value
+            model_name,
+            device=device.value,
+            compute_type=compute_type.value,
+            cpu_threads=self.config.cpu_threads,
+            num_workers=self.config.num_workers,
         )
 
         load_time = time.time() - start_time
         logger.info("Модель загружена за %.2f секунд", load_time)
-
-        # Сохраняем в кэш и обновляем порядок доступа
-        self._cache[cache_key] = model
-        self._access_order.append(cache_key)
-
+        with self._lock:
+            self._load_seconds[f"{model_name}_{device.value}_{compute_type.value}"] = (
+                load_time
+            )
         return model
 
-    def _update_access_order(self, cache_key: str) -> None:
-        """Обновляет порядок доступа для LRU алгоритма.
-
-        Перемещает ключ в конец списка, отмечая его как недавно использованный.
-        Это ключевая часть LRU реализации.
+    def _used_bytes(self) -> int:
+        """Суммарная оценка памяти моделей в кэше (вызывать под блокировкой)."""
+        return sum(entry.size_bytes for entry in self._cache.values())
 
-        Args:
-            cache_key: Ключ для перемещения в конец списка
-        """
-        # Удаляем ключ из текущей позиции (если есть)
-        if cache_key in self._access_order:
-            self._access_order.remove(cache_key)
+    def _evict_if_needed(self, incoming_bytes: int, keep: Optional[str] = None) -> None:
+        """Вытесняет наименее недавно использованные модели (вызывать под блокировкой).
 
-        # Добавляем в конец как наиболее недавно использованный
-        self._access_order.append(cache_key)
+        Освобождает место так, чтобы после добавления модели размером
+        incoming_bytes соблюдались лимит количества (cache_size) и бюджет
+        памяти (cache_max_bytes).
 
-    def _evict_if_needed(self) -> None:
-        """Вытесняет наименее недавно использованные модели при заполнении кэша.
+        Args:
+            incoming_bytes: Оценка памяти модели, которая будет добавлена
+            keep: Ключ, который нельзя вытеснять (только что загруженная модель)
 
-        Реализует LRU eviction policy:
-        - Удаляет модели с начала списка _access_order
-        - Продолжает до освобождения достаточного места
-        - Обновляет статистику вытеснений
+        Note:
+            Закрепленные модели не вытесняются, поэтому бюджет может быть
+            превышен, если закрепленных моделей больше, чем в него помещается.
         """
-        while len(self._cache) >= self.max_size:
-            # Проверяем наличие элементов для вытеснения
-            if not self._access_order:
-                break
+        reserve = 1 if incoming_bytes else 0
 
-            # Берем наименее недавно использованную модель (начало списка)
-            oldest_key = self._access_order.pop(0)
+        def _over_budget() -> bool:
+            if len(self._cache) + reserve > self.max_size:
+                return True
+            return bool(
+                self.max_bytes and self._used_bytes() + incoming_bytes > self.max_bytes
+            )
 
-            # Удаляем из кэша если ключ все еще присутствует
-            if oldest_key in self._cache:
-                del self._cache[oldest_key]
-                self._stats["evictions"] += 1
-                logger.debug("Вытеснена модель из кэша: %s", oldest_key)
+        while _over_budget():
+            victim = next(
+                (key for key in self._cache if key != keep and key not in self._pinned),
+                None,
+            )
+            if victim is None:
+                break
+            del self._cache[victim]
+            self._stats["evictions"] += 1
+            logger.debug("Вытеснена модель из кэша: %s", victim)
 
     def get_stats(self) -> ModelCacheStats:
         """Получает статистику производительности кэша.
 
         Returns:
-            Объект со статистикой включая hit ratio и список загруженных моделей
+            Объект со статистикой включая hit ratio, вытеснения и длительности загрузок
         """
-        return ModelCacheStats(
-            cache_size=len(self._cache),
-            cache_hits=self._stats["hits"],
-            cache_misses=self._stats["misses"],
-            loaded_models=list(self._cache.keys()),
-        )
+        with self._lock:
+            return ModelCacheStats(
+                cache_size=len(self._cache),
+                cache_hits=self._stats["hits"],
+                cache_misses=self._stats["misses"],
+                loaded_models=list(self._cache.keys()),
+                evictions=self._stats["evictions"],
+                load_waits=self._stats["load_waits"],
+                cache_bytes=self._used_bytes(),
+                max_bytes=self.max_bytes,
+                load_seconds=dict(self._load_seconds),
+                pinned_models=sorted(self._pinned),
+            )
 
     def clear_cache(self) -> None:
         """Очищает все кэшированные модели.
 
         Полезно для освобождения памяти или сброса состояния кэша.
-        Сбрасывает статистику доступа, но сохраняет общие метрики.
+        Загрузки, идущие в этот момент, завершатся и добавят модель заново.
+        Закрепление снимается вместе с моделями.
         """
-        cleared_count = len(self._cache)
-        self._cache.clear()
-        self._access_order.clear()
+        with self._lock:
+            cleared_count = len(self._cache)
+            self._cache.clear()
+            self._pinned.clear()
         logger.info("Очищено %d моделей из кэша", cleared_count)
 
 
@@ -638,7 +900,9 @@ class TranscriptionService:
         self.config = config or TranscriptionConfig()
         self.model_cache = model_cache or WhisperModelCache(self.config)
         self.device_selector = device_selector or DeviceSelector(self.config)
-        self.duration_service = duration_service or AudioDurationService()
+        self.duration_service = duration_service or AudioDurationService(
+            ffprobe_timeout=self.config.ffprobe_timeout
+        )
 
     def transcribe_file(
         self,
@@ -734,6 +998,281 @@ class TranscriptionService:
             # Проброс исключения для обработки выше по стеку
             raise
 
+    def transcribe_stream(
+        self,
+        path: Union[str, os.PathLike[str]],
+        model_name: Optional[str] = None,
+        start_offset: float = 0.0,
+        language: Optional[str] = None,
+    ) -> TranscriptionStream:
+        """Запускает потоковую транскрипцию: сегменты отдаются по мере декодирования.
+
+        В отличие от transcribe_file, не накапливает весь текст в памяти —
+        вызывающий код может сохранять сегменты партиями и обновлять прогресс.
+        Для возобновления после сбоя передайте start_offset (конец последнего
+        сохраненного сегмента) и ранее определенный язык.
+
+        Args:
+            path: Путь к аудиофайлу
+            model_name: Название модели (default_model если не указано)
+            start_offset: С какой секунды начинать (clip_timestamps faster-whisper)
+            language: Язык аудио; None — автоопределение
+
+        Returns:
+            TranscriptionStream с языком, длительностью и итератором сегментов
+
+        Raises:
+            RuntimeError: Если faster-whisper недоступен
+            Exception: Ошибки загрузки модели или декодирования
+        """
+        model_name = model_name or self.config.default_model
+        device, compute_type = self.device_selector.select_optimal_device()
+        model = self.model_cache.get_model(model_name, device, compute_type)
+
+        kwargs: Dict[str, Any] = {"beam_size": self.config.beam_size}
+        if start_offset > 0:
+            kwargs["clip_timestamps"] = [float(start_offset)]
+        if language:
+            kwargs["language"] = language
+
+        segments_gen, info = model.transcribe(str(path), **kwargs)
+
+        def _iter_segments() -> Iterator[TranscriptSegmentResult]:
+            for seg in segments_gen:
+                text = seg.text.strip()
+                # Пропускаем пустые сегменты и уже сохраненные до возобновления
+                if not text or seg.end <= start_offset:
+                    continue
+                yield TranscriptSegmentResult(
+                    start=float(seg.start),
+                    end=float(seg.end),
+                    text=text,
+                    avg_logprob=getattr(seg, "avg_logprob", None),
+                )
+
+        return TranscriptionStream(
+            language=language or _info_value(info, "language") or "unknown",
+            confidence=_info_value(info, "language_probability"),
+            duration=_info_value(info, "duration"),
+            segments=_iter_segments(),
+            model_used=model_name,
+            device_used=device.value,
+        )
+
+    def transcribe_stream_parallel(
+        self,
+        path: Union[str, os.PathLike[str]],
+        model_name: Optional[str] = None,
+        start_offset: float = 0.0,
+        language: Optional[str] = None,
+        workers: Optional[int] = None,
+    ) -> TranscriptionStream:
+        """Транскрибирует длинный файл параллельно по фрагментам в пуле процессов.
+
+        Алгоритм:
+        1. Аудио декодируется один раз (16 кГц mono) и размечается VAD
+        2. Фрагменты ~chunk_seconds режутся посередине пауз между речью
+        3. Каждый процесс пула держит свою закэшированную WhisperModel, поэтому
+           число процессов ограничено свободной памятью / оценкой модели
+        4. Фрагменты копируются из декодированного аудио по мере отправки в пул
+           (в работе не больше процессов + 1), а не все сразу
+        5. Сегменты сдвигаются на смещение фрагмента и отдаются в порядке времени;
+           дубликаты из зон перекрытия отбрасываются (сегмент принадлежит
+           фрагменту, в чей интервал попадает его середина)
+
+        Если язык не задан, он определяется один раз по первым
+        LANGUAGE_PROBE_SECONDS речи и передается всем фрагментам: иначе каждый
+        фрагмент определял бы язык сам и файл мог получиться на смеси языков.
+        Если пул процессов запустить нельзя (например, внутри daemon-процесса
+        prefork-воркера), фрагменты обрабатываются последовательно.
+
+        Args:
+            path: Путь к аудиофайлу
+            model_name: Название модели (default_model если не указано)
+            start_offset: С какой секунды начинать (возобновление)
+            language: Язык аудио; None - автоопределение
+            workers: Число процессов (parallel_workers из конфигурации если None)
+
+        Returns:
+            TranscriptionStream с итератором сегментов в порядке времени
+
+        Raises:
+            RuntimeError: Если faster-whisper недоступен
+        """
+        if WhisperModel is None:
+            raise RuntimeError(
+                "faster-whisper недоступен - установите командой: pip install faster-whisper"
+            )
+        from faster_whisper.audio import decode_audio
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        model_name = model_name or self.config.default_model
+        workers = workers or self.config.parallel_workers or _default_parallel_workers()
+        device, _ = self.device_selector.select_optimal_device()
+
+        audio = decode_audio(str(path), sampling_rate=SAMPLE_RATE)
+        duration = len(audio) / SAMPLE_RATE
+        speech = [
+            (ts["start"] / SAMPLE_RATE, ts["end"] / SAMPLE_RATE)
+            for ts in get_speech_timestamps(
+                audio,
+                VadOptions(min_silence_duration_ms=self.config.vad_min_silence_ms),
+            )
+        ]
+        plan = plan_audio_chunks(
+            speech, duration, self.config.chunk_seconds, start_offset=start_offset
+        )
+        overlap = self.config.chunk_overlap_seconds
+        windows = [
+            (max(0.0, start - overlap), min(duration, end + overlap), (start, end))
+            for start, end in plan
+        ]
+        workers = min(workers, len(windows), self._max_chunk_processes(model_name))
+        language_probe = None
+        if language is None and len(windows) > 1:
+            onset = max(
+                next(
+                    (start for start, end in speech if end > start_offset), start_offset
+                ),
+                start_offset,
+            )
+            language_probe = audio[
+                int(onset * SAMPLE_RATE) : int(
+                    (onset + LANGUAGE_PROBE_SECONDS) * SAMPLE_RATE
+                )
+            ].copy()
+        jobs = iter_chunk_jobs(audio, windows, model_name, language)
+        # Массив держит только генератор заданий: освобождается после последнего фрагмента
+        del audio
+
+        logger.info(
+            "Параллельная транскрипция: файл=%s, длительность=%.0fс, фрагментов=%d, процессов=%d",
+            path,
+            duration,
+            len(windows),
+            workers,
+        )
+        results = self._run_chunk_jobs(jobs, workers, language_probe)
+        first_segments, first_language = next(results, ([], None))
+
+        def _iter_segments() -> Iterator[TranscriptSegmentResult]:
+            yield from first_segments
+            for segments, _ in results:
+                yield from segments
+
+        return TranscriptionStream(
+            language=language or first_language or "unknown",
+            confidence=None,
+            duration=duration,
+            segments=_iter_segments(),
+            model_used=model_name,
+            device_used=device.value,
+        )
+
+    def _max_chunk_processes(self, model_name: str) -> int:
+        """Сколько процессов пула со своей копией модели поместится в свободную память."""
+        _, compute_type = self.device_selector.select_optimal_device()
+        per_process = estimate_model_bytes(model_name, compute_type)
+        return max(1, int(psutil.virtual_memory().available // per_process))
+
+    def _run_chunk_jobs(
+        self,
+        jobs: Iterable[ChunkJob],
+        workers: int,
+        language_probe: Optional[Any] = None,
+    ) -> Iterator[Tuple[List[TranscriptSegmentResult], Optional[str]]]:
+        """Выполняет фрагменты в пуле процессов, отдавая результаты в исходном порядке.
+
+        Задания берутся из jobs по мере освобождения пула: в работе не больше
+        workers + 1 фрагментов, остальные еще не скопированы из аудио.
+        Если передан language_probe (отсчеты начала речи), язык определяется по
+        нему до раздачи фрагментов и подставляется во все задания.
+        """
+        pending = iter(jobs)
+        first = next(pending, None)
+        if first is None:
+            return
+        model_name = first[0]
+        pending = itertools.chain([first], pending)
+
+        def _with_language(
+            remaining: Iterator[ChunkJob], language: Optional[str]
+        ) -> Iterator[ChunkJob]:
+            if not language:
+                return remaining
+            return (
+                (name, chunk, lo, owned, language)
+                for name, chunk, lo, owned, _ in remaining
+            )
+
+        if workers <= 1:
+            if language_probe is not None:
+                pending = _with_language(
+                    pending, detect_chunk_language(self, model_name, language_probe)
+                )
+            for job in pending:
+                yield transcribe_audio_chunk(self, *job)
+            return
+
+        # Делим ядра между процессами, чтобы потоки CTranslate2 не конкурировали
+        chunk_config = dataclasses.replace(
+            self.config,
+            cpu_threads=max(1, (os.cpu_count() or 1) // workers),
+            log_performance=False,
+        )
+        executor: Optional[ProcessPoolExecutor] = None
+        futures: Deque[Future[Any]] = deque()
+        head: List[ChunkJob] = []
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_chunk_worker,
+                initargs=(chunk_config,),
+            )
+            if language_probe is not None:
+                # Определение языка в процессе пула: модель грузится там, где она нужна
+                pending = _with_language(
+                    pending,
+                    executor.submit(
+                        _detect_language_in_worker, model_name, language_probe
+                    ).result(),
+                )
+                language_probe = None
+            head = list(itertools.islice(pending, workers + 1))
+            for job in head:
+                futures.append(executor.submit(_transcribe_chunk_in_worker, *job))
+        except (AssertionError, OSError, RuntimeError) as e:
+            # daemon-процессы (prefork Celery) не могут порождать дочерние
+            logger.warning(
+                "Пул процессов недоступен (%s) - фрагменты обрабатываются последовательно",
+                e,
+            )
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            pending = itertools.chain(head, pending)
+            if language_probe is not None:
+                pending = _with_language(
+                    pending, detect_chunk_language(self, model_name, language_probe)
+                )
+            for job in pending:
+                yield transcribe_audio_chunk(self, *job)
+            return
+
+        try:
+            while futures:
+                result = futures.popleft().result()
+                # Следующий фрагмент уходит в пул до того, как потребитель
+                # займется сегментами: процессы не простаивают
+                next_job = next(pending, None)
+                if next_job is not None:
+                    futures.append(
+                        executor.submit(_transcribe_chunk_in_worker, *next_job)
+                    )
+                yield result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def safe_transcribe(
         self,
         path: Union[str, os.PathLike[str]],
@@ -787,6 +1326,7 @@ class TranscriptionService:
             Словарь со статистикой:
             - cache_stats: Метрики кэша моделей (попадания, промахи, коэффициент)
             - device_info: Информация о доступных устройствах
+            - duration_cache: Метрики кэша длительностей аудио
             - config: Текущая конфигурация сервиса
         """
         cache_stats = self.model_cache.get_stats()
@@ -799,12 +1339,20 @@ class TranscriptionService:
                 "misses": cache_stats.cache_misses,
                 "hit_ratio": cache_stats.hit_ratio,
                 "loaded_models": cache_stats.loaded_models,
+                "evictions": cache_stats.evictions,
+                "load_waits": cache_stats.load_waits,
+                "cache_bytes": cache_stats.cache_bytes,
+                "max_bytes": cache_stats.max_bytes,
+                "load_seconds": cache_stats.load_seconds,
+                "pinned_models": cache_stats.pinned_models,
             },
             "device_info": device_info,
+            "duration_cache": self.duration_service.get_cache_stats(),
             "config": {
                 "default_model": self.config.default_model,
                 "beam_size": self.config.beam_size,
                 "cache_size": self.config.cache_size,
+                "cache_max_bytes": self.config.cache_max_bytes,
                 "gpu_enabled": self.config.enable_gpu,
             },
         }
@@ -816,7 +1364,9 @@ class TranscriptionService:
         """
         self.model_cache.clear_cache()
 
-    def warm_up_model(self, model_name: Optional[str] = None) -> None:
+    def warm_up_model(
+        self, model_name: Optional[str] = None, pin: bool = False
+    ) -> None:
         """Предварительно загружает модель для ускорения первой транскрипции.
 
         Устраняет задержку "холодного старта" путем предзагрузки модели в кэш.
@@ -824,6 +1374,7 @@ class TranscriptionService:
 
         Args:
             model_name: Название модели для предзагрузки (используется default_model если не указано)
+            pin: Закрепить модель, чтобы LRU не вытеснил ее разовыми запросами других моделей
         """
         model_name = model_name or self.config.default_model
         device, compute_type = self.device_selector.select_optimal_device()
@@ -832,12 +1383,219 @@ class TranscriptionService:
         start_time = time.time()
 
         # Загружаем модель в кэш
-        self.model_cache.get_model(model_name, device, compute_type)
+        self.model_cache.get_model(model_name, device, compute_type, pin=pin)
 
         warm_up_time = time.time() - start_time
         logger.info("Предзагрузка завершена за %.2f секунд", warm_up_time)
 
 
+# ============================================================================
+# ФРАГМЕНТАЦИЯ ДЛИННЫХ ФАЙЛОВ
+# ============================================================================
+
+# Частота дискретизации, с которой работает Whisper
+SAMPLE_RATE = 16000
+# Длина начала речи для однократного определения языка (окно Whisper)
+LANGUAGE_PROBE_SECONDS = 30.0
+
+
+# Задание фрагмента: модель, отсчеты, смещение, интервал владения, язык
+ChunkJob = Tuple[str, Any, float, Tuple[float, float], Optional[str]]
+
+
+def plan_audio_chunks(
+    speech_regions: List[Tuple[float, float]],
+    duration: float,
+    chunk_seconds: float,
+    start_offset: float = 0.0,
+) -> List[Tuple[float, float]]:
+    """Делит аудио на фрагменты ~chunk_seconds с границами посередине пауз.
+
+    Фрагменты покрывают интервал [start_offset, duration) без пропусков и
+    пересечений. Если речь идет без пауз дольше 2 * chunk_seconds, фрагмент
+    режется принудительно.
+
+    Args:
+        speech_regions: Интервалы речи (начало, конец) в секундах, по возрастанию
+        duration: Длительность аудио в секундах
+        chunk_seconds: Целевая длина фрагмента
+        start_offset: Начало первого фрагмента (возобновление)
+
+    Returns:
+        Список интервалов (начало, конец), которыми "владеют" фрагменты
+
+    Example:
+        >>> plan_audio_chunks([(0, 4), (6, 10)], 12.0, 3.0)
+        [(0.0, 5.0), (5.0, 12.0)]
+    """
+    if duration <= start_offset:
+        return []
+    chunks: List[Tuple[float, float]] = []
+    chunk_start = float(start_offset)
+    prev_end: Optional[float] = None
+    max_chunk = chunk_seconds * 2
+    for region_start, region_end in speech_regions:
+        if region_end <= chunk_start:
+            continue
+        # Режем в паузе перед регионом, если фрагмент набрал длину
+        # или регион сделал бы его слишком длинным
+        if (
+            prev_end is not None
+            and prev_end > chunk_start
+            and (
+                prev_end - chunk_start >= chunk_seconds
+                or region_end - chunk_start > max_chunk
+            )
+        ):
+            cut = (prev_end + max(region_start, prev_end)) / 2
+            chunks.append((chunk_start, cut))
+            chunk_start = cut
+        # Длинная речь без пауз: режем принудительно
+        while region_end - chunk_start > max_chunk:
+            cut = chunk_start + chunk_seconds
+            chunks.append((chunk_start, cut))
+            chunk_start = cut
+        prev_end = region_end if prev_end is None else max(prev_end, region_end)
+    chunks.append((chunk_start, float(duration)))
+    return chunks
+
+
+def iter_chunk_jobs(
+    audio: Any,
+    windows: List[Tuple[float, float, Tuple[float, float]]],
+    model_name: str,
+    language: Optional[str],
+) -> Iterator[ChunkJob]:
+    """Лениво нарезает задания фрагментов из декодированного аудио.
+
+    Отсчеты фрагмента копируются: срез numpy — это view, и отправленное в
+    пул задание держало бы (и сериализовало бы вместе с собой) весь массив.
+
+    Args:
+        audio: Отсчеты файла (numpy float32, 16 кГц)
+        windows: (начало, конец, интервал владения) фрагментов с перекрытием
+        model_name: Модель Whisper
+        language: Язык аудио или None
+
+    Returns:
+        Итератор заданий в порядке времени
+    """
+    for lo, hi, owned in windows:
+        chunk = audio[int(lo * SAMPLE_RATE) : int(hi * SAMPLE_RATE)].copy()
+        yield (model_name, chunk, lo, owned, language)
+
+
+def transcribe_audio_chunk(
+    service: "TranscriptionService",
+    model_name: str,
+    audio_chunk: Any,
+    chunk_offset: float,
+    owned: Tuple[float, float],
+    language: Optional[str],
+) -> Tuple[List[TranscriptSegmentResult], Optional[str]]:
+    """Транскрибирует один фрагмент и переводит время сегментов в координаты файла.
+
+    Args:
+        service: Сервис, чья модель используется
+        model_name: Модель Whisper
+        audio_chunk: Отсчеты фрагмента (numpy float32, 16 кГц)
+        chunk_offset: Секунда файла, с которой начинается фрагмент
+        owned: Интервал, которым владеет фрагмент (для отбрасывания перекрытий)
+        language: Язык аудио или None
+
+    Returns:
+        Кортеж (сегменты фрагмента, определенный язык)
+    """
+    device, compute_type = service.device_selector.select_optimal_device()
+    model = service.model_cache.get_model(model_name, device, compute_type)
+    kwargs: Dict[str, Any] = {"beam_size": service.config.beam_size}
+    if language:
+        kwargs["language"] = language
+    segments_gen, info = model.transcribe(audio_chunk, **kwargs)
+    result: List[TranscriptSegmentResult] = []
+    for seg in segments_gen:
+        text = seg.text.strip()
+        start = float(seg.start) + chunk_offset
+        end = float(seg.end) + chunk_offset
+        # Сегмент принадлежит фрагменту, в интервал которого попадает его середина
+        if not text or not owned[0] <= (start + end) / 2 < owned[1]:
+            continue
+        result.append(
+            TranscriptSegmentResult(
+                start=start,
+                end=end,
+                text=text,
+                avg_logprob=getattr(seg, "avg_logprob", None),
+            )
+        )
+    return result, language or _info_value(info, "language")
+
+
+def detect_chunk_language(
+    service: "TranscriptionService", model_name: str, audio_prefix: Any
+) -> Optional[str]:
+    """Определяет язык по началу речи без декодирования сегментов.
+
+    faster-whisper определяет язык сразу при вызове transcribe(), а сегменты
+    декодируются лениво — генератор здесь не перебирается.
+
+    Args:
+        service: Сервис, чья модель используется
+        model_name: Модель Whisper
+        audio_prefix: Отсчеты начала речи (numpy float32, 16 кГц)
+
+    Returns:
+        Код языка или None
+    """
+    device, compute_type = service.device_selector.select_optimal_device()
+    model = service.model_cache.get_model(model_name, device, compute_type)
+    _, info = model.transcribe(audio_prefix, beam_size=service.config.beam_size)
+    language = _info_value(info, "language")
+    return str(language) if language else None
+
+
+# Сервис процесса пула: своя WhisperModel в кэше каждого процесса
+_chunk_worker_service: Optional["TranscriptionService"] = None
+
+
+def _init_chunk_worker(config: TranscriptionConfig) -> None:
+    """Инициализатор процесса пула: создает локальный сервис со своим кэшем моделей."""
+    global _chunk_worker_service
+    _chunk_worker_service = TranscriptionService(config)
+
+
+def _transcribe_chunk_in_worker(
+    model_name: str,
+    audio_chunk: Any,
+    chunk_offset: float,
+    owned: Tuple[float, float],
+    language: Optional[str],
+) -> Tuple[List[TranscriptSegmentResult], Optional[str]]:
+    """Точка входа задачи пула процессов."""
+    service = _chunk_worker_service or _transcription_service
+    return transcribe_audio_chunk(
+        service, model_name, audio_chunk, chunk_offset, owned, language
+    )
+
+
+def _detect_language_in_worker(model_name: str, audio_prefix: Any) -> Optional[str]:
+    """Точка входа определения языка в пуле процессов."""
+    service = _chunk_worker_service or _transcription_service
+    return detect_chunk_language(service, model_name, audio_prefix)
+
+
+def _default_parallel_workers() -> int:
+    """Число процессов по умолчанию: половина ядер (не меньше 2, не больше 8)."""
+    return max(2, min(8, (os.cpu_count() or 2) // 2))
+
+
+def _info_value(info: Any, key: str) -> Any:
+    """Читает поле TranscriptionInfo faster-whisper (namedtuple или dict)."""
+    if isinstance(info, dict):
+        return info.get(key)
+    return getattr(info, key, None)
+
+
 # ============================================================================
 # ГЛОБАЛЬНЫЕ ОБЪЕКТЫ И LEGACY API
 # ============================================================================
@@ -898,6 +1656,56 @@ def safe_transcribe(
         return None, None, result.message
 
 
+def transcribe_stream(
+    path: Union[str, os.PathLike[str]],
+    model_name: str,
+    start_offset: float = 0.0,
+    language: Optional[str] = None,
+) -> TranscriptionStream:
+    """Потоковая транскрипция через глобальный сервис.
+
+    Обертка над TranscriptionService.transcribe_stream()
+
+    Args:
+        path: Путь к аудиофайлу
+        model_name: Название модели Whisper
+        start_offset: Секунда, с которой продолжить (возобновление)
+        language: Известный язык аудио (None — автоопределение)
+
+    Returns:
+        TranscriptionStream с итератором сегментов
+    """
+    return _transcription_service.transcribe_stream(
+        path, model_name, start_offset=start_offset, language=language
+    )
+
+
+def transcribe_stream_parallel(
+    path: Union[str, os.PathLike[str]],
+    model_name: str,
+    start_offset: float = 0.0,
+    language: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> TranscriptionStream:
+    """Параллельная транскрипция длинного файла через глобальный сервис.
+
+    Обертка над TranscriptionService.transcribe_stream_parallel()
+
+    Args:
+        path: Путь к аудиофайлу
+        model_name: Название модели Whisper
+        start_offset: Секунда, с которой продолжить (возобновление)
+        language: Известный язык аудио (None — автоопределение)
+        workers: Число процессов (None — из конфигурации)
+
+    Returns:
+        TranscriptionStream с итератором сегментов в порядке времени
+    """
+    return _transcription_service.transcribe_stream_parallel(
+        path, model_name, start_offset=start_offset, language=language, workers=workers
+    )
+
+
 def get_audio_duration_seconds(path: Union[str, os.PathLike[str]]) -> Optional[float]:
     """Legacy функция для обратной совместимости.
 
@@ -912,6 +1720,20 @@ def get_audio_duration_seconds(path: Union[str, os.PathLike[str]]) -> Optional[f
     return _transcription_service.get_audio_duration(path)
 
 
+async def probe_audio_duration(path: Union[str, os.PathLike[str]]) -> Optional[float]:
+    """Асинхронно определяет длительность аудио (не блокирует цикл событий).
+
+    Args:
+        path: Путь к аудиофайлу
+
+    Returns:
+        Длительность в секундах или None
+    """
+    return await _transcription_service.duration_service.get_duration_seconds_async(
+        path
+    )
+
+
 # ============================================================================
 # РАСШИРЕННЫЕ UTILITY ФУНКЦИИ
 # ============================================================================
@@ -938,6 +1760,53 @@ def warm_up_default_model() -> None:
     _transcription_service.warm_up_model()
 
 
+def warm_up_models(model_names: List[str], pin: bool = True) -> List[str]:
+    """Предзагружает (и по умолчанию закрепляет) несколько моделей в глобальном кэше.
+
+    Ошибки загрузки отдельных моделей логируются и не прерывают остальные.
+
+    Args:
+        model_names: Модели в порядке приоритета
+        pin: Закрепить модели в кэше
+
+    Returns:
+        Список успешно загруженных моделей
+    """
+    loaded: List[str] = []
+    for model_name in model_names:
+        try:
+            _transcription_service.warm_up_model(model_name, pin=pin)
+            loaded.append(model_name)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Не удалось предзагрузить модель %s: %s", model_name, e)
+    return loaded
+
+
+def configure_transcription_service(**overrides: Any) -> TranscriptionService:
+    """Пересоздает глобальный сервис с измененной конфигурацией.
+
+    Кэш моделей старого сервиса отбрасывается, поэтому вызывать до предзагрузки.
+
+    Args:
+        **overrides: Поля TranscriptionConfig для замены
+
+    Returns:
+        Новый глобальный сервис
+
+    Example:
+        configure_transcription_service(num_workers=4)
+    """
+    global _transcription_service
+    config = dataclasses.replace(_transcription_service.config, **overrides)
+    _transcription_service = TranscriptionService(config)
+    return _transcription_service
+
+
+def select_default_device() -> Tuple[DeviceType, ComputeType]:
+    """Возвращает устройство и тип вычислений, которые выберет глобальный сервис."""
+    return _transcription_service.device_selector.select_optimal_device()
+
+
 def clear_model_cache() -> None:
     """Очищает глобальный кэш моделей.
 
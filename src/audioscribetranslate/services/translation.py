@@ -0,0 +1,697 @@
+"""Сервис перевода текстов транскриптов.
+
+Повторяет устройство TranscriptionService: конфигурация, выбор устройства,
+кэш моделей и подключаемые реализации (backend) за общим интерфейсом.
+
+Конвейер перевода:
+- текст делится на предложения (split_sentences), длинные предложения режутся
+  по словам, чтобы не превышать лимит длины входа модели;
+- предложения токенизируются и группируются в мини-батчи по длине
+  (make_batches): похожие по длине предложения попадают в один батч, поэтому
+  паддинг до самого длинного почти ничего не стоит, а размер батча ограничен
+  бюджетом max_batch_tokens (длина_самого_длинного × число_предложений);
+- предложения, уже переведенные раньше, берутся из памяти переводов
+  (translation_memory.py), повторы внутри текста переводятся один раз;
+- батчи переводятся backend'ом, результат собирается в исходном порядке;
+- перевод на несколько языков (translate_many) делит текст на предложения
+  один раз, а токены исходных предложений переиспользует для всех целевых
+  языков одной многоязычной модели;
+- пропускная способность считается в сгенерированных токенах в секунду.
+
+Реализации:
+- CTranslate2Backend — модели OPUS-MT/Marian, сконвертированные
+  ct2-transformers-converter (каталог models_dir/<модель> с токенизатором);
+- StubTranslationBackend — детерминированная локальная заглушка для тестов
+  и окружений без моделей.
+
+Example:
+    service = get_translation_service()
+    result = service.translate_text("Привет. Как дела?", "ru", "en")
+    result.text, result.tokens_per_second
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .transcription import ComputeType, DeviceType
+from .translation_memory import TranslationMemory, dedupe, memory_key
+
+logger = logging.getLogger(__name__)
+
+# Опциональные зависимости: без них работает только заглушка
+ctranslate2: Optional[Any] = None
+AutoTokenizer: Optional[Any] = None
+
+try:
+    import ctranslate2  # type: ignore
+except ImportError:
+    logger.debug("ctranslate2 не установлен - доступна только заглушка перевода")
+
+try:
+    from transformers import AutoTokenizer  # type: ignore
+except ImportError:
+    logger.debug("transformers не установлен - токенизатор CTranslate2 недоступен")
+
+# Имя модели по умолчанию в Translation.model_name (enqueue_translation)
+DEFAULT_MODEL_ALIAS = "mt_model"
+
+BACKEND_CTRANSLATE2 = "ctranslate2"
+BACKEND_STUB = "stub"
+
+
+@dataclass(frozen=True)
+class TranslationConfig:
+    """Конфигурация сервиса перевода.
+
+    Атрибуты:
+        backend: ctranslate2 (без модели - TranslationError) или stub (только явно)
+        models_dir: Каталог сконвертированных моделей CTranslate2
+        model_template: Имя модели для пары языков, если модель не задана явно
+        max_batch_tokens: Бюджет мини-батча с учетом паддинга (токенов)
+        max_batch_size: Максимум предложений в мини-батче
+        max_sentence_tokens: Длина предложения, после которой оно режется
+        beam_size: Размер луча (1 = greedy, быстрее всего)
+        cache_size: Максимальное количество моделей в кэше
+        enable_gpu: Разрешить использование GPU если доступно
+        cpu_threads: Потоков на батч (intra_threads, 0 - значение CTranslate2)
+        inter_threads: Параллельных батчей на модель
+        target_prefix_template: Токен целевого языка многоязычной модели
+            (например, "__{tgt}__" для M2M100; "" - модель на пару языков)
+        memory_size: Предложений в локальной памяти переводов (0 - выключена)
+        memory_redis_url: Redis для общей памяти переводов (None - только процесс)
+        memory_ttl_seconds: Время жизни записей памяти переводов в Redis
+    """
+
+    backend: str = BACKEND_CTRANSLATE2
+    models_dir: str = "models/translation"
+    model_template: str = "opus-mt-{src}-{tgt}"
+    max_batch_tokens: int = 4096
+    max_batch_size: int = 64
+    max_sentence_tokens: int = 200  # Marian: вход не длиннее 512 подтокенов
+    beam_size: int = 2
+    cache_size: int = 4
+    enable_gpu: bool = True
+    cpu_threads: int = 0
+    inter_threads: int = 1
+    target_prefix_template: str = ""
+    memory_size: int = 100_000
+    memory_redis_url: Optional[str] = None
+    memory_ttl_seconds: int = 30 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class TranslationResult:
+    """Результат перевода текста с метриками пропускной способности.
+
+    Атрибуты:
+        text: Переведенный текст
+        model_name: Фактически использованная модель
+        backend: Имя реализации (ctranslate2 / stub)
+        sentences: Количество предложений
+        cached_sentences: Предложений без обращения к модели (память, повторы)
+        batches: Количество мини-батчей
+        input_tokens: Токенов на входе
+        output_tokens: Сгенерированных токенов
+        processing_seconds: Время перевода (токенизация + декодирование)
+    """
+
+    text: str
+    model_name: str
+    backend: str
+    sentences: int = 0
+    cached_sentences: int = 0
+    batches: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    processing_seconds: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Сгенерированных токенов в секунду (None, если перевода не было)."""
+        if self.output_tokens <= 0 or self.processing_seconds <= 0:
+            return None
+        return self.output_tokens / self.processing_seconds
+
+
+class TranslationError(RuntimeError):
+    """Перевод невозможен (нет backend'а или модели)."""
+
+
+# ============================================================================
+# РАЗБИЕНИЕ НА ПРЕДЛОЖЕНИЯ И МИНИ-БАТЧИ
+# ============================================================================
+
+# Конец предложения: знак препинания (с закрывающими кавычками/скобками) и пробел
+_SENTENCE_END = re.compile(r"(?<=[.!?…。！？])[\"'»”)\]]*\s+")
+
+
+def split_sentences(text: str, max_words: int = 0) -> List[str]:
+    """Делит текст на предложения, сохраняя знаки препинания.
+
+    Args:
+        text: Исходный текст
+        max_words: Длинные предложения режутся по словам на части не длиннее
+            max_words (0 - не резать)
+
+    Returns:
+        Непустые предложения в исходном порядке
+
+    Example:
+        >>> split_sentences("Привет! Как дела? Хорошо.")
+        ['Привет!', 'Как дела?', 'Хорошо.']
+    """
+    sentences: List[str] = []
+    for paragraph in text.splitlines():
+        for sentence in _SENTENCE_END.split(paragraph.strip()):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            words = sentence.split()
+            if max_words > 0 and len(words) > max_words:
+                sentences.extend(
+                    " ".join(words[i : i + max_words])
+                    for i in range(0, len(words), max_words)
+                )
+            else:
+                sentences.append(sentence)
+    return sentences
+
+
+def make_batches(
+    lengths: Sequence[int], max_batch_tokens: int, max_batch_size: int
+) -> List[List[int]]:
+    """Группирует предложения в мини-батчи с минимальным паддингом.
+
+    Индексы сортируются по длине, и батч пополняется, пока стоимость с
+    паддингом (длина самого длинного × размер батча) укладывается в бюджет.
+
+    Args:
+        lengths: Длины предложений в токенах
+        max_batch_tokens: Бюджет батча с учетом паддинга
+        max_batch_size: Максимум предложений в батче
+
+    Returns:
+        Списки индексов предложений; каждый индекс встречается ровно один раз.
+        Предложение длиннее бюджета образует отдельный батч.
+
+    Example:
+        >>> make_batches([5, 1, 4, 2], max_batch_tokens=8, max_batch_size=8)
+        [[1, 3], [2], [0]]
+    """
+    order = sorted(range(len(lengths)), key=lambda i: (lengths[i], i))
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for index in order:
+        # Индексы отсортированы по длине: текущее предложение - самое длинное в батче
+        padded = max(lengths[index], 1) * (len(current) + 1)
+        if current and (padded > max_batch_tokens or len(current) >= max_batch_size):
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
+
+
+# ============================================================================
+# РЕАЛИЗАЦИИ (BACKENDS)
+# ============================================================================
+
+
+class TranslationBackend(ABC):
+    """Интерфейс модели перевода: токенизация, перевод батча, детокенизация."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def tokenize(self, sentences: List[str]) -> List[List[str]]:
+        """Токенизирует предложения."""
+
+    @abstractmethod
+    def translate_tokens(
+        self, batch: List[List[str]], source_language: str, target_language: str
+    ) -> List[List[str]]:
+        """Переводит батч токенизированных предложений (порядок сохраняется)."""
+
+    @abstractmethod
+    def detokenize(self, tokens: List[str]) -> str:
+        """Собирает текст из токенов."""
+
+
+class StubTranslationBackend(TranslationBackend):
+    """Детерминированная заглушка: помечает предложения целевым языком.
+
+    Токены - слова, перевод - '[<target>] ' + исходное предложение. Позволяет
+    проверять конвейер (разбиение, батчи, порядок, метрики) без моделей.
+    """
+
+    name = BACKEND_STUB
+
+    def tokenize(self, sentences: List[str]) -> List[List[str]]:
+        return [sentence.split() for sentence in sentences]
+
+    def translate_tokens(
+        self, batch: List[List[str]], source_language: str, target_language: str
+    ) -> List[List[str]]:
+        return [[f"[{target_language}]", *tokens] for tokens in batch]
+
+    def detokenize(self, tokens: List[str]) -> str:
+        return " ".join(tokens)
+
+
+class CTranslate2Backend(TranslationBackend):
+    """Модель перевода CTranslate2 (OPUS-MT/Marian) с токенизатором transformers.
+
+    Атрибуты:
+        model_dir: Каталог модели (model.bin + файлы токенизатора)
+        translator: ctranslate2.Translator
+        tokenizer: Токенизатор transformers (sentencepiece)
+    """
+
+    name = BACKEND_CTRANSLATE2
+
+    def __init__(
+        self,
+        model_dir: str,
+        device: DeviceType,
+        compute_type: ComputeType,
+        config: TranslationConfig,
+    ) -> None:
+        if ctranslate2 is None or AutoTokenizer is None:
+            raise TranslationError("ctranslate2/transformers не установлены")
+        self.model_dir = model_dir
+        self.config = config
+        self.translator = ctranslate2.Translator(
+            model_dir,
+            device=device.value,
+            compute_type=compute_type.value,
+            inter_threads=max(config.inter_threads, 1),
+            intra_threads=max(config.cpu_threads, 0),
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+
+    def tokenize(self, sentences: List[str]) -> List[List[str]]:
+        return [
+            self.tokenizer.convert_ids_to_tokens(self.tokenizer.encode(sentence))
+            for sentence in sentences
+        ]
+
+    def translate_tokens(
+        self, batch: List[List[str]], source_language: str, target_language: str
+    ) -> List[List[str]]:
+        target_prefix = None
+        if self.config.target_prefix_template:
+            # Многоязычная модель: язык перевода задается первым токеном декодера
+            token = self.config.target_prefix_template.format(tgt=target_language)
+            target_prefix = [[token]] * len(batch)
+        results = self.translator.translate_batch(
+            batch,
+            target_prefix=target_prefix,
+            beam_size=self.config.beam_size,
+            max_batch_size=len(batch),
+            batch_type="examples",
+        )
+        return [result.hypotheses[0] for result in results]
+
+    def detokenize(self, tokens: List[str]) -> str:
+        if self.config.target_prefix_template and tokens:
+            tokens = tokens[1:]  # префикс целевого языка
+        ids = self.tokenizer.convert_tokens_to_ids(tokens)
+        return str(self.tokenizer.decode(ids, skip_special_tokens=True))
+
+
+# ============================================================================
+# УСТРОЙСТВО И КЭШ МОДЕЛЕЙ
+# ============================================================================
+
+
+def select_translation_device(
+    config: TranslationConfig,
+) -> Tuple[DeviceType, ComputeType]:
+    """Выбирает устройство для CTranslate2 (без зависимости от PyTorch).
+
+    Returns:
+        (cuda, float16), если GPU разрешен и CTranslate2 видит CUDA, иначе (cpu, int8)
+    """
+    if config.enable_gpu and ctranslate2 is not None:
+        try:
+            if ctranslate2.get_cuda_device_count() > 0:
+                return DeviceType.CUDA, ComputeType.FLOAT16
+        except Exception as e:  # noqa: BLE001
+            logger.debug("CTranslate2 CUDA недоступна: %s", e)
+    return DeviceType.CPU, ComputeType.INT8
+
+
+class TranslationModelCache:
+    """Потокобезопасный LRU-кэш загруженных моделей перевода.
+
+    Загрузка выполняется под блокировкой: модели перевода небольшие, а
+    повторная параллельная загрузка одной модели хуже короткого ожидания.
+    """
+
+    def __init__(self, config: TranslationConfig) -> None:
+        self.config = config
+        self._models: "OrderedDict[str, TranslationBackend]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_seconds = 0.0
+
+    def get_backend(self, model_name: str, model_dir: str) -> TranslationBackend:
+        """Возвращает загруженную модель, загружая её при промахе.
+
+        Args:
+            model_name: Ключ кэша (имя модели)
+            model_dir: Каталог модели
+
+        Returns:
+            Готовый к работе backend
+        """
+        with self._lock:
+            backend = self._models.get(model_name)
+            if backend is not None:
+                self._models.move_to_end(model_name)
+                self._hits += 1
+                return backend
+            self._misses += 1
+            device, compute_type = select_translation_device(self.config)
+            started = time.perf_counter()
+            backend = CTranslate2Backend(model_dir, device, compute_type, self.config)
+            self._load_seconds += time.perf_counter() - started
+            logger.info(
+                "Модель перевода %s загружена на %s/%s за %.2f с",
+                model_name,
+                device.value,
+                compute_type.value,
+                time.perf_counter() - started,
+            )
+            self._models[model_name] = backend
+            while len(self._models) > max(self.config.cache_size, 1):
+                evicted, _ = self._models.popitem(last=False)
+                self._evictions += 1
+                logger.info("Модель перевода %s вытеснена из кэша", evicted)
+            return backend
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Статистика кэша моделей перевода."""
+        with self._lock:
+            return {
+                "cached_models": list(self._models),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "load_seconds": round(self._load_seconds, 3),
+            }
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        with self._lock:
+            self._models.clear()
+
+
+# ============================================================================
+# СЕРВИС
+# ============================================================================
+
+
+class TranslationService:
+    """Сервис перевода: выбор модели и backend'а, батчинг, метрики.
+
+    Атрибуты:
+        config: Конфигурация сервиса
+        model_cache: Кэш моделей CTranslate2
+        stub: Заглушка для режима stub
+        memory: Память переводов предложений
+    """
+
+    def __init__(
+        self,
+        config: Optional[TranslationConfig] = None,
+        model_cache: Optional[TranslationModelCache] = None,
+        stub: Optional[TranslationBackend] = None,
+        memory: Optional[TranslationMemory] = None,
+    ) -> None:
+        self.config = config or TranslationConfig()
+        self.model_cache = model_cache or TranslationModelCache(self.config)
+        self.stub = stub or StubTranslationBackend()
+        self.memory = memory or TranslationMemory(
+            max_entries=self.config.memory_size,
+            redis_url=self.config.memory_redis_url,
+            ttl_seconds=self.config.memory_ttl_seconds,
+        )
+
+    def resolve_model_name(
+        self,
+        source_language: str,
+        target_language: str,
+        model_name: Optional[str] = None,
+    ) -> str:
+        """Возвращает модель: явно заданную или по шаблону для пары языков."""
+        if model_name and model_name != DEFAULT_MODEL_ALIAS:
+            return model_name
+        return self.config.model_template.format(
+            src=source_language, tgt=target_language
+        )
+
+    def get_backend(self, model_name: str) -> TranslationBackend:
+        """Выбирает реализацию для модели согласно config.backend.
+
+        Заглушка используется только при явном backend=stub: молча подменять
+        перевод текстом "[en] ..." нельзя.
+
+        Raises:
+            TranslationError: Неизвестный backend, либо библиотека или модель недоступны
+        """
+        backend = self.config.backend
+        if backend == BACKEND_STUB:
+            return self.stub
+        if backend != BACKEND_CTRANSLATE2:
+            raise TranslationError(f"Неизвестный backend перевода: {backend}")
+        model_dir = os.path.join(self.config.models_dir, model_name)
+        available = (
+            ctranslate2 is not None
+            and AutoTokenizer is not None
+            and os.path.isdir(model_dir)
+        )
+        if not available:
+            raise TranslationError(
+                f"Модель перевода {model_name} недоступна (каталог {model_dir}, "
+                f"ctranslate2={'есть' if ctranslate2 else 'нет'})"
+            )
+        return self.model_cache.get_backend(model_name, model_dir)
+
+    def translate_text(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        model_name: Optional[str] = None,
+    ) -> TranslationResult:
+        """Переводит текст предложениями в мини-батчах.
+
+        Args:
+            text: Исходный текст
+            source_language: ISO код исходного языка
+            target_language: ISO код целевого языка
+            model_name: Модель (None или 'mt_model' - по шаблону для пары)
+
+        Returns:
+            Перевод и метрики пропускной способности
+
+        Raises:
+            TranslationError: Модель недоступна в режиме ctranslate2
+        """
+        resolved = self.resolve_model_name(source_language, target_language, model_name)
+        if not text.strip() or source_language == target_language:
+            return TranslationResult(text=text, model_name=resolved, backend="none")
+
+        started = time.perf_counter()
+        sentences = split_sentences(text, max_words=self.config.max_sentence_tokens)
+        return self._translate_sentences(
+            sentences, source_language, target_language, resolved, {}, started
+        )
+
+    def translate_many(
+        self,
+        text: str,
+        source_language: str,
+        target_languages: Sequence[str],
+        model_name: Optional[str] = None,
+    ) -> Dict[str, TranslationResult]:
+        """Переводит текст на несколько языков с одним разбиением на предложения.
+
+        Args:
+            text: Исходный текст
+            source_language: ISO код исходного языка
+            target_languages: Целевые языки (повторы игнорируются)
+            model_name: Модель (None или 'mt_model' - по шаблону для каждой пары)
+
+        Returns:
+            Результаты по целевым языкам в порядке запроса
+
+        Raises:
+            TranslationError: Модель недоступна в режиме ctranslate2
+
+        Pitfalls:
+            Токены исходных предложений общие только у целевых языков с одной
+            моделью (многоязычная модель, target_prefix_template). Для моделей
+            на пару языков каждая пара токенизируется своим словарем.
+        """
+        sentences = split_sentences(text, max_words=self.config.max_sentence_tokens)
+        token_cache: Dict[str, Dict[int, List[str]]] = {}
+        results: Dict[str, TranslationResult] = {}
+        for target_language in dict.fromkeys(target_languages):
+            resolved = self.resolve_model_name(
+                source_language, target_language, model_name
+            )
+            if not text.strip() or source_language == target_language:
+                results[target_language] = TranslationResult(
+                    text=text, model_name=resolved, backend="none"
+                )
+                continue
+            results[target_language] = self._translate_sentences(
+                sentences,
+                source_language,
+                target_language,
+                resolved,
+                token_cache,
+                time.perf_counter(),
+            )
+        return results
+
+    def _translate_sentences(
+        self,
+        sentences: List[str],
+        source_language: str,
+        target_language: str,
+        resolved: str,
+        token_cache: Dict[str, Dict[int, List[str]]],
+        started: float,
+    ) -> TranslationResult:
+        """Переводит предложения: память переводов, мини-батчи, метрики.
+
+        token_cache хранит токены предложений по модели и индексу предложения,
+        чтобы другие целевые языки той же модели не токенизировали их снова.
+        """
+        backend = self.get_backend(resolved)
+        # Реализация в ключе: переводы заглушки не смешиваются с переводами модели
+        memory_model = f"{backend.name}:{resolved}"
+        keys = [
+            memory_key(source_language, target_language, memory_model, sentence)
+            for sentence in sentences
+        ]
+        positions = dedupe(keys)
+        known = self.memory.get_many(positions)
+        pending = [key for key in positions if key not in known]
+
+        cached_tokens = token_cache.setdefault(memory_model, {})
+        first_index = [positions[key][0] for key in pending]
+        missing = [i for i in first_index if i not in cached_tokens]
+        new_tokens = backend.tokenize([sentences[i] for i in missing])
+        cached_tokens.update(zip(missing, new_tokens))
+        tokenized = [cached_tokens[i] for i in first_index]
+        batches = make_batches(
+            [len(tokens) for tokens in tokenized],
+            self.config.max_batch_tokens,
+            self.config.max_batch_size,
+        )
+        fresh: Dict[str, str] = {}
+        output_tokens = 0
+        for batch in batches:
+            outputs = backend.translate_tokens(
+                [tokenized[i] for i in batch], source_language, target_language
+            )
+            for index, tokens in zip(batch, outputs):
+                output_tokens += len(tokens)
+                fresh[pending[index]] = backend.detokenize(tokens)
+        self.memory.put_many(fresh)
+        elapsed = time.perf_counter() - started
+
+        translated = [known.get(key, fresh.get(key, "")) for key in keys]
+        result = TranslationResult(
+            text=" ".join(part for part in translated if part),
+            model_name=resolved,
+            backend=backend.name,
+            sentences=len(sentences),
+            cached_sentences=len(sentences) - len(pending),
+            batches=len(batches),
+            input_tokens=sum(len(tokens) for tokens in tokenized),
+            output_tokens=output_tokens,
+            processing_seconds=elapsed,
+        )
+        logger.info(
+            "Перевод %s->%s (%s/%s): %d предложений (%d из памяти), %d батчей, %.1f ток/с",
+            source_language,
+            target_language,
+            result.backend,
+            resolved,
+            result.sentences,
+            result.cached_sentences,
+            result.batches,
+            result.tokens_per_second or 0.0,
+        )
+        return result
+
+    def get_service_stats(self) -> Dict[str, Any]:
+        """Статистика сервиса для мониторинга."""
+        device, compute_type = select_translation_device(self.config)
+        return {
+            "backend": self.config.backend,
+            "device": device.value,
+            "compute_type": compute_type.value,
+            "model_cache": self.model_cache.get_stats(),
+            "translation_memory": self.memory.get_stats(),
+        }
+
+
+# ============================================================================
+# ГЛОБАЛЬНЫЙ СЕРВИС
+# ============================================================================
+
+_translation_service = TranslationService()
+
+
+def get_translation_service() -> TranslationService:
+    """Возвращает глобальный сервис перевода."""
+    return _translation_service
+
+
+def configure_translation_service(**overrides: Any) -> TranslationService:
+    """Пересоздает глобальный сервис с измененной конфигурацией.
+
+    Args:
+        **overrides: Поля TranslationConfig для замены
+
+    Returns:
+        Новый глобальный сервис
+
+    Example:
+        configure_translation_service(backend="stub")
+    """
+    global _translation_service
+    config = dataclasses.replace(_translation_service.config, **overrides)
+    _translation_service = TranslationService(config)
+    return _translation_service
+
+
+def translate_text(
+    text: str,
+    source_language: str,
+    target_language: str,
+    model_name: Optional[str] = None,
+) -> TranslationResult:
+    """Переводит текст глобальным сервисом (см. TranslationService.translate_text)."""
+    return _translation_service.translate_text(
+        text, source_language, target_language, model_name
+    )
@@ -0,0 +1,260 @@
+"""Память переводов (translation memory) на уровне предложений.
+
+В записях встреч много повторов ("спасибо", приветствия, шаблонные фразы),
+а перевод одного транскрипта на несколько языков и повторный перевод снова
+прогоняют тот же исходный текст через модель. Память хранит перевод каждого
+предложения по ключу (исходный язык, целевой язык, модель, хеш
+нормализованного предложения).
+
+Уровни:
+- локальный LRU в процессе (OrderedDict под блокировкой, как кэш моделей);
+- общий уровень в Redis (опционально): ключи с TTL, чтение MGET и запись
+  одним pipeline на весь текст; общие счетчики попаданий для мониторинга.
+
+Ошибки Redis не прерывают перевод: общий уровень отключается на
+REMOTE_RETRY_SECONDS, и работа продолжается с локальным LRU.
+
+Example:
+    memory = TranslationMemory(max_entries=10_000, redis_url="redis://localhost:6379/0")
+    keys = [memory_key("ru", "en", "ctranslate2:opus-mt-ru-en", s) for s in sentences]
+    found = memory.get_many(keys)          # {key: перевод}
+    memory.put_many({key: translated})
+
+Pitfalls:
+    - Модель в ключе должна включать реализацию (stub/ctranslate2), иначе
+      переводы заглушки попадут в общий кэш под именем настоящей модели.
+    - Смена весов модели без смены имени требует смены namespace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+redis: Optional[Any] = None
+
+try:
+    import redis
+except ImportError:
+    logger.debug("redis не установлен - память переводов только в процессе")
+
+DEFAULT_NAMESPACE = "tm:v1"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+REMOTE_RETRY_SECONDS = 30.0
+
+
+def normalize_sentence(sentence: str) -> str:
+    """Нормализует предложение для ключа: NFKC и схлопывание пробелов.
+
+    Регистр и пунктуация сохраняются - они влияют на перевод.
+    """
+    return " ".join(unicodedata.normalize("NFKC", sentence).split())
+
+
+def memory_key(
+    source_language: str,
+    target_language: str,
+    model: str,
+    sentence: str,
+    namespace: str = DEFAULT_NAMESPACE,
+) -> str:
+    """Строит ключ памяти переводов для предложения.
+
+    Args:
+        source_language: ISO код исходного языка
+        target_language: ISO код целевого языка
+        model: Реализация и модель, например "ctranslate2:opus-mt-ru-en"
+        sentence: Исходное предложение
+        namespace: Префикс ключей (версия формата)
+
+    Returns:
+        Ключ вида "tm:v1:ru:en:<sha256>"
+    """
+    digest = hashlib.sha256(
+        f"{model}\x1f{normalize_sentence(sentence)}".encode("utf-8")
+    ).hexdigest()
+    return f"{namespace}:{source_language}:{target_language}:{digest}"
+
+
+class TranslationMemory:
+    """Двухуровневая память переводов: LRU в процессе + Redis.
+
+    Атрибуты:
+        max_entries: Размер локального LRU (0 - локальный уровень выключен)
+        ttl_seconds: Время жизни записей в Redis
+        namespace: Префикс ключей, в том числе счетчиков
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        namespace: str = DEFAULT_NAMESPACE,
+        client: Optional[Any] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self._client = client
+        if self._client is None and redis_url and redis is not None:
+            # from_url не подключается: соединение откроется при первом запросе
+            self._client = redis.Redis.from_url(
+                redis_url, socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._remote_disabled_until = 0.0
+        self._local_hits = 0
+        self._remote_hits = 0
+        self._misses = 0
+
+    @property
+    def _stats_key(self) -> str:
+        return f"{self.namespace}:stats"
+
+    def _remote(self) -> Optional[Any]:
+        if self._client is None or time.monotonic() < self._remote_disabled_until:
+            return None
+        return self._client
+
+    def _remote_failed(self, error: Exception) -> None:
+        self._remote_disabled_until = time.monotonic() + REMOTE_RETRY_SECONDS
+        logger.warning(
+            "Redis-уровень памяти переводов недоступен (%s), повтор через %.0f с",
+            error,
+            REMOTE_RETRY_SECONDS,
+        )
+
+    def _remember(self, key: str, value: str) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Ищет переводы: сначала в LRU, промахи - одним MGET в Redis.
+
+        Args:
+            keys: Ключи memory_key (повторы допустимы)
+
+        Returns:
+            Найденные переводы по ключам
+        """
+        unique = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        with self._lock:
+            for key in unique:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = value
+            self._local_hits += len(found)
+        missing = [key for key in unique if key not in found]
+        remote_hits = 0
+        client = self._remote()
+        if missing and client is not None:
+            try:
+                values = client.mget(missing)
+                for key, value in zip(missing, values):
+                    if value is not None:
+                        found[key] = (
+                            value.decode("utf-8") if isinstance(value, bytes) else value
+                        )
+                        remote_hits += 1
+                pipe = client.pipeline(transaction=False)
+                pipe.hincrby(
+                    self._stats_key, "hits", len(unique) - len(missing) + remote_hits
+                )
+                pipe.hincrby(self._stats_key, "misses", len(missing) - remote_hits)
+                pipe.execute()
+            except Exception as e:  # noqa: BLE001
+                self._remote_failed(e)
+        with self._lock:
+            self._remote_hits += remote_hits
+            self._misses += len(unique) - len(found)
+            for key in missing:
+                if key in found:
+                    self._remember(key, found[key])
+        return found
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        """Сохраняет переводы в LRU и (одним pipeline) в Redis."""
+        if not items:
+            return
+        with self._lock:
+            for key, value in items.items():
+                self._remember(key, value)
+        client = self._remote()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(key, value, ex=self.ttl_seconds)
+            pipe.execute()
+        except Exception as e:  # noqa: BLE001
+            self._remote_failed(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Статистика попаданий процесса и (если есть Redis) общая по всем воркерам."""
+        with self._lock:
+            lookups = self._local_hits + self._remote_hits + self._misses
+            stats: Dict[str, Any] = {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "local_hits": self._local_hits,
+                "remote_hits": self._remote_hits,
+                "misses": self._misses,
+                "hit_ratio": (
+                    round((lookups - self._misses) / lookups, 4) if lookups else None
+                ),
+                "remote_enabled": self._client is not None,
+            }
+        client = self._remote()
+        if client is not None:
+            try:
+                raw = client.hgetall(self._stats_key)
+                shared = {
+                    (k.decode() if isinstance(k, bytes) else k): int(v)
+                    for k, v in raw.items()
+                }
+                total = shared.get("hits", 0) + shared.get("misses", 0)
+                stats["shared"] = {
+                    "hits": shared.get("hits", 0),
+                    "misses": shared.get("misses", 0),
+                    "hit_ratio": (
+                        round(shared.get("hits", 0) / total, 4) if total else None
+                    ),
+                }
+            except Exception as e:  # noqa: BLE001
+                self._remote_failed(e)
+        return stats
+
+    def clear(self) -> None:
+        """Очищает локальный уровень и счетчики процесса (Redis не трогается)."""
+        with self._lock:
+            self._entries.clear()
+            self._local_hits = self._remote_hits = self._misses = 0
+
+
+def dedupe(keys: List[str]) -> Dict[str, List[int]]:
+    """Группирует позиции одинаковых ключей: каждое уникальное предложение
+    переводится один раз, даже если повторяется в тексте.
+
+    Returns:
+        {ключ: [индексы предложений]} в порядке первого появления
+    """
+    positions: Dict[str, List[int]] = {}
+    for index, key in enumerate(keys):
+        positions.setdefault(key, []).append(index)
+    return positions
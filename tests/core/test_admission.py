@@ -0,0 +1,153 @@
+"""
+:module: src/audioscribetranslate/core/admission.py
+Тесты контроля допуска загрузок: решения 429/503/pending, бэклог, разбор pending.
+Требования: ADMIT-101, ADMIT-102, ADMIT-103
+"""
+
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core import tasks
+from src.audioscribetranslate.core.admission import (
+    ADMIT,
+    DEFER,
+    REJECT_BACKLOG,
+    REJECT_USER,
+    AdmissionConfig,
+    Backlog,
+    decide_admission,
+    load_backlog_sync,
+)
+from src.audioscribetranslate.models.audio_file import AudioFile
+from src.audioscribetranslate.models.base import Base
+
+CONFIG = AdmissionConfig(
+    max_user_work_seconds=1000.0,
+    max_backlog_work_seconds=5000.0,
+    max_queue_work_seconds=600.0,
+    drain_rate=2.0,
+    default_cost_seconds=100.0,
+)
+
+
+@pytest.fixture
+def factory() -> Iterator[sessionmaker]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _audio(user_id: int, status: str, cost: float | None) -> AudioFile:
+    return AudioFile(
+        user_id=user_id,
+        filename="f.wav",
+        original_name="f.wav",
+        content_type="audio/wav",
+        size=1,
+        whisper_model="base",
+        status=status,
+        expected_cost_seconds=cost,
+    )
+
+
+def test_saturated_user_and_backlog_are_rejected_with_retry_after() -> None:
+    """Негативный тест: 429 по работе пользователя, 503 по общему бэклогу (ADMIT-101)"""
+    user = decide_admission(Backlog(user_seconds=1200.0), 0.0, CONFIG)
+    assert user.action == REJECT_USER and user.status_code == 429
+    assert user.retry_after == 100  # 200 с избытка / 2 воркера
+    saturated = Backlog(dispatched_seconds=3000.0, pending_seconds=2500.0)
+    backlog = decide_admission(saturated, 0.0, CONFIG)
+    assert backlog.action == REJECT_BACKLOG and backlog.status_code == 503
+    assert backlog.retry_after == 250
+    assert not user.admitted and not backlog.admitted
+
+
+def test_full_queue_low_memory_and_fifo_defer_to_pending() -> None:
+    """Edge case: заполненный брокер, нехватка памяти и очередь pending — отложить (ADMIT-102)"""
+    assert (
+        decide_admission(Backlog(dispatched_seconds=500.0), 200.0, CONFIG).action
+        == DEFER
+    )
+    assert decide_admission(Backlog(), 50.0, CONFIG, memory_ok=False).action == DEFER
+    waiting = Backlog(pending_count=1, pending_seconds=10.0)
+    assert decide_admission(waiting, 1.0, CONFIG).action == DEFER
+    # Один файл больше бюджета проходит в пустую очередь
+    assert decide_admission(Backlog(), 5000.0, CONFIG).action == ADMIT
+    assert decide_admission(
+        Backlog(user_seconds=9e9), 0.0, AdmissionConfig(enabled=False)
+    ).admitted
+
+
+def test_backlog_query_splits_pending_dispatched_and_user(
+    factory: sessionmaker,
+) -> None:
+    """Happy path: бэклог считается одним запросом, без оценки — по умолчанию (ADMIT-101)"""
+    with factory() as session:
+        session.add_all(
+            [
+                _audio(1, "queued", 200.0),
+                _audio(1, "pending", None),
+                _audio(2, "processing", 300.0),
+                _audio(2, "pending", 50.0),
+                _audio(1, "done", 999.0),
+            ]
+        )
+        session.commit()
+        backlog = load_backlog_sync(session, 1, CONFIG)
+    assert backlog.user_seconds == pytest.approx(300.0)
+    assert backlog.dispatched_seconds == pytest.approx(500.0)
+    assert backlog.pending_seconds == pytest.approx(150.0)
+    assert backlog.pending_count == 2
+
+
+def test_drain_pending_releases_in_order_within_budget(
+    factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Happy path: pending уходят в очередь по порядку, пока есть бюджет (ADMIT-103)"""
+    with factory() as session:
+        session.add(_audio(9, "queued", 300.0))
+        session.add_all([_audio(1, "pending", cost) for cost in (200.0, 100.0, 50.0)])
+        session.commit()
+    sent: List[int] = []
+    monkeypatch.setattr(tasks, "SyncSessionLocal", factory)
+    monkeypatch.setattr(tasks, "check_memory_available", lambda: True)
+    monkeypatch.setattr(
+        tasks.AdmissionConfig, "from_settings", classmethod(lambda cls, s: CONFIG)
+    )
+    monkeypatch.setattr(
+        tasks,
+        "enqueue_audio",
+        lambda audio_id, model, lang="ru": sent.append(audio_id) or True,
+    )
+
+    assert (
+        tasks.drain_pending_uploads() == 2
+    )  # 300 + 200 + 100 = 600, 50 уже не влезает
+    with factory() as session:
+        statuses = session.execute(
+            select(AudioFile.status).order_by(AudioFile.id)
+        ).scalars()
+        assert list(statuses) == ["queued", "queued", "queued", "pending"]
+    assert sent == [2, 3]
+
+
+def test_drain_pending_keeps_file_when_broker_down(
+    factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Негативный тест: сбой публикации возвращает файл в pending (ADMIT-103)"""
+    with factory() as session:
+        session.add(_audio(1, "pending", 10.0))
+        session.commit()
+    monkeypatch.setattr(tasks, "SyncSessionLocal", factory)
+    monkeypatch.setattr(tasks, "check_memory_available", lambda: True)
+    monkeypatch.setattr(
+        tasks, "enqueue_audio", lambda audio_id, model, lang="ru": False
+    )
+
+    assert tasks.drain_pending_uploads() == 0
+    with factory() as session:
+        assert session.execute(select(AudioFile.status)).scalar_one() == "pending"
@@ -0,0 +1,109 @@
+"""
+:module: src/audioscribetranslate/core/autoscaler.py
+Тесты решений автомасштабирования: рост пачкой, потолок памяти, гистерезис.
+Требования: SCALE-101, SCALE-102, SCALE-103
+"""
+
+from dataclasses import replace
+
+from src.audioscribetranslate.core.autoscaler import (
+    Autoscaler,
+    AutoscalerConfig,
+    AutoscalerInputs,
+)
+
+GB = 1024**3
+CONFIG = AutoscalerConfig(
+    max_workers=6,
+    target_drain_seconds=300.0,
+    max_scale_up_step=2,
+    scale_up_cooldown_seconds=10.0,
+    scale_down_cooldown_seconds=60.0,
+    hysteresis=0.5,
+    worker_overhead_bytes=0,
+    min_free_bytes=1 * GB,
+)
+
+
+def _inputs(
+    workers: int, cost: float, now: float, queued: int = 10, **kw
+) -> AutoscalerInputs:
+    return AutoscalerInputs(
+        workers=workers,
+        processing=kw.pop("processing", 0),
+        queued_by_model={"base": queued} if queued else {},
+        cost_by_model={"base": cost} if queued else {},
+        available_bytes=kw.pop("available_bytes", 64 * GB),
+        now=now,
+        **kw,
+    )
+
+
+def test_scale_up_in_bursts_with_cooldown() -> None:
+    """Happy path: рост пачкой по прогнозу работы, не чаще паузы (SCALE-101)"""
+    scaler = Autoscaler(CONFIG)
+    first = scaler.decide(_inputs(0, cost=1500.0, now=100.0))  # спрос 5 воркеров
+    assert (first.desired, first.target, first.reason) == (5, 2, "scale_up")
+    held = scaler.decide(_inputs(2, cost=1500.0, now=105.0))
+    assert held.delta == 0 and held.reason == "hold_up_cooldown"
+    assert scaler.decide(_inputs(2, cost=1500.0, now=111.0)).target == 4
+
+
+def test_demand_capped_by_queue_length_and_unpriced_files() -> None:
+    """Edge case: воркеров не больше ждущих файлов; файлы без оценки считаются по умолчанию (SCALE-101)"""
+    scaler = Autoscaler(replace(CONFIG, max_scale_up_step=10))
+    assert scaler.decide(_inputs(0, cost=10_000.0, now=0.0, queued=2)).target == 2
+    unpriced = AutoscalerInputs(
+        workers=0,
+        processing=0,
+        queued_by_model={"base": 30},
+        unpriced_by_model={"base": 30},
+        available_bytes=64 * GB,
+        now=100.0,
+    )
+    decision = Autoscaler(replace(CONFIG, max_scale_up_step=10)).decide(unpriced)
+    assert decision.work_seconds == 30 * 600.0 * 0.1
+    assert decision.target == 6
+
+
+def test_memory_cap_blocks_scale_up() -> None:
+    """Негативный тест: не хватает памяти на модель — воркер не запускается (SCALE-102)"""
+    scaler = Autoscaler(CONFIG)
+    # large int8 ~3 ГБ, свободно 3.5 ГБ при резерве 1 ГБ -> помещается 0
+    tight = AutoscalerInputs(
+        workers=1,
+        processing=1,
+        queued_by_model={"large": 5},
+        cost_by_model={"large": 5000.0},
+        available_bytes=int(3.5 * GB),
+        now=0.0,
+    )
+    decision = scaler.decide(tight)
+    assert decision.memory_cap == 1
+    assert decision.delta == 0 and decision.reason == "hold_memory"
+
+
+def test_scale_down_after_cooldown_with_hysteresis() -> None:
+    """Happy path: остановка по одному после паузы, спрос в полосе гистерезиса держит воркеры (SCALE-103)"""
+    scaler = Autoscaler(CONFIG)
+    # 3 воркера; работы на 2 воркера при drain=300 и на 3 при drain/1.5 -> полоса гистерезиса
+    band = scaler.decide(_inputs(3, cost=500.0, now=0.0))
+    assert band.desired == 2 and band.delta == 0 and band.reason == "hold"
+    # Очередь пуста: ждём паузу, затем по одному воркеру
+    assert (
+        scaler.decide(_inputs(3, cost=0, now=10.0, queued=0)).reason
+        == "hold_down_cooldown"
+    )
+    assert scaler.decide(_inputs(3, cost=0, now=71.0, queued=0)).target == 2
+    assert scaler.decide(_inputs(2, cost=0, now=100.0, queued=0)).delta == 0
+    assert scaler.decide(_inputs(2, cost=0, now=132.0, queued=0)).target == 1
+
+
+def test_busy_workers_are_kept_and_metrics_exported() -> None:
+    """Edge case: занятые воркеры не останавливаются; решения видны в метриках (SCALE-103)"""
+    scaler = Autoscaler(replace(CONFIG, scale_down_cooldown_seconds=0.0))
+    decision = scaler.decide(_inputs(2, cost=0, now=0.0, queued=0, processing=2))
+    assert decision.delta == 0
+    metrics = scaler.get_metrics()
+    assert metrics["last_decision"]["reason"] == "hold"
+    assert metrics["decisions_total"] == {"hold": 1}
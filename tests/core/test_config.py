@@ -3,13 +3,22 @@ from typing import Iterator
 """
 :module: src/audioscribetranslate/core/config.py
 Тесты конфигурации приложения и генерации URL для БД/Redis.
-Требования: CONFIG-101, CONFIG-102, CONFIG-103
+Требования: CONFIG-101, CONFIG-102, CONFIG-103, CONFIG-104
 """
 import os
+from pathlib import Path
 
 import pytest
 
-from src.audioscribetranslate.core.config import Settings, create_settings, get_env_file
+from src.audioscribetranslate.core.config import (
+    Settings,
+    create_settings,
+    get_env_file,
+    get_settings,
+    invalidate_settings,
+    override_settings,
+    reload_settings,
+)
 
 
 # SETUP: Сохраняем оригинальное окружение
@@ -66,3 +75,42 @@ def test_create_settings_env_file(monkeypatch: pytest.MonkeyPatch) -> None:
     s = create_settings()
     assert s.model_config["env_file"] == ".env"
     assert s.model_config["env_file"] == ".env"
+
+
+def test_get_settings_is_cached_until_env_file_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Happy path: повторные вызовы возвращают один объект, правка env-файла перечитывается (CONFIG-104)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ENV", "local")
+    env_file = tmp_path / ".env.local"
+    env_file.write_text("MAX_WORKERS=3\n")
+    invalidate_settings()
+    first = get_settings()
+    assert first is get_settings()
+    assert first.max_workers == 3
+
+    env_file.write_text("MAX_WORKERS=4\n")
+    mtime = os.stat(env_file).st_mtime_ns
+    os.utime(env_file, ns=(mtime, mtime + 10**9))  # гарантируем новый mtime
+    assert get_settings().max_workers == 4
+    invalidate_settings()
+
+
+def test_get_settings_switches_with_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Edge case: смена ENV даёт настройки другого env-файла (CONFIG-104)"""
+    monkeypatch.setenv("ENV", "local")
+    local = reload_settings()
+    monkeypatch.setenv("ENV", "docker")
+    docker = get_settings()
+    assert docker is not local
+    assert docker.model_config["env_file"] == ".env"
+    invalidate_settings()
+
+
+def test_override_settings_is_scoped() -> None:
+    """Негативный тест: подмена действует только внутри блока (CONFIG-104)"""
+    with override_settings(max_workers=1) as overridden:
+        assert get_settings() is overridden
+        assert get_settings().max_workers == 1
+    assert get_settings() is not overridden
@@ -1,9 +1,11 @@
 """
 :module: src/audioscribetranslate/core/files.py
 Проверка создания и получения структуры uploaded_files для аудиофайлов.
-Требования: FILES-101, FILES-102
+Требования: FILES-101, FILES-102, FILES-103, FILES-104
 """
 
+import hashlib
+import io
 import os
 import shutil
 from typing import Iterator
@@ -11,8 +13,11 @@ from typing import Iterator
 import pytest
 
 from src.audioscribetranslate.core.files import (
+    UploadTooLargeError,
+    content_addressed_filename,
     create_uploaded_files_structure,
     get_uploaded_files_dir,
+    save_upload_stream,
 )
 
 # SETUP: Тестовые данные для моделей и пользователей
@@ -85,3 +90,36 @@ def test_create_uploaded_files_structure_idempotent() -> None:
         for user in USERS:
             user_dir = os.path.join(base_dir, model, user)
             assert os.path.isdir(user_dir)
+
+
+def test_save_upload_stream_hashes_and_renames(tmp_path) -> None:
+    """Happy path: потоковое сохранение считает размер и SHA-256 (FILES-103)"""
+    data = os.urandom(10_000)
+    stored = save_upload_stream(io.BytesIO(data), str(tmp_path), "a.mp3", chunk_size=4096)
+    # VERIFICATION: файл на месте, временных файлов не осталось
+    assert stored.path == os.path.join(str(tmp_path), "a.mp3")
+    assert stored.size == len(data)
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert os.listdir(tmp_path) == ["a.mp3"]
+
+
+def test_save_upload_stream_rejects_too_large(tmp_path) -> None:
+    """Негативный тест: превышение max_bytes удаляет временный файл (FILES-103)"""
+    with pytest.raises(UploadTooLargeError):
+        save_upload_stream(
+            io.BytesIO(b"x" * 100), str(tmp_path), "big.mp3", max_bytes=10, chunk_size=8
+        )
+    assert os.listdir(tmp_path) == []
+
+
+def test_save_upload_stream_content_addressed_dedup(tmp_path) -> None:
+    """Edge case: повторная загрузка того же содержимого не создаёт копию (FILES-104)"""
+    data = b"same audio bytes"
+    first = save_upload_stream(io.BytesIO(data), str(tmp_path), original_name="a.MP3")
+    second = save_upload_stream(io.BytesIO(data), str(tmp_path), original_name="b.mp3")
+    # VERIFICATION: имя по хэшу, второй вызов переиспользует файл
+    assert os.path.basename(first.path) == content_addressed_filename(first.sha256, "a.MP3")
+    assert first.path.endswith(".mp3")
+    assert not first.deduplicated
+    assert second.deduplicated and second.path == first.path
+    assert os.listdir(tmp_path) == [os.path.basename(first.path)]
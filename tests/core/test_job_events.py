@@ -0,0 +1,86 @@
+"""
+:module: src/audioscribetranslate/core/job_events.py
+Тесты журнала переходов статусов и запроса перцентилей по стадиям.
+Требования: EVENTS-101, EVENTS-102, EVENTS-103
+"""
+
+from datetime import datetime, timezone
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core import job_events
+from src.audioscribetranslate.models.audio_file import AudioFile
+from src.audioscribetranslate.models.base import Base
+from src.audioscribetranslate.models.translation import Translation
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        yield s
+
+
+def test_record_job_event_appends_rows(session: Session) -> None:
+    """Happy path: каждый переход — отдельная строка со временем (EVENTS-101)"""
+    job_events.record_job_event(
+        session, job_events.TRANSCRIPT, 7, "processing", audio_file_id=3
+    )
+    job_events.record_job_event(
+        session, job_events.TRANSCRIPT, 7, "done", "processing", 3
+    )
+    session.commit()
+    rows = (
+        session.execute(select(job_events.JobEvent).order_by(job_events.JobEvent.id))
+        .scalars()
+        .all()
+    )
+    assert [(r.from_status, r.to_status) for r in rows] == [
+        (None, "processing"),
+        ("processing", "done"),
+    ]
+    assert all(r.entity_type == "transcript" and r.entity_id == 7 for r in rows)
+    assert all(r.audio_file_id == 3 and r.created_at is not None for r in rows)
+
+
+def test_stage_latency_query_uses_percentile_cont() -> None:
+    """Happy path: перцентили считаются в БД через percentile_cont (EVENTS-102)"""
+    since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    stmt = job_events.build_stage_latency_query(
+        "queued", "processing", since, (0.5, 0.99)
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.count("WITHIN GROUP") == 2
+    assert {c.name for c in stmt.selected_columns} == {
+        "entity_type",
+        "count",
+        "p50",
+        "p99",
+    }
+
+
+def test_percentile_label_formats_fractions() -> None:
+    """Edge case: дробные перцентили дают читаемые имена колонок (EVENTS-102)"""
+    assert job_events.percentile_label(0.5) == "p50"
+    assert job_events.percentile_label(0.999) == "p99.9"
+
+
+def test_list_query_indexes_present() -> None:
+    """Edge case: индексы под фильтры и сортировку роутеров списков (EVENTS-103)"""
+    audio_indexes = {ix.name for ix in AudioFile.__table__.indexes}
+    assert {
+        "ix_audio_files_user_id_upload_time",
+        "ix_audio_files_status_upload_time",
+        "ix_audio_files_queued_enqueued_at",
+    } <= audio_indexes
+    columns = {
+        tuple(c.name for c in ix.columns) for ix in Translation.__table__.indexes
+    }
+    assert ("transcript_id", "target_language") in columns
+    assert ("status", "created_at") in columns
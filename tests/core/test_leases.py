@@ -0,0 +1,226 @@
+"""
+:module: src/audioscribetranslate/core/leases.py
+Тесты аренды задач: захват, продление, пульс и сбор брошенных файлов.
+Требования: LEASE-101, LEASE-102, LEASE-103, LEASE-104, LEASE-105
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core import tasks
+from src.audioscribetranslate.core.leases import (
+    LeaseHeartbeat,
+    claim_lease,
+    expired_leases_query,
+    held_lease_pids,
+    renew_lease,
+)
+from src.audioscribetranslate.models.audio_file import AudioFile
+from src.audioscribetranslate.models.base import Base
+from src.audioscribetranslate.models.transcript import Transcript
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def factory() -> Iterator[sessionmaker]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def _audio(status: str = "queued", attempts: int = 0, **kwargs: object) -> AudioFile:
+    return AudioFile(
+        user_id=1,
+        filename="f.wav",
+        original_name="f.wav",
+        content_type="audio/wav",
+        size=1,
+        whisper_model="base",
+        status=status,
+        attempts=attempts,
+        **kwargs,
+    )
+
+
+def _add(factory: sessionmaker, *rows: AudioFile) -> List[int]:
+    with factory() as session:
+        session.add_all(rows)
+        session.commit()
+        return [row.id for row in rows]
+
+
+def test_claim_is_exclusive_until_lease_expires(factory: sessionmaker) -> None:
+    """Happy path: повторная доставка не захватывает живую аренду, после истечения — да (LEASE-101)"""
+    (audio_id,) = _add(factory, _audio())
+    with factory() as session:
+        assert claim_lease(session, AudioFile, audio_id, "w1", 60, now=NOW)
+        assert not claim_lease(session, AudioFile, audio_id, "w2", 60, now=NOW)
+        # Владелец может перезахватить свою строку (повтор задачи в том же воркере)
+        assert claim_lease(session, AudioFile, audio_id, "w1", 60, now=NOW)
+        assert claim_lease(
+            session, AudioFile, audio_id, "w2", 60, now=NOW + timedelta(seconds=61)
+        )
+        session.commit()
+        row = session.get(AudioFile, audio_id)
+        session.refresh(row)
+        assert row.status == "processing" and row.lease_owner == "w2"
+        assert row.attempts == 3
+
+
+def test_done_row_is_never_claimed_and_renew_fails_after_takeover(
+    factory: sessionmaker,
+) -> None:
+    """Негативный тест: done не захватывается, потерянная аренда не продлевается (LEASE-102)"""
+    done_id, audio_id = _add(factory, _audio("done"), _audio())
+    with factory() as session:
+        assert not claim_lease(session, AudioFile, done_id, "w1", 60, now=NOW)
+        assert claim_lease(session, AudioFile, audio_id, "w1", 60, now=NOW)
+        assert renew_lease(
+            session, AudioFile, audio_id, "w1", 60, now=NOW + timedelta(seconds=30)
+        )
+        later = NOW + timedelta(seconds=200)
+        assert claim_lease(session, AudioFile, audio_id, "w2", 60, now=later)
+        assert not renew_lease(session, AudioFile, audio_id, "w1", 60, now=later)
+        session.commit()
+
+
+def test_heartbeat_extends_lease_and_reports_loss(factory: sessionmaker) -> None:
+    """Edge case: пульс продлевает аренду, а после перехвата выставляет lost (LEASE-102)"""
+    (audio_id,) = _add(factory, _audio())
+    with factory() as session:
+        claim_lease(session, AudioFile, audio_id, "w1", 1, now=NOW)
+        session.commit()
+    heartbeat = LeaseHeartbeat(factory, AudioFile, audio_id, "w1", 120, 30)
+    assert heartbeat.beat() is True
+    with factory() as session:
+        expires = session.execute(select(AudioFile.lease_expires_at)).scalar_one()
+        assert expires.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+        assert session.execute(expired_leases_query(AudioFile, NOW)).all() == []
+        takeover = datetime.now(timezone.utc) + timedelta(hours=1)
+        claim_lease(session, AudioFile, audio_id, "w2", 60, now=takeover)
+        session.commit()
+    assert heartbeat.beat() is False
+    assert heartbeat.lost is True
+
+
+def test_reaper_requeues_abandoned_and_fails_exhausted(
+    factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Happy path: брошенный файл — в очередь, исчерпавший попытки — failed (LEASE-103)"""
+    past = datetime.now(timezone.utc) - timedelta(minutes=10)
+    future = datetime.now(timezone.utc) + timedelta(minutes=10)
+    ids = _add(
+        factory,
+        _audio("processing", 1, lease_owner="dead", lease_expires_at=past),
+        _audio("processing", 3, lease_owner="dead", lease_expires_at=past),
+        _audio("processing", 1, lease_owner="alive", lease_expires_at=future),
+        _audio("processing", 0),  # обработка, начатая до появления аренды
+    )
+    with factory() as session:
+        session.add(Transcript(audio_file_id=ids[1], text="", status="processing"))
+        session.commit()
+    sent: List[int] = []
+    monkeypatch.setattr(tasks, "SyncSessionLocal", factory)
+    monkeypatch.setattr(
+        tasks,
+        "enqueue_audio",
+        lambda audio_id, model, lang="ru": sent.append(audio_id) or True,
+    )
+
+    assert tasks.reap_expired_leases() == 3
+    with factory() as session:
+        statuses = session.execute(
+            select(AudioFile.status).order_by(AudioFile.id)
+        ).scalars()
+        assert list(statuses) == ["queued", "failed", "processing", "queued"]
+        assert session.execute(select(Transcript.status)).scalar_one() == "failed"
+        owners = session.execute(
+            select(AudioFile.lease_owner).order_by(AudioFile.id)
+        ).scalars()
+        assert list(owners) == [None, None, "alive", None]
+    assert sent == [ids[0], ids[3]]
+
+
+def test_reaper_parks_file_in_pending_when_broker_down(
+    factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Негативный тест: при сбое брокера файл уходит в pending для drain (LEASE-103)"""
+    past = datetime.now(timezone.utc) - timedelta(minutes=10)
+    _add(factory, _audio("processing", 1, lease_owner="dead", lease_expires_at=past))
+    monkeypatch.setattr(tasks, "SyncSessionLocal", factory)
+    monkeypatch.setattr(
+        tasks, "enqueue_audio", lambda audio_id, model, lang="ru": False
+    )
+
+    assert tasks.reap_expired_leases() == 1
+    with factory() as session:
+        assert session.execute(select(AudioFile.status)).scalar_one() == "pending"
+
+
+def test_held_lease_pids_reports_busy_local_workers(factory: sessionmaker) -> None:
+    """Happy path: занятыми считаются только живые аренды процессов этого хоста (LEASE-104)"""
+    future = datetime.now(timezone.utc) + timedelta(minutes=10)
+    past = datetime.now(timezone.utc) - timedelta(minutes=10)
+    _add(
+        factory,
+        _audio("processing", 1, lease_owner="h1:101:aa", lease_expires_at=future),
+        _audio("processing", 1, lease_owner="h1:102:bb", lease_expires_at=past),
+        _audio("processing", 1, lease_owner="h2:103:cc", lease_expires_at=future),
+        _audio("done", 1, lease_owner="h1:104:dd", lease_expires_at=future),
+    )
+    with factory() as session:
+        assert held_lease_pids(session, AudioFile, hostname="h1") == {101}
+
+
+def test_transcription_that_lost_its_lease_writes_nothing(
+    factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Негативный тест: после перехвата аренды результат и статус не пишутся (LEASE-105)"""
+    (audio_id,) = _add(factory, _audio())
+
+    def takeover(path: str, model: str) -> tuple:
+        with factory() as session:
+            session.execute(
+                update(AudioFile)
+                .where(AudioFile.id == audio_id)
+                .values(lease_owner="w2", lease_expires_at=NOW + timedelta(days=1))
+            )
+            session.commit()
+        return "текст", "ru", None
+
+    monkeypatch.setattr(tasks, "SyncSessionLocal", factory)
+    monkeypatch.setattr(tasks.settings, "transcription_streaming", False)
+    monkeypatch.setattr(tasks, "safe_transcribe", takeover)
+
+    tasks.transcribe_audio(audio_id, auto_translate=False)
+    with factory() as session:
+        audio = session.get(AudioFile, audio_id)
+        assert audio.status == "processing" and audio.lease_owner == "w2"
+        transcript = session.execute(select(Transcript)).scalar_one()
+        assert transcript.status == "processing" and transcript.text is None
+
+
+def test_transcription_error_fails_file_and_transcript(
+    factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Edge case: ошибка у владельца аренды помечает failed и файл, и транскрипт (LEASE-105)"""
+    (audio_id,) = _add(factory, _audio())
+
+    def crash(path: str, model: str) -> tuple:
+        raise RuntimeError("диск недоступен")
+
+    monkeypatch.setattr(tasks, "SyncSessionLocal", factory)
+    monkeypatch.setattr(tasks.settings, "transcription_streaming", False)
+    monkeypatch.setattr(tasks, "safe_transcribe", crash)
+
+    tasks.transcribe_audio(audio_id, auto_translate=False)
+    with factory() as session:
+        audio = session.get(AudioFile, audio_id)
+        assert audio.status == "failed" and audio.lease_owner is None
+        assert session.execute(select(Transcript.status)).scalar_one() == "failed"
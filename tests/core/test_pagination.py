@@ -0,0 +1,129 @@
+"""
+:module: src/audioscribetranslate/core/pagination.py
+Тесты курсорной (keyset) пагинации списков.
+Требования: PAGE-101, PAGE-102, PAGE-103
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core.pagination import (
+    InvalidCursorError,
+    build_page_query,
+    decode_cursor,
+    encode_cursor,
+    make_page,
+)
+from src.audioscribetranslate.models.audio_file import AudioFile
+from src.audioscribetranslate.models.base import Base
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(23):
+            s.add(
+                AudioFile(
+                    user_id=1,
+                    filename=f"{i}.wav",
+                    original_name=f"{i}.wav",
+                    content_type="audio/wav",
+                    size=i % 4,  # много одинаковых значений — проверка tie-breaker id
+                    whisper_model="base",
+                    upload_time=base + timedelta(minutes=i % 5),
+                    duration_seconds=None if i % 7 == 0 else float(i % 3),
+                )
+            )
+        s.commit()
+        yield s
+
+
+def _walk(
+    session: Session, column, order_by: str, order_dir: str, limit: int
+) -> List[int]:
+    ids: List[int] = []
+    cursor: Optional[str] = None
+    while True:
+        stmt = build_page_query(
+            select(AudioFile),
+            order_by,
+            column,
+            AudioFile.id,
+            order_dir,
+            limit,
+            cursor=cursor,
+        )
+        rows = session.execute(stmt).scalars().all()
+        page, cursor = make_page(rows, order_by, column, AudioFile.id, order_dir, limit)
+        ids.extend(r.id for r in page)
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("order_by", ["id", "size", "upload_time", "duration_seconds"])
+@pytest.mark.parametrize("order_dir", ["asc", "desc"])
+def test_cursor_walk_matches_offset_order(
+    session: Session, order_by: str, order_dir: str
+) -> None:
+    """Happy path: обход курсорами даёт тот же порядок без пропусков и повторов (PAGE-101)"""
+    column = getattr(AudioFile, order_by)
+    stmt = build_page_query(
+        select(AudioFile), order_by, column, AudioFile.id, order_dir, 1000
+    )
+    expected = [r.id for r in session.execute(stmt).scalars()]
+    assert len(expected) == 23
+    assert _walk(session, column, order_by, order_dir, limit=5) == expected
+
+
+def test_last_page_has_no_cursor(session: Session) -> None:
+    """Edge case: на последней странице next_cursor = None (PAGE-102)"""
+    stmt = build_page_query(
+        select(AudioFile), "id", AudioFile.id, AudioFile.id, "asc", 50
+    )
+    rows = session.execute(stmt).scalars().all()
+    page, cursor = make_page(rows, "id", AudioFile.id, AudioFile.id, "asc", 50)
+    assert len(page) == 23
+    assert cursor is None
+
+
+def test_cursor_roundtrip_datetime() -> None:
+    """Edge case: datetime в курсоре восстанавливается с часовым поясом (PAGE-102)"""
+    moment = datetime(2025, 5, 1, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor("upload_time", "desc", moment, 42)
+    assert decode_cursor(cursor, "upload_time", "desc") == (moment, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "eyJ4IjoxfQ", ""])
+def test_malformed_cursor_rejected(cursor: str) -> None:
+    """Негативный тест: повреждённый курсор отклоняется (PAGE-103)"""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "id", "asc")
+
+
+def test_cursor_for_other_order_rejected() -> None:
+    """Негативный тест: курсор другой сортировки не применяется (PAGE-103)"""
+    cursor = encode_cursor("size", "asc", 3, 7)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "size", "desc")
+
+
+def test_column_select_pages_add_order_column(session: Session) -> None:
+    """Edge case: выборка колонок без поля сортировки — оно добавляется для курсора (PAGE-101)"""
+    stmt = select(
+        AudioFile.id, AudioFile.duration_seconds.is_not(None).label("has_duration")
+    )
+    page_stmt = build_page_query(stmt, "size", AudioFile.size, AudioFile.id, "desc", 4)
+    assert "size" in page_stmt.selected_columns.keys()
+    rows = session.execute(page_stmt).all()
+    page, cursor = make_page(rows, "size", AudioFile.size, AudioFile.id, "desc", 4)
+    assert len(page) == 4 and cursor is not None
+    assert all(r.size == 3 for r in page)
+    assert {type(r.has_duration) for r in page} <= {bool, int}
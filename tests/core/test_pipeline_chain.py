@@ -0,0 +1,43 @@
+"""
+:module: src/audioscribetranslate/core/tasks.py
+Тесты сборки конвейера цепочки: стадии, очереди, передача ID между стадиями.
+Требования: PIPELINE-101, PIPELINE-102
+"""
+
+from src.audioscribetranslate.core.tasks import (
+    PIPELINE_SUMMARIZE_TASK,
+    PIPELINE_TRANSCRIBE_TASK,
+    PIPELINE_TRANSLATE_TASK,
+    build_audio_pipeline,
+    pipeline_summarize,
+    pipeline_translate,
+)
+
+
+def test_pipeline_stages_run_on_own_queues() -> None:
+    """Happy path: транскрибация в очереди цепочек, перевод и саммари — в своих (PIPELINE-101)"""
+    stages = build_audio_pipeline(7, "de", 3, "processing_chains.long").tasks
+    assert [s.task for s in stages] == [
+        PIPELINE_TRANSCRIBE_TASK,
+        PIPELINE_TRANSLATE_TASK,
+        PIPELINE_SUMMARIZE_TASK,
+    ]
+    assert stages[0].options == {"queue": "processing_chains.long", "priority": 3}
+    assert stages[0].kwargs == {"dispatch_priority": 3}
+    assert stages[0].immutable  # первая стадия не принимает результат
+    # Следующие стадии получают ID предыдущей первым аргументом
+    assert stages[1].args == ("de",) and stages[1].options["queue"] == "translation"
+    assert stages[2].args == ("de",) and stages[2].options["queue"] == "summarization"
+
+
+def test_pipeline_without_priority() -> None:
+    """Edge case: без планировщика приоритет не передаётся (PIPELINE-101)"""
+    first = build_audio_pipeline(7, "ru", None, "processing_chains").tasks[0]
+    assert first.options == {"queue": "processing_chains"}
+    assert first.kwargs == {}
+
+
+def test_downstream_stages_skip_without_upstream_result() -> None:
+    """Негативный тест: стадия без результата предыдущей ничего не делает (PIPELINE-102)"""
+    assert pipeline_translate(None, "en") is None
+    assert pipeline_summarize(None, "en") is None
@@ -0,0 +1,69 @@
+"""
+:module: src/audioscribetranslate/core/preload.py
+Тесты выбора моделей Whisper для предзагрузки в воркерах.
+Требования: WORKER-101, WORKER-102, WORKER-103, WORKER-104
+"""
+
+import pytest
+
+from src.audioscribetranslate.core import preload
+from src.audioscribetranslate.core.config import Settings
+from src.audioscribetranslate.core.preload import (
+    format_memory_snapshot,
+    model_queue_name,
+    models_from_queues,
+    process_memory_snapshot,
+    resolve_preload_models,
+)
+
+
+def test_model_queues_take_priority(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Happy path: воркер модельной очереди греет именно её модель (WORKER-101)"""
+    monkeypatch.setattr(preload, "recent_model_mix", lambda window: ["small"])
+    settings = Settings(whisper_models="base,large", worker_preload_models="auto")
+    queues = [model_queue_name("large"), "translation", "transcription"]
+    assert models_from_queues(queues) == ["large"]
+    assert resolve_preload_models(settings, queues) == ["large"]
+
+
+def test_auto_uses_recent_model_mix(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Edge case: режим auto берёт самые частые из разрешённых моделей (WORKER-102)"""
+    monkeypatch.setattr(
+        preload, "recent_model_mix", lambda window: ["custom", "small", "base"]
+    )
+    settings = Settings(
+        whisper_models="base,small",
+        worker_preload_models="auto",
+        worker_preload_max_models=1,
+    )
+    assert resolve_preload_models(settings) == ["small"]
+
+
+def test_auto_falls_back_when_stats_unavailable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Негативный тест: ошибка БД не ломает старт, грузится первая модель (WORKER-102)"""
+
+    def broken(window: int) -> list:
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(preload, "recent_model_mix", broken)
+    settings = Settings(whisper_models="base,small", worker_preload_models="auto")
+    assert resolve_preload_models(settings) == ["base"]
+    disabled = Settings(whisper_models="base", worker_preload_models="")
+    assert resolve_preload_models(disabled) == []
+
+
+def test_text_only_worker_preloads_nothing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Негативный тест: воркер перевода и саммари не грузит Whisper даже в auto (WORKER-104)"""
+    monkeypatch.setattr(preload, "recent_model_mix", lambda window: ["small"])
+    settings = Settings(whisper_models="base,small", worker_preload_models="auto")
+    assert resolve_preload_models(settings, ["translation", "summarization"]) == []
+    assert resolve_preload_models(settings, ["processing_chains.long"]) == ["small"]
+
+
+def test_process_memory_snapshot_reports_rss() -> None:
+    """Happy path: снимок памяти содержит RSS процесса в мегабайтах (WORKER-103)"""
+    snapshot = process_memory_snapshot()
+    assert snapshot["rss"] > 0
+    assert format_memory_snapshot({"rss": 1.0, "uss": 0.5}) == "rss=1.0MB uss=0.5MB"
@@ -0,0 +1,88 @@
+"""
+:module: src/audioscribetranslate/core/queue_depth.py
+Тесты подсчёта глубины очереди агрегирующим запросом.
+Требования: QUEUE-101, QUEUE-102
+"""
+
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core import queue_depth
+from src.audioscribetranslate.core.queue_depth import QueueDepth, count_queue_depth
+from src.audioscribetranslate.models.audio_file import AudioFile
+from src.audioscribetranslate.models.base import Base
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        yield s
+
+
+def _audio(status: str, model: str) -> AudioFile:
+    return AudioFile(
+        user_id=1,
+        filename="f.wav",
+        original_name="f.wav",
+        content_type="audio/wav",
+        size=1,
+        whisper_model=model,
+        status=status,
+    )
+
+
+def test_count_queue_depth_breakdown(session: Session) -> None:
+    """Happy path: разбивка по статусам и моделям без загрузки строк (QUEUE-101)"""
+    session.add_all(
+        [
+            _audio("queued", "base"),
+            _audio("queued", "base"),
+            _audio("queued", "large"),
+            _audio("processing", "base"),
+            _audio("done", "base"),
+        ]
+    )
+    session.commit()
+    depth = count_queue_depth(session)
+    assert depth.queued == 3
+    assert depth.by_status == {
+        "uploaded": 0,
+        "pending": 0,
+        "queued": 3,
+        "processing": 1,
+    }
+    assert depth.by_model == {"base": 2, "large": 1}
+
+
+def test_get_queue_depth_uses_ttl_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Edge case: в пределах TTL повторный запрос не идёт в БД (QUEUE-102)"""
+    calls = []
+
+    def fake_count(session: object) -> QueueDepth:
+        calls.append(1)
+        return QueueDepth(
+            by_status={"queued": 5}, computed_at=queue_depth.time.monotonic()
+        )
+
+    class FakeSession:
+        def __enter__(self) -> "FakeSession":
+            return self
+
+        def __exit__(self, *args: object) -> None:
+            return None
+
+    monkeypatch.setattr(queue_depth, "count_queue_depth", fake_count)
+    monkeypatch.setattr(queue_depth, "SyncSessionLocal", FakeSession)
+    queue_depth.invalidate_queue_depth()
+    assert queue_depth.get_queue_depth(max_age=60).queued == 5
+    assert queue_depth.get_queue_depth(max_age=60).queued == 5
+    assert len(calls) == 1
+    assert queue_depth.get_queue_depth(max_age=0).queued == 5
+    assert len(calls) == 2
+    queue_depth.invalidate_queue_depth()
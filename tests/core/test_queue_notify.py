@@ -0,0 +1,105 @@
+"""
+:module: src/audioscribetranslate/core/queue_notify.py
+Тесты пробуждения менеджера цепочек: локальное событие, Redis pub/sub, деградация.
+Требования: NOTIFY-101, NOTIFY-102, NOTIFY-103
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.audioscribetranslate.core.queue_notify import QUEUE_CHANNEL, QueueNotifier
+
+
+class _FakePubSub:
+    def __init__(self, client: "_FakeRedis") -> None:
+        self.client = client
+        self.messages: List[Dict[str, Any]] = []
+        self.ready = threading.Event()
+
+    def subscribe(self, channel: str) -> None:
+        self.client.subscribers.append(self)
+        self.ready.set()
+
+    def get_message(self, timeout: float = 0.0) -> Optional[Dict[str, Any]]:
+        if self.messages:
+            return self.messages.pop(0)
+        time.sleep(min(timeout, 0.01))
+        return None
+
+    def close(self) -> None:
+        self.client.subscribers.remove(self)
+
+
+class _FakeRedis:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.published: List[tuple] = []
+        self.subscribers: List[_FakePubSub] = []
+
+    def publish(self, channel: str, message: str) -> int:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.published.append((channel, message))
+        for sub in self.subscribers:
+            sub.messages.append(
+                {"type": "message", "channel": channel, "data": message}
+            )
+        return len(self.subscribers)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> _FakePubSub:
+        return _FakePubSub(self)
+
+
+def test_local_notify_wakes_waiter_immediately() -> None:
+    """Happy path: уведомление в процессе будит ожидание без таймаута (NOTIFY-101)"""
+    notifier = QueueNotifier()
+    assert notifier.wait(0.01) is False
+    threading.Timer(0.05, notifier.notify, args=("upload",)).start()
+    started = time.monotonic()
+    assert notifier.wait(10.0) is True
+    assert time.monotonic() - started < 1.0
+    stats = notifier.get_stats()
+    assert stats["wakeups"] == 1 and stats["timeouts"] == 1
+    assert stats["remote_enabled"] is False
+
+
+def test_notification_crosses_processes_via_redis() -> None:
+    """Happy path: публикация одного процесса будит подписчика другого (NOTIFY-102)"""
+    client = _FakeRedis()
+    manager = QueueNotifier(client=client)
+    api = QueueNotifier(client=client)
+    assert manager.start_listener() is True
+    try:
+        # Первое пробуждение — страховочный опрос после подписки
+        assert manager.wait(2.0) is True
+        assert api.notify("upload") is True
+        assert client.published == [(QUEUE_CHANNEL, "upload")]
+        assert manager.wait(2.0) is True
+        assert manager.get_stats()["received"] == 1
+        assert manager.get_stats()["listening"] is True
+    finally:
+        manager.stop_listener()
+    assert manager.get_stats()["listening"] is False
+
+
+def test_burst_of_notifications_collapses_into_one_wakeup() -> None:
+    """Edge case: пачка загрузок за время settle даёт одно пробуждение (NOTIFY-101)"""
+    notifier = QueueNotifier()
+    notifier.notify()
+    threading.Timer(0.02, notifier.notify).start()
+    assert notifier.wait(1.0, settle=0.1) is True
+    assert notifier.wait(0.01) is False
+
+
+def test_redis_failure_still_wakes_locally() -> None:
+    """Негативный тест: недоступный Redis не ломает постановку, будит локально (NOTIFY-103)"""
+    client = _FakeRedis(fail=True)
+    notifier = QueueNotifier(client=client)
+    assert notifier.notify() is False
+    assert notifier.wait(0.5) is True
+    # Публикация отключена на паузу: повторная попытка не ходит в Redis
+    client.fail = False
+    assert notifier.notify() is False
+    assert client.published == []
+    assert notifier.get_stats()["publish_errors"] == 1
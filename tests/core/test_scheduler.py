@@ -0,0 +1,119 @@
+"""
+:module: src/audioscribetranslate/core/scheduler.py
+Тесты планирования транскрипции по ожидаемой стоимости (SJF со старением).
+Требования: SCHED-101, SCHED-102, SCHED-103, SCHED-104
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core import tasks
+from src.audioscribetranslate.core.config import Settings
+from src.audioscribetranslate.core.scheduler import (
+    LONG_QUEUE_SUFFIX,
+    is_stale_dispatch,
+    plan_job,
+    priority_for_cost,
+)
+from src.audioscribetranslate.models.audio_file import AudioFile
+from src.audioscribetranslate.models.base import Base
+from src.audioscribetranslate.models.transcript import Transcript
+from src.audioscribetranslate.models.transcript_segment import TranscriptSegment
+from src.audioscribetranslate.services.transcription import (
+    TranscriptionStream,
+    TranscriptSegmentResult,
+)
+
+
+def test_short_jobs_get_higher_priority() -> None:
+    """Happy path: 30-секундное сообщение опережает трёхчасовую запись (SCHED-101)"""
+    settings = Settings(scheduler_priority_base_seconds=30.0)
+    voicemail = plan_job(30.0, "base", "processing_chains", rtf=0.1, settings=settings)
+    lecture = plan_job(
+        3 * 3600.0, "base", "processing_chains", rtf=0.1, settings=settings
+    )
+    assert voicemail.priority == 0
+    assert lecture.priority > voicemail.priority
+    assert lecture.expected_seconds == pytest.approx(1080.0)
+    assert priority_for_cost(10**9, base_seconds=30.0) == 9
+
+
+def test_aging_promotes_waiting_long_jobs() -> None:
+    """Edge case: ожидание снижает эффективную стоимость, длинная задача не голодает (SCHED-102)"""
+    fresh = priority_for_cost(1920.0, base_seconds=30.0)
+    aged = priority_for_cost(
+        1920.0, base_seconds=30.0, waited_seconds=3000.0, aging_seconds=600.0
+    )
+    starved = priority_for_cost(1920.0, 30.0, waited_seconds=10**6, aging_seconds=600.0)
+    assert fresh == 6
+    assert aged < fresh
+    assert starved == 0
+
+
+def test_long_queue_split_and_stale_dispatch() -> None:
+    """Негативный тест: без порога одна очередь; устаревшее сообщение распознаётся (SCHED-103)"""
+    single = Settings(scheduler_long_job_seconds=0.0)
+    split = Settings(scheduler_long_job_seconds=600.0)
+    assert plan_job(7200.0, "large", "q", rtf=1.0, settings=single).queue == "q"
+    assert (
+        plan_job(7200.0, "large", "q", rtf=1.0, settings=split).queue
+        == "q" + LONG_QUEUE_SUFFIX
+    )
+    assert plan_job(None, "unknown", "q", settings=single).expected_seconds > 0
+
+    audio = AudioFile(priority=2, status="queued")
+    assert is_stale_dispatch(audio, 5)
+    assert not is_stale_dispatch(audio, 2)
+    assert not is_stale_dispatch(audio, None)
+
+
+def _stream(*args: object, **kwargs: object) -> TranscriptionStream:
+    segment = TranscriptSegmentResult(start=50.0, end=60.0, text="конец")
+    return TranscriptionStream(
+        language="ru",
+        confidence=None,
+        duration=60.0,
+        segments=iter([segment]),
+        model_used="base",
+        device_used="cpu",
+    )
+
+
+@pytest.mark.parametrize(
+    "resume_end, threshold, expected",
+    [(None, 0, True), (30.0, 0, False), (None, 10, False)],
+)
+def test_streaming_rtf_only_for_full_sequential_runs(
+    monkeypatch: pytest.MonkeyPatch,
+    resume_end: float | None,
+    threshold: int,
+    expected: bool,
+) -> None:
+    """Edge case: RTF не пишется при возобновлении и параллельных фрагментах (SCHED-104)"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    monkeypatch.setattr(tasks, "transcribe_stream", _stream)
+    monkeypatch.setattr(tasks, "transcribe_stream_parallel", _stream)
+    monkeypatch.setattr(tasks.settings, "long_audio_threshold_seconds", threshold)
+    with factory() as session:
+        transcript = Transcript(audio_file_id=1, status="processing")
+        session.add(transcript)
+        session.flush()
+        if resume_end is not None:
+            session.add(
+                TranscriptSegment(
+                    transcript_id=transcript.id,
+                    start=0.0,
+                    end=resume_end,
+                    text="начало",
+                )
+            )
+        session.commit()
+        result = tasks.run_streaming_transcription(
+            session, int(transcript.id), "f.wav", "base", duration_hint=60.0
+        )
+    assert result[2] is None and result[3] == 60.0
+    assert result[4] is expected
@@ -0,0 +1,116 @@
+"""
+:module: src/audioscribetranslate/core/text_streaming.py
+Тесты отдачи текста транскрипта: Range, ETag, окна по сегментам.
+Требования: TEXT-101, TEXT-102, TEXT-103, TEXT-104
+"""
+
+from datetime import datetime, timezone
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core.tasks import copy_transcript_segments
+from src.audioscribetranslate.core.text_streaming import (
+    RangeNotSatisfiableError,
+    etag_matches,
+    join_segment_texts,
+    make_etag,
+    parse_byte_range,
+    segment_window_query,
+    segment_window_version_query,
+)
+from src.audioscribetranslate.models.base import Base
+from src.audioscribetranslate.models.transcript_segment import TranscriptSegment
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-50", (950, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        (None, None),
+        ("items=0-1", None),
+        ("bytes=0-1,5-6", None),
+        ("bytes=9-2", None),
+    ],
+)
+def test_parse_byte_range(header, expected) -> None:
+    """Happy path: один диапазон байт разбирается, прочее — отдача целиком (TEXT-101)"""
+    assert parse_byte_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+def test_parse_byte_range_unsatisfiable(header: str) -> None:
+    """Негативный тест: диапазон за концом текста — 416 (TEXT-101)"""
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_byte_range(header, 1000)
+
+
+def test_etag_changes_with_version_and_matches_lists() -> None:
+    """Happy path: ETag зависит от версии, If-None-Match понимает списки и W/ (TEXT-102)"""
+    t1 = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    t2 = datetime(2025, 1, 1, 12, 0, 1, tzinfo=timezone.utc)
+    etag = make_etag(5, t1, 1024)
+    assert etag != make_etag(5, t2, 1024)
+    assert etag != make_etag(5, t1, 1024, "w0-60")
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag(5, t2, 1024), etag)
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        for i in range(10):  # сегменты по 10 с: [0,10), [10,20), ...
+            s.add(
+                TranscriptSegment(
+                    transcript_id=1, start=i * 10.0, end=i * 10.0 + 10.0, text=f"s{i}"
+                )
+            )
+        s.add(TranscriptSegment(transcript_id=2, start=0.0, end=5.0, text="other"))
+        s.commit()
+        yield s
+
+
+def test_segment_window_returns_overlapping_segments(session: Session) -> None:
+    """Happy path: окно по времени отдаёт только пересекающиеся сегменты (TEXT-103)"""
+    rows = session.execute(segment_window_query(1, 15.0, 35.0)).all()
+    assert join_segment_texts([r.text for r in rows]) == "s1 s2 s3"
+
+
+def test_segment_window_open_end(session: Session) -> None:
+    """Edge case: окно без конца — до последнего сегмента (TEXT-103)"""
+    rows = session.execute(segment_window_query(1, 85.0, None)).all()
+    assert [r.text for r in rows] == ["s8", "s9"]
+    assert session.execute(segment_window_query(1, 100.0, None)).all() == []
+
+
+def test_segment_window_version_tracks_appended_segments(session: Session) -> None:
+    """Edge case: дописанный сегмент меняет версию окна (и ETag) (TEXT-104)"""
+    before = session.execute(segment_window_version_query(1, 85.0, None)).one()
+    assert (before.segments, before.max_end) == (2, 100.0)
+    session.add(TranscriptSegment(transcript_id=1, start=100.0, end=108.0, text="s10"))
+    session.commit()
+    after = session.execute(segment_window_version_query(1, 85.0, None)).one()
+    assert (after.segments, after.max_end) == (3, 108.0)
+    empty = session.execute(segment_window_version_query(1, 200.0, None)).one()
+    assert empty.segments == 0
+
+
+def test_reused_transcript_gets_segment_copy(session: Session) -> None:
+    """Edge case: дедуплицированный транскрипт отдаёт окно по копии сегментов (TEXT-103)"""
+    session.add(TranscriptSegment(transcript_id=3, start=0.0, end=1.0, text="stale"))
+    assert copy_transcript_segments(session, 1, 3) == 10
+    session.commit()
+    rows = session.execute(segment_window_query(3, 15.0, 35.0)).all()
+    assert join_segment_texts([r.text for r in rows]) == "s1 s2 s3"
+    assert len(session.execute(segment_window_query(3, 0.0, None)).all()) == 10
@@ -0,0 +1,111 @@
+"""
+:module: src/audioscribetranslate/core/tasks.py
+Тесты задачи перевода транскрипта сразу на несколько языков.
+Требования: TRANSLATE-105, TRANSLATE-106
+"""
+
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import src.audioscribetranslate.models  # noqa: F401  # регистрация всех таблиц
+from src.audioscribetranslate.core import tasks
+from src.audioscribetranslate.core.job_events import JobEvent
+from src.audioscribetranslate.models.base import Base
+from src.audioscribetranslate.models.transcript import Transcript
+from src.audioscribetranslate.models.translation import Translation
+from src.audioscribetranslate.services.translation import (
+    TranslationConfig,
+    TranslationService,
+)
+
+
+@pytest.fixture
+def factory(monkeypatch: pytest.MonkeyPatch) -> Iterator[sessionmaker[Session]]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    monkeypatch.setattr(tasks, "SyncSessionLocal", factory)
+    with factory() as s:
+        s.add(
+            Transcript(
+                id=1, audio_file_id=1, status="done", language="ru", text="Привет. Мир."
+            )
+        )
+        s.commit()
+    yield factory
+
+
+def _queue(factory: sessionmaker[Session], languages: List[str]) -> List[int]:
+    with factory() as s:
+        rows = [
+            Translation(
+                transcript_id=1,
+                source_language="ru",
+                target_language=language,
+                model_name="mt_model",
+                status="queued",
+            )
+            for language in languages
+        ]
+        s.add_all(rows)
+        s.commit()
+        return [int(r.id) for r in rows]
+
+
+def test_multi_translation_records_backend(
+    factory: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Happy path: пакет переводов записывает текст и фактический backend (TRANSLATE-105)"""
+    service = TranslationService(TranslationConfig(backend="stub"))
+    monkeypatch.setattr(tasks, "get_translation_service", lambda: service)
+    ids = _queue(factory, ["en", "de"])
+
+    tasks.translate_transcript_multi(ids)
+
+    with factory() as s:
+        rows = s.execute(select(Translation).order_by(Translation.id)).scalars().all()
+    assert [(r.target_language, r.status, r.backend) for r in rows] == [
+        ("en", "done", "stub"),
+        ("de", "done", "stub"),
+    ]
+    assert all(r.text for r in rows)
+
+
+def test_multi_translation_failure_spares_done_and_foreign_rows(
+    factory: sessionmaker[Session], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Негативный тест: ошибка пакета не трогает готовые и чужие переводы (TRANSLATE-106)"""
+
+    queued, done = _queue(factory, ["en", "de"])
+    with factory() as s:
+        s.add(Transcript(id=2, audio_file_id=2, status="done", language="ru", text="x"))
+        foreign = Translation(transcript_id=2, target_language="fr", status="queued")
+        s.add(foreign)
+        s.commit()
+        foreign_id = int(foreign.id)
+
+    def _fail(*args: object, **kwargs: object) -> None:
+        # Повторная доставка: другой воркер успел завершить один перевод
+        with factory() as other:
+            other.get(Translation, done).status = "done"
+            other.commit()
+        raise RuntimeError("model crashed")
+
+    service = TranslationService(TranslationConfig(backend="stub"))
+    monkeypatch.setattr(service, "translate_many", _fail)
+    monkeypatch.setattr(tasks, "get_translation_service", lambda: service)
+
+    tasks.translate_transcript_multi([queued, done, foreign_id])
+
+    with factory() as s:
+        statuses = {r.id: r.status for r in s.execute(select(Translation)).scalars()}
+        failed = s.execute(
+            select(JobEvent.entity_id, JobEvent.from_status).where(
+                JobEvent.to_status == "failed"
+            )
+        ).all()
+    assert statuses == {queued: "failed", done: "done", foreign_id: "queued"}
+    assert [tuple(r) for r in failed] == [(queued, "processing")]
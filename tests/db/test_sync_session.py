@@ -0,0 +1,48 @@
+"""
+:module: src/audioscribetranslate/db/sync_session.py
+Тесты общего синхронного движка для Celery-задач.
+Требования: DB-301, DB-302
+"""
+
+import os
+
+import pytest
+
+from src.audioscribetranslate.db import sync_session
+from src.audioscribetranslate.db.sync_session import (
+    dispose_sync_engine,
+    get_sync_engine,
+    get_sync_sessionmaker,
+    reset_sync_engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_engine():
+    # CLEANUP: каждый тест начинает без созданного движка
+    dispose_sync_engine()
+    yield
+    dispose_sync_engine()
+
+
+def test_get_sync_engine_is_process_singleton() -> None:
+    """Happy path: повторные вызовы возвращают один и тот же движок (DB-301)"""
+    engine = get_sync_engine()
+    assert engine is get_sync_engine()
+    assert get_sync_sessionmaker() is get_sync_sessionmaker()
+
+
+def test_get_sync_engine_recreated_after_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Edge case: смена PID (fork) приводит к созданию нового пула (DB-302)"""
+    engine = get_sync_engine()
+    # sync_session.os — тот же модуль os: сохраняем оригинал до подмены
+    real_getpid = os.getpid
+    monkeypatch.setattr(sync_session.os, "getpid", lambda: real_getpid() + 1)
+    assert get_sync_engine() is not engine
+
+
+def test_reset_sync_engine_drops_inherited_pool() -> None:
+    """Негативный тест: после reset_sync_engine движок создаётся заново (DB-302)"""
+    engine = get_sync_engine()
+    reset_sync_engine()
+    assert get_sync_engine() is not engine
@@ -1,7 +1,7 @@
 """
 :module: src/audioscribetranslate/models/transcript.py
 Тесты модели транскрипта.
-Требования: TRANSCRIPT-101, TRANSCRIPT-102
+Требования: TRANSCRIPT-101, TRANSCRIPT-102, TRANSCRIPT-103
 """
 import pytest
 
@@ -42,3 +42,9 @@ def test_transcript_model_relationships() -> None:
     assert hasattr(Transcript, "translations")
     assert hasattr(Transcript, "audio_file")
     assert hasattr(Transcript, "translations")
+
+def test_transcript_relationships_are_opt_in() -> None:
+    """Edge case: связи не грузятся неявно, удаление каскадит БД (TRANSCRIPT-103)"""
+    assert Transcript.audio_file.property.lazy == "raise_on_sql"
+    assert Transcript.translations.property.lazy == "raise_on_sql"
+    assert Transcript.translations.property.passive_deletes is True
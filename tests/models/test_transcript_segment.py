@@ -0,0 +1,29 @@
+"""
+:module: src/audioscribetranslate/models/transcript_segment.py
+Тесты модели сегмента транскрипта.
+Требования: SEGMENT-101, SEGMENT-102
+"""
+
+import pytest
+
+from src.audioscribetranslate.models.transcript_segment import TranscriptSegment
+
+
+def test_transcript_segment_model_fields() -> None:
+    """Happy path: поля модели TranscriptSegment соответствуют требованиям (SEGMENT-101)"""
+    segment = TranscriptSegment(
+        transcript_id=1, start=1.5, end=3.25, text="Привет", avg_logprob=-0.2
+    )
+    assert segment.transcript_id == 1
+    assert segment.start == 1.5
+    assert segment.end == 3.25
+    assert segment.text == "Привет"
+    assert segment.avg_logprob == -0.2
+
+
+def test_transcript_segment_index_on_transcript_and_start() -> None:
+    """Edge case: составной индекс (transcript_id, start) для возобновления (SEGMENT-102)"""
+    indexes = {
+        tuple(c.name for c in ix.columns) for ix in TranscriptSegment.__table__.indexes
+    }
+    assert ("transcript_id", "start") in indexes
@@ -0,0 +1,93 @@
+"""
+:module: src/audioscribetranslate/services/audio_headers.py
+Тесты определения длительности по заголовкам MP3/FLAC/OGG/M4A.
+Требования: DURATION-101, DURATION-102, DURATION-103
+"""
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from src.audioscribetranslate.services.audio_headers import HeaderDurationExtractor
+from src.audioscribetranslate.services.transcription import AudioDurationService
+
+# MPEG-1 Layer III, 128 кбит/с, 44.1 кГц, стерео: кадр 417 байт, 1152 сэмпла
+MP3_HEADER = b"\xff\xfb\x90\x00"
+MP3_FRAME = MP3_HEADER + b"\x00" * (417 - 4)
+
+
+def _ogg_page(granule: int, payload: bytes) -> bytes:
+    return (
+        b"OggS"
+        + bytes([0, 0])
+        + struct.pack("<qIIIB", granule, 1, 0, 0, 1)
+        + bytes([len(payload)])
+        + payload
+    )
+
+
+def test_header_durations_for_supported_formats(tmp_path: Path) -> None:
+    """Happy path: длительность читается из заголовков без ffprobe (DURATION-101)"""
+    extractor = HeaderDurationExtractor()
+
+    flac = tmp_path / "a.flac"
+    packed = (16000 << 44) | (0 << 41) | (15 << 36) | 48000  # 3 секунды
+    flac.write_bytes(
+        b"fLaC"
+        + b"\x80\x00\x00\x22"
+        + b"\x00" * 10
+        + struct.pack(">Q", packed)
+        + b"\x00" * 16
+    )
+    assert extractor.extract_duration(flac) == pytest.approx(3.0)
+
+    ogg = tmp_path / "a.ogg"
+    vorbis_id = b"\x01vorbis" + struct.pack("<IBI", 0, 2, 44100) + b"\x00" * 14
+    ogg.write_bytes(_ogg_page(0, vorbis_id) + b"\x00" * 100 + _ogg_page(441000, b"x"))
+    assert extractor.extract_duration(ogg) == pytest.approx(10.0)
+
+    m4a = tmp_path / "a.m4a"
+    mvhd_body = (
+        b"\x00\x00\x00\x00" + struct.pack(">IIII", 0, 0, 1000, 7500) + b"\x00" * 80
+    )
+    mvhd = struct.pack(">I", 8 + len(mvhd_body)) + b"mvhd" + mvhd_body
+    moov = struct.pack(">I", 8 + len(mvhd)) + b"moov" + mvhd
+    mdat = struct.pack(">I", 8 + 64) + b"mdat" + b"\x00" * 64
+    ftyp = struct.pack(">I", 16) + b"ftypM4A " + b"\x00" * 4
+    m4a.write_bytes(ftyp + mdat + moov)  # moov после mdat
+    assert extractor.extract_duration(m4a) == pytest.approx(7.5)
+
+
+def test_mp3_xing_and_cbr(tmp_path: Path) -> None:
+    """Edge case: VBR по заголовку Xing, CBR по битрейту с учётом ID3 (DURATION-102)"""
+    extractor = HeaderDurationExtractor()
+
+    xing = bytearray(MP3_FRAME)
+    xing[36:48] = b"Xing" + struct.pack(">II", 1, 1000)
+    vbr = tmp_path / "vbr.mp3"
+    vbr.write_bytes(bytes(xing) + MP3_FRAME * 10)
+    assert extractor.extract_duration(vbr) == pytest.approx(1000 * 1152 / 44100)
+
+    id3 = b"ID3\x03\x00\x00" + bytes([0, 0, 0, 20]) + b"\x00" * 20
+    cbr = tmp_path / "renamed.bin"
+    cbr.write_bytes(id3 + MP3_FRAME * 100)
+    assert extractor.extract_duration(cbr) == pytest.approx(
+        100 * 1152 / 44100, rel=0.01
+    )
+
+
+def test_duration_service_caches_by_mtime_and_size(tmp_path: Path) -> None:
+    """Негативный тест: мусор даёт None, изменение файла сбрасывает кэш (DURATION-103)"""
+    service = AudioDurationService()
+    service.extractors = [HeaderDurationExtractor()]
+    path = tmp_path / "a.mp3"
+    path.write_bytes(b"not audio at all")
+    assert service.get_duration_seconds(path) is None
+    assert service.get_duration_seconds(path) is None
+    assert service.get_cache_stats()["hits"] == 1
+
+    path.write_bytes(MP3_FRAME * 100)
+    assert service.get_duration_seconds(path) == pytest.approx(2.6, rel=0.02)
+    assert service.get_cache_stats()["misses"] == 2
+    assert service.get_duration_seconds(tmp_path / "missing.mp3") is None
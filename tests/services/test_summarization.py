@@ -0,0 +1,77 @@
+"""
+:module: src/audioscribetranslate/services/summarization.py
+Тесты экстрактивной суммаризации TextRank и иерархического map-reduce.
+Требования: SUMMARY-201, SUMMARY-202, SUMMARY-203
+"""
+
+import pytest
+
+from src.audioscribetranslate.services.summarization import (
+    SummarizationConfig,
+    SummarizationError,
+    SummarizationService,
+    TextRankSummarizer,
+)
+from src.audioscribetranslate.services.translation import split_sentences
+
+TOPIC = [
+    "Бюджет проекта на следующий квартал увеличен на десять процентов.",
+    "Бюджет проекта согласован с финансовым отделом и руководством.",
+    "Финансовый отдел просит отчёт о расходах проекта каждый месяц.",
+]
+NOISE = ["Погода сегодня солнечная.", "Кофе закончился утром.", "Ага."]
+
+
+def test_textrank_prefers_central_sentences_in_original_order() -> None:
+    """Happy path: выбираются связанные по теме предложения в исходном порядке (SUMMARY-201)"""
+    sentences = [NOISE[0], TOPIC[0], NOISE[1], TOPIC[1], NOISE[2], TOPIC[2]]
+    summary = TextRankSummarizer().summarize_sentences(sentences, limit=3)
+    assert summary == TOPIC
+
+
+def test_textrank_is_deterministic_and_handles_no_words() -> None:
+    """Edge case: предложения без значимых слов не ломают ранжирование (SUMMARY-201)"""
+    summarizer = TextRankSummarizer()
+    sentences = ["Да.", "Нет.", "Ну.", "Ок."]
+    assert summarizer.summarize_sentences(sentences, 2) == ["Да.", "Нет."]
+    assert summarizer.summarize_sentences(["Одно предложение."], 3) == [
+        "Одно предложение."
+    ]
+
+
+def test_service_records_metrics_and_sizes() -> None:
+    """Happy path: размер саммари по доле текста, метрики заполнены (SUMMARY-202)"""
+    text = " ".join((TOPIC + NOISE) * 2)
+    service = SummarizationService(SummarizationConfig(ratio=0.25, min_sentences=1))
+    result = service.summarize_text(text, model_name="summ_model")
+    assert result.model_name == "textrank"
+    assert result.input_sentences == 12
+    assert result.output_sentences == 3
+    assert result.levels == 1 and result.chunks == 1
+    assert result.input_chars == len(text) and result.output_chars == len(result.text)
+    assert result.processing_seconds >= 0
+
+
+def test_map_reduce_bounds_long_inputs() -> None:
+    """Edge case: длинный текст сворачивается по уровням до одного фрагмента (SUMMARY-203)"""
+    sentences = [
+        f"Пункт номер {i} обсуждения темы {i % 7} совещания." for i in range(500)
+    ]
+    config = SummarizationConfig(chunk_sentences=20, max_sentences=5, max_workers=2)
+    result = SummarizationService(config).summarize_text(" ".join(sentences))
+    assert result.chunks == 25
+    assert result.levels >= 3
+    assert result.output_sentences == 5
+    assert set(split_sentences(result.text)) <= set(sentences)
+
+
+def test_empty_text() -> None:
+    """Edge case: пустой перевод даёт пустое саммари (SUMMARY-202)"""
+    result = SummarizationService().summarize_text("   ")
+    assert result.text == "" and result.output_sentences == 0
+
+
+def test_unknown_backend_rejected() -> None:
+    """Негативный тест: неизвестная реализация суммаризации (SUMMARY-202)"""
+    with pytest.raises(SummarizationError):
+        SummarizationService(SummarizationConfig(backend="llm"))
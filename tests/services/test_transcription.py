@@ -0,0 +1,219 @@
+"""
+:module: src/audioscribetranslate/services/transcription.py
+Тесты фрагментации длинных аудиофайлов и кэша моделей Whisper.
+Требования: TRANSCRIBE-201, TRANSCRIBE-202, TRANSCRIBE-203, TRANSCRIBE-204, TRANSCRIBE-205,
+TRANSCRIBE-206, TRANSCRIBE-207
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.audioscribetranslate.services import transcription
+from src.audioscribetranslate.services.transcription import (
+    ComputeType,
+    DeviceType,
+    TranscriptionConfig,
+    TranscriptionService,
+    WhisperModelCache,
+    estimate_model_bytes,
+    iter_chunk_jobs,
+    plan_audio_chunks,
+)
+
+
+class _SlowModel:
+    """Подменяет WhisperModel: считает загрузки и имитирует долгую загрузку."""
+
+    loads = 0
+
+    def __init__(self, name: str, **kwargs: object) -> None:
+        type(self).loads += 1
+        time.sleep(0.05)
+        self.name = name
+
+
+@pytest.fixture
+def fake_whisper(monkeypatch: pytest.MonkeyPatch) -> type:
+    _SlowModel.loads = 0
+    monkeypatch.setattr(transcription, "WhisperModel", _SlowModel)
+    return _SlowModel
+
+
+def test_plan_audio_chunks_cuts_in_silence() -> None:
+    """Happy path: граница фрагмента проходит посередине паузы (TRANSCRIBE-201)"""
+    chunks = plan_audio_chunks([(0, 4), (6, 10)], 12.0, chunk_seconds=3.0)
+    assert chunks == [(0.0, 5.0), (5.0, 12.0)]
+
+
+def test_plan_audio_chunks_covers_from_offset_without_gaps() -> None:
+    """Edge case: фрагменты покрывают [start_offset, duration) без разрывов (TRANSCRIBE-202)"""
+    speech = [(0, 4), (6, 10), (11, 20), (25, 30)]
+    chunks = plan_audio_chunks(speech, 32.0, chunk_seconds=5.0, start_offset=7.0)
+    assert chunks[0][0] == 7.0
+    assert chunks[-1][1] == 32.0
+    for (_, prev_end), (next_start, _) in zip(chunks, chunks[1:]):
+        assert prev_end == next_start
+
+
+def test_plan_audio_chunks_forces_cut_in_continuous_speech() -> None:
+    """Негативный тест: речь без пауз режется не длиннее 2 * chunk_seconds (TRANSCRIBE-202)"""
+    chunks = plan_audio_chunks([(0, 100)], 100.0, chunk_seconds=10.0)
+    assert all(end - start <= 20.0 for start, end in chunks)
+    assert plan_audio_chunks([], 5.0, chunk_seconds=10.0, start_offset=5.0) == []
+
+
+def test_model_cache_single_flight_under_concurrency(fake_whisper: type) -> None:
+    """Happy path: параллельные запросы одной модели дают одну загрузку (TRANSCRIBE-203)"""
+    cache = WhisperModelCache(TranscriptionConfig(cache_size=2))
+    results = []
+
+    def worker() -> None:
+        results.append(cache.get_model("tiny", DeviceType.CPU, ComputeType.INT8))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert fake_whisper.loads == 1
+    assert all(model is results[0] for model in results)
+    stats = cache.get_stats()
+    assert stats.cache_misses == 1
+    assert stats.cache_hits + stats.load_waits == 7
+
+
+def test_model_cache_evicts_by_memory_budget(fake_whisper: type) -> None:
+    """Edge case: бюджет памяти вытесняет наименее недавно использованную модель (TRANSCRIBE-203)"""
+    budget = estimate_model_bytes("small", ComputeType.INT8) + estimate_model_bytes(
+        "base", ComputeType.INT8
+    )
+    cache = WhisperModelCache(TranscriptionConfig(cache_size=8, cache_max_bytes=budget))
+    cache.get_model("small", DeviceType.CPU, ComputeType.INT8)
+    cache.get_model("tiny", DeviceType.CPU, ComputeType.INT8)
+    cache.get_model("small", DeviceType.CPU, ComputeType.INT8)
+    cache.get_model("base", DeviceType.CPU, ComputeType.INT8)
+    stats = cache.get_stats()
+    assert stats.loaded_models == ["small_cpu_int8", "base_cpu_int8"]
+    assert stats.evictions == 1
+    assert stats.cache_bytes <= budget
+
+
+def test_model_cache_load_error_propagates_to_waiters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Негативный тест: ошибка загрузки не кэшируется и не оставляет зависших ожиданий (TRANSCRIBE-203)"""
+
+    def broken(name: str, **kwargs: object) -> None:
+        raise OSError("no weights")
+
+    monkeypatch.setattr(transcription, "WhisperModel", broken)
+    cache = WhisperModelCache(TranscriptionConfig())
+    with pytest.raises(OSError):
+        cache.get_model("tiny", DeviceType.CPU, ComputeType.INT8)
+    assert cache.get_stats().cache_size == 0
+    assert cache._loading == {}
+
+
+def test_model_cache_pinned_model_is_not_evicted(fake_whisper: type) -> None:
+    """Edge case: закреплённая модель переживает вытеснение по LRU (TRANSCRIBE-204)"""
+    cache = WhisperModelCache(TranscriptionConfig(cache_size=1))
+    cache.get_model("base", DeviceType.CPU, ComputeType.INT8, pin=True)
+    cache.get_model("tiny", DeviceType.CPU, ComputeType.INT8)
+    cache.get_model("small", DeviceType.CPU, ComputeType.INT8)
+    stats = cache.get_stats()
+    assert "base_cpu_int8" in stats.loaded_models
+    assert stats.pinned_models == ["base_cpu_int8"]
+
+
+class _LanguageModel:
+    """Подменяет WhisperModel: пробник начала речи — de, фрагменты сами — en."""
+
+    def __init__(self) -> None:
+        self.languages: list = []
+
+    def transcribe(self, audio: object, **kwargs: object) -> tuple:
+        if audio == "probe":
+            return iter(()), {"language": "de"}
+        self.languages.append(kwargs.get("language"))
+        return iter(()), {"language": kwargs.get("language") or "en"}
+
+
+def test_parallel_chunks_share_language_detected_once() -> None:
+    """Edge case: язык определяется один раз и передается всем фрагментам (TRANSCRIBE-205)"""
+    service = TranscriptionService(TranscriptionConfig())
+    model = _LanguageModel()
+    service.model_cache.get_model = lambda *args, **kwargs: model  # type: ignore[method-assign]
+    jobs = [
+        ("tiny", f"chunk{i}", i * 10.0, (i * 10.0, i * 10.0 + 10.0), None)
+        for i in range(3)
+    ]
+
+    results = list(service._run_chunk_jobs(jobs, workers=1, language_probe="probe"))
+
+    assert model.languages == ["de", "de", "de"]
+    assert [language for _, language in results] == ["de", "de", "de"]
+
+
+def test_chunk_jobs_are_copies_and_processes_fit_in_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Edge case: фрагменты не держат весь массив, процессов не больше, чем влезет моделей (TRANSCRIBE-206)"""
+    audio = np.zeros(4 * transcription.SAMPLE_RATE, dtype=np.float32)
+    windows = [(0.0, 2.5, (0.0, 2.0)), (1.5, 4.0, (2.0, 4.0))]
+    jobs = list(iter_chunk_jobs(audio, windows, "base", "ru"))
+    assert [job[1].base is None for job in jobs] == [True, True]
+    assert [len(job[1]) for job in jobs] == [40000, 40000]
+
+    service = TranscriptionService(TranscriptionConfig())
+    _, compute_type = service.device_selector.select_optimal_device()
+    per_model = estimate_model_bytes("base", compute_type)
+    monkeypatch.setattr(
+        transcription.psutil,
+        "virtual_memory",
+        lambda: SimpleNamespace(available=per_model * 2 + 1),
+    )
+    assert service._max_chunk_processes("base") == 2
+    monkeypatch.setattr(
+        transcription.psutil, "virtual_memory", lambda: SimpleNamespace(available=0)
+    )
+    assert service._max_chunk_processes("base") == 1
+
+
+class _InlineExecutor:
+    """Подменяет ProcessPoolExecutor: выполняет задания сразу и считает отправки."""
+
+    submitted = 0
+
+    def __init__(self, **kwargs: object) -> None:
+        type(self).submitted = 0
+
+    def submit(self, fn: object, *args: object) -> Future:
+        type(self).submitted += 1
+        future: Future = Future()
+        future.set_result(([], args[-1]))
+        return future
+
+    def shutdown(self, **kwargs: object) -> None:
+        pass
+
+
+def test_pool_keeps_bounded_number_of_chunks_in_flight(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Happy path: фрагменты уходят в пул по мере готовности, не все сразу (TRANSCRIBE-207)"""
+    monkeypatch.setattr(transcription, "ProcessPoolExecutor", _InlineExecutor)
+    service = TranscriptionService(TranscriptionConfig())
+    jobs = (("m", f"chunk{i}", 0.0, (0.0, 1.0), "ru") for i in range(10))
+
+    results = service._run_chunk_jobs(jobs, workers=2)
+    in_flight = []
+    for consumed, _ in enumerate(results, start=1):
+        in_flight.append(_InlineExecutor.submitted - consumed)
+
+    assert len(in_flight) == 10
+    assert max(in_flight) == 3  # workers + 1: следующий фрагмент уже готов
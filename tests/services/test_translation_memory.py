@@ -0,0 +1,81 @@
+"""
+:module: src/audioscribetranslate/services/translation_memory.py
+Тесты памяти переводов: ключи, общий уровень Redis, деградация до LRU.
+Требования: TM-101, TM-102, TM-103
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from src.audioscribetranslate.services.translation_memory import (
+    TranslationMemory,
+    memory_key,
+)
+
+
+def test_translation_memory_keys_separate_pairs_and_models() -> None:
+    """Edge case: ключ зависит от пары языков и модели, но не от пробелов (TM-101)"""
+    key = memory_key("ru", "en", "stub:m", "Добрый  день.")
+    assert key == memory_key("ru", "en", "stub:m", " Добрый день. ")
+    assert key != memory_key("ru", "de", "stub:m", "Добрый день.")
+    assert key != memory_key("ru", "en", "ctranslate2:m", "Добрый день.")
+
+
+class _FakeRedis:
+    def __init__(self, fail: bool = False) -> None:
+        self.data: Dict[str, Any] = {}
+        self.fail = fail
+
+    def mget(self, keys):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.data.get(k) for k in keys]
+
+    def hgetall(self, key):
+        return self.data.get(key, {})
+
+    def pipeline(self, transaction: bool = True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis) -> None:
+        self.client = client
+        self.ops: List[Tuple[str, tuple]] = []
+
+    def set(self, key, value, ex=None):
+        self.ops.append(("set", (key, value.encode("utf-8"))))
+
+    def hincrby(self, key, field, amount):
+        self.ops.append(("hincrby", (key, field, amount)))
+
+    def execute(self):
+        if self.client.fail:
+            raise ConnectionError("redis down")
+        for op, args in self.ops:
+            if op == "set":
+                self.client.data[args[0]] = args[1]
+            else:
+                stats = self.client.data.setdefault(args[0], {})
+                stats[args[1]] = stats.get(args[1], 0) + args[2]
+
+
+def test_remote_tier_shared_between_processes() -> None:
+    """Happy path: запись одного процесса находится другим через Redis (TM-102)"""
+    client = _FakeRedis()
+    writer = TranslationMemory(max_entries=10, client=client)
+    reader = TranslationMemory(max_entries=10, client=client)
+    writer.put_many({"k1": "перевод"})
+    assert reader.get_many(["k1", "k2"]) == {"k1": "перевод"}
+    stats = reader.get_stats()
+    assert stats["remote_hits"] == 1 and stats["misses"] == 1
+    assert stats["shared"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+    assert reader.get_many(["k1"]) == {"k1": "перевод"}  # теперь из LRU
+    assert reader.get_stats()["local_hits"] == 1
+
+
+def test_remote_failure_degrades_to_local() -> None:
+    """Негативный тест: недоступный Redis не ломает перевод, работает LRU (TM-103)"""
+    memory = TranslationMemory(max_entries=2, client=_FakeRedis(fail=True))
+    memory.put_many({"a": "1", "b": "2", "c": "3"})
+    assert memory.get_many(["a", "b", "c"]) == {"b": "2", "c": "3"}
+    assert memory.get_stats()["entries"] == 2
@@ -0,0 +1,153 @@
+"""
+:module: src/audioscribetranslate/services/translation.py
+Тесты конвейера перевода: разбиение на предложения, мини-батчи, выбор backend'а,
+память переводов в конвейере.
+Требования: TRANSLATE-101, TRANSLATE-102, TRANSLATE-103, TRANSLATE-104, TM-101
+"""
+
+from typing import List
+
+import pytest
+
+from src.audioscribetranslate.services.translation import (
+    StubTranslationBackend,
+    TranslationConfig,
+    TranslationError,
+    TranslationService,
+    make_batches,
+    split_sentences,
+)
+
+
+def test_split_sentences_keeps_punctuation() -> None:
+    """Happy path: текст делится на предложения по знакам конца и строкам (TRANSLATE-101)"""
+    text = "Привет! Как дела? Всё «хорошо». \nНовая строка без точки\n\n"
+    assert split_sentences(text) == [
+        "Привет!",
+        "Как дела?",
+        "Всё «хорошо».",
+        "Новая строка без точки",
+    ]
+
+
+def test_split_sentences_cuts_long_sentences() -> None:
+    """Edge case: предложение длиннее лимита режется по словам (TRANSLATE-101)"""
+    parts = split_sentences(" ".join(f"w{i}" for i in range(10)), max_words=4)
+    assert parts == ["w0 w1 w2 w3", "w4 w5 w6 w7", "w8 w9"]
+
+
+@pytest.mark.parametrize("budget, size", [(16, 64), (1000, 3), (1, 64)])
+def test_make_batches_respects_budget(budget: int, size: int) -> None:
+    """Happy path: каждый индекс ровно в одном батче, паддинг в пределах бюджета (TRANSLATE-102)"""
+    lengths = [7, 1, 3, 3, 12, 2, 5, 1, 8]
+    batches = make_batches(lengths, budget, size)
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) <= size
+        padded = max(lengths[i] for i in batch) * len(batch)
+        assert len(batch) == 1 or padded <= budget
+
+
+def test_stub_translation_preserves_order_and_reports_throughput() -> None:
+    """Happy path: заглушка детерминирована, порядок предложений сохраняется (TRANSLATE-102)"""
+    service = TranslationService(TranslationConfig(backend="stub", max_batch_tokens=6))
+    text = "Короткое. Это предложение немного длиннее остальных. Третье тут."
+    result = service.translate_text(text, "ru", "en")
+    assert result.text == (
+        "[en] Короткое. [en] Это предложение немного длиннее остальных. [en] Третье тут."
+    )
+    assert service.translate_text(text, "ru", "en").text == result.text
+    assert result.sentences == 3 and result.batches > 1
+    assert result.backend == "stub" and result.model_name == "opus-mt-ru-en"
+    assert result.output_tokens == result.input_tokens + 3
+    assert result.tokens_per_second is not None and result.tokens_per_second > 0
+
+
+@pytest.mark.parametrize("text, source", [("Текст.", "en"), ("   ", "ru")])
+def test_passthrough_without_translation(text: str, source: str) -> None:
+    """Edge case: одинаковые языки или пустой текст не переводятся (TRANSLATE-102)"""
+    result = TranslationService(TranslationConfig(backend="stub")).translate_text(
+        text, source, "en"
+    )
+    assert result.text == text
+    assert result.tokens_per_second is None
+
+
+def test_default_backend_without_model_fails(tmp_path) -> None:
+    """Негативный тест: по умолчанию без модели CTranslate2 — ошибка, не заглушка (TRANSLATE-103)"""
+    service = TranslationService(TranslationConfig(models_dir=str(tmp_path)))
+    with pytest.raises(TranslationError):
+        service.translate_text("Привет.", "ru", "de", model_name="mt_model")
+
+
+def test_unknown_backend_fails() -> None:
+    """Негативный тест: устаревший backend=auto не подменяет перевод заглушкой (TRANSLATE-103)"""
+    service = TranslationService(TranslationConfig(backend="auto"))
+    with pytest.raises(TranslationError):
+        service.translate_text("Привет.", "ru", "de")
+
+
+def test_explicit_ctranslate2_without_model_fails(tmp_path) -> None:
+    """Негативный тест: backend=ctranslate2 без модели — ошибка, а не заглушка (TRANSLATE-103)"""
+    service = TranslationService(
+        TranslationConfig(backend="ctranslate2", models_dir=str(tmp_path))
+    )
+    with pytest.raises(TranslationError):
+        service.translate_text("Привет.", "ru", "en", model_name="opus-mt-ru-en")
+
+
+class _CountingStub(StubTranslationBackend):
+    def __init__(self) -> None:
+        self.translated: List[List[str]] = []
+
+    def translate_tokens(self, batch, source_language, target_language):
+        self.translated.extend(batch)
+        return super().translate_tokens(batch, source_language, target_language)
+
+
+def test_translation_memory_skips_known_and_repeated_sentences() -> None:
+    """Happy path: повторы и уже переведённые предложения не идут в модель (TM-101)"""
+    stub = _CountingStub()
+    service = TranslationService(TranslationConfig(backend="stub"), stub=stub)
+    first = service.translate_text("Спасибо. Начнём. Спасибо.", "ru", "en")
+    assert first.text == "[en] Спасибо. [en] Начнём. [en] Спасибо."
+    assert first.cached_sentences == 1 and len(stub.translated) == 2
+
+    second = service.translate_text("Спасибо.  Итоги.", "ru", "en")
+    assert second.text == "[en] Спасибо. [en] Итоги."
+    assert second.cached_sentences == 1 and len(stub.translated) == 3
+    assert service.memory.get_stats()["local_hits"] >= 1
+
+
+class _TokenizeCountingStub(StubTranslationBackend):
+    def __init__(self) -> None:
+        self.tokenized = 0
+
+    def tokenize(self, sentences):
+        self.tokenized += len(sentences)
+        return super().tokenize(sentences)
+
+
+def test_translate_many_shares_segmentation_for_multilingual_model() -> None:
+    """Happy path: одна многоязычная модель — токенизация один раз на все языки (TRANSLATE-104)"""
+    stub = _TokenizeCountingStub()
+    service = TranslationService(TranslationConfig(backend="stub"), stub=stub)
+    results = service.translate_many(
+        "Первое. Второе.", "ru", ["en", "de", "en", "ru"], model_name="m2m100"
+    )
+    assert list(results) == ["en", "de", "ru"]
+    assert results["en"].text == "[en] Первое. [en] Второе."
+    assert results["de"].text == "[de] Первое. [de] Второе."
+    assert results["ru"].text == "Первое. Второе." and results["ru"].backend == "none"
+    assert stub.tokenized == 2
+    assert {r.model_name for r in results.values()} == {"m2m100"}
+
+
+def test_translate_many_per_pair_models() -> None:
+    """Edge case: модели на пару языков — своя модель и токенизация на язык (TRANSLATE-104)"""
+    stub = _TokenizeCountingStub()
+    service = TranslationService(TranslationConfig(backend="stub"), stub=stub)
+    results = service.translate_many("Первое. Второе.", "ru", ["en", "de"])
+    assert results["en"].model_name == "opus-mt-ru-en"
+    assert results["de"].model_name == "opus-mt-ru-de"
+    assert stub.tokenized == 4
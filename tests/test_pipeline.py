@@ -17,6 +17,7 @@ from audioscribetranslate.models.summary import Summary
 from audioscribetranslate.models.transcript import Transcript
 from audioscribetranslate.models.translation import Translation
 from audioscribetranslate.models.user import User
+from audioscribetranslate.services.translation import configure_translation_service
 
 
 @pytest.mark.asyncio
@@ -69,7 +70,8 @@ async def test_full_pipeline_manual(db_session: AsyncSession) -> None:
     )
     assert ok and translation_id is not None
 
-    # Run translation task
+    # Run translation task (модели CTranslate2 в тестовом окружении нет)
+    configure_translation_service(backend="stub")
     translate_transcript(translation_id)
 
     # Enqueue summary